@@ -0,0 +1 @@
+"""asv benchmarks for retentioneering — see benchmarks/README.md."""
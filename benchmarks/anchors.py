@@ -0,0 +1,37 @@
+"""`paths.anchors` resolution: the pattern matching under every anchored tool."""
+
+from retentioneering.paths import anchors
+
+from .common import StreamBenchmark, with_peakmem
+
+
+@with_peakmem
+class Anchors(StreamBenchmark):
+    def setup(self, rows):
+        super().setup(rows)
+        self.df = self.stream.df
+        self.schema = self.stream.schema
+
+    def _positions(self, spec):
+        anchors.resolve_positions(
+            self.df, self.schema, anchors.parse_spec(spec), offset_side="start"
+        )
+
+    def time_resolve_event(self, rows):
+        anchors.resolve_anchors(self.df, self.schema, "cart")
+
+    def time_resolve_pattern(self, rows):
+        anchors.resolve_anchors(
+            self.df, self.schema, "product_view->.*->cart->.*->purchase"
+        )
+
+    def time_resolve_pattern_all(self, rows):
+        anchors.resolve_anchors(
+            self.df, self.schema, "product_view->add_to_cart", occurrence="all"
+        )
+
+    def time_positions_step_offset(self, rows):
+        self._positions({"pattern": "cart", "offset": 2})
+
+    def time_positions_time_offset(self, rows):
+        self._positions({"pattern": "cart", "offset": "10m"})
@@ -0,0 +1,111 @@
+"""Shared fixtures for the benchmarks: synthetic event logs at any scale.
+
+`event_log(n_rows)` is the first `n_rows` events of
+`datasets.generate_ecom`, the library's own vectorized e-commerce
+simulation, so the benchmarks run on the model the bundled dataset comes
+from. Each scale is written to Parquet once (`RETENTIONEERING_BENCH_DATA`,
+default a directory under the system temp dir) and read back by every
+benchmark process after that.
+
+`SCALES` are the row counts every benchmark is parametrized over; set
+`RETENTIONEERING_BENCH_ROWS` (comma-separated, e.g. ``10000,1000000``) to
+run a subset.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import tempfile
+from typing import ClassVar
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from retentioneering import Eventstream
+from retentioneering.datasets import generate_ecom
+
+SCALES = [
+    int(n)
+    for n in os.environ.get(
+        "RETENTIONEERING_BENCH_ROWS", "10000,1000000,10000000"
+    ).split(",")
+]
+
+DATA_DIR = pathlib.Path(
+    os.environ.get("RETENTIONEERING_BENCH_DATA")
+    or pathlib.Path(tempfile.gettempdir()) / "retentioneering-bench"
+)
+
+SCHEMA = {
+    "path_cols": ["user_id", "session_id"],
+    "segment_cols": ["platform", "acquisition_channel"],
+}
+
+FUNNEL = ["catalog", "product_view", "add_to_cart", "cart", "purchase"]
+
+#: The columns of `generate_ecom`'s output the benchmarks read
+COLUMNS = [
+    "user_id",
+    "session_id",
+    "event",
+    "timestamp",
+    "platform",
+    "acquisition_channel",
+]
+
+#: `generate_ecom` averages ~50 events a user; this many rows per user
+#: overshoots, and the log is trimmed to size
+_ROWS_PER_USER = 40
+
+
+def event_log(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """The first `n_rows` events `datasets.generate_ecom` simulates."""
+    n_users = max(1, n_rows // _ROWS_PER_USER)
+    with tempfile.TemporaryDirectory() as tmp:
+        raw = pathlib.Path(tmp) / "events.parquet"
+        while True:
+            # Written chunk by chunk, so only the trimmed log is ever in memory
+            generate_ecom(n_users, seed, path=raw)
+            if pq.read_metadata(raw).num_rows >= n_rows:
+                break
+            n_users *= 2
+        return pd.read_parquet(raw, columns=COLUMNS).head(n_rows)
+
+
+def load_log(n_rows: int) -> pd.DataFrame:
+    """`event_log(n_rows)`, generated on first use and cached as Parquet."""
+    path = DATA_DIR / f"events_{n_rows}.parquet"
+    if not path.exists():
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # Concurrent benchmark processes may race to write the same scale
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        event_log(n_rows).to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    return pd.read_parquet(path)
+
+
+def load_stream(n_rows: int) -> Eventstream:
+    return Eventstream(load_log(n_rows), SCHEMA)
+
+
+def with_peakmem(cls):
+    """Give every `time_*` benchmark of `cls` a `peakmem_*` twin."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("time_") and callable(member):
+            setattr(cls, "peakmem_" + name.removeprefix("time_"), member)
+    return cls
+
+
+class StreamBenchmark:
+    """Base for benchmarks over `load_stream(rows)` at every scale."""
+
+    params: ClassVar[list] = [SCALES]
+    param_names: ClassVar[list] = ["rows"]
+    # One call per sample: at 10M rows a single call takes seconds
+    number = 1
+    repeat = (1, 5, 60.0)
+    timeout = 1800
+
+    def setup(self, rows):
+        self.stream = load_stream(rows)
@@ -0,0 +1,92 @@
+"""Every data processor, once per call on a freshly loaded stream."""
+
+from retentioneering import Eventstream
+
+from .common import FUNNEL, SCHEMA, StreamBenchmark, load_log, with_peakmem
+
+
+@with_peakmem
+class DataProcessors(StreamBenchmark):
+    def time_filter_events(self, rows):
+        self.stream.filter_events(keep={"event": FUNNEL})
+
+    def time_filter_paths(self, rows):
+        self.stream.filter_paths({"op": ">", "metric": "length", "value": 5})
+
+    def time_add_events(self, rows):
+        self.stream.add_events("checkout", source_event=["cart", "shipping_details"])
+
+    def time_add_segment_rules(self, rows):
+        self.stream.add_segment(
+            "device",
+            rules=[["platform", "=", "mobile", "mobile"], ["web"]],
+        )
+
+    def time_add_segment_funnel(self, rows):
+        self.stream.add_segment("funnel", funnel_events=FUNNEL[2:])
+
+    def time_add_clusters(self, rows):
+        self.stream.add_clusters(
+            "behavior",
+            features=[
+                {"metric": "length"},
+                {"metric": "has_event", "metric_args": {"event": "purchase"}},
+            ],
+            method_args={"n_clusters": 4},
+        )
+
+    def time_add_start_end_events(self, rows):
+        self.stream.add_start_end_events()
+
+    def time_collapse_events(self, rows):
+        self.stream.collapse_events(loops=["product_view", "search", "catalog"])
+
+    def time_to_daily_states(self, rows):
+        self.stream.to_daily_states(max_dormant_days=30, path_col="user_id")
+
+    def time_drop_segment(self, rows):
+        self.stream.drop_segment("acquisition_channel")
+
+    def time_edit_events(self, rows):
+        self.stream.edit_events(rename={"product_view": "pdp"}, delete=["error_page"])
+
+    def time_rename_events(self, rows):
+        self.stream.rename_events({"product_view": "pdp", "add_to_cart": "atc"})
+
+    def time_rename_segment_levels(self, rows):
+        self.stream.rename_segment_levels("platform", {"mobile": "phone"})
+
+    def time_drop_events(self, rows):
+        self.stream.drop_events(["error_page", "support_chat"])
+
+    def time_sample_paths(self, rows):
+        self.stream.sample_paths(frac=0.1, random_state=0)
+
+    def time_split_sessions(self, rows):
+        self.stream.split_sessions(
+            session_col="visit_id", timeout="30m", path_col="user_id"
+        )
+
+    def time_truncate_paths(self, rows):
+        self.stream.truncate_paths("product_view", "purchase")
+
+
+@with_peakmem
+class UrlsToEvents(StreamBenchmark):
+    def setup(self, rows):
+        df = load_log(rows)
+        df["page_url"] = ("/shop/" + df["event"].astype(str)).astype("category")
+        self.stream = Eventstream(df, {**SCHEMA, "custom_cols": ["page_url"]})
+
+    def time_urls_to_events(self, rows):
+        self.stream.urls_to_events(
+            column="page_url",
+            nodes=[
+                {
+                    "path": "shop",
+                    "aggregate_children": True,
+                    "name": "shop",
+                    "exclude": False,
+                }
+            ],
+        )
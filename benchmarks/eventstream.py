@@ -0,0 +1,18 @@
+"""Eventstream construction: preprocessing, sorting and indexing a raw log."""
+
+from retentioneering import Eventstream
+
+from .common import SCHEMA, StreamBenchmark, load_log, with_peakmem
+
+
+@with_peakmem
+class Construct(StreamBenchmark):
+    def setup(self, rows):
+        self.df = load_log(rows)
+
+    def time_construct(self, rows):
+        Eventstream(self.df, SCHEMA)
+
+    def time_describe(self, rows):
+        # Lazy stats on a fresh stream: the first thing a notebook shows
+        Eventstream(self.df, SCHEMA).describe()
@@ -0,0 +1,6 @@
+"""`import retentioneering` in a fresh interpreter, heavy stacks left unloaded."""
+
+
+def timeraw_import():
+    # asv runs the returned code in a new process, so nothing is cached yet
+    return "import retentioneering"
@@ -0,0 +1,43 @@
+"""The headless tools behind every widget, plus `get_conversion_rate`."""
+
+from .common import FUNNEL, StreamBenchmark, with_peakmem
+
+_DIFF = ("platform", "mobile", "desktop")
+
+
+@with_peakmem
+class Tools(StreamBenchmark):
+    def time_transition_graph_data(self, rows):
+        self.stream.transition_graph_data()
+
+    def time_transition_graph_data_diff(self, rows):
+        self.stream.transition_graph_data(diff=_DIFF)
+
+    def time_step_matrix_data(self, rows):
+        self.stream.step_matrix_data(max_steps=20)
+
+    def time_step_matrix_data_anchor(self, rows):
+        self.stream.step_matrix_data(max_steps=20, anchor="cart")
+
+    def time_funnel_data(self, rows):
+        self.stream.funnel_data(FUNNEL)
+
+    def time_funnel_data_diff(self, rows):
+        self.stream.funnel_data(FUNNEL, diff=_DIFF)
+
+    def time_segment_overview_data(self, rows):
+        self.stream.segment_overview_data(
+            "platform", metrics=[{"metric": "length"}, {"metric": "duration"}]
+        )
+
+    def time_cluster_analysis_data(self, rows):
+        self.stream.cluster_analysis_data(
+            features=[{"metric": "length"}, {"metric": "event_count_bulk"}],
+            method_args={"n_clusters": 4},
+        )
+
+    def time_get_conversion_rate(self, rows):
+        self.stream.get_conversion_rate("add_to_cart", "purchase")
+
+    def time_get_conversion_rate_within(self, rows):
+        self.stream.get_conversion_rate("add_to_cart", "purchase", within="1h")
@@ -1,4 +1,6 @@
 import type { WidgetHost } from "@retentioneering/viz-core";
+import { applyPatch, type PatchOp } from "./delta";
+import { unpackJson } from "./payload";
 
 /**
  * Minimal shape of anywidget's `AnyModel` that we depend on. Kept local
@@ -17,6 +19,11 @@ export interface AnyWidgetModel {
 
 /**
  * Wraps a live anywidget model as a `WidgetHost`:
+ *  - get() unpacks a large packed traitlet value (see payload.ts) the first
+ *    time it is read, so widgets only ever see plain JSON.
+ *  - get("result")/onChange("result") follow `result_version`: a result
+ *    Python sent only as a patch is applied here (see resultState()), and
+ *    widgets just see `result` change.
  *  - get/set go straight through model.get/model.set (set() also flushes
  *    via save_changes(), matching the old hand-written
  *    `model.set(k, v); model.save_changes();` pairs).
@@ -33,9 +40,11 @@ export interface AnyWidgetModel {
  * viz-core) that touches `model.get`/`model.set`/`model.on`/`model.off`.
  */
 export function anywidgetHost(model: AnyWidgetModel): WidgetHost {
-  return {
+  const host: WidgetHost = {
     get(key: string) {
-      return model.get(key);
+      if (key === "result") return resultState(model, host).json;
+      const value = model.get(key);
+      return typeof value === "string" ? unpackJson(value) : value;
     },
 
     set(key: string, value: unknown) {
@@ -51,6 +60,11 @@ export function anywidgetHost(model: AnyWidgetModel): WidgetHost {
     },
 
     onChange(key: string, cb: () => void) {
+      if (key === "result") {
+        const { listeners } = resultState(model, host);
+        listeners.add(cb);
+        return () => listeners.delete(cb);
+      }
       const event = `change:${key}`;
       model.on(event, cb);
       return () => model.off(event, cb);
@@ -83,4 +97,91 @@ export function anywidgetHost(model: AnyWidgetModel): WidgetHost {
       });
     },
   };
+  return host;
+}
+
+interface ResultState {
+  /** `result_version` that `json` is at */
+  version: number;
+  json: string;
+  listeners: Set<() => void>;
+}
+
+interface ResultPatch {
+  base: number;
+  version: number;
+  ops: PatchOp[];
+}
+
+const resultStates = new WeakMap<AnyWidgetModel, ResultState>();
+
+/**
+ * The model's current `result`, kept in step with `result_version`. Python
+ * bumps the version on every new result and, in the same message, sends
+ * either `result` itself (`result_patch` "") or only a patch from the
+ * previous version, leaving the model's `result` as it was. The patched
+ * result lives here rather than being model.set(): a local set would be
+ * flushed back to the kernel with the next save_changes(). One state per
+ * model, however many views it has, so each patch is applied once. A patch
+ * from a version this page doesn't hold triggers a fetch of the whole
+ * result through the base `result` tool.
+ */
+function resultState(model: AnyWidgetModel, host: WidgetHost): ResultState {
+  const existing = resultStates.get(model);
+  if (existing) return existing;
+  const state: ResultState = {
+    version: (model.get("result_version") as number) ?? 0,
+    json: unpackJson((model.get("result") as string) || "{}"),
+    listeners: new Set(),
+  };
+  resultStates.set(model, state);
+  const notify = () => state.listeners.forEach((cb) => cb());
+
+  const advance = (): boolean => {
+    const version = (model.get("result_version") as number) ?? 0;
+    if (version === state.version) return false;
+    const raw = model.get("result_patch") as string;
+    const patch = raw ? (JSON.parse(unpackJson(raw)) as ResultPatch) : null;
+    if (patch && patch.version === version) {
+      if (patch.base !== state.version) {
+        resync();
+        return false;
+      }
+      state.json = JSON.stringify(applyPatch(JSON.parse(state.json), patch.ops));
+    } else {
+      state.json = unpackJson((model.get("result") as string) || "{}");
+    }
+    state.version = version;
+    return true;
+  };
+
+  const resync = () => {
+    host
+      .compute<{ version: number; result: string }>("result", {})
+      .then(({ version, result }) => {
+        if (version < state.version) return;
+        state.version = version;
+        state.json = unpackJson(result || "{}");
+        notify();
+      })
+      .catch((e) => console.error("retentioneering: result resync failed", e));
+  };
+  // The model's own `result` predates the last patch if that arrived before
+  // this state existed — or not, when the state came from the kernel whole
+  // (page reload); there is no telling, so fetch it.
+  if (model.get("result_patch")) resync();
+
+  model.on("change:result_version", () => {
+    if (advance()) notify();
+  });
+  model.on("change:result", () => {
+    if (advance()) return notify();
+    // Set without a new version: take it as is
+    const json = unpackJson((model.get("result") as string) || "{}");
+    if (json !== state.json) {
+      state.json = json;
+      notify();
+    }
+  });
+  return state;
 }
@@ -1,4 +1,5 @@
 import type { WidgetHost } from "@retentioneering/viz-core";
+import { isPacked, unpackObject } from "./payload";
 
 /**
  * Read-only `WidgetHost` over a plain data blob — the host for the
@@ -12,11 +13,16 @@ import type { WidgetHost } from "@retentioneering/viz-core";
  * objects/arrays via model.get(); static-export data is plain parsed JSON,
  * so get() re-serializes object/array values to match what widget code
  * expects (it JSON.parse()s them right back) — same behavior as before.
+ * A large `result` arrives packed (see payload.ts); it is unpacked on first
+ * read and the plain value kept in its place.
  */
 export function staticHost(data: Record<string, unknown>): WidgetHost {
   return {
     get(key: string) {
-      const v = data[key];
+      let v = data[key];
+      if (isPacked(v)) {
+        v = data[key] = unpackObject(v);
+      }
       if (v !== null && v !== undefined && typeof v === "object") {
         return JSON.stringify(v);
       }
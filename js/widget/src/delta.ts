@@ -0,0 +1,57 @@
+/**
+ * Applies the `result` patches `retentioneering/widgets/_delta.py` produces:
+ * a list of operations, each addressing a value by its `path` of object keys
+ * / array indices from the root of the parsed result.
+ *
+ *   set     — replace (or add) the value at `path`; [] replaces the root
+ *   del     — remove an object key
+ *   reindex — rebuild a square matrix for a new event list: new position i
+ *             is old position `index[i]`, or an all-null row/column for -1
+ *   cells   — overwrite individual cells `(rows[k], cols[k]) = values[k]`
+ */
+
+export type PatchOp =
+  | { op: "set"; path: PathKey[]; value: unknown }
+  | { op: "del"; path: PathKey[] }
+  | { op: "reindex"; path: PathKey[]; index: number[] }
+  | { op: "cells"; path: PathKey[]; rows: number[]; cols: number[]; values: unknown[] };
+
+type PathKey = string | number;
+type Container = Record<PathKey, unknown>;
+
+/** Replay `ops` on `root` (mutated where possible); returns the new root. */
+export function applyPatch(root: unknown, ops: PatchOp[]): unknown {
+  for (const op of ops) {
+    if (op.path.length === 0) {
+      if (op.op !== "set") throw new Error(`delta: ${op.op} needs a path`);
+      root = op.value;
+      continue;
+    }
+    let parent = root as Container;
+    for (const key of op.path.slice(0, -1)) parent = parent[key] as Container;
+    const key = op.path[op.path.length - 1];
+    switch (op.op) {
+      case "set":
+        parent[key] = op.value;
+        break;
+      case "del":
+        delete parent[key];
+        break;
+      case "reindex":
+        parent[key] = reindex(parent[key] as unknown[][], op.index);
+        break;
+      case "cells": {
+        const matrix = parent[key] as unknown[][];
+        for (let k = 0; k < op.rows.length; k++) matrix[op.rows[k]][op.cols[k]] = op.values[k];
+        break;
+      }
+      default:
+        throw new Error(`delta: unknown patch operation ${(op as { op: string }).op}`);
+    }
+  }
+  return root;
+}
+
+function reindex(matrix: unknown[][], index: number[]): unknown[][] {
+  return index.map((r) => index.map((c) => (r === -1 || c === -1 ? null : matrix[r][c])));
+}
@@ -0,0 +1,293 @@
+/**
+ * Decoder for the packed widget payloads `retentioneering/widgets/_payload.py`
+ * produces for large `result` values:
+ *
+ *   {"$packed": 1, "gzip": "<base64 gzip of the columnar JSON>"}
+ *
+ * where the columnar JSON carries numeric matrices as
+ * `{"$typed": "f8" | "i4", "shape": [...], "data": "<base64 little-endian>"}`
+ * (NaN standing for null) and repetitive string lists as
+ * `{"$dict": [...], "codes": <typed i4>}`.
+ *
+ * Hosts call `unpackJson()` on every value they hand out, so widget code keeps
+ * JSON.parse()-ing plain JSON strings and never sees the packed form. Decoding
+ * is lazy — only when a widget first reads the key — and cached per payload.
+ *
+ * Inflate is synchronous (host.get() is), so it can't use the browser's
+ * DecompressionStream; `inflateRaw` below is a small DEFLATE decoder after
+ * Joergen Ibsen's tinf.
+ */
+
+const PACKED_PREFIX = /^\s*\{\s*"\$packed"/;
+
+/** Recently unpacked payloads, oldest first — a page can show several widgets. */
+const unpacked = new Map<string, string>();
+const UNPACKED_MAX = 4;
+
+/** `raw` itself, or — for a packed payload — the plain JSON it stands for. */
+export function unpackJson(raw: string): string {
+  if (!PACKED_PREFIX.test(raw)) return raw;
+  let json = unpacked.get(raw);
+  if (json === undefined) {
+    json = JSON.stringify(unpackObject(JSON.parse(raw)));
+    if (unpacked.size >= UNPACKED_MAX) unpacked.delete(unpacked.keys().next().value as string);
+  } else {
+    unpacked.delete(raw);
+  }
+  unpacked.set(raw, json);
+  return json;
+}
+
+/** The payload behind a parsed `{"$packed": ...}` envelope; anything else as is. */
+export function unpackObject(value: unknown): unknown {
+  if (!isPacked(value)) return value;
+  const inner = new TextDecoder().decode(gunzip(base64ToBytes(value.gzip)));
+  return decodeColumns(JSON.parse(inner));
+}
+
+export function isPacked(value: unknown): value is { $packed: number; gzip: string } {
+  return value !== null && typeof value === "object" && "$packed" in value;
+}
+
+// ── columnar JSON ─────────────────────────────────────────────────────────────
+
+interface TypedSpec {
+  $typed: "f8" | "i4";
+  shape: number[];
+  data: string;
+}
+
+function decodeColumns(value: unknown): unknown {
+  if (Array.isArray(value)) return value.map(decodeColumns);
+  if (value === null || typeof value !== "object") return value;
+  const obj = value as Record<string, unknown>;
+  if ("$typed" in obj) return decodeTyped(obj as unknown as TypedSpec);
+  if ("$dict" in obj) {
+    const labels = obj.$dict as string[];
+    return (decodeTyped(obj.codes as TypedSpec) as number[]).map((code) => labels[code]);
+  }
+  const out: Record<string, unknown> = {};
+  for (const [key, v] of Object.entries(obj)) out[key] = decodeColumns(v);
+  return out;
+}
+
+function decodeTyped(spec: TypedSpec): unknown[] {
+  const bytes = base64ToBytes(spec.data);
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const n = spec.$typed === "f8" ? bytes.length / 8 : bytes.length / 4;
+  const flat: Array<number | null> = new Array(n);
+  for (let i = 0; i < n; i++) {
+    if (spec.$typed === "f8") {
+      const v = view.getFloat64(i * 8, true);
+      flat[i] = Number.isNaN(v) ? null : v;
+    } else {
+      flat[i] = view.getInt32(i * 4, true);
+    }
+  }
+  if (spec.shape.length === 1) return flat;
+  const [rows, cols] = spec.shape;
+  const out: Array<Array<number | null>> = new Array(rows);
+  for (let r = 0; r < rows; r++) out[r] = flat.slice(r * cols, (r + 1) * cols);
+  return out;
+}
+
+function base64ToBytes(b64: string): Uint8Array {
+  const bin = atob(b64);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  return bytes;
+}
+
+// ── gzip / DEFLATE ────────────────────────────────────────────────────────────
+
+/** Strip the gzip member header (RFC 1952) and inflate its DEFLATE body. */
+export function gunzip(src: Uint8Array): Uint8Array {
+  if (src[0] !== 0x1f || src[1] !== 0x8b || src[2] !== 8) {
+    throw new Error("payload: not a gzip stream");
+  }
+  const flags = src[3];
+  let pos = 10;
+  if (flags & 4) pos += 2 + (src[pos] | (src[pos + 1] << 8)); // FEXTRA
+  if (flags & 8) while (src[pos++] !== 0); // FNAME
+  if (flags & 16) while (src[pos++] !== 0); // FCOMMENT
+  if (flags & 2) pos += 2; // FHCRC
+  const end = src.length;
+  // ISIZE: uncompressed length mod 2^32, the last 4 bytes
+  const size = (src[end - 4] | (src[end - 3] << 8) | (src[end - 2] << 16) | (src[end - 1] << 24)) >>> 0;
+  return inflateRaw(src.subarray(pos, end - 8), new Uint8Array(size));
+}
+
+class Tree {
+  table = new Uint16Array(16); // code length -> number of codes
+  trans = new Uint16Array(288); // codes ordered by length, then value
+}
+
+class Reader {
+  pos = 0;
+  tag = 0;
+  bitcount = 0;
+  out = 0;
+  constructor(public src: Uint8Array, public dest: Uint8Array) {}
+
+  private fill() {
+    while (this.bitcount < 24) {
+      this.tag |= (this.src[this.pos++] ?? 0) << this.bitcount;
+      this.bitcount += 8;
+    }
+  }
+
+  bits(num: number, base: number): number {
+    if (!num) return base;
+    this.fill();
+    const val = this.tag & (0xffff >>> (16 - num));
+    this.tag >>>= num;
+    this.bitcount -= num;
+    return val + base;
+  }
+
+  symbol(t: Tree): number {
+    this.fill();
+    let sum = 0;
+    let cur = 0;
+    let len = 0;
+    let tag = this.tag;
+    do {
+      cur = 2 * cur + (tag & 1);
+      tag >>>= 1;
+      ++len;
+      sum += t.table[len];
+      cur -= t.table[len];
+    } while (cur >= 0);
+    this.tag = tag;
+    this.bitcount -= len;
+    return t.trans[sum + cur];
+  }
+}
+
+const LENGTH_BITS = new Uint8Array(30);
+const LENGTH_BASE = new Uint16Array(30);
+const DIST_BITS = new Uint8Array(30);
+const DIST_BASE = new Uint16Array(30);
+const CLC_ORDER = [16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15];
+
+function buildBitsBase(bits: Uint8Array, base: Uint16Array, delta: number, first: number) {
+  for (let i = 0; i < delta; i++) bits[i] = 0;
+  for (let i = 0; i < 30 - delta; i++) bits[i + delta] = (i / delta) | 0;
+  for (let sum = first, i = 0; i < 30; i++) {
+    base[i] = sum;
+    sum += 1 << bits[i];
+  }
+}
+buildBitsBase(LENGTH_BITS, LENGTH_BASE, 4, 3);
+buildBitsBase(DIST_BITS, DIST_BASE, 2, 1);
+LENGTH_BITS[28] = 0;
+LENGTH_BASE[28] = 258;
+
+const FIXED_LT = new Tree();
+const FIXED_DT = new Tree();
+(function buildFixedTrees() {
+  FIXED_LT.table[7] = 24;
+  FIXED_LT.table[8] = 152;
+  FIXED_LT.table[9] = 112;
+  for (let i = 0; i < 24; i++) FIXED_LT.trans[i] = 256 + i;
+  for (let i = 0; i < 144; i++) FIXED_LT.trans[24 + i] = i;
+  for (let i = 0; i < 8; i++) FIXED_LT.trans[24 + 144 + i] = 280 + i;
+  for (let i = 0; i < 112; i++) FIXED_LT.trans[24 + 144 + 8 + i] = 144 + i;
+  FIXED_DT.table[5] = 32;
+  for (let i = 0; i < 32; i++) FIXED_DT.trans[i] = i;
+})();
+
+function buildTree(t: Tree, lengths: Uint8Array, off: number, num: number) {
+  t.table.fill(0);
+  for (let i = 0; i < num; i++) t.table[lengths[off + i]]++;
+  t.table[0] = 0;
+  const offs = new Uint16Array(16);
+  for (let sum = 0, i = 0; i < 16; i++) {
+    offs[i] = sum;
+    sum += t.table[i];
+  }
+  for (let i = 0; i < num; i++) {
+    if (lengths[off + i]) t.trans[offs[lengths[off + i]]++] = i;
+  }
+}
+
+function decodeTrees(d: Reader, lt: Tree, dt: Tree) {
+  const hlit = d.bits(5, 257);
+  const hdist = d.bits(5, 1);
+  const hclen = d.bits(4, 4);
+  const lengths = new Uint8Array(288 + 32);
+  for (let i = 0; i < hclen; i++) lengths[CLC_ORDER[i]] = d.bits(3, 0);
+  const codeTree = new Tree();
+  buildTree(codeTree, lengths, 0, 19);
+  lengths.fill(0, 0, 19);
+
+  for (let num = 0; num < hlit + hdist; ) {
+    const sym = d.symbol(codeTree);
+    if (sym === 16) {
+      const prev = lengths[num - 1];
+      for (let n = d.bits(2, 3); n; n--) lengths[num++] = prev;
+    } else if (sym === 17) {
+      for (let n = d.bits(3, 3); n; n--) lengths[num++] = 0;
+    } else if (sym === 18) {
+      for (let n = d.bits(7, 11); n; n--) lengths[num++] = 0;
+    } else {
+      lengths[num++] = sym;
+    }
+  }
+  buildTree(lt, lengths, 0, hlit);
+  buildTree(dt, lengths, hlit, hdist);
+}
+
+function inflateBlock(d: Reader, lt: Tree, dt: Tree) {
+  for (;;) {
+    let sym = d.symbol(lt);
+    if (sym === 256) return;
+    if (sym < 256) {
+      d.dest[d.out++] = sym;
+    } else {
+      sym -= 257;
+      const length = d.bits(LENGTH_BITS[sym], LENGTH_BASE[sym]);
+      const dist = d.symbol(dt);
+      const from = d.out - d.bits(DIST_BITS[dist], DIST_BASE[dist]);
+      for (let i = from; i < from + length; i++) d.dest[d.out++] = d.dest[i];
+    }
+  }
+}
+
+function inflateStored(d: Reader) {
+  // Back up to the byte boundary: whole unread bytes sit in the bit buffer
+  while (d.bitcount >= 8) {
+    d.pos--;
+    d.bitcount -= 8;
+  }
+  const length = d.src[d.pos] | (d.src[d.pos + 1] << 8);
+  d.pos += 4; // LEN, NLEN
+  d.dest.set(d.src.subarray(d.pos, d.pos + length), d.out);
+  d.out += length;
+  d.pos += length;
+  d.tag = 0;
+  d.bitcount = 0;
+}
+
+/** Inflate a raw DEFLATE stream (RFC 1951) into `dest`, sized by the caller. */
+export function inflateRaw(src: Uint8Array, dest: Uint8Array): Uint8Array {
+  const d = new Reader(src, dest);
+  let final = 0;
+  do {
+    final = d.bits(1, 0);
+    const type = d.bits(2, 0);
+    if (type === 0) {
+      inflateStored(d);
+    } else if (type === 1) {
+      inflateBlock(d, FIXED_LT, FIXED_DT);
+    } else if (type === 2) {
+      const lt = new Tree();
+      const dt = new Tree();
+      decodeTrees(d, lt, dt);
+      inflateBlock(d, lt, dt);
+    } else {
+      throw new Error("payload: invalid DEFLATE block type");
+    }
+  } while (!final);
+  return d.out === dest.length ? dest : dest.subarray(0, d.out);
+}
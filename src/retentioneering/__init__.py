@@ -1,4 +1,5 @@
-from retentioneering import datasets, mcp
+import importlib
+
 from retentioneering.eventstream.eventstream import Eventstream
 from retentioneering.eventstream.schema import EventstreamSchema
 
@@ -10,3 +11,17 @@ except Exception:
     __version__ = "unknown"
 
 __all__ = ["Eventstream", "EventstreamSchema", "__version__", "datasets", "mcp"]
+
+# Imported on first access (PEP 562): `mcp` brings in the MCP SDK and its
+# server stack, which scripts that never serve an agent shouldn't pay for.
+_LAZY_SUBMODULES = ("datasets", "mcp")
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
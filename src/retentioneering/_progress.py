@@ -0,0 +1,66 @@
+"""Progress checkpoints for long-running library calls.
+
+Long computations (preprocessing chains, chunked metric passes, clustering)
+call `checkpoint("...")` between their stages. Outside a `reporting()` block
+that is a no-op. Inside one - the MCP server runs every tool call in one -
+each checkpoint is passed to the block's callback, and raises
+`OperationCancelledError` once the block's `cancelled` event is set: a
+worker thread cannot be interrupted, so the next checkpoint is where a
+cancelled or timed-out call actually stops.
+
+The active block lives in a context variable, like `_tracking.caller_context`,
+so concurrent calls on different threads never see each other's callback.
+"""
+
+import contextlib
+import contextvars
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from retentioneering.exceptions import OperationCancelledError
+
+
+@dataclass
+class _Reporter:
+    callback: Callable[[int, str], None] | None
+    cancelled: threading.Event
+    count: int = field(default=0)
+
+
+_reporter: contextvars.ContextVar[_Reporter | None] = contextvars.ContextVar(
+    "retentioneering_progress_reporter", default=None
+)
+
+
+@contextlib.contextmanager
+def reporting(
+    callback: Callable[[int, str], None] | None = None,
+    cancelled: threading.Event | None = None,
+) -> Iterator[threading.Event]:
+    """Route the checkpoints of the calls made inside this block to
+    `callback(n, message)`, `n` counting checkpoints from 1, and cancel them
+    by setting the yielded event. Restores the enclosing block on exit."""
+    reporter = _Reporter(callback, cancelled or threading.Event())
+    token = _reporter.set(reporter)
+    try:
+        yield reporter.cancelled
+    finally:
+        _reporter.reset(token)
+
+
+def checkpoint(message: str) -> None:
+    """Mark the start of a stage of a long computation. Never raises, except
+    `OperationCancelledError` when the enclosing `reporting()` block was
+    cancelled."""
+    reporter = _reporter.get()
+    if reporter is None:
+        return
+    if reporter.cancelled.is_set():
+        raise OperationCancelledError(message)
+    reporter.count += 1
+    if reporter.callback is not None:
+        try:
+            reporter.callback(reporter.count, message)
+        except Exception:
+            pass
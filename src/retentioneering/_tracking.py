@@ -1,5 +1,16 @@
-"""PostHog analytics tracking for retentioneering."""
-
+"""PostHog analytics tracking for retentioneering.
+
+Tracking stays off the caller's path: `track()` only stamps the event with
+its caller type and puts it on a bounded in-memory queue (dropping it when
+the queue is full), and a background thread hands queued events to the
+PostHog client, which is itself created on the first event. Base
+properties and the opt-out file/Colab checks are resolved on that thread
+too. Events a process fires more than `_SAMPLE_AFTER` times are sampled
+from then on (one in `_SAMPLE_EVERY`, tagged with `sample_rate`), so a
+processor applied in a tight loop doesn't flood the queue.
+"""
+
+import atexit
 import contextlib
 import contextvars
 import functools
@@ -8,8 +19,11 @@ import json
 import os
 import pathlib
 import platform
+import queue
 import sys
+import threading
 import uuid
+from collections import Counter
 
 from retentioneering.exceptions import RetentioneeringError
 
@@ -30,12 +44,29 @@ def _resolve_posthog_key() -> str:
 
 _KEY = _resolve_posthog_key()
 
-try:
-    from posthog import Posthog
+#: The PostHog client once built (None if that failed); `_NOT_BUILT` until the
+#: first event needs it, so importing the library never constructs one
+_NOT_BUILT = object()
+_ph = _NOT_BUILT
+_ph_lock = threading.Lock()
+
 
-    _ph = Posthog(project_api_key=_KEY, host=_HOST)
-except Exception:
-    _ph = None  # type: ignore[assignment]
+def _client():
+    global _ph
+    with _ph_lock:
+        if _ph is _NOT_BUILT:
+            try:
+                from posthog import Posthog
+
+                _ph = Posthog(project_api_key=_KEY, host=_HOST)
+            except Exception:
+                _ph = None
+            # atexit runs hooks last-in-first-out: moved after the client's
+            # own hook, ours runs first and hands over what's still queued
+            # before the client flushes and shuts down
+            atexit.unregister(_flush_at_exit)
+            atexit.register(_flush_at_exit)
+        return _ph
 
 
 # ── distinct_id ────────────────────────────────────────────────────────────────
@@ -147,24 +178,26 @@ def _lib_version() -> str:
 
 _DISTINCT_ID, _DISTINCT_ID_TYPE = _distinct_id()
 
-_BASE_PROPS: dict = {
-    "lib_version": _lib_version(),
-    "os": platform.system(),
-    "os_version": platform.release(),
-    "python_version": platform.python_version(),
-    "env": _detect_env(),
-    "distinct_id_type": _DISTINCT_ID_TYPE,
-}
-
-_kernel = _kernel_id()
-if _kernel:
-    _BASE_PROPS["kernel_id"] = _kernel
 
-if _script_path_hash_val := _script_path_hash():
-    _BASE_PROPS["script_path_hash"] = _script_path_hash_val
-
-if _command_hash_val := _command_hash():
-    _BASE_PROPS["command_hash"] = _command_hash_val
+@functools.cache
+def _base_props() -> dict:
+    """Properties sent with every event. Computed once, on the tracking
+    thread: `_kernel_id` imports ipykernel."""
+    props = {
+        "lib_version": _lib_version(),
+        "os": platform.system(),
+        "os_version": platform.release(),
+        "python_version": platform.python_version(),
+        "env": _detect_env(),
+        "distinct_id_type": _DISTINCT_ID_TYPE,
+    }
+    if kernel := _kernel_id():
+        props["kernel_id"] = kernel
+    if script_path_hash := _script_path_hash():
+        props["script_path_hash"] = script_path_hash
+    if command_hash := _command_hash():
+        props["command_hash"] = command_hash
+    return props
 
 
 # ── opt-out ────────────────────────────────────────────────────────────────────
@@ -215,16 +248,111 @@ def caller_context(caller_type: str):
 
 _depth = 0  # global call depth counter — suppresses nested tracked calls
 
+#: Events waiting for the tracking thread; full means new events are dropped
+_QUEUE_SIZE = 10_000
+_queue: "queue.Queue[tuple[str, str, dict | None]]" = queue.Queue(_QUEUE_SIZE)
+_dropped = 0
+
+#: Occurrences of one event name a process sends in full before sampling it
+_SAMPLE_AFTER = 100
+#: Beyond `_SAMPLE_AFTER`, one occurrence in this many is sent
+_SAMPLE_EVERY = 100
+_event_counts: Counter = Counter()
+
+_wakeup = threading.Event()
+# Taken while a batch is drained and delivered, so flush() returns only once
+# everything queued before it has reached the client, in order
+_deliver_lock = threading.Lock()
+_thread: threading.Thread | None = None
+_thread_lock = threading.Lock()
+
 
 def track(event: str, properties: dict | None = None) -> None:
-    """Fire-and-forget PostHog event. Never raises."""
-    if _ph is None or _no_track_requested():
+    """Fire-and-forget PostHog event, queued for the tracking thread.
+    Never raises."""
+    global _dropped
+    if _ph is None or os.environ.get("RETENTIONEERING_NO_TRACK"):
         return
-    props = {**_BASE_PROPS, "caller_type": _caller_type.get(), **(properties or {})}
     try:
-        _ph.capture(distinct_id=_DISTINCT_ID, event=event, properties=props)
+        status = (properties or {}).get("status")
+        if status != "error":
+            # Counter increments are not atomic across threads; a miscount
+            # only shifts which occurrence is sampled
+            n = _event_counts[event] = _event_counts[event] + 1
+            if n > _SAMPLE_AFTER:
+                if n % _SAMPLE_EVERY:
+                    return
+                properties = {**(properties or {}), "sample_rate": 1 / _SAMPLE_EVERY}
+        _queue.put_nowait((event, _caller_type.get(), properties))
+    except queue.Full:
+        _dropped += 1
+        return
     except Exception:
-        pass
+        return
+    _ensure_thread()
+    _wakeup.set()
+
+
+def flush() -> None:
+    """Hand every queued event to the PostHog client now. Never raises."""
+    _deliver()
+
+
+def _ensure_thread() -> None:
+    global _thread
+    if _thread is not None:
+        return
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_run, name="retentioneering-tracking", daemon=True
+            )
+            _thread.start()
+            atexit.register(_flush_at_exit)
+
+
+def _flush_at_exit() -> None:
+    """The one exit hook: registered with the tracking thread, and moved
+    after the client's own hook once the client is built."""
+    built_before = _ph is not _NOT_BUILT
+    flush()
+    if not built_before and _ph not in (None, _NOT_BUILT):
+        # Built during exit, too late for its own exit hook to run
+        try:
+            _ph.flush(timeout_seconds=1.0)
+        except Exception:
+            pass
+
+
+def _run() -> None:
+    while True:
+        _wakeup.wait()
+        _wakeup.clear()
+        _deliver()
+
+
+def _deliver() -> None:
+    with _deliver_lock:
+        batch = []
+        while True:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        try:
+            if _no_track_requested():
+                return
+            ph = _client()
+            if ph is None:
+                return
+            base = _base_props()
+            for event, caller_type, properties in batch:
+                props = {**base, "caller_type": caller_type, **(properties or {})}
+                ph.capture(distinct_id=_DISTINCT_ID, event=event, properties=props)
+        except Exception:
+            pass
 
 
 def identify(properties: dict | None = None) -> None:
@@ -232,7 +360,9 @@ def identify(properties: dict | None = None) -> None:
     if _ph is None or _no_track_requested():
         return
     try:
-        _ph.identify(_DISTINCT_ID, properties=properties or {})
+        ph = _client()
+        if ph is not None:
+            ph.identify(_DISTINCT_ID, properties=properties or {})
     except Exception:
         pass
 
@@ -275,6 +405,55 @@ def _split_args(
     return default_args, non_default_args
 
 
+class _ArgSplitter:
+    """`_split_args` for one function, with the signature walked once.
+
+    The common call shapes — plain positional and keyword arguments — are
+    matched against the precomputed parameter list directly instead of
+    through `Signature.bind`; anything else (positional-only or variadic
+    parameters, arguments that wouldn't bind) takes `_split_args`.
+    """
+
+    def __init__(self, sig: inspect.Signature) -> None:
+        self.sig = sig
+        params = list(sig.parameters.values())
+        self.simple = all(
+            p.kind
+            in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+            for p in params
+        )
+        self.positional = [
+            p.name for p in params if p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ]
+        self.names = frozenset(p.name for p in params)
+        self.required = [p.name for p in params if p.default is inspect.Parameter.empty]
+        self.defaults = [
+            (p.name, p.default)
+            for p in params
+            if p.name not in ("self", "cls")
+            and p.default is not inspect.Parameter.empty
+        ]
+
+    def __call__(self, args: tuple, kwargs: dict) -> tuple[list[str], list[str]]:
+        if not self.simple or len(args) > len(self.positional):
+            return _split_args(self.sig, args, kwargs)
+        bound = dict(zip(self.positional, args))
+        for name in kwargs:
+            if name in bound or name not in self.names:
+                return _split_args(self.sig, args, kwargs)
+        bound.update(kwargs)
+        if any(name not in bound for name in self.required):
+            return [], []
+        default_args: list[str] = []
+        non_default_args: list[str] = []
+        for name, default in self.defaults:
+            if name not in bound or _is_default(bound[name], default):
+                default_args.append(name)
+            else:
+                non_default_args.append(name)
+        return default_args, non_default_args
+
+
 def _error_type_name(exc: Exception) -> str:
     """The library's stable `error_code` for RetentioneeringError (survives class
     renames/refactors), else the qualified exception class name — never str(exc),
@@ -306,7 +485,7 @@ def tracked(event_name: str, condition=None, props_fn=None):
     """
 
     def decorator(func):
-        sig = inspect.signature(func)
+        split_args = _ArgSplitter(inspect.signature(func))
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -314,7 +493,7 @@ def tracked(event_name: str, condition=None, props_fn=None):
             skip = _depth > 0 or (condition is not None and not condition(args[0]))
             if skip:
                 return func(*args, **kwargs)
-            default_args, non_default_args = _split_args(sig, args, kwargs)
+            default_args, non_default_args = split_args(args, kwargs)
             base_props = {
                 "default_args": default_args,
                 "non_default_args": non_default_args,
@@ -9,10 +9,12 @@ from typing import Any, Dict, List, Literal, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.cluster import HDBSCAN, KMeans
-from sklearn.decomposition import NMF
+from sklearn.cluster import HDBSCAN, KMeans, MiniBatchKMeans
+from sklearn.decomposition import NMF, MiniBatchNMF
+from sklearn.neighbors import NearestNeighbors
 from sklearn.preprocessing import MinMaxScaler, StandardScaler
 
+from retentioneering._progress import checkpoint
 from retentioneering.data_processors.data_processor import DataProcessor
 from retentioneering.eventstream.schema import EventstreamSchema
 from retentioneering.exceptions import PreprocessingConfigError
@@ -40,6 +42,8 @@ class AddClusters(DataProcessor):
         method_params: Parameters for the clustering algorithm
         eventstream: Eventstream instance (needed for MetricBuilder)
         path_col: Path ID column name (optional)
+        batch_size: Paths per chunk in batch mode, or None to cluster every
+            path in one go
     """
 
     name: str
@@ -50,6 +54,7 @@ class AddClusters(DataProcessor):
     nmf_components: int | None
     eventstream: Any
     path_col: str | None
+    batch_size: int | None
 
     def __init__(
         self,
@@ -61,6 +66,7 @@ class AddClusters(DataProcessor):
         scaler: T_Scaler = "minmax",
         nmf_components: int | None = None,
         path_col: str | None = None,
+        batch_size: int | None = None,
     ) -> None:
         """
         Initialize AddClusters processor.
@@ -83,6 +89,13 @@ class AddClusters(DataProcessor):
             scaler: Feature scaler - "minmax", "std", or None. Default is "minmax".
                      "standard" is accepted as a legacy alias of "std".
             path_col: Path ID column (if None, taken from schema)
+            batch_size: When set, features are computed and clustered in
+                     chunks of this many paths, so the feature matrix is
+                     never built for every path at once. "kmeans" becomes
+                     MiniBatchKMeans (so `batch_size` must be at least
+                     `n_clusters`), and "hdbscan" is fitted on a random
+                     sample of `batch_size` paths, every other path taking
+                     the label of its nearest sampled neighbour.
         """
         self.eventstream = eventstream
         self.name = name
@@ -91,6 +104,17 @@ class AddClusters(DataProcessor):
         self.scaler = scaler
         self.nmf_components = nmf_components
         self.path_col = path_col
+        self.batch_size = batch_size
+
+        if batch_size is not None and (
+            isinstance(batch_size, bool)
+            or not isinstance(batch_size, int)
+            or batch_size < 1
+        ):
+            raise PreprocessingConfigError(
+                PROCESSOR_NAME,
+                f"batch_size must be a positive int or None, got {batch_size!r}",
+            )
 
         self.method_params = parse_method_args(
             method,
@@ -102,6 +126,18 @@ class AddClusters(DataProcessor):
                 PROCESSOR_NAME,
                 "method_args={'n_clusters': ...} is required for the 'kmeans' method",
             )
+        if (
+            method == "kmeans"
+            and batch_size is not None
+            and batch_size < self.method_params["n_clusters"]
+        ):
+            # The first chunk initialises MiniBatchKMeans' centroids, one per
+            # cluster, so it has to hold at least as many paths as clusters
+            raise PreprocessingConfigError(
+                PROCESSOR_NAME,
+                f"batch_size ({batch_size}) must be at least n_clusters "
+                f"({self.method_params['n_clusters']}) for the 'kmeans' method",
+            )
 
         super().__init__()
 
@@ -134,6 +170,11 @@ class AddClusters(DataProcessor):
 
         # Build features using MetricBuilder
         metric_builder = MetricBuilder(self.eventstream)
+        if self.batch_size is not None:
+            cluster_series = self._cluster_in_batches(metric_builder, path_col)
+            return self._add_labels(df, schema, path_col, cluster_series)
+
+        checkpoint("clustering: computing features")
         metrics_df = metric_builder.build_metrics(self.features, path_col)
 
         if metrics_df.empty:
@@ -159,6 +200,7 @@ class AddClusters(DataProcessor):
             features_scaled = nmf.fit_transform(features_scaled)
 
         # Perform clustering
+        checkpoint(f"clustering: fitting {self.method}")
         cluster_labels = self._cluster(features_scaled)
 
         # Create cluster labels Series indexed by path_id
@@ -171,7 +213,16 @@ class AddClusters(DataProcessor):
         cluster_series = cluster_series.apply(
             lambda x: f"cluster_{x}" if x >= 0 else "noise"
         )
+        return self._add_labels(df, schema, path_col, cluster_series)
 
+    def _add_labels(
+        self,
+        df: pd.DataFrame,
+        schema: EventstreamSchema,
+        path_col: str,
+        cluster_series: pd.Series,
+    ) -> Tuple[pd.DataFrame, EventstreamSchema]:
+        """Broadcast per-path labels to every row and register the segment."""
         # Map cluster labels to all events in the dataframe
         new_df = df.copy()
         new_df[self.name] = new_df[path_col].map(cluster_series)
@@ -183,30 +234,127 @@ class AddClusters(DataProcessor):
 
         return new_df, new_schema
 
-    def _scale_features(self, features: np.ndarray) -> np.ndarray:
+    def _cluster_in_batches(
+        self, metric_builder: MetricBuilder, path_col: str
+    ) -> pd.Series:
         """
-        Scale features based on the configured method.
+        Batch mode: cluster every path without holding all features at once.
 
-        Args:
-            features: Raw feature matrix
+        Features are recomputed per chunk on every pass instead of being kept
+        between passes - keeping them would bring back the full matrix this
+        mode exists to avoid. The scaler and then NMF are fitted incrementally
+        (`partial_fit`), one pass each, k-means is fitted as MiniBatchKMeans
+        in the next one, and a last pass assigns labels chunk by chunk.
+        HDBSCAN has no incremental fit or `predict`, so it is fitted on one
+        random sample of `batch_size` paths and every other path is labelled
+        after its nearest sampled neighbour (noise included).
 
         Returns:
-            Scaled feature matrix
+            Series of cluster labels ("cluster_0", ..., "noise") indexed by path id
         """
+
+        def chunks(paths=None):
+            return metric_builder.iter_metrics(
+                self.features, path_col, chunk_size=self.batch_size, paths=paths
+            )
+
+        scaler = self._make_scaler()
+        if scaler is not None:
+            for metrics_df in chunks():
+                scaler.partial_fit(self._feature_matrix(metrics_df))
+
+        def scale(metrics_df: pd.DataFrame) -> np.ndarray:
+            features = self._feature_matrix(metrics_df)
+            return scaler.transform(features) if scaler is not None else features
+
+        # NMF is fitted on scaled features, so it takes its own pass once the
+        # scaler has seen every chunk.
+        nmf = None
+        if self.nmf_components is not None:
+            nmf = MiniBatchNMF(n_components=self.nmf_components, random_state=42)
+            for metrics_df in chunks():
+                nmf.partial_fit(scale(metrics_df))
+
+        def transform(metrics_df: pd.DataFrame) -> np.ndarray:
+            features = scale(metrics_df)
+            return nmf.transform(features) if nmf is not None else features
+
+        if self.method == "kmeans":
+            kmeans = MiniBatchKMeans(
+                n_clusters=self.method_params["n_clusters"],
+                batch_size=self.batch_size,
+                random_state=42,
+                n_init="auto",
+            )
+            for metrics_df in chunks():
+                kmeans.partial_fit(transform(metrics_df))
+            predict = kmeans.predict
+        elif self.method == "hdbscan":
+            all_paths = self.eventstream.df[path_col].unique()
+            rng = np.random.default_rng(42)
+            sample = rng.choice(
+                all_paths, size=min(self.batch_size, len(all_paths)), replace=False
+            )
+            (sample_df,) = chunks(paths=sample)
+            sample_features = transform(sample_df)
+            sample_labels = self._cluster(sample_features)
+            neighbors = NearestNeighbors(n_neighbors=1).fit(sample_features)
+
+            def predict(features: np.ndarray) -> np.ndarray:
+                nearest = neighbors.kneighbors(features, return_distance=False)
+                return sample_labels[nearest[:, 0]]
+        else:
+            raise PreprocessingConfigError(
+                PROCESSOR_NAME, f"Unknown clustering method: {self.method}"
+            )
+
+        labelled = []
+        for metrics_df in chunks():
+            labels = predict(transform(metrics_df))
+            names = np.where(
+                labels >= 0, np.char.add("cluster_", labels.astype(str)), "noise"
+            )
+            labelled.append(pd.Series(names, index=metrics_df.index))
+        return pd.concat(labelled).rename(self.name)
+
+    def _feature_matrix(self, metrics_df: pd.DataFrame) -> np.ndarray:
+        """Feature values of one chunk, NaN filled with 0 as in the one-shot path."""
+        if metrics_df.empty or metrics_df.shape[1] == 0:
+            raise PreprocessingConfigError(
+                PROCESSOR_NAME,
+                "No features were computed. Check metric configurations.",
+            )
+        return metrics_df.fillna(0).values
+
+    def _make_scaler(self) -> MinMaxScaler | StandardScaler | None:
+        """Unfitted scaler for the configured method, for incremental fitting."""
         method = normalize_scaler(self.scaler)
         if method is None:
-            return features
+            return None
         elif method == "minmax":
-            scaler = MinMaxScaler()
-            return scaler.fit_transform(features)
+            return MinMaxScaler()
         elif method == "std":
-            scaler = StandardScaler()
-            return scaler.fit_transform(features)
+            return StandardScaler()
         else:
             raise PreprocessingConfigError(
                 PROCESSOR_NAME, f"Unknown scaler method: {self.scaler}"
             )
 
+    def _scale_features(self, features: np.ndarray) -> np.ndarray:
+        """
+        Scale features based on the configured method.
+
+        Args:
+            features: Raw feature matrix
+
+        Returns:
+            Scaled feature matrix
+        """
+        scaler = self._make_scaler()
+        if scaler is None:
+            return features
+        return scaler.fit_transform(features)
+
     def _cluster(self, features: np.ndarray) -> np.ndarray:
         """
         Perform clustering using the configured method.
@@ -1,5 +1,6 @@
 from typing import Callable, Collection, Tuple
 
+import numpy as np
 import pandas as pd
 
 from retentioneering import engine
@@ -63,23 +64,28 @@ def _inject_row_idx(sql: str) -> str:
     )
 
 
-def _build_funnel_segment_query(
+def _funnel_levels(
+    df: pd.DataFrame,
     path_col: str,
     event_col: str,
     index_col: str,
     funnel_events: list[str],
-    result_col: str,
-) -> str:
+) -> np.ndarray:
     """
-    Per-row DuckDB query, chained-CTE approach identical in spirit to
-    tools/funnel.py: a path reaches step k iff there exist event indices
-    i_0 < i_1 < ... < i_k with event(i_j) = funnel_events[j] — i.e. an
-    increasing subsequence of positions, not a comparison of *last*
-    occurrences. step_k holds, per path, the earliest occurrence of
-    funnel_events[k - 1] that comes strictly after the path's step_{k - 1}
-    match. This correctly handles paths that revisit an earlier funnel
-    event after completing a later one (see funnel.py's
-    test_funnel_repeated_event_after_step for the equivalent regression).
+    The funnel level of every row of `df`, in row order.
+
+    A path reaches step k iff there exist event indices i_0 < i_1 < ... < i_k
+    with event(i_j) = funnel_events[j] — an increasing subsequence of
+    positions, not a comparison of *last* occurrences. Matching each step at
+    its earliest occurrence after the previous step's match is enough to find
+    the longest such prefix, so the scan only keeps, per path, how many steps
+    it has matched and the index of the last match. A step then reads just
+    the rows of its own event and keeps, per path still at that depth, the
+    earliest one past the previous match - no join of the log against itself,
+    and the rows never leave their order, so there is nothing to re-sort.
+    This correctly handles paths that revisit an earlier funnel event after
+    completing a later one (see funnel.py's test_funnel_repeated_event_after_step
+    for the equivalent regression).
 
     path_cols is validated (coarsest-first, strictly nested) at Eventstream
     construction time, and the caller restricts path_col to schema.path_cols,
@@ -90,95 +96,31 @@ def _build_funnel_segment_query(
       funnel_events[k]  — path completed steps 0..k in order, but not step k+1
                           in order (missing, or out of sequence)
       'out_of_funnel'   — path never completed step 0 in order
-
-    Reads from the 'eventstream' variable in caller scope (same as sql= mode).
-    Row order is restored via _ROW_IDX_COL.
-
-    Example output for funnel_events=['add_to_cart', 'purchase'], path_id='session',
-    event='event', index='__index__':
-
-        WITH step_1 AS (
-                SELECT "session" AS path_id, MIN("__index__") AS idx
-                FROM eventstream WHERE "event" = 'add_to_cart' GROUP BY "session"
-             ),
-             step_2 AS (
-                SELECT eventstream."session" AS path_id, MIN(eventstream."__index__") AS idx
-                FROM eventstream JOIN step_1 ON eventstream."session" = step_1.path_id
-                WHERE eventstream."event" = 'purchase' AND eventstream."__index__" > step_1.idx
-                GROUP BY eventstream."session"
-             ),
-             paths AS (SELECT DISTINCT "session" AS path_id FROM eventstream),
-             levels AS (
-                SELECT paths.path_id,
-                    CASE
-                        WHEN step_2.idx IS NOT NULL THEN 'purchase'
-                        WHEN step_1.idx IS NOT NULL THEN 'add_to_cart'
-                        ELSE 'out_of_funnel'
-                    END AS funnel
-                FROM paths
-                LEFT JOIN step_1 ON step_1.path_id = paths.path_id
-                LEFT JOIN step_2 ON step_2.path_id = paths.path_id
-             )
-        SELECT eventstream.__retentioneering_row_idx__, levels.funnel
-        FROM eventstream
-        JOIN levels ON eventstream."session" = levels.path_id
     """
-    path_col_q = engine.quote_ident(path_col)
-    event_col_q = engine.quote_ident(event_col)
-    index_col_q = engine.quote_ident(index_col)
-    n = len(funnel_events)
-
-    ctes = []
-    for step_num, step_event in enumerate(funnel_events, start=1):
-        ev = quote_literal(step_event)
-        if step_num == 1:
-            ctes.append(
-                f"step_1 AS ("
-                f"SELECT {path_col_q} AS path_id, MIN({index_col_q}) AS idx "
-                f"FROM eventstream "
-                f"WHERE {event_col_q} = {ev} "
-                f"GROUP BY {path_col_q}"
-                f")"
-            )
-        else:
-            prev = f"step_{step_num - 1}"
-            ctes.append(
-                f"step_{step_num} AS ("
-                f"SELECT eventstream.{path_col_q} AS path_id, MIN(eventstream.{index_col_q}) AS idx "
-                f"FROM eventstream "
-                f"JOIN {prev} ON eventstream.{path_col_q} = {prev}.path_id "
-                f"WHERE eventstream.{event_col_q} = {ev} AND eventstream.{index_col_q} > {prev}.idx "
-                f"GROUP BY eventstream.{path_col_q}"
-                f")"
-            )
-
-    ctes.append(f"paths AS (SELECT DISTINCT {path_col_q} AS path_id FROM eventstream)")
-
-    joins = " ".join(
-        f"LEFT JOIN step_{k} ON step_{k}.path_id = paths.path_id"
-        for k in range(1, n + 1)
-    )
-    whens = "\n        ".join(
-        f"WHEN step_{k}.idx IS NOT NULL THEN {quote_literal(funnel_events[k - 1])}"
-        for k in range(n, 0, -1)
-    )
-    ctes.append(
-        f"levels AS ("
-        f"SELECT paths.path_id,\n"
-        f"    CASE\n"
-        f"        {whens}\n"
-        f"        ELSE 'out_of_funnel'\n"
-        f"    END AS {result_col}\n"
-        f"FROM paths {joins}"
-        f")"
-    )
-
-    return (
-        f"WITH {', '.join(ctes)}\n"
-        f"SELECT eventstream.{_ROW_IDX_COL}, levels.{result_col}\n"
-        f"FROM eventstream\n"
-        f"JOIN levels ON eventstream.{path_col_q} = levels.path_id"
-    )
+    path_codes, path_ids = pd.factorize(df[path_col])
+    index = df[index_col].to_numpy(dtype=np.int64)
+    events = df[event_col]
+
+    # Per path: steps matched so far, and the index of the last match
+    depth = np.zeros(len(path_ids), dtype=np.int64)
+    last_idx = np.full(len(path_ids), np.iinfo(np.int64).min, dtype=np.int64)
+    no_match = np.iinfo(np.int64).max
+    for step, step_event in enumerate(funnel_events):
+        rows = np.flatnonzero((events == step_event).to_numpy(dtype=bool))
+        rows = rows[path_codes[rows] >= 0]
+        paths = path_codes[rows]
+        rows = rows[(depth[paths] == step) & (index[rows] > last_idx[paths])]
+        if not len(rows):
+            break
+        match_idx = np.full(len(path_ids), no_match, dtype=np.int64)
+        np.minimum.at(match_idx, path_codes[rows], index[rows])
+        matched = match_idx != no_match
+        depth[matched] = step + 1
+        last_idx[matched] = match_idx[matched]
+
+    levels = np.array(["out_of_funnel", *funnel_events], dtype=object)
+    row_depth = np.where(path_codes >= 0, depth[path_codes], 0)
+    return levels[row_depth]
 
 
 _BIN_KEYS = frozenset({"metric", "edges", "quantiles", "segment_levels"})
@@ -456,19 +398,9 @@ class AddSegment(DataProcessor):
                     PROCESSOR_NAME,
                     f"path_col '{pid_col}' must be one of schema.path_cols: {schema.path_cols}.",
                 )
-            # Add row index so we can restore original order after DuckDB execution
-            eventstream = df.copy()
-            eventstream[_ROW_IDX_COL] = range(len(df))
-            query = _build_funnel_segment_query(
-                pid_col,
-                schema.event_col,
-                schema.index,
-                self.funnel_events,
-                "__funnel_level__",
+            values = _funnel_levels(
+                df, pid_col, schema.event_col, schema.index, self.funnel_events
             )
-            result = engine.run(query, eventstream=eventstream)
-            result = result.sort_values(_ROW_IDX_COL).reset_index(drop=True)
-            values = result["__funnel_level__"].tolist()
 
         elif self.time_range is not None:
             start, end = self.time_range
@@ -1,5 +1,6 @@
-from typing import Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 from retentioneering import engine
@@ -167,10 +168,61 @@ class FilterEvents(DataProcessor):
                 "Either 'keep', 'drop', 'func', or 'sql' must be provided.",
             )
 
-        # duckdb sets all pandas categorical columns as ordered; setting them back to unordered
-        for col in [schema.event_col] + schema.segment_cols:
-            df[col] = df[col].astype("category")
-            df[col] = df[col].cat.remove_unused_categories()
-            df[col] = df[col].cat.as_unordered()
-
-        return df, schema
+        return _restore_categoricals(df, schema), schema
+
+
+def _restore_categoricals(df: pd.DataFrame, schema: EventstreamSchema) -> pd.DataFrame:
+    # duckdb sets all pandas categorical columns as ordered; setting them back to unordered
+    for col in [schema.event_col] + schema.segment_cols:
+        df[col] = df[col].astype("category")
+        df[col] = df[col].cat.remove_unused_categories()
+        df[col] = df[col].cat.as_unordered()
+    return df
+
+
+def keep_paths(
+    df: pd.DataFrame, schema: EventstreamSchema, path_ids: Any, path_col: str
+) -> pd.DataFrame:
+    """
+    The rows of `df` whose `path_col` is in `path_ids` - what
+    `FilterEvents(keep={path_col: path_ids})` returns, for id sets the library
+    computed itself (the paths a condition or pattern matched).
+
+    `keep=` renders every value as a SQL literal into an `IN (...)` list and
+    first checks each one against the column's values in Python, which is
+    right for a handful of user-typed values and ruinous for millions of ids.
+    Here the ids are registered as a one-column frame and joined against
+    instead (a hash semi-join), and nothing is validated: ids that came out of
+    this very frame cannot be unknown.
+    """
+    path_ids = pd.DataFrame({"path_id": pd.unique(np.asarray(path_ids))})
+    return keep_paths_matching(
+        df, schema, "select path_id from path_ids", path_col, path_ids=path_ids
+    )
+
+
+def keep_paths_matching(
+    df: pd.DataFrame,
+    schema: EventstreamSchema,
+    paths_sql: str,
+    path_col: str,
+    **tables: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    The rows of `df` whose `path_col` is among the ids `paths_sql` selects.
+
+    `paths_sql` is a one-column query run inside the same statement, over
+    `df` and any extra `tables`, so the kept ids never leave the engine - the
+    shape `filter_paths` needs to evaluate its condition and filter in one go.
+    """
+    order_by = (
+        f"{engine.quote_ident(schema.path_col)}, "
+        f"{engine.quote_ident(schema.index)}, "
+        f"{engine.quote_ident(schema.subindex)}"
+    )
+    query = f"""
+        select * from df
+        where {engine.quote_ident(path_col)} in ({paths_sql})
+        order by {order_by}
+    """
+    return _restore_categoricals(engine.run(query, df=df, **tables), schema)
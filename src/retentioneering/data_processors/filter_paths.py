@@ -1,6 +1,7 @@
 import pandas as pd
 from typing import Any, Dict, List, Tuple
 
+from retentioneering import engine
 from retentioneering.data_processors.data_processor import DataProcessor
 from retentioneering.eventstream.schema import EventstreamSchema
 from retentioneering.exceptions import PreprocessingConfigError
@@ -45,3 +46,12 @@ class FilterPaths(DataProcessor):
 
     def _get_where_condition(self, node: Dict[str, Any]) -> str:
         return ast_to_sql(node, PROCESSOR_NAME)
+
+    def _get_paths_query(self, metrics_sql: str, path_col: str) -> str:
+        """The ids of the paths satisfying the condition, as one query over
+        the per-path metrics query (`MetricBuilder.metrics_sql`)"""
+        where_condition = self._get_where_condition(self.condition)
+        return f"""
+            WITH metrics AS ({metrics_sql})
+            SELECT {engine.quote_ident(path_col)} FROM metrics WHERE {where_condition}
+        """
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Literal, Tuple
 
 import pandas as pd
 
@@ -7,9 +7,12 @@ from retentioneering import engine
 from retentioneering.data_processors.data_processor import DataProcessor
 from retentioneering.eventstream.schema import EventstreamSchema
 from retentioneering.exceptions import PreprocessingConfigError
+from retentioneering.utils.sampling import hash_sample
 
 PROCESSOR_NAME = "sample_paths"
 
+T_SampleMethod = Literal["reservoir", "hash"]
+
 
 @dataclass
 class SamplePaths(DataProcessor):
@@ -17,6 +20,7 @@ class SamplePaths(DataProcessor):
     frac: float | None
     random_state: int | None
     path_col: str | None
+    method: T_SampleMethod
 
     def __init__(
         self,
@@ -24,6 +28,7 @@ class SamplePaths(DataProcessor):
         frac: float | None = None,
         random_state: int | None = None,
         path_col: str | None = None,
+        method: T_SampleMethod = "reservoir",
     ) -> None:
         if (n is None) == (frac is None):
             raise PreprocessingConfigError(
@@ -42,11 +47,16 @@ class SamplePaths(DataProcessor):
                 raise PreprocessingConfigError(
                     PROCESSOR_NAME, "Argument 'frac' must be in the range (0.0, 1.0]."
                 )
+        if method not in ("reservoir", "hash"):
+            raise PreprocessingConfigError(
+                PROCESSOR_NAME, "Argument 'method' must be 'reservoir' or 'hash'."
+            )
 
         self.n = n
         self.frac = float(frac) if frac is not None else None
         self.random_state = random_state
         self.path_col = path_col
+        self.method = method
         super().__init__()
 
     def apply(
@@ -57,6 +67,23 @@ class SamplePaths(DataProcessor):
         if self.frac == 1.0:
             return df, schema
 
+        if self.method == "hash":
+            # A filter on a seeded hash of the path id: no single-threaded
+            # reservoir, and the same paths for the same seed on every run
+            df = hash_sample(
+                df, path_col, self.frac, seed=self.random_state or 0, n=self.n
+            )
+        else:
+            df = self._reservoir_sample(df, path_col)
+
+        for col in [schema.event_col] + schema.segment_cols:
+            df[col] = df[col].astype("category")
+            df[col] = df[col].cat.remove_unused_categories()
+            df[col] = df[col].cat.as_unordered()
+
+        return df, schema
+
+    def _reservoir_sample(self, df: pd.DataFrame, path_col: str) -> pd.DataFrame:
         path_col_q = engine.quote_ident(path_col)
 
         query_template = """
@@ -87,11 +114,4 @@ class SamplePaths(DataProcessor):
             set_threads=set_threads,
         )
 
-        df = engine.run(query, df=df)
-
-        for col in [schema.event_col] + schema.segment_cols:
-            df[col] = df[col].astype("category")
-            df[col] = df[col].cat.remove_unused_categories()
-            df[col] = df[col].cat.as_unordered()
-
-        return df, schema
+        return engine.run(query, df=df)
@@ -1,4 +1,4 @@
 from retentioneering.datasets import ecom
-from retentioneering.datasets.ecom import load_ecom
+from retentioneering.datasets.ecom import generate_ecom, iter_ecom, load_ecom
 
-__all__ = ["ecom", "load_ecom"]
+__all__ = ["ecom", "generate_ecom", "iter_ecom", "load_ecom"]
@@ -37,16 +37,26 @@ Pass `as_dataframe=True` for the raw `pd.DataFrame` instead:
 ...         "platform", "acquisition_channel", "user_cohort", "user_lifecycle",
 ...     ],
 ... })
+
+`generate_ecom` simulates the same model for any number of users, in
+vectorized batches, streaming to Parquet when the result won't fit in memory:
+
+>>> stream = rete.datasets.generate_ecom(n_users=50_000, seed=1)
+>>> rete.datasets.generate_ecom(n_users=10_000_000, path="ecom_10m.parquet")
 """
 
 from __future__ import annotations
 
+import os
 import pathlib
 import typing
 
 import numpy as np
 import pandas as pd
 
+from retentioneering._progress import checkpoint
+from retentioneering.exceptions import InvalidParameterError
+
 if typing.TYPE_CHECKING:
     from retentioneering.eventstream.eventstream import Eventstream
 
@@ -214,6 +224,499 @@ def _generate_ecom(n_users: int = 600, seed: int = 42) -> pd.DataFrame:
     return df
 
 
+# ---------------------------------------------------------------------------
+# Vectorized generator (any number of users)
+# ---------------------------------------------------------------------------
+
+#: Users simulated from one random stream. Each block's stream is seeded by
+#: (seed, block number), so the output never depends on `chunk_size`.
+_BLOCK_USERS = 4096
+
+_START = pd.Timestamp("2024-01-01")
+_N_DAYS = 181
+_ANOM_DAYS, _BUG_DAYS, _PAY_DAYS = (59, 62), (99, 130), (139, 159)
+
+_EVENTS = [
+    "home",
+    "catalog",
+    "search",
+    "filter_results",
+    "product_view",
+    "add_to_cart",
+    "cart",
+    "shipping_details",
+    "payment_details",
+    "purchase",
+    "wishlist_add",
+    "compare",
+    "review_page",
+    "promo_page",
+    "account_page",
+    "error_page",
+    "support_chat",
+    "checkout_bug",
+    "payment_error",
+]
+_EXIT = len(_EVENTS)
+_E = {name: i for i, name in enumerate(_EVENTS)}
+_PLATFORMS = ["desktop", "mobile", "tablet"]
+_PLATFORM_P = [0.52, 0.38, 0.10]
+_CHANNELS = ["organic", "paid_search", "email", "social", "direct"]
+_CHANNEL_P = [0.37, 0.28, 0.15, 0.15, 0.05]
+_LIFECYCLES = ["new", "returning", "loyal"]
+_NOISE = ["account_page", "promo_page", "wishlist_add", "error_page", "support_chat"]
+_NOISE_P = [0.30, 0.25, 0.20, 0.15, 0.10]
+
+# `_next_event`'s transitions that don't depend on the session's context
+_FIXED_TRANSITIONS = {
+    "home": {
+        "catalog": 0.42,
+        "search": 0.32,
+        "promo_page": 0.14,
+        "account_page": 0.08,
+        "_exit": 0.04,
+    },
+    "filter_results": {
+        "product_view": 0.55 * 0.78,
+        "filter_results": 0.22,
+        "catalog": 0.35 * 0.78,
+        "_exit": 0.10 * 0.78,
+    },
+    "wishlist_add": {
+        "product_view": 0.45,
+        "catalog": 0.30,
+        "add_to_cart": 0.15,
+        "_exit": 0.10,
+    },
+    "compare": {
+        "product_view": 0.50,
+        "add_to_cart": 0.25,
+        "catalog": 0.20,
+        "_exit": 0.05,
+    },
+    "review_page": {
+        "product_view": 0.55,
+        "catalog": 0.25,
+        "add_to_cart": 0.12,
+        "_exit": 0.08,
+    },
+    "promo_page": {"product_view": 0.50, "catalog": 0.30, "home": 0.15, "_exit": 0.05},
+    "account_page": {"home": 0.45, "catalog": 0.35, "_exit": 0.20},
+    "add_to_cart": {"cart": 0.86, "catalog": 0.10, "_exit": 0.04},
+    "error_page": {"home": 0.35, "catalog": 0.30, "support_chat": 0.20, "_exit": 0.15},
+    "checkout_bug": {"add_to_cart": 1.0},
+    "payment_error": {"support_chat": 1.0},
+}
+
+
+def _transition_table() -> np.ndarray:
+    table = np.zeros((_EXIT + 1, _EXIT + 1))
+    table[:, _EXIT] = 1.0  # unlisted states (and _exit itself) end the session
+    for state, nxt in _FIXED_TRANSITIONS.items():
+        table[_E[state]] = 0.0
+        for event, p in nxt.items():
+            table[_E[state], _E.get(event, _EXIT)] = p
+    return table
+
+
+_TRANSITIONS = _transition_table()
+
+
+def generate_ecom(
+    n_users: int = 600,
+    seed: int = 42,
+    chunk_size: int = 100_000,
+    path: "str | os.PathLike | None" = None,
+    as_dataframe: bool = False,
+) -> "Eventstream | pd.DataFrame | pathlib.Path":
+    """Simulate the e-commerce dataset for any number of users.
+
+    The same session model as the bundled dataset — the five stories, the
+    user profiles and the per-state transition probabilities of
+    ``_next_event`` — simulated for whole batches of sessions at once with
+    NumPy instead of one event at a time, so millions of users take
+    minutes rather than hours. A session's events are 15-180 s apart, in
+    the order the model produced them.
+
+    Parameters
+    ----------
+    n_users:
+        Number of users to simulate.
+    seed:
+        Random seed. The output depends only on `seed` and `n_users`, never
+        on `chunk_size`.
+    chunk_size:
+        Users generated and converted to a DataFrame at a time; bounds the
+        memory the simulation itself needs.
+    path:
+        Write the events to this Parquet file one chunk (row group) at a
+        time and return its path, without ever holding the whole dataset
+        in memory.
+    as_dataframe:
+        If True (and no `path`), return a `pd.DataFrame` instead of an
+        `Eventstream`.
+
+    Returns
+    -------
+    Eventstream (configured like `load_ecom()`), `pd.DataFrame`, or the
+    `pathlib.Path` written to, with `load_ecom`'s columns. `user_id` and
+    `session_id` are strings as in the bundled dataset; the other
+    string columns are categoricals.
+
+    """
+    if isinstance(n_users, bool) or not isinstance(n_users, int) or n_users < 1:
+        raise InvalidParameterError("n_users", n_users, ["a positive integer"])
+    if (
+        isinstance(chunk_size, bool)
+        or not isinstance(chunk_size, int)
+        or chunk_size < 1
+    ):
+        raise InvalidParameterError("chunk_size", chunk_size, ["a positive integer"])
+
+    chunks = iter_ecom(n_users, seed=seed, chunk_size=chunk_size)
+    if path is not None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = pathlib.Path(path)
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return path
+
+    df = pd.concat(list(chunks), ignore_index=True)
+    if as_dataframe:
+        return df
+
+    from retentioneering.eventstream.eventstream import Eventstream
+
+    return Eventstream(df, _ECOM_SCHEMA)
+
+
+def iter_ecom(
+    n_users: int, seed: int = 42, chunk_size: int = 100_000
+) -> "typing.Iterator[pd.DataFrame]":
+    """`generate_ecom`'s events as DataFrames of `chunk_size` users each.
+
+    Every user's events are in exactly one chunk, in session and time
+    order; concatenated, the chunks equal `generate_ecom(n_users, seed,
+    as_dataframe=True)` for any `chunk_size`.
+    """
+    pending: list[dict] = []
+    first_user = 0
+    n_sessions = 0
+    for block_start in range(0, n_users, _BLOCK_USERS):
+        checkpoint(f"Generating users {block_start:,}-{n_users:,}")
+        n = min(_BLOCK_USERS, n_users - block_start)
+        block = _simulate_block(seed, block_start // _BLOCK_USERS, n)
+        block["user"] += block_start
+        block["session"] += n_sessions
+        # Every session has at least its entry event
+        n_sessions = int(block["session"][-1]) + 1
+        pending.append(block)
+        done = block_start + n
+        while done - first_user >= chunk_size or (
+            done == n_users and first_user < n_users
+        ):
+            end = min(first_user + chunk_size, n_users)
+            merged = {k: np.concatenate([b[k] for b in pending]) for k in pending[0]}
+            cut = int(np.searchsorted(merged["user"], end))
+            yield _chunk_frame({k: v[:cut] for k, v in merged.items()})
+            pending = [{k: v[cut:] for k, v in merged.items()}]
+            first_user = end
+
+
+def _simulate_block(seed: int, block: int, n: int) -> dict:
+    """One block of `n` users' events as arrays, users and sessions numbered
+    from 0, sorted by session and time."""
+    rng = np.random.default_rng([seed, block])
+
+    # ── Users ────────────────────────────────────────────────────────────────
+    reg_day = rng.integers(0, 120, n)
+    channel = rng.choice(len(_CHANNELS), n, p=_CHANNEL_P)
+    platform = rng.choice(len(_PLATFORMS), n, p=_PLATFORM_P)
+    n_sess = rng.integers(3, 10, n)
+
+    # Session days: n_sess distinct days from registration on, redrawn for
+    # the (rare) users whose draw repeats a day
+    days = np.empty((n, 9), dtype=np.int64)
+    redraw = np.arange(n)
+    column = np.arange(9)
+    while len(redraw):
+        span = _N_DAYS - reg_day[redraw]
+        draw = reg_day[redraw, None] + (
+            rng.random((len(redraw), 9)) * span[:, None]
+        ).astype(np.int64)
+        # Unused columns can't collide with real days
+        draw = np.where(column < n_sess[redraw, None], draw, _N_DAYS + column)
+        draw.sort(axis=1)
+        days[redraw] = draw
+        redraw = redraw[(np.diff(draw, axis=1) == 0).any(axis=1)]
+    used = column < n_sess[:, None]
+    session_user = np.repeat(np.arange(n), n_sess)
+    day = days[used]
+    m = len(day)
+
+    # ── Sessions ─────────────────────────────────────────────────────────────
+    plat = platform[session_user].copy()
+    switched = rng.random(m) < 0.10
+    plat[switched] = rng.choice(len(_PLATFORMS), int(switched.sum()), p=_PLATFORM_P)
+    chan = channel[session_user]
+    age = day - reg_day[session_user]
+    lifecycle = np.where(age < 30, 0, np.where(age < 90, 1, 2))
+    anom = (_ANOM_DAYS[0] <= day) & (day <= _ANOM_DAYS[1])
+    bug = (_BUG_DAYS[0] <= day) & (day <= _BUG_DAYS[1])
+    pay = (_PAY_DAYS[0] <= day) & (day <= _PAY_DAYS[1])
+    p_atc = _add_to_cart_probs(lifecycle, chan, plat, anom)
+    start = day * 86_400 + rng.integers(8, 22, m) * 3_600 + rng.integers(0, 59, m) * 60
+
+    # ── Events ───────────────────────────────────────────────────────────────
+    entry = np.zeros((m, _EXIT + 1))
+    entry[:, [_E["home"], _E["catalog"], _E["search"]]] = [0.50, 0.30, 0.20]
+    email = chan == 2
+    entry[email] *= 0.60
+    entry[email, _E["product_view"]] += 0.40
+    loyal = lifecycle == 2
+    entry[loyal] *= 0.75
+    entry[loyal, _E["product_view"]] += 0.25 * 0.7
+    entry[loyal, _E["add_to_cart"]] += 0.25 * 0.3
+    state = _sample(rng, entry)
+    max_steps = rng.integers(4, 22, m)
+
+    sessions, events = [np.arange(m)], [state.copy()]
+    live = np.arange(m)
+    noise_cdf = np.cumsum(_NOISE_P)
+    noise_codes = np.array([_E[e] for e in _NOISE])
+    for step in range(int(max_steps.max(initial=0))):
+        live = live[(max_steps[live] > step) & (state[live] != _E["purchase"])]
+        if not len(live):
+            break
+        nxt = _sample(
+            rng,
+            _transition_probs(
+                state[live],
+                lifecycle[live],
+                plat[live],
+                chan[live],
+                anom[live],
+                bug[live],
+                pay[live],
+                p_atc[live],
+            ),
+        )
+        stays = nxt != _EXIT
+        live, nxt = live[stays], nxt[stays]
+        state[live] = nxt
+        sessions.append(live)
+        events.append(nxt)
+        noisy = rng.random(len(live)) < 0.06
+        sessions.append(live[noisy])
+        events.append(
+            noise_codes[np.searchsorted(noise_cdf, rng.random(int(noisy.sum())))]
+        )
+
+    session = np.concatenate(sessions)
+    order = np.argsort(session, kind="stable")
+    session = session[order]
+    event = np.concatenate(events)[order]
+
+    gap = rng.integers(15, 180, len(session))
+    elapsed = np.cumsum(gap)
+    first = np.flatnonzero(np.diff(session, prepend=-1))
+    elapsed -= np.repeat(
+        elapsed[first] - gap[first], np.diff(np.append(first, len(session)))
+    )
+
+    return {
+        "user": session_user[session],
+        "session": session,
+        "event": event,
+        "seconds": start[session] + elapsed,
+        "platform": plat[session],
+        "channel": chan[session],
+        "reg_day": reg_day[session_user[session]],
+        "lifecycle": lifecycle[session],
+    }
+
+
+def _add_to_cart_probs(lifecycle, channel, platform, is_anom) -> np.ndarray:
+    """`_add_to_cart_prob` for arrays of sessions."""
+    base = np.array([0.10, 0.18, 0.28])[lifecycle]
+    base = base + np.where(channel == 1, 0.08, 0.0) - np.where(channel == 3, 0.03, 0.0)
+    base = base - np.where(platform == 1, 0.04, 0.0)
+    base = np.where(is_anom, base * 0.30, base)
+    return np.clip(base, 0.03, 0.45)
+
+
+def _transition_probs(
+    state, lifecycle, platform, channel, is_anom, is_bug, is_pay, p_atc
+) -> np.ndarray:
+    """`_next_event`'s next-event distribution, one row per session; the last
+    column is the exit. Its nested draws (e.g. the 55 % checkout-bug roll
+    before the regular shipping choice) are folded into mixtures."""
+    probs = _TRANSITIONS[state]
+    mobile = platform == 1
+
+    rows = state == _E["catalog"]
+    if rows.any():
+        sl = np.where(is_anom[rows], 0.18, 0.10)[:, None]
+        probs[rows] = _distribution(
+            {
+                "product_view": 0.42 * (1 - sl),
+                "search": 0.15 * (1 - sl),
+                "filter_results": 0.20 * (1 - sl),
+                "catalog": sl,
+                "home": 0.15 * (1 - sl),
+                "_exit": 0.08 * (1 - sl),
+            }
+        )
+
+    rows = state == _E["search"]
+    if rows.any():
+        sl = np.where(is_anom[rows], 0.28, 0.18)[:, None]
+        probs[rows] = _distribution(
+            {
+                "product_view": 0.38 * (1 - sl),
+                "search": sl,
+                "filter_results": 0.30 * (1 - sl),
+                "catalog": 0.22 * (1 - sl),
+                "_exit": 0.10 * (1 - sl),
+            }
+        )
+
+    rows = state == _E["product_view"]
+    if rows.any():
+        sl = np.where(channel[rows] == 3, 0.22, 0.14)[:, None]
+        left = 1 - sl
+        p_exit = np.where(lifecycle[rows] == 0, 0.12, 0.06)[:, None]
+        regular = _distribution(
+            {
+                "product_view": sl,
+                "add_to_cart": p_atc[rows, None] * left,
+                "catalog": 0.28 * left,
+                "search": 0.15 * left,
+                "wishlist_add": 0.08 * left,
+                "compare": 0.05 * left,
+                "review_page": 0.07 * left,
+                "_exit": p_exit * left,
+            }
+        )
+        glitch = _distribution({"error_page": 0.5, "support_chat": 0.5})
+        probs[rows] = _mix(is_anom[rows], 0.10, glitch, regular)
+
+    rows = state == _E["cart"]
+    if rows.any():
+        abandon = np.where(mobile[rows], 0.22, 0.14)[:, None]
+        probs[rows] = _distribution(
+            {
+                "shipping_details": 1 - abandon - 0.05,
+                "catalog": abandon * 0.55,
+                "home": abandon * 0.30,
+                "_exit": 0.05,
+            }
+        )
+
+    rows = state == _E["shipping_details"]
+    if rows.any():
+        fwd = np.where(mobile[rows], 0.68, 0.82)[:, None]
+        regular = _distribution(
+            {
+                "payment_details": fwd,
+                "cart": (1 - fwd) * 0.55,
+                "home": (1 - fwd) * 0.35,
+                "_exit": 0.02,
+            }
+        )
+        probs[rows] = _mix(
+            is_bug[rows] & mobile[rows],
+            0.55,
+            _distribution({"checkout_bug": 1.0}),
+            regular,
+        )
+
+    rows = state == _E["payment_details"]
+    if rows.any():
+        probs[rows] = _mix(
+            is_pay[rows],
+            0.70,
+            _distribution({"payment_error": 1.0}),
+            _distribution({"purchase": 0.88, "shipping_details": 0.08, "_exit": 0.04}),
+        )
+
+    rows = state == _E["support_chat"]
+    if rows.any():
+        probs[rows] = _mix(
+            is_pay[rows],
+            0.40,
+            _distribution({"payment_details": 1.0}),
+            _distribution({"home": 0.40, "catalog": 0.30, "_exit": 0.30}),
+        )
+
+    return probs
+
+
+def _distribution(weights: dict) -> np.ndarray:
+    """Rows of next-event probabilities from `{event: weight}` (scalars or
+    column vectors), normalised like `_norm`."""
+    n = max(np.shape(w)[0] if np.ndim(w) else 1 for w in weights.values())
+    row = np.zeros((n, _EXIT + 1))
+    for event, weight in weights.items():
+        row[:, _E.get(event, _EXIT)] = np.ravel(np.broadcast_to(weight, (n, 1)))
+    return row / row.sum(axis=1, keepdims=True)
+
+
+def _mix(when: np.ndarray, p: float, special: np.ndarray, regular: np.ndarray):
+    """`special` with probability `p` where `when`, else `regular`."""
+    weight = np.where(when, p, 0.0)[:, None]
+    return weight * special + (1 - weight) * regular
+
+
+def _sample(rng: np.random.Generator, probs: np.ndarray) -> np.ndarray:
+    """One column index per row of `probs`, drawn with the row's probabilities."""
+    cdf = np.cumsum(probs, axis=1)
+    drawn = (rng.random(len(probs))[:, None] >= cdf).sum(axis=1)
+    # Float error can leave the last cumulative sum a hair below 1
+    return np.minimum(drawn, probs.shape[1] - 1)
+
+
+def _chunk_frame(block: dict) -> pd.DataFrame:
+    """The arrays of `_simulate_block` as `load_ecom`'s columns."""
+    users, user_idx = np.unique(block["user"], return_inverse=True)
+    sessions, session_idx = np.unique(block["session"], return_inverse=True)
+    cohorts = (_START + pd.to_timedelta(np.arange(120), unit="D")).strftime("%Y-%m")
+    cohort_levels = sorted(set(cohorts))
+    cohort_code = np.searchsorted(cohort_levels, np.asarray(cohorts))
+    return pd.DataFrame(
+        {
+            "user_id": np.array([f"user_{u:04d}" for u in users], dtype=object)[
+                user_idx
+            ],
+            "session_id": np.array(
+                [f"sess_{s + 1:06d}" for s in sessions], dtype=object
+            )[session_idx],
+            "event": pd.Categorical.from_codes(block["event"], _EVENTS),
+            "timestamp": _START + pd.to_timedelta(block["seconds"], unit="s"),
+            "platform": pd.Categorical.from_codes(block["platform"], _PLATFORMS),
+            "acquisition_channel": pd.Categorical.from_codes(
+                block["channel"], _CHANNELS
+            ),
+            "user_cohort": pd.Categorical.from_codes(
+                cohort_code[block["reg_day"]], cohort_levels
+            ),
+            "user_lifecycle": pd.Categorical.from_codes(
+                block["lifecycle"], _LIFECYCLES
+            ),
+        }
+    )
+
+
 # ---------------------------------------------------------------------------
 # Session generator (state machine)
 # ---------------------------------------------------------------------------
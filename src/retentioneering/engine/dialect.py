@@ -10,7 +10,8 @@ this one module, not grep every query string in the codebase.
 
 This module does not transpile or validate SQL - it only wraps the
 enumerable DuckDB-specific fragments currently in use (EPOCH, path-string
-aggregation, regex matching) as plain string-returning functions.
+aggregation, regex matching, seeded hashing) as plain string-returning
+functions.
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from __future__ import annotations
 __all__ = [
     "epoch",
     "interval_seconds",
+    "seeded_hash",
     "path_agg",
     "path_agg_ordered",
     "regexp_match",
@@ -37,6 +39,15 @@ def epoch(expr: str) -> str:
     return f"EPOCH({expr})"
 
 
+def seeded_hash(expr: str, seed: int) -> str:
+    """
+    DuckDB hash() of `expr` salted with the integer `seed`: an unsigned
+    64-bit value that depends only on the two, so the same row hashes the
+    same in every query, on every thread and as rows are added around it.
+    """
+    return f"hash({expr}, {int(seed)})"
+
+
 def path_agg(expr: str, sep: str = "->") -> str:
     """
     Aggregate `expr` (typically an event column) into a single `sep`-delimited
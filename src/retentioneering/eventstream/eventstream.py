@@ -1,6 +1,6 @@
 import inspect
 import json
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 from functools import cached_property
 
 import pandas as pd
@@ -12,6 +12,7 @@ from retentioneering.exceptions import SchemaConfigError
 from retentioneering.ops import op as _op
 from retentioneering.tools.types import T_TransitionMatrixValues, T_Diff
 from retentioneering.utils.sentinels import UNSET as _SEGMENT_LEVEL_UNSET
+from retentioneering.utils.sql_quoting import quote_list
 from retentioneering.utils.sequences import find_delimiter_collisions
 
 #: `diff`/`get_segment_levels` sentinel standing in for a missing (None/NaN)
@@ -27,6 +28,21 @@ def _to_datetime_auto(series: pd.Series) -> pd.Series:
     return pd.to_datetime(series)
 
 
+@dataclass(frozen=True)
+class _StreamStats:
+    """The cheap whole-frame statistics several accessors and every widget
+    constructor ask for, computed together by `Eventstream._stats`."""
+
+    #: Rows excluding synthetic path_start/path_end
+    n_rows: int
+    #: Distinct values of `schema.path_col`
+    n_paths: int
+    #: Rows per event, synthetic path_start/path_end included
+    event_counts: dict
+    #: Segment columns with at least one missing (None/NaN) level
+    segments_with_missing: frozenset
+
+
 def _validate_path_cols_nesting(df: pd.DataFrame, path_cols: list) -> None:
     """
     path_cols must be ordered coarsest-first: every value of path_cols[i+1]
@@ -106,6 +122,23 @@ class Eventstream:
     def schema(self) -> EventstreamSchema:
         return EventstreamSchema.from_dict(self._schema)
 
+    def _replace_data(self, df: pd.DataFrame, schema: dict) -> None:
+        """Swap this eventstream's frame and schema in place.
+
+        Only Cluster Analysis's "save clusters" does this, an exception to
+        ADR-0003. Everything derived from the old data is dropped: the
+        cached properties (`schema`, `fingerprint`, `_stats`) and the entries
+        of the per-stream tool caches (`utils.stream_cache`).
+        """
+        from retentioneering.utils import stream_cache
+
+        self._df = df
+        self._schema = schema
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
+        stream_cache.forget(self)
+
     @property
     def df(self) -> pd.DataFrame:
         return self._df
@@ -213,11 +246,9 @@ class Eventstream:
 
     def _row_count_label(self) -> str:
         """Human-readable row count (excluding synthetic path_start/path_end
-        rows), e.g. `120k`, `4.2M`, `57`. Cheap boolean-mask count, no copy —
-        mirrors `is_empty()`'s approach so `__repr__` stays safe to call on
-        large eventstreams."""
-        exclude = [EventTypes().PATH_START.type, EventTypes().PATH_END.type]
-        n = int((~self._df[self.schema.event_type].isin(exclude)).sum())
+        rows), e.g. `120k`, `4.2M`, `57`. Read from the cached `_stats`, so
+        `__repr__` stays safe to call on large eventstreams."""
+        n = self._stats.n_rows
         if n >= 1_000_000:
             return f"{n / 1_000_000:.1f}M"
         if n >= 1_000:
@@ -290,8 +321,7 @@ class Eventstream:
         # the whole eventstream just to test emptiness.
         if not exclude_start_end:
             return self._df.empty
-        exclude = [EventTypes().PATH_START.type, EventTypes().PATH_END.type]
-        return bool(self._df[self.schema.event_type].isin(exclude).all())
+        return self._stats.n_rows == 0
 
     def equals(
         self,
@@ -315,10 +345,59 @@ class Eventstream:
         return pd.DataFrame.equals(df1, df2)
 
     def get_event_counts(self) -> dict[str, int]:
-        event_col = self.schema.event_col
-        event_col_q = engine.quote_ident(event_col)
-        query = f"SELECT {event_col_q}, COUNT(*) AS cnt FROM df GROUP BY {event_col_q}"
-        return engine.run(query, df=self._df).set_index(event_col)["cnt"].to_dict()
+        return dict(self._stats.event_counts)
+
+    @cached_property
+    def _stats(self) -> _StreamStats:
+        """Row, path and event counts and missing-segment flags in one query.
+
+        The frame never changes after construction (ADR-0003), so this runs at
+        most once per eventstream however often `repr`, `is_empty`,
+        `get_event_counts`, `get_segment_levels` or a widget constructor ask.
+        The per-event groups and the grand total come from the same scan via
+        GROUPING SETS.
+        """
+        schema = self.schema
+        event_col_q = engine.quote_ident(schema.event_col)
+        synthetic = quote_list(
+            [EventTypes().PATH_START.type, EventTypes().PATH_END.type]
+        )
+        missing = "".join(
+            f", bool_or({engine.quote_ident(col)} IS NULL) AS missing_{i}"
+            for i, col in enumerate(schema.segment_cols)
+        )
+        query = f"""
+        SELECT
+            {event_col_q} AS event,
+            GROUPING({event_col_q}) AS is_total,
+            COUNT(*) AS n,
+            COUNT(*) FILTER (
+                WHERE {engine.quote_ident(schema.event_type)} NOT IN ({synthetic})
+            ) AS n_rows,
+            COUNT(DISTINCT {engine.quote_ident(schema.path_col)}) AS n_paths
+            {missing}
+        FROM df
+        GROUP BY GROUPING SETS (({event_col_q}), ())
+        """
+        result = engine.run(query, df=self._df)
+        is_total = result["is_total"] == 1
+        events = result[~is_total]
+        if is_total.any():
+            total = result[is_total].iloc[0]
+            n_rows, n_paths = int(total["n_rows"]), int(total["n_paths"])
+            with_missing = frozenset(
+                col
+                for i, col in enumerate(schema.segment_cols)
+                if bool(total[f"missing_{i}"])
+            )
+        else:
+            n_rows, n_paths, with_missing = 0, 0, frozenset()
+        return _StreamStats(
+            n_rows=n_rows,
+            n_paths=n_paths,
+            event_counts=dict(zip(events["event"], events["n"].astype(int))),
+            segments_with_missing=with_missing,
+        )
 
     @cached_property
     def fingerprint(self) -> str:
@@ -360,9 +439,8 @@ class Eventstream:
         """
         levels = {}
         for col in self.schema.segment_cols:
-            series = self._df[col]
-            cats = series.cat.categories.tolist()
-            if series.isna().any():
+            cats = self._df[col].cat.categories.tolist()
+            if col in self._stats.segments_with_missing:
                 cats = cats + [SEGMENT_MISSING]
             levels[col] = cats
         return levels
@@ -372,6 +450,7 @@ class Eventstream:
         self,
         percentiles: tuple = (0.25, 0.5, 0.75, 0.9, 0.99),
         top_events: int | None = 20,
+        approx: bool = False,
     ) -> dict:
         """
         Compute basic descriptive statistics for the eventstream.
@@ -384,13 +463,21 @@ class Eventstream:
         Parameters
         ----------
         percentiles : tuple of float, default (0.25, 0.5, 0.75, 0.9, 0.99)
-            Percentiles (0-1) reported in `path_stats`.
+            Percentiles (0-1) reported in `path_stats`. The median is always
+            reported too, as `DataFrame.describe` does.
         top_events : int or None, default 20
             Number of most frequent events to include in `event_frequency`.
             Pass `None` to include every unique event, unranked and
             unlimited - use this when the result feeds something that needs
             the full event vocabulary (e.g. building a rename mapping),
             since the default silently drops everything past the top 20.
+        approx : bool, default False
+            Estimate `shape.n_paths` and the `path_stats` percentiles with
+            DuckDB's sketches (`approx_count_distinct`, `approx_quantile`)
+            instead of computing them exactly - for a first look at a source
+            too large to sort. Every other statistic stays exact. Unlike the
+            `sample=` fraction the widgets and `*_data` methods take, every
+            path is still counted.
 
         Returns
         -------
@@ -413,10 +500,13 @@ class Eventstream:
         --------
             stream.describe()
             stream.describe(top_events=None)  # full event_frequency, no cap
+            stream.describe(approx=True)  # sketches for a very large source
         """
         from retentioneering.tools.describe import Describe
 
-        return Describe(self).fit(percentiles=percentiles, top_events=top_events)
+        return Describe(self).fit(
+            percentiles=percentiles, top_events=top_events, approx=approx
+        )
 
     @_tracked("dp_filter_events")
     @_op
@@ -477,6 +567,7 @@ class Eventstream:
         scaler: str | None = "minmax",
         nmf_components=None,
         path_col=None,
+        batch_size=None,
     ) -> "Eventstream":
         """
         Cluster paths using ML and add a new segment column with `cluster_0`, `cluster_1`,
@@ -520,6 +611,16 @@ class Eventstream:
             When set, reduces features to this many NMF components before clustering.
         path_col : str, optional
             Path ID column override; defaults to `schema.path_col`.
+        batch_size : int, optional
+            Process paths in chunks of this many instead of all at once, for
+            streams too large to hold every path's features in memory. Features
+            are computed per chunk, the scaler and NMF are fitted incrementally,
+            and `"kmeans"` runs as mini-batch k-means, which needs chunks of at
+            least `n_clusters` paths. `"hdbscan"` has no
+            incremental form, so it is fitted on a random sample of `batch_size`
+            paths and every other path takes the label of its nearest sampled
+            path. Labels are close to, but not identical with, those of the
+            default one-shot fit.
 
         Examples
         --------
@@ -537,6 +638,14 @@ class Eventstream:
             # the same clustering the headless analysis settled on
             result = stream.cluster_analysis_data(features=[{"metric": "length"}])
             stream.add_clusters(name="cluster", features=[{"metric": "length"}], **result["best_params"])
+
+            # millions of paths: 100k at a time
+            stream.add_clusters(
+                name="cluster",
+                features=[{"metric": "event_count_bulk"}],
+                method_args={"n_clusters": 5},
+                batch_size=100_000,
+            )
         """
         from retentioneering.data_processors.add_clusters import AddClusters
 
@@ -549,6 +658,7 @@ class Eventstream:
             scaler=scaler,
             nmf_components=nmf_components,
             path_col=path_col,
+            batch_size=batch_size,
         ).apply(self._df, self.schema)
         return Eventstream(new_df, asdict(new_schema), preprocess=False)
 
@@ -649,8 +759,8 @@ class Eventstream:
         Keep only paths that satisfy a metric condition.
 
         The condition is a tree of comparison nodes connected by `and` / `or` / `not`
-        branch nodes. Per-path metrics are computed once and the condition is evaluated
-        in SQL.
+        branch nodes. The per-path metrics, the condition and the selection of the
+        matching paths' events run as a single SQL statement.
 
         Raises `EmptyEventstreamError` when no paths match.
 
@@ -692,8 +802,10 @@ class Eventstream:
                  "metric_args": {"pattern": "registration->.*->purchase"}},
             ])
         """
+        from retentioneering.data_processors.filter_events import keep_paths_matching
         from retentioneering.data_processors.filter_paths import FilterPaths
         from retentioneering.exceptions import EmptyEventstreamError
+        from retentioneering.metrics.metric_builder import MetricBuilder
 
         if isinstance(condition, list):
             condition = {"op": "and", "args": condition}
@@ -701,21 +813,24 @@ class Eventstream:
         dp = FilterPaths(condition, path_col)
         path_col = path_col or self.schema.path_col
 
-        # Extract metric configs
-        metric_configs = dp._get_metric_configs(condition)
-
-        # Build metrics
-        metrics = self.get_metrics(metric_configs, path_col=path_col).reset_index()
-
-        where_condition = dp._get_where_condition(condition)
-        path_col_q = engine.quote_ident(path_col)
-        query = f"SELECT {path_col_q} FROM metrics WHERE {where_condition}"
-        path_ids = engine.run(query, metrics=metrics)[path_col].tolist()
+        # Metrics, condition and the semi-join back to the events run as one
+        # statement: neither the metric table nor the kept ids leave the engine
+        builder = MetricBuilder(self)
+        metrics_sql, tables = builder.metrics_sql(
+            dp._get_metric_configs(condition), path_col
+        )
+        new_df = keep_paths_matching(
+            self._df,
+            self.schema,
+            dp._get_paths_query(metrics_sql, path_col),
+            path_col,
+            **tables,
+        )
 
-        if len(path_ids) == 0:
+        if new_df.empty:
             raise EmptyEventstreamError("no paths match the filter_paths condition")
 
-        result_stream = self.filter_events(keep={path_col: path_ids})
+        result_stream = Eventstream(new_df, asdict(self.schema), preprocess=False)
         if result_stream.is_empty():
             raise EmptyEventstreamError("no events remain after filter_paths")
         return result_stream
@@ -1286,7 +1401,7 @@ class Eventstream:
     @_tracked("dp_sample_paths")
     @_op
     def sample_paths(
-        self, n=None, frac=None, random_state=None, path_col=None
+        self, n=None, frac=None, random_state=None, path_col=None, method="reservoir"
     ) -> "Eventstream":
         """
         Randomly sample paths (and all their events).
@@ -1303,18 +1418,32 @@ class Eventstream:
             Passing `1.0` returns the eventstream unchanged.
         random_state : int, optional
             Seed for the random number generator; pass an integer for reproducible results.
+            With `method="hash"`, the seed of the hash (default 0).
         path_col : str, optional
             Path ID column override; defaults to `schema.path_col`.
+        method : {"reservoir", "hash"}, default "reservoir"
+            `"reservoir"` draws exactly `n` or `frac` of the paths at random;
+            with a `random_state` DuckDB runs it on a single thread. `"hash"`
+            keeps the paths whose seeded hash of the path id is in the lowest
+            `frac` of the hash range, or the `n` lowest: a plain filter that
+            runs on every thread, picks the same paths on every run, and keeps
+            them in the sample as new paths are added to the data. `frac` then
+            gives about, not exactly, that share of paths.
 
         Examples
         --------
             stream.sample_paths(n=1000)
             stream.sample_paths(frac=0.1, random_state=42)  # 10 % of paths
+            stream.sample_paths(frac=0.1, method="hash")
         """
         from retentioneering.data_processors.sample_paths import SamplePaths
 
         new_df, new_schema = SamplePaths(
-            n=n, frac=frac, random_state=random_state, path_col=path_col
+            n=n,
+            frac=frac,
+            random_state=random_state,
+            path_col=path_col,
+            method=method,
         ).apply(self._df, self.schema)
         return Eventstream(new_df, asdict(new_schema), preprocess=False)
 
@@ -1562,15 +1691,27 @@ class Eventstream:
         elif len(split) == 2:
             ids1, ids2 = split[0], split[1]
             path_col = path_col or self.schema.path_col
-            available_ids = set(self._df[path_col].unique().tolist())
-            missing1 = [i for i in ids1 if i not in available_ids]
-            missing2 = [i for i in ids2 if i not in available_ids]
-            if missing1 or missing2:
-                raise PathIdNotFoundError(
-                    sorted(set(missing1 + missing2), key=str), path_col
-                )
-            s1 = self.filter_events(keep={path_col: list(ids1)})
-            s2 = self.filter_events(keep={path_col: list(ids2)})
+            # One vectorized membership test per group rather than a Python
+            # set of every id in the stream
+            available_ids = self._df[path_col].unique()
+            missing = [
+                i
+                for ids in (ids1, ids2)
+                for i, found in zip(ids, pd.Index(list(ids)).isin(available_ids))
+                if not found
+            ]
+            if missing:
+                raise PathIdNotFoundError(sorted(set(missing), key=str), path_col)
+            s1 = self._keep_paths(
+                ids1,
+                path_col,
+                {"type": "filter_events", "keep": {path_col: list(ids1)}},
+            )
+            s2 = self._keep_paths(
+                ids2,
+                path_col,
+                {"type": "filter_events", "keep": {path_col: list(ids2)}},
+            )
         else:
             raise DiffConfigError("diff must be (seg, v1, v2) or (ids1, ids2)")
         if s1.is_empty():
@@ -1606,10 +1747,45 @@ class Eventstream:
         match = anchors.resolve_anchors(
             stream.df, stream.schema, path_pattern, path_col=path_col
         )
-        matching_ids = match.paths().tolist()
-        if not matching_ids:
+        matching_ids = match.paths()
+        if matching_ids.empty:
             raise PatternNoMatchError(path_pattern)
-        return self.filter_events(keep={path_col: matching_ids})
+        return self._keep_paths(
+            matching_ids, path_col, self._pattern_step(path_pattern, path_col)
+        )
+
+    def _pattern_step(self, path_pattern: str, path_col: str) -> dict:
+        """The lineage entry of keeping the paths matching `path_pattern`: the
+        `filter_paths` call on `matches_pattern` that selects the same paths."""
+        step = {
+            "type": "filter_paths",
+            "condition": {
+                "op": "=",
+                "metric": "matches_pattern",
+                "value": True,
+                "metric_args": {"pattern": path_pattern},
+            },
+        }
+        if path_col != self.schema.path_col:
+            step["path_col"] = path_col
+        return step
+
+    def _keep_paths(self, path_ids, path_col: str, step: dict) -> "Eventstream":
+        """
+        Keep the paths in a library-computed id set (see
+        `filter_events.keep_paths`): a semi-join against the ids instead of an
+        `IN (...)` literal list, with no per-id validation.
+
+        `step` is the lineage entry recorded for it: the selection the ids came
+        from, such as `_pattern_step`, so that `recipe()` replays it without
+        spelling out every kept id.
+        """
+        from retentioneering.data_processors.filter_events import keep_paths
+
+        new_df = keep_paths(self._df, self.schema, path_ids, path_col)
+        result = Eventstream(new_df, asdict(self.schema), preprocess=False)
+        result._lineage = list(self._lineage) + [step]
+        return result
 
     @_tracked("dp_add_start_end_events")
     @_op
@@ -1650,6 +1826,7 @@ class Eventstream:
         path_col: str | None = None,
         diff: T_Diff = None,
         path_pattern: str | None = None,
+        sample: float | None = None,
     ) -> pd.DataFrame:
         """
         Compute the transition **matrix** between events (headless): an
@@ -1667,7 +1844,7 @@ class Eventstream:
               - `"unique_paths"` — number of distinct paths containing the transition.
               - `"share_of_total"` — share of this transition among all transitions in the eventstream.
               - `"avg_per_path"` — average number of occurrences per path.
-              - `"time_median"` / `"time_q95"` — median / 95th-percentile time between the two events (in seconds).
+              - `"time_median"` / `"time_q95"` — median / 95th-percentile time between the two events (in seconds). Exact for transitions up to 1000 s apart, within 1% above that: both are read off one duration sketch per transition, computed once per eventstream, so switching between them is instant.
         path_col : str, optional
             Path ID column override; defaults to `schema.path_col`.
         diff : tuple or list, optional
@@ -1688,6 +1865,12 @@ class Eventstream:
             drawn — a graph has no step axis to centre. To cut the paths
             themselves down to the window the pattern describes, use
             `truncate_paths`.
+        sample : float, optional
+            Estimate from this fraction of paths, e.g. `0.01`, rather than
+            from them all; see [Approximate mode](/docs/widgets#approximate-mode).
+            Returns an `Approximation` instead: its `value` is what the exact
+            call returns, its `low` / `high` the same shape again, bounding
+            each number's 95% confidence interval.
 
         Returns
         -------
@@ -1700,9 +1883,22 @@ class Eventstream:
             stream.transition_graph_data(edge_weight="count")
             diff, g1, g2 = stream.transition_graph_data(diff=("platform", "mobile", "desktop"))
             stream.transition_graph_data(path_pattern="add_to_cart->.*->purchase")
+            stream.transition_graph_data(edge_weight="count", sample=0.01).low
         """
         from retentioneering.tools.transition_matrix import TransitionMatrix
 
+        if sample is not None:
+            from retentioneering.tools.approx import approximate, scale_all
+
+            return approximate(
+                self,
+                lambda part: part.transition_graph_data(
+                    edge_weight, path_col, diff, path_pattern
+                ),
+                sample,
+                path_col,
+                scale=scale_all if edge_weight in ("count", "unique_paths") else None,
+            )
         return TransitionMatrix(self).fit(
             edge_weight, diff, path_col, path_pattern=path_pattern
         )
@@ -1715,6 +1911,7 @@ class Eventstream:
         path_col: str | None = None,
         path_pattern: str | None = None,
         anchor: str | dict | None = None,
+        sample: float | None = None,
     ):
         """
         Compute per-step event-share matrices for Step Matrix / Step Sankey (headless).
@@ -1754,6 +1951,12 @@ class Eventstream:
             selects as well as centres. `occurrence="all"` is rejected: several
             positions per path would make a path count more than once, and the
             cells are shares of paths.
+        sample : float, optional
+            Estimate from this fraction of paths, e.g. `0.01`, rather than
+            from them all; see [Approximate mode](/docs/widgets#approximate-mode).
+            Returns an `Approximation` instead: its `value` is what the exact
+            call returns, its `low` / `high` the same shape again, bounding
+            each number's 95% confidence interval.
 
         Returns
         -------
@@ -1776,6 +1979,17 @@ class Eventstream:
         """
         from retentioneering.tools.step_matrix import StepMatrix
 
+        if sample is not None:
+            from retentioneering.tools.approx import approximate
+
+            return approximate(
+                self,
+                lambda part: part.step_sankey_data(
+                    max_steps, diff, path_col, path_pattern, anchor
+                ),
+                sample,
+                path_col,
+            )
         result = StepMatrix(self).fit(
             max_steps=max_steps,
             diff=diff,
@@ -1799,6 +2013,7 @@ class Eventstream:
         path_col: str | None = None,
         path_pattern: str | None = None,
         anchor: str | dict | None = None,
+        sample: float | None = None,
     ):
         """
         Alias for `step_sankey_data` — Step Matrix and Step Sankey render the
@@ -1836,6 +2051,12 @@ class Eventstream:
             selects as well as centres. `occurrence="all"` is rejected: several
             positions per path would make a path count more than once, and the
             cells are shares of paths.
+        sample : float, optional
+            Estimate from this fraction of paths, e.g. `0.01`, rather than
+            from them all; see [Approximate mode](/docs/widgets#approximate-mode).
+            Returns an `Approximation` instead: its `value` is what the exact
+            call returns, its `low` / `high` the same shape again, bounding
+            each number's 95% confidence interval.
 
         Returns
         -------
@@ -1857,6 +2078,7 @@ class Eventstream:
             path_col=path_col,
             path_pattern=path_pattern,
             anchor=anchor,
+            sample=sample,
         )
 
     @_tracked("widget_step_sankey")
@@ -1870,6 +2092,7 @@ class Eventstream:
         step_window=None,
         height=None,
         sidebar_open=None,
+        sample=None,
         state_file=None,
     ):
         """
@@ -1907,6 +2130,10 @@ class Eventstream:
             Widget height in pixels.
         sidebar_open : bool, default True
             Whether the sidebar starts open.
+        sample : float, optional
+            Show an estimate from this fraction of paths first, e.g. `0.01`,
+            and the exact result once a background computation has it; see
+            [Approximate mode](/docs/widgets#approximate-mode).
         state_file : str, optional
             JSON file the widget state is bound to; see
             [Saving widget state](/docs/widgets#saving-widget-state).
@@ -1928,6 +2155,7 @@ class Eventstream:
             step_window=step_window if step_window is not None else _UNSET,
             height=height if height is not None else _UNSET,
             sidebar_open=sidebar_open if sidebar_open is not None else _UNSET,
+            sample=sample,
             state_file=state_file,
         )
 
@@ -1942,6 +2170,7 @@ class Eventstream:
         step_window=None,
         height=None,
         sidebar_open=None,
+        sample=None,
         state_file=None,
     ):
         """
@@ -1988,6 +2217,10 @@ class Eventstream:
             Widget height in pixels.
         sidebar_open : bool, default True
             Whether the sidebar starts open.
+        sample : float, optional
+            Show an estimate from this fraction of paths first, e.g. `0.01`,
+            and the exact result once a background computation has it; see
+            [Approximate mode](/docs/widgets#approximate-mode).
         state_file : str, optional
             JSON file the widget state is bound to; see
             [Saving widget state](/docs/widgets#saving-widget-state).
@@ -2010,6 +2243,7 @@ class Eventstream:
             step_window=step_window if step_window is not None else _UNSET,
             height=height if height is not None else _UNSET,
             sidebar_open=sidebar_open if sidebar_open is not None else _UNSET,
+            sample=sample,
             state_file=state_file,
         )
 
@@ -2024,6 +2258,7 @@ class Eventstream:
         sidebar_open=None,
         views=None,
         view=None,
+        sample=None,
         state_file=None,
     ):
         """
@@ -2069,6 +2304,10 @@ class Eventstream:
             View applied once after the graph is built: a view dict (`name`
             not required), or the name of an entry in `views`. See the
             [Views](/docs/widgets/transition-graph#views) section.
+        sample : float, optional
+            Show an estimate from this fraction of paths first, e.g. `0.01`,
+            and the exact result once a background computation has it; see
+            [Approximate mode](/docs/widgets#approximate-mode).
         state_file : str, optional
             JSON file the widget state is bound to; see
             [Saving widget state](/docs/widgets#saving-widget-state).
@@ -2107,6 +2346,7 @@ class Eventstream:
             sidebar_open=sidebar_open if sidebar_open is not None else _UNSET,
             views=views if views is not None else _UNSET,
             view=view if view is not None else _UNSET,
+            sample=sample,
             state_file=state_file,
         )
 
@@ -2118,6 +2358,7 @@ class Eventstream:
         path_col: str | None = None,
         height: int | None = None,
         sidebar_open: bool | None = None,
+        sample: float | None = None,
         state_file: str | None = None,
     ):
         """
@@ -2142,6 +2383,10 @@ class Eventstream:
             Widget height in pixels.
         sidebar_open : bool, default True
             Whether the sidebar starts open.
+        sample : float, optional
+            Show an estimate from this fraction of paths first, e.g. `0.01`,
+            and the exact result once a background computation has it; see
+            [Approximate mode](/docs/widgets#approximate-mode).
         state_file : str, optional
             JSON file the widget state is bound to; see
             [Saving widget state](/docs/widgets#saving-widget-state).
@@ -2160,6 +2405,7 @@ class Eventstream:
             path_col=path_col if path_col is not None else _UNSET,
             height=height if height is not None else _UNSET,
             sidebar_open=sidebar_open if sidebar_open is not None else _UNSET,
+            sample=sample,
             state_file=state_file,
         )
 
@@ -2169,6 +2415,7 @@ class Eventstream:
         steps: list[str] | None = None,
         diff=None,
         path_col: str | None = None,
+        sample: float | None = None,
     ) -> dict:
         """
         Compute funnel conversion metrics and return a dict (headless).
@@ -2183,6 +2430,12 @@ class Eventstream:
             `(path_ids1, path_ids2)`; `value2` may be `<REST>`.
         path_col : str, optional
             Path ID column override; defaults to `schema.path_col`.
+        sample : float, optional
+            Estimate from this fraction of paths, e.g. `0.01`, rather than
+            from them all; see [Approximate mode](/docs/widgets#approximate-mode).
+            Returns an `Approximation` instead: its `value` is what the exact
+            call returns, its `low` / `high` the same shape again, bounding
+            each number's 95% confidence interval.
 
         Returns
         -------
@@ -2203,6 +2456,16 @@ class Eventstream:
         """
         from retentioneering.tools.funnel import Funnel
 
+        if sample is not None:
+            from retentioneering.tools.approx import approximate
+
+            return approximate(
+                self,
+                lambda part: part.funnel_data(steps, diff, path_col),
+                sample,
+                path_col,
+                scale=Funnel.scale_counts,
+            )
         if not steps:
             return {"steps": []}
         return Funnel(self).fit(steps=steps, diff=diff, path_col=path_col)
@@ -2293,6 +2556,53 @@ class Eventstream:
             path_col=path_col,
         )
 
+    @_tracked("get_conversion_rates")
+    def get_conversion_rates(
+        self,
+        questions: list[dict],
+        path_col: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Many `get_conversion_rate` questions at once, in one tidy table.
+
+        Each question is a dict with `start_anchor`, `end_anchor` and,
+        optionally, `within` — the arguments `get_conversion_rate` takes, with
+        the same meaning and the same list fan-out. What the questions share is
+        computed once: every distinct start anchor and end anchor is resolved a
+        single time however many questions name it, and all the windows are
+        counted together, so comparing thirty (start, end, within)
+        combinations costs little more than comparing a handful.
+
+        Parameters
+        ----------
+        questions : list of dict
+            `{"start_anchor": ..., "end_anchor": ..., "within": ...}` per
+            question.
+        path_col : str, optional
+            Path ID column override; defaults to `schema.path_col`.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per question (per combination, for a list side), in order,
+            with `get_conversion_rate`'s columns plus `within` — the window as
+            given, `None` for the rest of the path.
+
+        Examples
+        --------
+            stream.get_conversion_rates(
+                [
+                    {"start_anchor": "add_to_cart", "end_anchor": "purchase"},
+                    {"start_anchor": "add_to_cart", "end_anchor": "purchase", "within": 5},
+                    {"start_anchor": "add_to_cart", "end_anchor": "purchase", "within": "30m"},
+                    {"start_anchor": "catalog", "end_anchor": ["cart", "purchase"]},
+                ]
+            )
+        """
+        from retentioneering.tools.conversion import ConversionRate
+
+        return ConversionRate(self).fit_many(questions, path_col=path_col)
+
     @_tracked("widget_segment_overview")
     def segment_overview(
         self,
@@ -2301,6 +2611,7 @@ class Eventstream:
         path_col: str | None = None,
         height: int | None = None,
         sidebar_open: bool | None = None,
+        sample: float | None = None,
         state_file: str | None = None,
     ):
         """
@@ -2331,6 +2642,10 @@ class Eventstream:
             Widget height in pixels.
         sidebar_open : bool, default True
             Whether the sidebar starts open.
+        sample : float, optional
+            Show an estimate from this fraction of paths first, e.g. `0.01`,
+            and the exact result once a background computation has it; see
+            [Approximate mode](/docs/widgets#approximate-mode).
         state_file : str, optional
             JSON file the widget state is bound to; see
             [Saving widget state](/docs/widgets#saving-widget-state).
@@ -2357,6 +2672,7 @@ class Eventstream:
             path_col=path_col if path_col is not None else _UNSET,
             height=height if height is not None else _UNSET,
             sidebar_open=sidebar_open if sidebar_open is not None else _UNSET,
+            sample=sample,
             state_file=state_file,
         )
 
@@ -2366,6 +2682,7 @@ class Eventstream:
         segment_col: str,
         metrics: list | None = None,
         path_col: str | None = None,
+        sample: float | None = None,
     ) -> "pd.DataFrame":
         """
         Compute aggregated metrics across segment levels (headless).
@@ -2383,6 +2700,12 @@ class Eventstream:
             metric reference.
         path_col : str, optional
             Path ID column override; defaults to `schema.path_col`.
+        sample : float, optional
+            Estimate from this fraction of paths, e.g. `0.01`, rather than
+            from them all; see [Approximate mode](/docs/widgets#approximate-mode).
+            Returns an `Approximation` instead: its `value` is what the exact
+            call returns, its `low` / `high` the same shape again, bounding
+            each number's 95% confidence interval.
 
         Returns
         -------
@@ -2392,6 +2715,16 @@ class Eventstream:
         """
         from retentioneering.tools.segment_overview import SegmentOverview
 
+        if sample is not None:
+            from retentioneering.tools.approx import approximate
+
+            return approximate(
+                self,
+                lambda part: part.segment_overview_data(segment_col, metrics, path_col),
+                sample,
+                path_col,
+                scale=SegmentOverview.scale_counts,
+            )
         return SegmentOverview(self).fit(
             segment_col=segment_col,
             metrics=metrics or [],
@@ -136,3 +136,11 @@ class InvalidSegmentSelectionError(MetricDistributionError):
 class WidgetExportError(RetentioneeringError):
     def __init__(self, message: str):
         super().__init__(message, "WIDGET_EXPORT_ERROR")
+
+
+class OperationCancelledError(RetentioneeringError):
+    def __init__(self, context: str | None = None):
+        message = "Operation cancelled"
+        if context:
+            message += f": {context}"
+        super().__init__(message, "OPERATION_CANCELLED")
@@ -0,0 +1,122 @@
+"""Reading `load_data`'s CSV through DuckDB instead of `pd.read_csv`.
+
+Agents point `load_data` at warehouse exports far larger than the server's
+container. `Eventstream(path)` materialises every column of the file as
+pandas objects before the schema is even looked at; here DuckDB's CSV reader
+streams the file and only the columns the schema names, and only the paths
+kept by `sample`/`max_paths`, ever reach pandas.
+
+Sampling keeps whole paths of `schema.path_col` (the coarsest path column,
+so finer ones stay nested) chosen by a seeded hash of the path id, through the
+same predicates as `utils.sampling`: the same file and arguments always load
+the same paths, and `sample=0.1` loads the paths `hash_sample(df, path_col,
+0.1)` would keep from the whole file read as text.
+
+Path and event columns are read as VARCHAR. DuckDB infers a column's type from
+the first rows only, so ids that look numeric there would make the read fail
+on the first one further down that isn't. Once read, a column whose every
+value is a number is converted back, so numeric ids come out as int64 the way
+`pd.read_csv` reads them.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Tuple
+
+import pandas as pd
+
+from retentioneering import engine
+from retentioneering.engine import dialect
+from retentioneering.eventstream.schema import EventstreamSchema
+from retentioneering.exceptions import SchemaConfigError
+from retentioneering.utils.sampling import sample_n_predicate, sample_predicate
+from retentioneering.utils.sql_quoting import quote_literal
+
+
+def read_csv_pruned(
+    path: str,
+    schema: dict | None = None,
+    max_paths: int | None = None,
+    sample: float | None = None,
+    seed: int = 0,
+) -> Tuple[pd.DataFrame, dict]:
+    """
+    Read the schema's columns of the CSV at *path*, optionally for a
+    deterministic subset of paths.
+
+    Args:
+        path: Local CSV file.
+        schema: Eventstream schema dict. Its path, event, timestamp and
+            segment columns are read, plus `custom_cols` and any of the
+            event_type/index/subindex columns the file has; others are skipped.
+        max_paths: Keep at most this many paths.
+        sample: Keep this share (0-1] of paths.
+        seed: Seed of the path hash `max_paths` and `sample` select by.
+
+    Returns:
+        The frame, and load stats: `bytes_read`, `bytes_in_memory` and
+        `columns`. `bytes_read` is an estimate, the file size times the passes
+        made over it; DuckDB does not report what it actually read.
+
+    Raises:
+        FileNotFoundError: *path* doesn't exist.
+        SchemaConfigError: A column the schema names is not in the file.
+        ValueError: *max_paths* or *sample* is out of range.
+    """
+    if max_paths is not None and max_paths < 1:
+        raise ValueError(f"max_paths must be a positive integer, got {max_paths}")
+    if sample is not None and not 0 < sample <= 1:
+        raise ValueError(f"sample must be in (0, 1], got {sample}")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No such file: {path}")
+
+    s = EventstreamSchema.from_dict(dict(schema or {}))
+    header = f"SELECT * FROM read_csv_auto({quote_literal(path)}) LIMIT 0"
+    available = list(engine.run(header).columns)
+
+    required = s.public_cols
+    missing = [c for c in required if c not in available]
+    if missing:
+        raise SchemaConfigError(
+            f"Column(s) {missing} named by the schema are not in {path}. "
+            f"The file has: {available}"
+        )
+    optional = [c for c in (s.event_type, s.index, s.subindex) if c in available]
+    columns = required + optional
+    select = ", ".join(engine.quote_ident(c) for c in columns)
+
+    as_text = list(dict.fromkeys(s.path_cols + [s.event_col]))
+    types = ", ".join(f"{quote_literal(c)}: 'VARCHAR'" for c in as_text)
+    source = f"read_csv_auto({quote_literal(path)}, types={{{types}}})"
+
+    path_q = engine.quote_ident(s.path_col)
+    hash_sql = dialect.seeded_hash(path_q, seed)
+    where = sample_predicate(hash_sql, 1 if sample is None else sample)
+    passes = 1
+    if max_paths is not None:
+        # One pass picks the paths (holding only their hashes), one reads them
+        passes = 2
+        sampled = f"(SELECT {path_q} FROM {source} WHERE {where})"
+        where += f" AND {sample_n_predicate(hash_sql, max_paths, source=sampled)}"
+    df = engine.run(f"SELECT {select} FROM {source} WHERE {where}")
+    _restore_numeric(df, as_text)
+
+    stats = {
+        "bytes_read": os.path.getsize(path) * passes,
+        "bytes_in_memory": int(df.memory_usage(index=True, deep=True).sum()),
+        "columns": columns,
+    }
+    return df, stats
+
+
+def _restore_numeric(df: pd.DataFrame, columns: list) -> None:
+    """Convert, in place, each of `columns` that holds only numbers to the
+    numeric dtype `pd.read_csv` would have given it."""
+    for col in columns:
+        values = df[col]
+        if not values.notna().any():
+            continue
+        numeric = pd.to_numeric(values, errors="coerce")
+        if numeric.notna().sum() == values.notna().sum():
+            df[col] = numeric
@@ -7,25 +7,53 @@ call methods on one `ReportSession` instance instead of mutating list-boxed
 free variables directly — the same "business logic behind a small object,
 transport wires it up" split `widgets/_base.py`'s `RetentioneeringWidget`
 (`dispatch_compute`) already uses for the REST/anywidget transport boundary.
+
+It also keeps the streams derived by `local_preprocessors`: agents tend to
+reuse the same two or three lists across a dozen tabs, so `derived()` holds
+an LRU of them keyed by (base stream, canonical preprocessor JSON), bounded
+by the frames' memory rather than by entry count.
 """
 
 from __future__ import annotations
 
+import contextvars
+import json
 import pathlib
 import tempfile
-from typing import Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
+from retentioneering.exceptions import OperationCancelledError
 from retentioneering.mcp._agent_logic import _apply_preprocessors, _build_data_note
 
 
+DEFAULT_CACHE_BYTES = 512 * 2**20
+
+
 class ReportSession:
-    def __init__(self, base_stream: Any | None, context: dict | None = None):
+    def __init__(
+        self,
+        base_stream: Any | None,
+        context: dict | None = None,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ):
         self._base_stream = base_stream  # original, until load_data() replaces it
         self.active_stream = base_stream
         self.context: dict = context or {}
         self.context_events: set = set(self.context.get("events", {}).keys())
         self.base_preprocessors: list = []
         self.pending_tabs: list[dict] = []
+        # add_* tools run concurrently (see `_worker_pool`)
+        self._tabs_lock = threading.Lock()
+        # (id(base), preprocessors JSON) -> (base, derived stream, nbytes).
+        # Entries hold their base, so the id can't be reused while cached.
+        self._derived: OrderedDict[tuple, tuple] = OrderedDict()
+        self._derived_lock = threading.Lock()
+        self.cache_bytes = cache_bytes
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def load_data(self, stream: Any, context: dict | None = None) -> Any:
         """Replace the base/active stream with *stream* — used by the
@@ -38,6 +66,8 @@ class ReportSession:
         self.active_stream = stream
         self.base_preprocessors = []
         self.pending_tabs = []
+        with self._derived_lock:
+            self._derived.clear()
         if context is not None:
             self.context = context
             self.context_events = set(context.get("events", {}).keys())
@@ -45,12 +75,11 @@ class ReportSession:
 
     @staticmethod
     def stream_stats(stream: Any) -> dict:
-        s = stream.schema
-        df = stream.df
+        # Served from the eventstream's cached stats - no rescan per call
         return {
-            "n_paths": int(df[s.path_col].nunique()),
-            "n_events_total": len(df),
-            "events": sorted(df[s.event_col].astype(str).unique().tolist()),
+            "n_paths": stream._stats.n_paths,
+            "n_events_total": len(stream.df),
+            "events": sorted(str(e) for e in stream.get_event_counts()),
         }
 
     def update_base_stream(self, preprocessors: list) -> Any:
@@ -59,20 +88,125 @@ class ReportSession:
         new_stream = _apply_preprocessors(self._base_stream, preprocessors)
         self.active_stream = new_stream
         self.base_preprocessors = list(preprocessors)
+        self._drop_stale_derived()
         return new_stream
 
     def reset_base_stream(self) -> Any:
         self.active_stream = self._base_stream
         self.base_preprocessors = []
+        self._drop_stale_derived()
         return self._base_stream
 
-    def add_tab(self, label: str, data: dict, local_preprocessors: list) -> str:
-        tab_id = f"tab-{len(self.pending_tabs)}"
-        self.pending_tabs.append(
-            {"label": label, "data": data, "local_preprocessors": local_preprocessors}
-        )
+    def derived(self, preprocessors: list) -> Any:
+        """`active_stream` with *preprocessors* applied on top, served from
+        the LRU when the same list was applied to the same stream before.
+        An empty list is the active stream itself."""
+        base = self.active_stream
+        if not preprocessors:
+            return base
+        key = (id(base), json.dumps(preprocessors, sort_keys=True, default=str))
+        with self._derived_lock:
+            entry = self._derived.get(key)
+            if entry is not None:
+                self._derived.move_to_end(key)
+                self._cache_hits += 1
+                return entry[1]
+            self._cache_misses += 1
+
+        # Applied outside the lock: two concurrent misses on one key both
+        # compute, which beats serialising every other tab behind them
+        stream = _apply_preprocessors(base, preprocessors)
+        nbytes = int(stream.df.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.cache_bytes:
+            return stream
+        with self._derived_lock:
+            self._derived[key] = (base, stream, nbytes)
+            self._derived.move_to_end(key)
+            total = sum(e[2] for e in self._derived.values())
+            while total > self.cache_bytes:
+                _, (_, _, evicted) = self._derived.popitem(last=False)
+                total -= evicted
+        return stream
+
+    def cache_info(self) -> dict:
+        """Hit/miss counts and memory use of the derived-stream cache."""
+        with self._derived_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "entries": len(self._derived),
+                "bytes": sum(e[2] for e in self._derived.values()),
+                "max_bytes": self.cache_bytes,
+            }
+
+    def _drop_stale_derived(self) -> None:
+        # Streams derived from a replaced active stream can only come back
+        # into use through reset_base_stream, i.e. when based on the original
+        keep = (id(self._base_stream), id(self.active_stream))
+        with self._derived_lock:
+            for key in [k for k in self._derived if k[0] not in keep]:
+                del self._derived[key]
+
+    def add_tab(
+        self,
+        label: str,
+        data: dict,
+        local_preprocessors: list,
+        params: dict | None = None,
+    ) -> str:
+        """Register a tab. *params* are the arguments its add_* tool computed
+        *data* from; a tab without them is left alone by `refresh_tabs`."""
+        tab = {"label": label, "data": data, "local_preprocessors": local_preprocessors}
+        if params is not None:
+            tab["params"] = params
+        with self._tabs_lock:
+            tab_id = f"tab-{len(self.pending_tabs)}"
+            self.pending_tabs.append(tab)
         return tab_id
 
+    def refresh_tabs(
+        self,
+        build: Callable[[Any, str, dict], dict],
+        max_workers: int | None = None,
+    ) -> list[dict]:
+        """Recompute every pending tab on the current active stream, on a
+        thread pool: `build(stream, widget_type, params)` returns the tab's
+        new data, or {"error": ...}. Tabs share the derived-stream cache, so
+        a local preprocessor list common to several is applied once.
+
+        Returns one `{"label", "status"}` entry per tab, status being
+        "refreshed", "skipped" (no params recorded) or "error" (with the
+        message; the tab keeps its previous data).
+        """
+        with self._tabs_lock:
+            tabs = list(self.pending_tabs)
+
+        def refresh(tab: dict) -> dict:
+            if "params" not in tab:
+                return {"label": tab["label"], "status": "skipped"}
+            try:
+                src = self.derived(tab["local_preprocessors"])
+                data = build(src, tab["data"]["widget_type"], tab["params"])
+            except OperationCancelledError:
+                raise
+            except Exception as exc:
+                data = {"error": str(exc)}
+            if "error" in data:
+                return {"label": tab["label"], "status": "error", **data}
+            tab["data"] = data
+            return {"label": tab["label"], "status": "refreshed"}
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="retentioneering-tabs"
+        ) as pool:
+            # Each task runs in a copy of the caller's context, so it reports
+            # progress to (and is cancelled with) the calling tool
+            futures = [
+                pool.submit(contextvars.copy_context().run, refresh, tab)
+                for tab in tabs
+            ]
+            return [f.result() for f in futures]
+
     def package(self, title: str, analysis: str | None) -> dict:
         """Pure packaging of the pending tabs into a report payload — no file
         I/O. This is what a non-notebook caller (e.g. the platform's chat
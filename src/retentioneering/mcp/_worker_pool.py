@@ -0,0 +1,128 @@
+"""`ToolPool`: runs MCP tool calls on worker threads instead of the server's
+event loop.
+
+FastMCP calls a synchronous tool inline, on the loop that also serves the SSE
+transport, so one heavy `update_base_stream` used to stall every other
+request - and the progress notifications that could have told the agent what
+was going on. Here each call runs on a thread of a shared pool inside a
+`_progress.reporting()` block: its checkpoints are forwarded to the loop as
+progress notifications, and a client cancellation or a timeout sets the
+block's cancel event, so the call stops at its next checkpoint.
+
+Calls that only read the session run concurrently; calls that replace its
+stream (`exclusive=True`) wait for those to finish and run alone. The lock is
+taken on the worker thread, so a cancelled call holds it until it has really
+stopped, not merely until its caller gave up waiting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterator
+
+from retentioneering._progress import checkpoint, reporting
+
+
+class _ReadWriteLock:
+    """Many readers or one writer. A waiting writer holds back new readers,
+    so a stream replacement isn't starved by a steady flow of add_* calls."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextlib.contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class ToolPool:
+    def __init__(self, max_workers: int = 4, timeout: float | None = None):
+        """
+        Args:
+            max_workers: Tool calls that can run at the same time.
+            timeout: Seconds a call may run before it is cancelled, or None
+                for no limit.
+        """
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="retentioneering-mcp"
+        )
+        self._lock = _ReadWriteLock()
+
+    async def run(
+        self,
+        fn: Callable[[], Any],
+        name: str,
+        exclusive: bool = False,
+        on_progress: Callable[[int, str], Awaitable[None]] | None = None,
+    ) -> Any:
+        """
+        Run `fn()` on the pool and return its result.
+
+        Args:
+            fn: The tool call, with its arguments bound.
+            name: Tool name, the first progress message.
+            exclusive: Run alone - for calls that replace the session's stream.
+            on_progress: Coroutine sent each checkpoint as `(n, message)`, on
+                the caller's loop.
+
+        Raises:
+            asyncio.TimeoutError: The call ran past `timeout`; it is cancelled.
+            asyncio.CancelledError: The awaiting task was cancelled; so is the call.
+        """
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+
+        def forward(n: int, message: str) -> None:
+            if on_progress is not None:
+                asyncio.run_coroutine_threadsafe(on_progress(n, message), loop)
+
+        def call() -> Any:
+            lock = self._lock.write() if exclusive else self._lock.read()
+            with lock, reporting(forward, cancelled):
+                checkpoint(name)
+                return fn()
+
+        future = loop.run_in_executor(
+            self._executor, contextvars.copy_context().run, call
+        )
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            cancelled.set()
+            raise
+
+    def shutdown(self) -> None:
+        """Stop accepting calls; running ones finish on their own threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -21,13 +21,15 @@ text in `mcp/_prompts.py`.
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import os
 import socket
 import threading
 from functools import wraps
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 from retentioneering._tracking import caller_context as _tracking_caller_context
 from retentioneering._tracking import track as _track
@@ -39,6 +41,7 @@ from retentioneering.mcp._agent_logic import (
 )
 from retentioneering.mcp._prompts import _system_instructions
 from retentioneering.mcp._report_session import ReportSession
+from retentioneering.mcp._worker_pool import ToolPool
 
 __all__ = ["serve", "_apply_preprocessors", "_find_unlinked_numbers"]
 
@@ -47,6 +50,9 @@ def serve(
     stream: "Eventstream | None" = None,
     context: dict | None = None,
     port: int = 8765,
+    workers: int = 4,
+    tool_timeout: float | None = None,
+    cache_mb: int = 512,
 ) -> None:
     """
     Start a local MCP server exposing *stream* to Claude (or any MCP client).
@@ -68,6 +74,21 @@ def serve(
             })
     port:
         HTTP port for the SSE transport (default 8765).
+    workers:
+        Tool calls that can run at the same time (default 4). Calls run off
+        the transport's event loop and report progress to clients that ask
+        for it; calls that only read the stream run side by side, while
+        load_data / update_base_stream / reset_base_stream / export_report
+        wait for them and run alone.
+    tool_timeout:
+        Seconds a tool call may run before it is cancelled and the agent gets
+        an error instead, or None (default) for no limit. A cancelled call
+        stops at its next progress checkpoint.
+    cache_mb:
+        Memory budget (default 512) for the streams derived by tools'
+        local_preprocessors. A list the agent reuses on the same base stream
+        is served from this cache instead of being reapplied; least recently
+        used streams are dropped once the budget is exceeded. 0 disables it.
 
     Notes
     -----
@@ -90,7 +111,15 @@ def serve(
         "mcp_serve", {"has_context": bool(context), "has_stream": stream is not None}
     )
     _check_port_available(port)
-    mcp = _build_server(stream, context or {}, port=port, notebook_dir=os.getcwd())
+    mcp = _build_server(
+        stream,
+        context or {},
+        port=port,
+        notebook_dir=os.getcwd(),
+        workers=workers,
+        tool_timeout=tool_timeout,
+        cache_mb=cache_mb,
+    )
     thread = threading.Thread(
         target=lambda: mcp.run(transport="sse"),
         daemon=True,
@@ -133,31 +162,70 @@ def _build_server(
     context: dict,
     port: int = 8765,
     notebook_dir: str = "",
+    workers: int = 4,
+    tool_timeout: float | None = None,
+    cache_mb: int = 512,
 ) -> FastMCP:
     mcp = FastMCP(
         "retentioneering",
         instructions=_system_instructions(stream, context, notebook_dir=notebook_dir),
         port=port,
     )
+    pool = ToolPool(max_workers=workers, timeout=tool_timeout)
 
-    def _tool():
-        """@mcp.tool() that sets caller='mcp' in the tracking context."""
+    def _tool(exclusive: bool = False):
+        """@mcp.tool() that runs the call on `pool`, sets caller='mcp' in the
+        tracking context and forwards progress checkpoints to the client.
+        `exclusive` for tools that replace the session's stream."""
 
         def decorator(fn):
             @wraps(fn)
-            def wrapper(*args, **kwargs):
-                with _tracking_caller_context("mcp"):
-                    return fn(*args, **kwargs)
-
+            async def wrapper(*args, ctx: Context, **kwargs):
+                async def progress(n: int, message: str) -> None:
+                    try:
+                        await ctx.report_progress(n, message=message)
+                    except Exception:
+                        pass  # no request to report to, or the client left
+
+                def call():
+                    with _tracking_caller_context("mcp"):
+                        return fn(*args, **kwargs)
+
+                try:
+                    return await pool.run(
+                        call, fn.__name__, exclusive=exclusive, on_progress=progress
+                    )
+                except asyncio.TimeoutError:
+                    return json.dumps(
+                        {
+                            "error": f"{fn.__name__} ran longer than {tool_timeout}s "
+                            f"and was cancelled."
+                        }
+                    )
+
+            # FastMCP reads the tool's parameters off the signature; add the
+            # Context it injects, which the tool itself never sees.
+            sig = inspect.signature(fn, eval_str=True)
+            ctx_param = inspect.Parameter(
+                "ctx", inspect.Parameter.KEYWORD_ONLY, annotation=Context
+            )
+            wrapper.__signature__ = sig.replace(
+                parameters=[*sig.parameters.values(), ctx_param]
+            )
+            wrapper.__annotations__ = {**fn.__annotations__, "ctx": Context}
             return mcp.tool()(wrapper)
 
         return decorator
 
-    session = ReportSession(stream, context)
+    session = ReportSession(stream, context, cache_bytes=cache_mb * 2**20)
 
-    @_tool()
+    @_tool(exclusive=True)
     def load_data(
-        path: str, schema: dict | None = None, context: dict | None = None
+        path: str,
+        schema: dict | None = None,
+        context: dict | None = None,
+        max_paths: int | None = None,
+        sample: float | None = None,
     ) -> str:
         """
         Load an eventstream from a local CSV file and set it as the base stream
@@ -180,19 +248,32 @@ def _build_server(
                "segment_cols": [...]}
             Defaults to path_cols=["user_id"], event_col="event",
             timestamp_col="timestamp" for any key left unspecified.
+            Only the columns it names are read; list any other column you
+            need in "custom_cols".
         context:
             Optional semantic layer — same shape as serve()'s context argument
             (description, events, kpis). Replaces any context set previously.
+        max_paths:
+            Optional cap on the number of paths loaded. Use it (or sample) for
+            very large files: paths are picked by a hash of their id, so the
+            same call always loads the same paths.
+        sample:
+            Optional share of paths to load, between 0 and 1 (e.g. 0.1).
 
         Returns
         -------
-        JSON with updated stream stats: n_paths, n_events_total, events list.
+        JSON with updated stream stats: n_paths, n_events_total, events list,
+        and "load": bytes_read (an estimate: file size times passes over it),
+        bytes_in_memory, columns, load_seconds.
         """
         return json.dumps(
-            tools.load_data(session, path, schema, context), ensure_ascii=False
+            tools.load_data(
+                session, path, schema, context, max_paths=max_paths, sample=sample
+            ),
+            ensure_ascii=False,
         )
 
-    @_tool()
+    @_tool(exclusive=True)
     def update_base_stream(preprocessors: list) -> str:
         """
         Apply preprocessing to the original eventstream and set it as the active
@@ -223,7 +304,7 @@ def _build_server(
             tools.update_base_stream(session, preprocessors), ensure_ascii=False
         )
 
-    @_tool()
+    @_tool(exclusive=True)
     def reset_base_stream() -> str:
         """
         Reset the active stream to the original eventstream passed to serve().
@@ -269,10 +350,14 @@ def _build_server(
         return json.dumps(tools.describe_tool(tool), ensure_ascii=False)
 
     @_tool()
-    def describe() -> str:
+    def describe(approx: bool = False) -> str:
         """Return schema, event list, unique path counts and available segments.
-        Reflects the current active stream (after any update_base_stream calls)."""
-        return json.dumps(tools.describe(session, session.context), ensure_ascii=False)
+        Reflects the current active stream (after any update_base_stream calls).
+        Pass approx=True on very large sources to estimate n_paths with a sketch."""
+        return json.dumps(
+            tools.describe(session, session.context, approx=approx),
+            ensure_ascii=False,
+        )
 
     @_tool()
     def add_transition_graph(
@@ -537,11 +622,12 @@ def _build_server(
         """
         return json.dumps(tools.check_analysis(analysis), ensure_ascii=False)
 
-    @_tool()
+    @_tool(exclusive=True)
     def export_report(
         title: str = "Analysis Report",
         analysis: str | None = None,
         path: str | None = None,
+        refresh: bool = False,
     ) -> str:
         """
         Generate the HTML report with all widgets added via add_transition_graph /
@@ -563,6 +649,11 @@ def _build_server(
             Supports markdown: # headings, **bold**, *italic*, tables, - lists.
         path:
             Destination file path. If None, a temp file is created.
+        refresh:
+            Recompute every tab on the current base stream first (all at
+            once), e.g. after update_base_stream changed the data under tabs
+            added earlier. A tab that fails to recompute keeps its previous
+            data.
         """
         if not session.pending_tabs:
             return json.dumps(
@@ -570,6 +661,10 @@ def _build_server(
                     "error": "No widgets added. Call add_transition_graph or add_step_matrix first."
                 }
             )
-        return json.dumps(session.export(title, analysis, path))
+        refreshed = session.refresh_tabs(tools._build_tab) if refresh else None
+        report = session.export(title, analysis, path)
+        if refreshed is not None:
+            report["refreshed"] = refreshed
+        return json.dumps(report)
 
     return mcp
@@ -23,11 +23,12 @@ from __future__ import annotations
 import inspect
 import json
 import math
+import time
 from typing import Any
 
+from retentioneering._progress import checkpoint
 from retentioneering.eventstream.eventstream import Eventstream
 from retentioneering.mcp._agent_logic import (
-    _apply_preprocessors,
     _find_unlinked_numbers,
     _segment_overview_summary,
     _step_matrix_summary,
@@ -63,6 +64,8 @@ def load_data(
     path: str,
     schema: dict | None = None,
     context: dict | None = None,
+    max_paths: int | None = None,
+    sample: float | None = None,
 ) -> dict:
     """
     Load an eventstream from a local CSV file and set it as the base stream
@@ -85,21 +88,43 @@ def load_data(
            "segment_cols": [...]}
         Defaults to path_cols=["user_id"], event_col="event",
         timestamp_col="timestamp" for any key left unspecified.
+        Only the columns it names are read; list any other column you need
+        in "custom_cols".
     context:
         Optional semantic layer — same shape as serve()'s context argument
         (description, events, kpis). Replaces any context set previously.
+    max_paths:
+        Optional cap on the number of paths loaded. Use it (or sample) for
+        very large files: paths are picked by a hash of their id, so the same
+        call always loads the same paths.
+    sample:
+        Optional share of paths to load, between 0 and 1 (e.g. 0.1).
 
     Returns
     -------
-    Stream stats: n_paths, n_events_total, events list.
+    Stream stats: n_paths, n_events_total, events list, and a "load" entry
+    with bytes_read (an estimate: file size times passes over it),
+    bytes_in_memory, columns and load_seconds.
     {"error": ...} if the file can't be read or doesn't match the schema.
     """
+    from retentioneering.mcp._csv_loader import read_csv_pruned
+
+    checkpoint(f"reading {path}")
+    started = time.perf_counter()
     try:
-        stream = Eventstream(path, schema=schema)
+        df, load = read_csv_pruned(path, schema, max_paths=max_paths, sample=sample)
+        if df.empty:
+            return {"error": f"No events loaded from {path}."}
+        stream = Eventstream(df, schema=schema)
     except Exception as exc:
         return {"error": str(exc)}
+    load["load_seconds"] = round(time.perf_counter() - started, 3)
     session.load_data(stream, context)
-    return {"status": "data loaded", **ReportSession.stream_stats(stream)}
+    return {
+        "status": "data loaded",
+        **ReportSession.stream_stats(stream),
+        "load": load,
+    }
 
 
 def update_base_stream(session: Any, preprocessors: list) -> dict:
@@ -198,29 +223,33 @@ def describe_tool(tool: str = "") -> dict:
     return {"error": f"Unknown tool {t!r}.", **_tool_docs_index()}
 
 
-def describe(session: Any, context: dict) -> dict:
+def describe(session: Any, context: dict, approx: bool = False) -> dict:
     """Return schema, event list, unique path counts and available segments.
-    Reflects the current active stream (after any update_base_stream calls)."""
+    Reflects the current active stream (after any update_base_stream calls).
+    approx=True estimates n_paths with a sketch, for very large sources.
+    derived_cache reports how often local_preprocessors were served from the
+    session's cache of derived streams."""
     if (err := _require_stream(session)) is not None:
         return err
+    from retentioneering.tools.describe import Describe
+
     cur = session.active_stream
     s = cur.schema
-    ec, pc = s.event_col, s.path_col
-    df = cur.df
-    ts_col = s.timestamp_col
+    overview = Describe(cur).overview(approx=approx)
     result = {
-        "n_paths": int(df[pc].nunique()),
-        "n_events_total": len(df),
-        "event_col": ec,
-        "path_col": pc,
+        "n_paths": overview["shape"]["n_paths"],
+        "n_events_total": overview["shape"]["n_events"],
+        "event_col": s.event_col,
+        "path_col": s.path_col,
         "path_cols": s.path_cols,
         "segment_cols": s.segment_cols,
-        "timestamp_col": ts_col,
+        "timestamp_col": s.timestamp_col,
         "date_range": {
-            "min": str(df[ts_col].min())[:10],
-            "max": str(df[ts_col].max())[:10],
+            "min": str(overview["date_range"]["min"])[:10],
+            "max": str(overview["date_range"]["max"])[:10],
         },
-        "events": sorted(df[ec].astype(str).unique().tolist()),
+        "events": sorted(str(e) for e in overview["event_counts"]),
+        "derived_cache": session.cache_info(),
     }
     if context.get("events"):
         result["event_descriptions"] = context["events"]
@@ -276,16 +305,41 @@ def add_transition_graph(
     """
     if (err := _require_stream(session)) is not None:
         return err
-    src = _apply_preprocessors(session.active_stream, local_preprocessors or [])
+    params = {
+        "edge_weight": edge_weight,
+        "diff": diff,
+        "path_col": path_col,
+        "views": views,
+    }
+    data = _transition_graph_tab(session.derived(local_preprocessors or []), params)
+    if "error" in data:
+        return {"error": data["error"], "label": label}
+    tab_id = session.add_tab(label, data, local_preprocessors or [], params)
+
+    from retentioneering.widgets._payload import unpack_envelope
+
+    summary = _transition_graph_summary(
+        unpack_envelope(data["result"]), session.context_events, edge_weight
+    )
+    summary["tab_id"] = tab_id
+    summary["label"] = label
+    return summary
+
+
+def _transition_graph_tab(src: Eventstream, params: dict) -> dict:
+    """The report tab data of `add_transition_graph(**params)` over *src*,
+    or {"error": ...}."""
+    checkpoint("computing transition graph")
+    views = params.get("views")
     widget = src.transition_graph(
-        edge_weight=edge_weight,
-        diff=diff,
-        path_col=path_col or None,
+        edge_weight=params.get("edge_weight", "proba_out"),
+        diff=params.get("diff"),
+        path_col=params.get("path_col") or None,
         **({"views": views} if views else {}),
     )
     if widget.error:
-        return {"error": widget.error, "label": label}
-    data = {
+        return {"error": widget.error}
+    return {
         "widget_type": "transition_graph",
         "widget_id": widget.widget_id,
         "result": json.loads(widget.result or "{}"),
@@ -303,13 +357,6 @@ def add_transition_graph(
         "height": widget.height,
         "sidebar_open": False,
     }
-    tab_id = session.add_tab(label, data, local_preprocessors or [])
-
-    result_raw = json.loads(widget.result or "{}")
-    summary = _transition_graph_summary(result_raw, session.context_events, edge_weight)
-    summary["tab_id"] = tab_id
-    summary["label"] = label
-    return summary
 
 
 def add_step_matrix(
@@ -350,16 +397,40 @@ def add_step_matrix(
     """
     if (err := _require_stream(session)) is not None:
         return err
-    src = _apply_preprocessors(session.active_stream, local_preprocessors or [])
+    params = {
+        "max_steps": max_steps,
+        "diff": diff,
+        "path_pattern": path_pattern,
+        "path_col": path_col,
+    }
+    data = _step_matrix_tab(session.derived(local_preprocessors or []), params)
+    if "error" in data:
+        return {"error": data["error"], "label": label}
+    tab_id = session.add_tab(label, data, local_preprocessors or [], params)
+
+    from retentioneering.widgets._payload import unpack_envelope
+
+    summary = _step_matrix_summary(
+        unpack_envelope(data["result"]), session.context_events
+    )
+    summary["tab_id"] = tab_id
+    summary["label"] = label
+    return summary
+
+
+def _step_matrix_tab(src: Eventstream, params: dict) -> dict:
+    """The report tab data of `add_step_matrix(**params)` over *src*, or
+    {"error": ...}."""
+    checkpoint("computing step matrix")
     widget = src.step_matrix(
-        max_steps=max_steps,
-        diff=diff,
-        path_col=path_col or None,
-        path_pattern=path_pattern or None,
+        max_steps=params.get("max_steps", 10),
+        diff=params.get("diff"),
+        path_col=params.get("path_col") or None,
+        path_pattern=params.get("path_pattern") or None,
     )
     if widget.error:
-        return {"error": widget.error, "label": label}
-    data = {
+        return {"error": widget.error}
+    return {
         "widget_type": "step_matrix",
         "result": json.loads(widget.result or "{}"),
         "max_steps": widget.max_steps,
@@ -372,13 +443,6 @@ def add_step_matrix(
         "height": widget.height,
         "sidebar_open": False,
     }
-    tab_id = session.add_tab(label, data, local_preprocessors or [])
-
-    result_raw = json.loads(widget.result or "{}")
-    summary = _step_matrix_summary(result_raw, session.context_events)
-    summary["tab_id"] = tab_id
-    summary["label"] = label
-    return summary
 
 
 def add_segment_overview(
@@ -458,15 +522,34 @@ def add_segment_overview(
     """
     if (err := _require_stream(session)) is not None:
         return err
-    src = _apply_preprocessors(session.active_stream, local_preprocessors or [])
+    params = {"segment_col": segment_col, "metrics": metrics, "path_col": path_col}
+    data = _segment_overview_tab(session.derived(local_preprocessors or []), params)
+    if "error" in data:
+        return {"error": data["error"], "label": label}
+    tab_id = session.add_tab(label, data, local_preprocessors or [], params)
+
+    from retentioneering.widgets._payload import unpack_envelope
+
+    summary = _segment_overview_summary(
+        unpack_envelope(data["result"]), session.context_events
+    )
+    summary["tab_id"] = tab_id
+    summary["label"] = label
+    return summary
+
+
+def _segment_overview_tab(src: Eventstream, params: dict) -> dict:
+    """The report tab data of `add_segment_overview(**params)` over *src*, or
+    {"error": ...}."""
+    checkpoint("computing segment overview")
     widget = src.segment_overview(
-        segment_col=segment_col,
-        metrics=metrics or [],
-        path_col=path_col or None,
+        segment_col=params["segment_col"],
+        metrics=params.get("metrics") or [],
+        path_col=params.get("path_col") or None,
     )
     if widget.error:
-        return {"error": widget.error, "label": label}
-    data = {
+        return {"error": widget.error}
+    return {
         "widget_type": "segment_overview",
         "result": json.loads(widget.result or "{}"),
         "segment_col": widget.segment_col or "",
@@ -479,13 +562,18 @@ def add_segment_overview(
         "height": widget.height,
         "sidebar_open": False,
     }
-    tab_id = session.add_tab(label, data, local_preprocessors or [])
 
-    result_raw = json.loads(widget.result or "{}")
-    summary = _segment_overview_summary(result_raw, session.context_events)
-    summary["tab_id"] = tab_id
-    summary["label"] = label
-    return summary
+
+#: widget_type -> the function computing that kind of tab from its params
+_TAB_BUILDERS = {
+    "transition_graph": _transition_graph_tab,
+    "step_matrix": _step_matrix_tab,
+    "segment_overview": _segment_overview_tab,
+}
+
+
+def _build_tab(src: Eventstream, widget_type: str, params: dict) -> dict:
+    return _TAB_BUILDERS[widget_type](src, params)
 
 
 def get_conversion_rate(
@@ -553,7 +641,7 @@ def get_conversion_rate(
     """
     if (err := _require_stream(session)) is not None:
         return err
-    src = _apply_preprocessors(session.active_stream, local_preprocessors or [])
+    src = session.derived(local_preprocessors or [])
     try:
         frame = src.get_conversion_rate(
             start_anchor=start_anchor,
@@ -631,6 +719,7 @@ def export_report(
     session: Any,
     title: str = "Analysis Report",
     analysis: str | None = None,
+    refresh: bool = False,
 ) -> dict:
     """
     Finalize the report with all widgets added via add_transition_graph /
@@ -651,9 +740,17 @@ def export_report(
            [Timing:basket] takes 2.3 min on average. In the funnel
            [Purchase Funnel:payment_details] is the main bottleneck."
         Supports markdown: # headings, **bold**, *italic*, tables, - lists.
+    refresh:
+        Recompute every tab on the current base stream first (all at once),
+        e.g. after update_base_stream changed the data under tabs added
+        earlier. A tab that fails to recompute keeps its previous data.
     """
     if not session.pending_tabs:
         return {
             "error": "No widgets added. Call add_transition_graph or add_step_matrix first."
         }
-    return session.package(title, analysis)
+    refreshed = session.refresh_tabs(_build_tab) if refresh else None
+    report = session.package(title, analysis)
+    if refreshed is not None:
+        report["refreshed"] = refreshed
+    return report
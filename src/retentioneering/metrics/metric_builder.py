@@ -57,11 +57,13 @@ resolves against the eventstream's own events. in_segment/in_segment_bulk take
 no 'event_col': they match segment levels, not event names.
 """
 
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from retentioneering import engine
+from retentioneering._progress import checkpoint
 from retentioneering.engine import dialect
 from retentioneering.eventstream.event_type import EventTypes
 from retentioneering.exceptions import (
@@ -636,6 +638,52 @@ class MetricConfig:
             )
 
 
+def _key_cols(path_col: str | List[str]) -> List[str]:
+    """The columns of a path key: one, or several for a composite key"""
+    return [path_col] if isinstance(path_col, str) else list(path_col)
+
+
+def _key_sql(path_col: str | List[str]) -> str:
+    """A path key as a quoted SELECT / GROUP BY column list"""
+    return ", ".join(engine.quote_ident(col) for col in _key_cols(path_col))
+
+
+# Numbers the paths of a composite key in frames that need a single path column
+_COMPOSITE_KEY_COL = "__path_key__"
+
+
+def _active_days_sql(event_col: str, timestamp_col: str, active_events: Any) -> str:
+    """Per-path aggregate: distinct days with an event (of `active_events`, if
+    given)"""
+    event_col_q = engine.quote_ident(event_col)
+    day = f"CAST({engine.quote_ident(timestamp_col)} AS DATE)"
+    if not active_events:
+        return f"COUNT(DISTINCT {day})"
+    ev_list = active_events if isinstance(active_events, list) else [active_events]
+    return f"COUNT(DISTINCT CASE WHEN {event_col_q} IN ({quote_list(ev_list)}) THEN {day} END)"
+
+
+def _in_segment_sql(segment_name: str, level: Any, mode: str, threshold: Any) -> str:
+    """Per-path aggregate: 1 if the path belongs to `level` of `segment_name`
+    under `mode` (see `_build_in_segment`), else 0"""
+    segment_q = engine.quote_ident(segment_name)
+    hit = f"CASE WHEN {segment_q} = {quote_literal(level)} THEN 1 ELSE 0 END"
+    if mode == "any":
+        # segment_level appears at least once
+        return f"MAX({hit})"
+    if mode == "all":
+        # segment_level is the only value in the segment column
+        return (
+            f"CASE WHEN COUNT(DISTINCT {segment_q}) = 1 AND MAX({hit}) = 1 "
+            f"THEN 1 ELSE 0 END"
+        )
+    # event_share: segment_level appears in at least N% of events
+    return (
+        f"CASE WHEN CAST(SUM({hit}) AS DOUBLE) / COUNT(*) >= {threshold} "
+        f"THEN 1 ELSE 0 END"
+    )
+
+
 class MetricBuilder:
     """Main class for building metrics"""
 
@@ -643,7 +691,13 @@ class MetricBuilder:
         self.eventstream = eventstream
         self.df = eventstream.df
         self.df_with_start_end = None  # Lazy load for path_pattern metric
+        # Same, per composite key - see `_start_end_frame`
+        self._keyed_start_end: Dict[Any, pd.DataFrame] = {}
         self.schema = eventstream.schema
+        # Where wildcards (every event, every segment level) are resolved.
+        # The builder's own rows, except for the per-chunk builders of
+        # `iter_metrics`, which resolve against the whole eventstream.
+        self.vocabulary_df = eventstream.df
 
     def validate_metric_config(
         self,
@@ -830,17 +884,23 @@ class MetricBuilder:
                     )
 
     def build_metrics(
-        self, config: List[Dict[str, Any]], path_col: str | None = None
+        self, config: List[Dict[str, Any]], path_col: str | List[str] | None = None
     ) -> pd.DataFrame:
         """
         Main method for building metrics
 
         Args:
             config: List of metric configuration dicts with 'metric' and optional 'metric_args' fields
-            path_col: Path ID column (if None, taken from schema)
+            path_col: Path ID column (if None, taken from schema). A list of
+                columns is a composite key: every distinct combination of
+                their values is a path of its own, e.g. `[path_col,
+                segment_col]` measures each path separately within each
+                segment level. Missing values in key columns form their own
+                group.
 
         Returns:
-            DataFrame with path_id as index and metrics as columns
+            DataFrame with path_id as index and metrics as columns; for a
+            composite key, a MultiIndex with one level per key column
 
         Raises:
             InvalidMetricConfigError: If any metric configuration references an
@@ -848,22 +908,230 @@ class MetricBuilder:
                 instead of silently producing all-zero metrics.
         """
         path_col = path_col or self.schema.path_col
-        event_col = self.schema.event_col
+        metric_config = self._parse_and_validate(config)
+        return self._build_parsed(metric_config.parsed_configs, path_col)
+
+    def metrics_sql(
+        self, config: List[Dict[str, Any]], path_col: str | List[str] | None = None
+    ) -> Tuple[str, Dict[str, pd.DataFrame]]:
+        """
+        The `build_metrics` table as a query, for callers that go on to filter
+        or aggregate it in the engine instead of reading it back
+
+        Every metric that is an aggregate over a path's own rows becomes one
+        expression of a single `GROUP BY` over `df`, so the table is never
+        materialized in pandas. `matches_pattern`, which needs the anchor
+        matcher, is built as a frame the way `build_metrics` builds it and
+        joined in by path.
+
+        Args:
+            config: Metric configuration dicts, as for `build_metrics`
+            path_col: Path ID column (if None, taken from schema), or a list
+                of columns for a composite key
+
+        Returns:
+            The query - the key column(s), then one column per metric named as
+            in `build_metrics`, reading the rows as `df` - and the extra
+            frames it joins, to be registered alongside `df` in `engine.run`.
+            A `time_between` column is named by its parsed metric name, so a
+            custom `event_col` qualifies it as it does every other metric.
+        """
+        path_col = path_col or self.schema.path_col
+        metric_config = self._parse_and_validate(config)
 
-        available_events = set(self.df[event_col].unique().tolist())
+        columns: Dict[str, str] = {}
+        # Every metric column in config order, wherever it is computed
+        names: Dict[str, None] = {}
+        tables: Dict[str, pd.DataFrame] = {}
+        for parsed in metric_config.parsed_configs:
+            exprs = self._metric_exprs(parsed)
+            if exprs is None:
+                frame = self._build_parsed([parsed], path_col)
+                tables[f"metric_{len(tables)}"] = frame.reset_index()
+                names.update(dict.fromkeys(frame.columns))
+            else:
+                columns.update(exprs)
+                names.update(dict.fromkeys(exprs))
+
+        key_q = _key_sql(path_col)
+        selects = [key_q] + [
+            f"{expr} AS {engine.quote_ident(name)}" for name, expr in columns.items()
+        ]
+        query = f"SELECT {', '.join(selects)} FROM df GROUP BY {key_q}"
+        if tables:
+            joins = " ".join(f"LEFT JOIN {name} USING ({key_q})" for name in tables)
+            ordered = ", ".join([key_q] + [engine.quote_ident(n) for n in names])
+            query = f"SELECT {ordered} FROM ({query}) AS aggregates {joins}"
+        return query, tables
+
+    def _metric_exprs(self, config: Dict[str, Any]) -> Dict[str, str] | None:
+        """
+        Per-path aggregate expressions over `df` for one parsed config, keyed
+        by metric column name; None for a metric that is not a plain
+        aggregate (`matches_pattern`).
+
+        Each mirrors its `_build_*` counterpart, including the `path_start` /
+        `path_end` boundaries `time_between` may refer to: they carry their
+        path's first and last timestamp.
+        """
+        metric_type = config["type"]
+        event_col = config.get("event_col") or self.schema.event_col
+        event_col_q = engine.quote_ident(event_col)
+        timestamp_col_q = engine.quote_ident(self.schema.timestamp_col)
+        prefix = _prefix(config.get("event_col"))
+
+        def count(events: List[str]) -> str:
+            return f"COUNT(*) FILTER (WHERE {event_col_q} IN ({quote_list(events)}))"
+
+        if metric_type == "length":
+            return {"length": "COUNT(*)"}
+        if metric_type == "duration":
+            duration = dialect.epoch(f"MAX({timestamp_col_q}) - MIN({timestamp_col_q})")
+            return {"duration": f"CAST({duration} AS DOUBLE)"}
+        if metric_type == "first_event_time":
+            first = dialect.epoch(f"MIN({timestamp_col_q})")
+            return {"first_event_time": f"CAST({first} AS DOUBLE)"}
+        if metric_type == "active_days":
+            return {
+                "active_days": _active_days_sql(
+                    self.schema.event_col,
+                    self.schema.timestamp_col,
+                    config.get("active_events"),
+                )
+            }
+        if metric_type in ("event_count", "event_count_bulk"):
+            events = self._resolve_event_names(config, event_col)
+            return {f"{metric_type}_{prefix}{e}": count([e]) for e in events}
+        if metric_type in ("has_event", "has_event_bulk"):
+            events = self._resolve_event_names(config, event_col)
+            return {
+                f"{metric_type}_{prefix}{e}": f"CAST({count([e])} > 0 AS INTEGER)"
+                for e in events
+            }
+        if metric_type == "has_all_events":
+            present = " AND ".join(f"{count([e])} > 0" for e in config["events"])
+            return {config["metric_names"][0]: f"CAST({present} AS INTEGER)"}
+        if metric_type == "has_any_event":
+            present = f"{count(config['events'])} > 0"
+            return {config["metric_names"][0]: f"CAST({present} AS INTEGER)"}
+        if metric_type == "time_from_to":
+
+            def first_time(event: str) -> str:
+                if config.get("event_col") is None and event in SYNTHETIC_EVENTS:
+                    agg = "MIN" if event == EventTypes().PATH_START.name else "MAX"
+                    return f"{agg}({timestamp_col_q})"
+                return (
+                    f"MIN({timestamp_col_q}) FILTER "
+                    f"(WHERE {event_col_q} = {quote_literal(event)})"
+                )
+
+            diff = f"{first_time(config['end_event'])} - {first_time(config['start_event'])}"
+            return {config["metric_names"][0]: dialect.epoch(diff)}
+        if metric_type in ("in_segment", "in_segment_bulk"):
+            segment_name = config["segment_name"]
+            segment_names = (
+                list(self.schema.segment_cols)
+                if segment_name is None
+                else [segment_name]
+            )
+            exprs = {}
+            for name in segment_names:
+                levels = config["segment_levels"]
+                if levels is None:
+                    levels = self._resolve_segment_levels(name)
+                for level in levels:
+                    col = f"{metric_type}_{name}_{level}_{config['mode']}"
+                    exprs[col] = _in_segment_sql(
+                        name, level, config["mode"], config.get("threshold")
+                    )
+            return exprs
+        return None
+
+    def iter_metrics(
+        self,
+        config: List[Dict[str, Any]],
+        path_col: str | None = None,
+        chunk_size: int = 100_000,
+        paths: Any = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the `build_metrics` table in chunks of at most `chunk_size` paths
+
+        For consumers that cannot hold one row per path for every feature at
+        once (a wildcard `event_count_bulk` over millions of paths). Every
+        chunk has the same columns in the same order as `build_metrics` would
+        produce: the configs are validated once, and wildcards (every event,
+        every segment level) resolve against the whole eventstream rather than
+        against the chunk, which may not contain all of them.
+
+        Args:
+            config: Metric configuration dicts, as for `build_metrics`
+            path_col: Path ID column (if None, taken from schema)
+            chunk_size: Maximum number of paths per yielded frame
+            paths: Optional path ids to restrict to; the rest of the
+                eventstream is not read. Ids that are not in the eventstream
+                are ignored.
+
+        Yields:
+            DataFrame with path_id as index and metrics as columns, chunks in
+            order of the paths' first appearance in the eventstream
+        """
+        from dataclasses import asdict
+
+        from retentioneering.eventstream.eventstream import Eventstream
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive int, got {chunk_size}")
+
+        path_col = path_col or self.schema.path_col
+        metric_config = self._parse_and_validate(config)
+
+        df = self.df
+        if paths is not None:
+            df = df[df[path_col].isin(paths)]
+
+        # One factorize + stable sort instead of an `isin` per chunk: rows keep
+        # their (path, timestamp) order within each chunk, and the whole split
+        # costs a single pass however many chunks there are.
+        codes, _ = pd.factorize(df[path_col])
+        chunk_of_row = codes // chunk_size
+        order = np.argsort(chunk_of_row, kind="stable")
+        n_chunks = int(chunk_of_row.max()) + 1 if len(chunk_of_row) else 0
+        bounds = np.searchsorted(chunk_of_row[order], np.arange(n_chunks + 1))
+
+        schema = asdict(self.schema)
+        for i, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:]), start=1):
+            checkpoint(f"metrics: chunk {i}/{n_chunks}")
+            chunk_df = df.iloc[order[lo:hi]].reset_index(drop=True)
+            chunk = MetricBuilder(Eventstream(chunk_df, schema, preprocess=False))
+            chunk.vocabulary_df = self.vocabulary_df
+            yield chunk._build_parsed(metric_config.parsed_configs, path_col)
+
+    def _parse_and_validate(self, config: List[Dict[str, Any]]) -> MetricConfig:
+        """Parses `config` and validates every entry against the eventstream's
+        events and segment levels"""
+        event_col = self.schema.event_col
+        available_events = set(self.vocabulary_df[event_col].unique().tolist())
         metric_config = MetricConfig(config, available_events=available_events)
 
         for parsed in metric_config.parsed_configs:
             self.validate_metric_config(
                 parsed["original"], available_events=available_events
             )
+        return metric_config
 
-        path_ids = self.df[path_col].unique()
+    def _build_parsed(
+        self, parsed_configs: List[Dict[str, Any]], path_col: str
+    ) -> pd.DataFrame:
+        """Builds already validated configs over this builder's rows, one row
+        per path"""
+        event_col = self.schema.event_col
+        path_ids = self._path_ids(path_col)
 
         metric_dfs: List[pd.DataFrame] = []
 
         # Build metrics for each configuration
-        for config_item in metric_config.parsed_configs:
+        for config_item in parsed_configs:
             metric_df = self._build_metric(config_item, path_col, event_col)
 
             # For time_from_to metrics, keep NaN values (don't fill with 0)
@@ -879,9 +1147,66 @@ class MetricBuilder:
         else:
             result_df = pd.DataFrame(index=path_ids)
 
-        result_df.index.name = path_col
+        result_df.index.names = _key_cols(path_col)
         return result_df
 
+    def _path_ids(self, path_col: str | List[str]) -> pd.Index:
+        """Every path of `path_col` in order of first appearance; a MultiIndex
+        for a composite key"""
+        if isinstance(path_col, str):
+            return pd.Index(self.df[path_col].unique())
+        return pd.MultiIndex.from_frame(self.df[_key_cols(path_col)].drop_duplicates())
+
+    def _start_end_frame(
+        self, path_col: str | List[str], event_col: str
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        The rows with `path_start`/`path_end` added at `path_col`'s grain, and
+        the column identifying a path in them.
+
+        Boundaries need a single path column. A composite key gets one holding
+        each path's position in `_path_ids` - the rows of `self.df` are not
+        copied, only the handful of columns the boundary metrics read.
+        """
+        if isinstance(path_col, str):
+            if self.df_with_start_end is None:
+                self.df_with_start_end = self.eventstream.add_start_end_events(
+                    path_col=path_col
+                ).df
+            return self.df_with_start_end, path_col
+
+        from retentioneering.data_processors.add_start_end_events import (
+            AddStartEndEvents,
+        )
+
+        keys = _key_cols(path_col)
+        cache_key = (tuple(keys), event_col)
+        if cache_key not in self._keyed_start_end:
+            schema = self.schema
+            cols = list(
+                dict.fromkeys(
+                    [
+                        schema.path_col,
+                        schema.event_col,
+                        event_col,
+                        schema.event_type,
+                        schema.timestamp_col,
+                        schema.index,
+                        schema.subindex,
+                    ]
+                )
+            )
+            # sort=False numbers groups in order of first appearance, the
+            # order `_path_ids` lists them in
+            key_codes = self.df.groupby(
+                keys, dropna=False, sort=False, observed=True
+            ).ngroup()
+            narrow = self.df[cols].assign(**{_COMPOSITE_KEY_COL: key_codes})
+            self._keyed_start_end[cache_key], _ = AddStartEndEvents(
+                _COMPOSITE_KEY_COL
+            ).apply(narrow, schema)
+        return self._keyed_start_end[cache_key], _COMPOSITE_KEY_COL
+
     def _build_metric(
         self, config: Dict[str, Any], path_col: str, event_col: str
     ) -> pd.DataFrame:
@@ -926,7 +1251,7 @@ class MetricBuilder:
         event_names = config["event_names"]
         if event_names is None:
             # Wildcard: 'events' was omitted/None - count every event in the stream.
-            event_names = sorted(self.df[event_col].unique().tolist())
+            event_names = sorted(self.vocabulary_df[event_col].unique().tolist())
         return event_names
 
     def _build_count_pivot(
@@ -940,7 +1265,7 @@ class MetricBuilder:
         into one column per event named '{col_prefix}{event}'. Used directly by
         event_count/event_count_bulk, and as the basis for has_event/has_event_bulk
         (via >0) and has_all_events/has_any_event (via row-wise all()/any())."""
-        path_col_q = engine.quote_ident(path_col)
+        path_col_q = _key_sql(path_col)
         event_col_q = engine.quote_ident(event_col)
         events_quoted = quote_list(event_names)
         query = f"""
@@ -960,7 +1285,7 @@ class MetricBuilder:
 
         # Pivot: path_id as index, events as columns
         metrics_df = (
-            result.set_index([path_col, event_col])["count"]
+            result.set_index([*_key_cols(path_col), event_col])["count"]
             .unstack(fill_value=0)
             .reindex(columns=event_names, fill_value=0)
         )
@@ -1028,45 +1353,41 @@ class MetricBuilder:
         end_event = config["end_event"]
         timestamp_col = self.schema.timestamp_col
 
-        # Lazy load dataframe with start_end events (needed for path_start/path_end)
-        if self.df_with_start_end is None:
-            self.df_with_start_end = self.eventstream.add_start_end_events(
-                path_col=path_col
-            ).df
+        # Rows with start_end events (needed for path_start/path_end)
+        df_with_start_end, key_col = self._start_end_frame(path_col, event_col)
 
-        path_col_q = engine.quote_ident(path_col)
+        key_col_q = engine.quote_ident(key_col)
         event_col_q = engine.quote_ident(event_col)
         timestamp_col_q = engine.quote_ident(timestamp_col)
         query = f"""
         WITH first_events AS (
             SELECT
-                {path_col_q},
+                {key_col_q},
                 MIN(CASE WHEN {event_col_q} = {quote_literal(start_event)} THEN {timestamp_col_q} END) as time_from,
                 MIN(CASE WHEN {event_col_q} = {quote_literal(end_event)} THEN {timestamp_col_q} END) as time_to
             FROM df_with_start_end
-            GROUP BY {path_col_q}
+            GROUP BY {key_col_q}
         )
         SELECT
-            {path_col_q},
+            {key_col_q},
             {dialect.epoch("time_to - time_from")} as time_diff_seconds
         FROM first_events
         WHERE time_from IS NOT NULL AND time_to IS NOT NULL
         """
 
-        result = engine.run(query, df_with_start_end=self.df_with_start_end)
+        result = engine.run(query, df_with_start_end=df_with_start_end)
+        result = self._rekey(result.set_index(key_col), path_col)
 
         metric_name = f"time_from_{start_event}_to_{end_event}"
         if len(result) > 0:
-            return result.set_index(path_col).rename(
-                columns={"time_diff_seconds": metric_name}
-            )
+            return result.rename(columns={"time_diff_seconds": metric_name})
         else:
             # Empty result - no paths have both events
             return pd.DataFrame(columns=[metric_name])
 
     def _build_length(self, path_col: str) -> pd.DataFrame:
         """Number of steps (events) per path"""
-        path_col_q = engine.quote_ident(path_col)
+        path_col_q = _key_sql(path_col)
         query = f"""
         SELECT {path_col_q}, COUNT(*) AS length
         FROM df
@@ -1078,7 +1399,7 @@ class MetricBuilder:
     def _build_duration(self, path_col: str) -> pd.DataFrame:
         """Duration in seconds between first and last event per path"""
         timestamp_col = self.schema.timestamp_col
-        path_col_q = engine.quote_ident(path_col)
+        path_col_q = _key_sql(path_col)
         timestamp_col_q = engine.quote_ident(timestamp_col)
         query = f"""
         SELECT {path_col_q}, {dialect.epoch(f"MAX({timestamp_col_q}) - MIN({timestamp_col_q})")} AS duration
@@ -1093,7 +1414,7 @@ class MetricBuilder:
         """Unix timestamp (seconds) of first event per path.
         Stored as float so mean/median/percentile aggregations work correctly."""
         timestamp_col = self.schema.timestamp_col
-        path_col_q = engine.quote_ident(path_col)
+        path_col_q = _key_sql(path_col)
         timestamp_col_q = engine.quote_ident(timestamp_col)
         query = f"""
         SELECT {path_col_q}, {dialect.epoch(f"MIN({timestamp_col_q})")} AS first_event_time
@@ -1107,19 +1428,10 @@ class MetricBuilder:
     def _build_active_days(self, path_col: str, active_events=None) -> pd.DataFrame:
         """Number of unique days with at least one (matching) event per path.
         active_events: optional list of events to count; if None, all events count."""
-        timestamp_col = self.schema.timestamp_col
-        event_col = self.schema.event_col
-        path_col_q = engine.quote_ident(path_col)
-        event_col_q = engine.quote_ident(event_col)
-        timestamp_col_q = engine.quote_ident(timestamp_col)
-        if active_events:
-            ev_list = (
-                active_events if isinstance(active_events, list) else [active_events]
-            )
-            quoted = quote_list(ev_list)
-            count_expr = f"COUNT(DISTINCT CASE WHEN {event_col_q} IN ({quoted}) THEN CAST({timestamp_col_q} AS DATE) END)"
-        else:
-            count_expr = f"COUNT(DISTINCT CAST({timestamp_col_q} AS DATE))"
+        path_col_q = _key_sql(path_col)
+        count_expr = _active_days_sql(
+            self.schema.event_col, self.schema.timestamp_col, active_events
+        )
         query = f"""
         SELECT {path_col_q}, {count_expr} AS active_days
         FROM df
@@ -1142,11 +1454,8 @@ class MetricBuilder:
         pattern = config["pattern"]
         metric_name = config["metric_names"][0]
 
-        # Lazy load dataframe with start_end events (needed for path_start/path_end in patterns)
-        if self.df_with_start_end is None:
-            self.df_with_start_end = self.eventstream.add_start_end_events(
-                path_col=path_col
-            ).df
+        # Rows with start_end events (needed for path_start/path_end in patterns)
+        df_with_start_end, key_col = self._start_end_frame(path_col, event_col)
 
         # Token existence is checked by `validate_metric_config`, which every
         # build goes through; normalizing here only settles the redundant
@@ -1154,16 +1463,27 @@ class MetricBuilder:
         pattern = anchors.normalize_pattern(pattern, warn=False, param="pattern")
 
         match = anchors.resolve_anchors(
-            self.df_with_start_end,
+            df_with_start_end,
             self.schema,
             pattern,
-            path_col=path_col,
+            path_col=key_col,
             event_col=event_col,
         )
         matched = match.paths()
 
-        all_paths = pd.Index(self.df_with_start_end[path_col].unique(), name=path_col)
-        return pd.DataFrame({metric_name: all_paths.isin(matched)}, index=all_paths)
+        all_paths = pd.Index(df_with_start_end[key_col].unique(), name=key_col)
+        return self._rekey(
+            pd.DataFrame({metric_name: all_paths.isin(matched)}, index=all_paths),
+            path_col,
+        )
+
+    def _rekey(self, frame: pd.DataFrame, path_col: str | List[str]) -> pd.DataFrame:
+        """Maps a frame indexed by `_start_end_frame`'s path column back to
+        `path_col`'s own ids"""
+        if isinstance(path_col, str):
+            return frame
+        frame.index = self._path_ids(path_col)[frame.index.to_numpy(dtype=np.int64)]
+        return frame
 
     def _build_in_segment(self, config: Dict[str, Any], path_col: str) -> pd.DataFrame:
         """
@@ -1224,7 +1544,7 @@ class MetricBuilder:
         representation for a stable column order. Missing values are skipped -
         NaN can't be compared with `=` in SQL, so a NaN "level" would only ever
         produce an all-zero column."""
-        unique_values = self.df[segment_name].unique().tolist()
+        unique_values = self.vocabulary_df[segment_name].unique().tolist()
         return sorted((v for v in unique_values if not pd.isna(v)), key=str)
 
     def _build_in_segment_columns(
@@ -1240,78 +1560,27 @@ class MetricBuilder:
         column per level of a single segment column, named
         '{col_prefix}{segment_name}_{level}_{mode}'. `segment_levels=None`
         resolves to every level present in the column."""
-        df = self.df
-
         if segment_levels is None:
             segment_levels = self._resolve_segment_levels(segment_name)
 
         metric_names = [
             f"{col_prefix}{segment_name}_{v}_{mode}" for v in segment_levels
         ]
-
-        # Build metrics for each segment level
-        result_dfs = []
-        path_col_q = engine.quote_ident(path_col)
-        segment_name_q = engine.quote_ident(segment_name)
-
-        for segment_level, metric_name in zip(segment_levels, metric_names):
-            # Format value for SQL comparison
-            sql_value = quote_literal(segment_level)
-
-            if mode == "any":
-                # Path belongs if segment_level appears at least once
-                query = f"""
-                SELECT
-                    {path_col_q},
-                    MAX(CASE WHEN {segment_name_q} = {sql_value} THEN 1 ELSE 0 END) AS belongs
-                FROM df
-                GROUP BY {path_col_q}
-                """
-                result = engine.run(query, df=df)
-
-            elif mode == "all":
-                # Path belongs if segment_level is the only value in the segment column
-                query = f"""
-                WITH path_segment_levels AS (
-                    SELECT
-                        {path_col_q},
-                        COUNT(DISTINCT {segment_name_q}) AS distinct_values,
-                        MAX(CASE WHEN {segment_name_q} = {sql_value} THEN 1 ELSE 0 END) AS has_target
-                    FROM df
-                    GROUP BY {path_col_q}
-                )
-                SELECT
-                    {path_col_q},
-                    CASE WHEN distinct_values = 1 AND has_target = 1 THEN 1 ELSE 0 END AS belongs
-                FROM path_segment_levels
-                """
-                result = engine.run(query, df=df)
-
-            elif mode == "event_share":
-                # Path belongs if segment_level appears in at least N% of events
-                query = f"""
-                WITH path_counts AS (
-                    SELECT
-                        {path_col_q},
-                        COUNT(*) AS total_events,
-                        SUM(CASE WHEN {segment_name_q} = {sql_value} THEN 1 ELSE 0 END) AS target_events
-                    FROM df
-                    GROUP BY {path_col_q}
-                )
-                SELECT
-                    {path_col_q},
-                    CASE WHEN CAST(target_events AS DOUBLE) / total_events >= {threshold} THEN 1 ELSE 0 END AS belongs
-                FROM path_counts
-                """
-                result = engine.run(query, df=df)
-            else:
-                continue
-
-            result_dfs.append(
-                result.set_index(path_col).rename(columns={"belongs": metric_name})
-            )
-
-        if not result_dfs:
+        if not metric_names:
             return pd.DataFrame(columns=metric_names)
 
-        return pd.concat(result_dfs, axis=1)
+        # One pass for every level; positional aliases, since two levels may
+        # spell the same column name
+        path_col_q = _key_sql(path_col)
+        belongs = ", ".join(
+            f"{_in_segment_sql(segment_name, level, mode, threshold)} AS belongs_{i}"
+            for i, level in enumerate(segment_levels)
+        )
+        query = f"""
+        SELECT {path_col_q}, {belongs}
+        FROM df
+        GROUP BY {path_col_q}
+        """
+        result = engine.run(query, df=self.df).set_index(path_col)
+        result.columns = metric_names
+        return result
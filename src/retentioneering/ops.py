@@ -33,6 +33,8 @@ from dataclasses import dataclass, field
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+from retentioneering._progress import checkpoint
+
 if TYPE_CHECKING:
     from retentioneering.eventstream.eventstream import Eventstream
 
@@ -194,7 +196,10 @@ def apply_op(stream: "Eventstream", op_: dict | Op) -> "Eventstream":
 def apply_ops(stream: "Eventstream", ops: list[dict | Op]) -> "Eventstream":
     """Apply an ordered list of ops to `stream`, in order, returning the final
     `Eventstream`. Used by `Eventstream.from_recipe()` and by
-    `mcp/server.py`'s `_apply_preprocessors`."""
-    for op_ in ops:
+    `mcp/server.py`'s `_apply_preprocessors`. Each op is a progress
+    checkpoint (see `_progress`)."""
+    for i, op_ in enumerate(ops, start=1):
+        op_type = op_.type if isinstance(op_, Op) else dict(op_).get("type")
+        checkpoint(f"step {i}/{len(ops)}: {op_type}")
         stream = apply_op(stream, op_)
     return stream
@@ -68,7 +68,10 @@ bound.
 
 from __future__ import annotations
 
+import threading
 import warnings
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Iterable, Sequence
 
@@ -868,6 +871,70 @@ def parse_specs(value: object, *, param: str = "anchor") -> list[AnchorSpec]:
     )
 
 
+#: Step numberings `_step_numbering` keeps, most recently used last
+_NUMBERINGS_SIZE = 4
+_numberings: OrderedDict[tuple, tuple[weakref.ref, pd.DataFrame]] = OrderedDict()
+_numberings_lock = threading.Lock()
+
+
+def _step_numbering(
+    df: pd.DataFrame, schema: "EventstreamSchema", path_col: str
+) -> pd.DataFrame:
+    """
+    Every row of `df` with its 1-based step within its path.
+
+    Columns ``p`` (the path id), ``idx`` (``schema.index``), ``ts`` and
+    ``step``. Kept for the last few frames it was asked for — an anchored
+    tool resolves a start and an end bound on the same frame, and a widget
+    re-resolves on every parameter change — and dropped as soon as the frame
+    is. Eventstream frames are never modified in place, so a frame's
+    numbering stays valid for as long as the frame lives.
+    """
+    key = (
+        id(df),
+        len(df),
+        path_col,
+        schema.index,
+        schema.subindex,
+        schema.timestamp_col,
+    )
+    with _numberings_lock:
+        cached = _numberings.get(key)
+        if cached is not None and cached[0]() is df:
+            _numberings.move_to_end(key)
+            return cached[1]
+
+    path_q = engine.quote_ident(path_col)
+    index_q = engine.quote_ident(schema.index)
+    subindex_q = engine.quote_ident(schema.subindex)
+    ts_q = engine.quote_ident(schema.timestamp_col)
+    numbering = engine.run(
+        f"""
+        SELECT {path_q} AS p, {index_q} AS idx, {ts_q} AS ts,
+               row_number() OVER (
+                   PARTITION BY {path_q} ORDER BY {index_q}, {subindex_q}
+               ) AS step
+        FROM df
+        """,
+        df=df,
+    )
+    with _numberings_lock:
+        _numberings[key] = (weakref.ref(df), numbering)
+        _numberings.move_to_end(key)
+        while len(_numberings) > _NUMBERINGS_SIZE:
+            _numberings.popitem(last=False)
+    weakref.finalize(df, _forget_numbering, key)
+    return numbering
+
+
+def _forget_numbering(key: tuple) -> None:
+    with _numberings_lock:
+        cached = _numberings.get(key)
+        # The id may already be reused by a newer frame's entry
+        if cached is not None and cached[0]() is None:
+            del _numberings[key]
+
+
 def _offset_query(
     schema: "EventstreamSchema",
     path_col: str,
@@ -877,64 +944,65 @@ def _offset_query(
     in_steps: bool,
 ) -> str:
     """
-    SQL resolving an anchor row to a bound `offset` away from it.
+    SQL moving each anchor row `offset` away and reading off where it landed.
+
+    Reads the frame's rows from ``steps`` (see :func:`_step_numbering`) and
+    returns `path_col`, ``step`` and ``bound`` — the same three columns as the
+    anchor itself, in one pass over the numbering.
 
     An offset that runs past the path's own boundary clamps to it — "10 steps
     after B" on a path with 4 events left is those 4 events, not an empty
     window and not a dropped path.
     """
     path_q = engine.quote_ident(path_col)
-    index_q = engine.quote_ident(schema.index)
-    subindex_q = engine.quote_ident(schema.subindex)
-    ts_q = engine.quote_ident(schema.timestamp_col)
-
-    base = f"""
-        SELECT {path_q} AS p, {index_q} AS idx, {ts_q} AS ts,
-               row_number() OVER (
-                   PARTITION BY {path_q} ORDER BY {index_q}, {subindex_q}
-               ) AS step
-        FROM df
-    """
-    edges = "SELECT p, MIN(idx) AS min_idx, MAX(idx) AS max_idx, MAX(step) AS max_step FROM base GROUP BY p"
+    edges = "SELECT p, MIN(idx) AS min_idx, MAX(idx) AS max_idx, MAX(step) AS max_step FROM steps GROUP BY p"
 
     if in_steps:
         # Out of range in either direction clamps to the corresponding edge.
-        return f"""
-            WITH base AS ({base}), edges AS ({edges}),
-            want AS (
-                SELECT a.{path_q} AS p, a.step + {int(offset)} AS want FROM anchor a
-            )
-            SELECT w.p AS {path_q},
+        moved = f"""
+            SELECT w.p,
                    COALESCE(
                        b.idx,
                        CASE WHEN w.want > e.max_step THEN e.max_idx ELSE e.min_idx END
                    ) AS bound
-            FROM want w
+            FROM (
+                SELECT a.{path_q} AS p, a.step + {int(offset)} AS want FROM anchor a
+            ) w
             JOIN edges e ON e.p = w.p
-            LEFT JOIN base b ON b.p = w.p AND b.step = w.want
+            LEFT JOIN steps b ON b.p = w.p AND b.step = w.want
         """
-
-    # A time offset lands on a timestamp, not on an event: a start bound takes
-    # the first event at or after the mark, an end bound the last one at or
-    # before it. Exact hits are inside the window on both sides.
-    mark = f"""
-        SELECT a.{path_q} AS p, b.ts + {dialect.interval_seconds(offset)} AS mark
-        FROM anchor a JOIN base b ON b.p = a.{path_q} AND b.idx = a.bound
-    """
-    if offset_side == "start":
-        pick, fallback, cmp = "MIN(b.idx)", "e.max_idx", "b.ts >= m.mark"
     else:
-        pick, fallback, cmp = "MAX(b.idx)", "e.min_idx", "b.ts <= m.mark"
-    # Grouped by the mark itself, not only by the path: with `occurrence="all"`
-    # one path carries several anchors, and grouping by path alone would fold
-    # them into a single bound.
+        # A time offset lands on a timestamp, not on an event: a start bound
+        # takes the first event at or after the mark, an end bound the last one
+        # at or before it. Exact hits are inside the window on both sides.
+        if offset_side == "start":
+            pick, fallback, cmp = "MIN(b.idx)", "e.max_idx", "b.ts >= m.mark"
+        else:
+            pick, fallback, cmp = "MAX(b.idx)", "e.min_idx", "b.ts <= m.mark"
+        # Grouped by the mark itself, not only by the path: with
+        # `occurrence="all"` one path carries several anchors, and grouping by
+        # path alone would fold them into a single bound.
+        moved = f"""
+            SELECT m.p, COALESCE({pick}, {fallback}) AS bound
+            FROM (
+                SELECT a.{path_q} AS p,
+                       b.ts + {dialect.interval_seconds(offset)} AS mark
+                FROM anchor a JOIN steps b ON b.p = a.{path_q} AND b.idx = a.bound
+            ) m
+            JOIN edges e ON e.p = m.p
+            LEFT JOIN steps b ON b.p = m.p AND {cmp}
+            GROUP BY m.p, m.mark, {fallback}
+        """
+
+    # Back to step space: the moved bound is a real event row, so index and
+    # step identify each other unambiguously there. DISTINCT because two
+    # anchors of the same path can be moved onto the same row — an offset that
+    # runs past the path's end clamps both to it — and a bound repeated twice
+    # would mark the same event twice.
     return f"""
-        WITH base AS ({base}), edges AS ({edges}), mark AS ({mark})
-        SELECT m.p AS {path_q}, COALESCE({pick}, {fallback}) AS bound
-        FROM mark m
-        JOIN edges e ON e.p = m.p
-        LEFT JOIN base b ON b.p = m.p AND {cmp}
-        GROUP BY m.p, m.mark, {fallback}
+        WITH edges AS ({edges}), moved AS ({moved})
+        SELECT DISTINCT m.p AS {path_q}, b.step AS step, m.bound AS bound
+        FROM moved m JOIN steps b ON b.p = m.p AND b.idx = m.bound
     """
 
 
@@ -955,31 +1023,6 @@ def _anchor_part(spec: AnchorSpec) -> int:
     return max(i for i, start in enumerate(starts) if start <= resolved_ordinal)
 
 
-def _step_query(schema: "EventstreamSchema", path_col: str) -> str:
-    """SQL putting an anchor's ``schema.index`` bound back in step space.
-
-    Only used after an offset has moved the bound: an offset lands on a real
-    event row, so index and step identify each other unambiguously there.
-    """
-    path_q = engine.quote_ident(path_col)
-    index_q = engine.quote_ident(schema.index)
-    subindex_q = engine.quote_ident(schema.subindex)
-    # DISTINCT because two anchors of the same path can be moved onto the same
-    # row — an offset that runs past the path's end clamps both to it — and a
-    # bound repeated twice would mark the same event twice.
-    return f"""
-        WITH base AS (
-            SELECT {path_q} AS p, {index_q} AS idx,
-                   row_number() OVER (
-                       PARTITION BY {path_q} ORDER BY {index_q}, {subindex_q}
-                   ) AS step
-            FROM df
-        )
-        SELECT DISTINCT a.{path_q} AS {path_q}, b.step AS step, a.bound AS bound
-        FROM anchor a JOIN base b ON b.p = a.{path_q} AND b.idx = a.bound
-    """
-
-
 def resolve_positions(
     df: pd.DataFrame,
     schema: "EventstreamSchema",
@@ -1058,8 +1101,8 @@ def resolve_positions(
         resolved_side = "end" if seconds < 0 else "start"
 
     query = _offset_query(schema, path_col, seconds, resolved_side, in_steps=in_steps)
-    moved = engine.run(query, df=df, anchor=anchor)
-    return engine.run(_step_query(schema, path_col), df=df, anchor=moved)
+    steps = _step_numbering(df, schema, path_col)
+    return engine.run(query, steps=steps, anchor=anchor)
 
 
 def resolve_bound(
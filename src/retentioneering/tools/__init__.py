@@ -1,8 +1,16 @@
-from .transition_matrix import TransitionMatrix
-from .step_matrix import StepMatrix
-from .funnel import Funnel
-from .segment_overview import SegmentOverview
-from .cluster_analysis import ClusterAnalysis
+# The tools are loaded on first access (PEP 562), not with the package:
+# `eventstream` imports `tools.types`, which runs this file, and
+# `ClusterAnalysis` alone would otherwise pull in sklearn and scipy for
+# every `import retentioneering`.
+import importlib
+
+_MODULES = {
+    "TransitionMatrix": ".transition_matrix",
+    "StepMatrix": ".step_matrix",
+    "Funnel": ".funnel",
+    "SegmentOverview": ".segment_overview",
+    "ClusterAnalysis": ".cluster_analysis",
+}
 
 __all__ = [
     "TransitionMatrix",
@@ -11,3 +19,15 @@ __all__ = [
     "SegmentOverview",
     "ClusterAnalysis",
 ]
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
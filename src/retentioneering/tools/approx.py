@@ -0,0 +1,287 @@
+"""
+Approximate tool results, with error bars, from a sample of paths.
+
+`approximate(eventstream, compute, frac)` runs `compute` — a function of an
+eventstream returning a DataFrame, a Series, a number, or dicts, lists and
+tuples of those, such as a headless ``*_data`` method — on the `frac` hash
+sample of paths (see `utils.sampling`) rather than on the whole stream, and
+returns the result with a 95% confidence interval for every number in it.
+
+The sample is the same on every call with the same `frac`, so switching a
+parameter back and forth shows the same estimate each time, and it is cached
+per eventstream, so only the first call pays for the filter.
+
+The intervals come from random groups: the sample is split into `GROUPS`
+parts by path hash, `compute` runs on each part too, and the spread of those
+answers gives the standard error of the whole sample's. That needs no formula
+per metric — a median or a share of paths gets an interval as readily as a
+count — for `GROUPS` extra calls on data a tenth the sample's size. A cell
+some parts have no value for (an event none of their paths reach) takes its
+interval from the others, as does a whole part the call fails on (a funnel
+step none of its paths reach); one with fewer than two values has none (NaN).
+
+Counts — of transitions, of paths — grow with the sample and are scaled up
+by ``1 / frac``: the caller says which numbers those are with `scale`.
+"""
+
+from __future__ import annotations
+
+import threading
+import warnings
+import weakref
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from retentioneering.exceptions import (
+    InvalidParameterError,
+    OperationCancelledError,
+    RetentioneeringError,
+)
+from retentioneering.utils.sampling import hash_sample
+from retentioneering.utils.stream_cache import per_stream_cache
+
+if TYPE_CHECKING:
+    from retentioneering.eventstream.eventstream import Eventstream
+
+__all__ = ["GROUPS", "Approximation", "approximate", "scale_all"]
+
+#: Parts the sample is split into for the error bars
+GROUPS = 10
+#: Seed of the path hash; fixed, so every call samples the same paths
+SEED = 0
+#: 97.5th percentile of Student's t by degrees of freedom (index 0 unused)
+_T975 = np.array(
+    [np.nan, 12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262]
+)
+
+# eventstream -> {(path_col, frac): (sample, [GROUPS parts of it], paths)}
+_samples: weakref.WeakKeyDictionary = per_stream_cache()
+_samples_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Approximation:
+    """
+    A tool's result estimated from a `frac` sample of `paths` paths.
+
+    `value` has the shape the exact call returns. `low` and `high` have the
+    same shape and hold the bounds of each number's 95% confidence interval;
+    what isn't a number, like an event name, is copied into both as is.
+    """
+
+    value: Any
+    low: Any
+    high: Any
+    frac: float
+    paths: int
+
+
+def approximate(
+    eventstream: Eventstream,
+    compute: Callable[[Eventstream], Any],
+    frac: float,
+    path_col: str | None = None,
+    scale: Callable[[Any, float], Any] | None = None,
+) -> Approximation:
+    """
+    Estimate ``compute(eventstream)`` from the `frac` sample of its paths.
+
+    `scale(result, factor)` returns `result` with its counts multiplied by
+    `factor`; leave it out when the result has none (shares, rates, times).
+    """
+    if (
+        isinstance(frac, bool)
+        or not isinstance(frac, (int, float))
+        or not 0 < frac <= 1
+    ):
+        raise InvalidParameterError("sample", frac)
+    path_col = path_col or eventstream.schema.path_col
+    if frac == 1:
+        value = compute(eventstream)
+        paths = int(eventstream.df[path_col].nunique())
+        return Approximation(value, value, value, 1.0, paths)
+
+    sample, parts, paths = _sample(eventstream, path_col, float(frac))
+    value = compute(sample)
+    estimates = [_compute_part(compute, part) for part in parts]
+    if scale is not None:
+        value = scale(value, 1 / frac)
+        # Each part is a GROUPS-th of the sample: scaled up to the whole
+        # stream, their mean is `value`
+        estimates = [
+            scale(e, GROUPS / frac) if e is not None else None for e in estimates
+        ]
+    low, high = _interval(value, estimates)
+    return Approximation(value, low, high, float(frac), paths)
+
+
+def _compute_part(compute: Callable[[Eventstream], Any], part: Eventstream) -> Any:
+    """`compute(part)`, or None when the part can't answer — it has no paths,
+    or none reaching an event the call names — and so adds no estimate."""
+    try:
+        return compute(part)
+    except OperationCancelledError:
+        raise
+    except RetentioneeringError:
+        return None
+
+
+def scale_all(result: Any, factor: float) -> Any:
+    """`result` with every number in it multiplied by `factor`."""
+    if isinstance(result, pd.DataFrame):
+        scaled = result.copy()
+        for position in _numeric_positions(result):
+            scaled.isetitem(position, result.iloc[:, position] * factor)
+        return scaled
+    if isinstance(result, pd.Series):
+        return result * factor if _is_numeric(result.dtype) else result
+    if isinstance(result, dict):
+        return {k: scale_all(v, factor) for k, v in result.items()}
+    if isinstance(result, (list, tuple)):
+        return type(result)(scale_all(v, factor) for v in result)
+    if _is_number(result):
+        return result * factor
+    return result
+
+
+def _sample(eventstream: Eventstream, path_col: str, frac: float):
+    key = (path_col, frac)
+    with _samples_lock:
+        cached = _samples.get(eventstream, {}).get(key)
+    if cached is not None:
+        return cached
+
+    from retentioneering.eventstream.eventstream import Eventstream
+
+    schema = eventstream.schema
+    df = hash_sample(eventstream.df, path_col, frac, seed=SEED, groups=GROUPS)
+    for col in [schema.event_col] + schema.segment_cols:
+        df[col] = df[col].astype("category").cat.remove_unused_categories()
+    group = df.pop("__group").to_numpy()
+    schema_dict = asdict(schema)
+    sample = Eventstream(df, schema_dict, preprocess=False)
+    parts = [
+        Eventstream(
+            df[group == g].reset_index(drop=True), schema_dict, preprocess=False
+        )
+        for g in range(GROUPS)
+    ]
+    cached = (sample, parts, int(df[path_col].nunique()))
+    with _samples_lock:
+        _samples.setdefault(eventstream, {})[key] = cached
+    return cached
+
+
+def _interval(value: Any, estimates: list) -> tuple[Any, Any]:
+    """(low, high) bounds of `value` given the per-group `estimates`."""
+    if isinstance(value, pd.DataFrame):
+        return _frame_interval(value, estimates)
+    if isinstance(value, pd.Series):
+        low, high = _frame_interval(
+            value.to_frame(),
+            [e.to_frame() if isinstance(e, pd.Series) else None for e in estimates],
+        )
+        return low.iloc[:, 0], high.iloc[:, 0]
+    if isinstance(value, dict):
+        bounds = {
+            k: _interval(
+                v, [e.get(k) if isinstance(e, dict) else None for e in estimates]
+            )
+            for k, v in value.items()
+        }
+        return (
+            {k: b[0] for k, b in bounds.items()},
+            {k: b[1] for k, b in bounds.items()},
+        )
+    if isinstance(value, (list, tuple)):
+        bounds = [
+            _interval(
+                v,
+                [
+                    e[i] if isinstance(e, (list, tuple)) and i < len(e) else None
+                    for e in estimates
+                ],
+            )
+            for i, v in enumerate(value)
+        ]
+        return type(value)(b[0] for b in bounds), type(value)(b[1] for b in bounds)
+    if _is_number(value):
+        stack = np.array(
+            [[[float(e)]] if _is_number(e) else [[np.nan]] for e in estimates]
+        )
+        low, high = _bounds(np.array([[float(value)]]), stack)
+        return float(low[0, 0]), float(high[0, 0])
+    return value, value
+
+
+def _frame_interval(value: pd.DataFrame, estimates: list) -> tuple:
+    low, high = value.copy(), value.copy()
+    # Positions rather than labels: Segment Overview has a `None` column,
+    # which list-based selection doesn't find
+    positions = _numeric_positions(value)
+    if not positions:
+        return low, high
+    aligned = [
+        e.reindex(index=value.index, columns=value.columns).iloc[:, positions]
+        if isinstance(e, pd.DataFrame)
+        else pd.DataFrame(np.nan, index=value.index, columns=range(len(positions)))
+        for e in estimates
+    ]
+    stack = np.stack([_seconds(e) for e in aligned])
+    lo, hi = _bounds(_seconds(value.iloc[:, positions]), stack)
+    for i, position in enumerate(positions):
+        if pd.api.types.is_timedelta64_dtype(value.dtypes.iloc[position]):
+            low.isetitem(position, pd.to_timedelta(lo[:, i], unit="s"))
+            high.isetitem(position, pd.to_timedelta(hi[:, i], unit="s"))
+        else:
+            low.isetitem(position, lo[:, i])
+            high.isetitem(position, hi[:, i])
+    return low, high
+
+
+def _bounds(value: np.ndarray, stack: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Student-t 95% bounds around `value` from `stack`, its estimates on
+    each group (groups along the first axis)."""
+    n = (~np.isnan(stack)).sum(axis=0)
+    with warnings.catch_warnings():
+        # All-NaN cells and cells with one estimate have no spread: NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        se = np.nanstd(stack, axis=0, ddof=1) / np.sqrt(n)
+        smallest = np.nanmin(stack, axis=0)
+    half = _T975[np.clip(n - 1, 0, len(_T975) - 1)] * se
+    low, high = value - half, value + half
+    # Counts and shares can't go below zero, though a symmetric interval
+    # around a small one would; differences (diff mode) can
+    low = np.where((smallest >= 0) & (value >= 0), np.maximum(low, 0), low)
+    return low, high
+
+
+def _seconds(df: pd.DataFrame) -> np.ndarray:
+    """`df` as floats, timedeltas in seconds."""
+    return np.column_stack(
+        [
+            col.dt.total_seconds().to_numpy(dtype=float, na_value=np.nan)
+            if pd.api.types.is_timedelta64_dtype(col.dtype)
+            else col.to_numpy(dtype=float, na_value=np.nan)
+            for _, col in df.items()
+        ]
+    ).reshape(len(df), df.shape[1])
+
+
+def _numeric_positions(df: pd.DataFrame) -> list[int]:
+    return [i for i, dtype in enumerate(df.dtypes) if _is_numeric(dtype)]
+
+
+def _is_numeric(dtype) -> bool:
+    return (
+        pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    ) or pd.api.types.is_timedelta64_dtype(dtype)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(
+        value, (bool, np.bool_)
+    )
@@ -17,10 +17,6 @@ from typing import TYPE_CHECKING, Any, Dict, List, Literal
 
 import numpy as np
 import pandas as pd
-from sklearn.cluster import HDBSCAN, KMeans
-from sklearn.decomposition import NMF
-from sklearn.metrics import silhouette_score
-from sklearn.preprocessing import MinMaxScaler, StandardScaler
 
 if TYPE_CHECKING:
     from retentioneering.eventstream.eventstream import Eventstream
@@ -224,6 +220,8 @@ class ClusterAnalysis:
         # 4. Normal mode — single NMF + cluster + overview
         nmf_data: Dict[str, Any] | None = None
         if nmf_components is not None:
+            from sklearn.decomposition import NMF
+
             nmf_model = NMF(n_components=nmf_components, random_state=42)
             features_scaled = nmf_model.fit_transform(features_scaled)
             nmf_data = {
@@ -272,6 +270,10 @@ class ClusterAnalysis:
     # ------------------------------------------------------------------
 
     def _scale_features(self, features: np.ndarray, scaler: T_Scaler) -> np.ndarray:
+        # sklearn is imported where it's used: it takes longer to import than
+        # the rest of the package, and most sessions never cluster
+        from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
         scaler = normalize_scaler(scaler)
         if scaler is None:
             return features
@@ -290,6 +292,8 @@ class ClusterAnalysis:
         min_cluster_size: int | None,
         cluster_selection_epsilon: float | None,
     ) -> np.ndarray:
+        from sklearn.cluster import HDBSCAN, KMeans
+
         if method == "kmeans":
             return KMeans(
                 n_clusters=n_clusters, random_state=42, n_init="auto"
@@ -306,6 +310,8 @@ class ClusterAnalysis:
     @staticmethod
     def _safe_silhouette(features: np.ndarray, labels: np.ndarray) -> float | None:
         """Compute silhouette score, filtering noise (label=-1). Returns None if < 2 clusters."""
+        from sklearn.metrics import silhouette_score
+
         mask = labels >= 0
         unique_labels = set(labels[mask])
         if len(unique_labels) < 2:
@@ -328,6 +334,9 @@ class ClusterAnalysis:
         cluster_selection_epsilon: float | List[float] | None,
         select: Dict[str, Any] | None = None,
     ) -> Dict[str, Any]:
+        from sklearn.cluster import HDBSCAN, KMeans
+        from sklearn.decomposition import NMF
+
         nmf_component_values = (
             nmf_components
             if isinstance(nmf_components, (list, tuple))
@@ -63,6 +63,13 @@ def parse_within(within) -> tuple[str, float] | None:
     return ("seconds", parse_duration(within, param="within"))
 
 
+#: Columns of `ConversionRate.fit_many`: `COLUMNS` plus the question's window
+BATCH_COLUMNS = [*COLUMNS[:2], "within", *COLUMNS[2:]]
+
+#: Keys one `fit_many` question may carry
+QUESTION_KEYS = frozenset({"start_anchor", "end_anchor", "within"})
+
+
 @dataclass
 class ConversionRate:
     """Computes per-path conversion from one anchor to another."""
@@ -82,57 +89,117 @@ class ConversionRate:
         See `Eventstream.get_conversion_rate` for the parameters and the
         returned columns.
         """
-        es = self.eventstream
-        schema = es.schema
-        df = es.df
+        path_col = self._path_col(path_col)
+        available = self._available()
+        starts = self._parse_side(start_anchor, "start_anchor", available)
+        ends = self._parse_side(end_anchor, "end_anchor", available)
+        window = parse_within(within)
+
+        questions = [(s, e, within, window) for s in starts for e in ends]
+        return self._evaluate(questions, path_col)[COLUMNS]
+
+    def fit_many(self, questions, path_col: str | None = None) -> pd.DataFrame:
+        """
+        Many conversion questions over one eventstream, one row per question.
+
+        See `Eventstream.get_conversion_rates` for the parameters and the
+        returned columns.
+        """
+        path_col = self._path_col(path_col)
+        allowed = ["a non-empty list of {'start_anchor', 'end_anchor', 'within'} dicts"]
+        if not isinstance(questions, (list, tuple)) or not questions:
+            raise InvalidParameterError("questions", questions, allowed)
 
+        available = self._available()
+        parsed = []
+        for question in questions:
+            if not isinstance(question, dict):
+                raise InvalidParameterError("questions", question, allowed)
+            unknown = set(question) - QUESTION_KEYS
+            if unknown:
+                raise InvalidParameterError(
+                    "questions", sorted(unknown), sorted(QUESTION_KEYS)
+                )
+            if "start_anchor" not in question or "end_anchor" not in question:
+                raise InvalidParameterError("questions", question, allowed)
+            starts = self._parse_side(
+                question["start_anchor"], "start_anchor", available
+            )
+            ends = self._parse_side(question["end_anchor"], "end_anchor", available)
+            within = question.get("within")
+            window = parse_within(within)
+            parsed.extend((s, e, within, window) for s in starts for e in ends)
+        return self._evaluate(parsed, path_col)
+
+    def _path_col(self, path_col: str | None) -> str:
+        schema = self.eventstream.schema
         path_col = path_col or schema.path_col
         if path_col not in schema.path_cols:
             raise InvalidParameterError("path_col", path_col, schema.path_cols)
+        return path_col
 
-        available = df[schema.event_col].unique().tolist()
-        starts = self._parse_side(start_anchor, "start_anchor", available)
-        ends = self._parse_side(end_anchor, "end_anchor", available)
-        window = parse_within(within)
+    def _available(self) -> list:
+        es = self.eventstream
+        return es.df[es.schema.event_col].unique().tolist()
+
+    def _evaluate(self, questions: list[tuple], path_col: str) -> pd.DataFrame:
+        """
+        Rows for `(start_spec, end_spec, within, window)` questions.
 
+        Everything the questions share is resolved once: each distinct start
+        anchor, each end anchor's base rate, and each (start, end) pair's end
+        positions, however many windows ask about that pair. The windows
+        themselves are then counted for every pair in a single query.
+        """
+        df = self.eventstream.df
+        schema = self.eventstream.schema
         total_paths = int(df[path_col].nunique())
-        base_rates = [self._base_rate(spec, path_col, total_paths) for spec in ends]
 
-        rows = []
-        for start_spec in starts:
-            start_pos = anchors.resolve_positions(
-                df, schema, start_spec, offset_side="start", path_col=path_col
-            )
-            paths_with_start = int(len(start_pos))
-            # Step space, strictly after: an end anchor at the same position as
-            # the start one is the start one (`start_anchor == end_anchor` asks
-            # about a *repeat*), and only steps put a `path_end` sentinel after
-            # the last real event rather than on it.
-            floor = start_pos[[path_col, "step"]].rename(columns={"step": "bound_step"})
-            for end_spec, base_rate in zip(ends, base_rates):
-                converted = (
-                    self._converted(start_pos, floor, end_spec, window, path_col)
-                    if paths_with_start
-                    else 0
+        start_pos: dict = {}
+        base_rates: dict = {}
+        end_pos: dict = {}
+        for start_spec, end_spec, _, _ in questions:
+            if start_spec not in start_pos:
+                start_pos[start_spec] = anchors.resolve_positions(
+                    df, schema, start_spec, offset_side="start", path_col=path_col
                 )
-                # No start anchor means no question was asked of these paths,
-                # which is data, not an error: the rate is undefined, not zero.
-                rate = (
-                    converted / paths_with_start if paths_with_start else float("nan")
-                )
-                rows.append(
-                    {
-                        "start_anchor": start_spec.pattern,
-                        "end_anchor": end_spec.pattern,
-                        "paths_with_start": paths_with_start,
-                        "converted": converted,
-                        "conversion_rate": rate,
-                        "base_rate": base_rate,
-                        "lift": rate / base_rate if base_rate else float("nan"),
-                    }
+            if end_spec not in base_rates:
+                base_rates[end_spec] = self._base_rate(end_spec, path_col, total_paths)
+            pair = (start_spec, end_spec)
+            if pair not in end_pos and not start_pos[start_spec].empty:
+                end_pos[pair] = self._end_positions(
+                    start_pos[start_spec], end_spec, path_col
                 )
 
-        result = pd.DataFrame(rows, columns=COLUMNS)
+        converted = self._converted(
+            start_pos,
+            end_pos,
+            {(s, e, window) for s, e, _, window in questions},
+            path_col,
+        )
+
+        rows = []
+        for start_spec, end_spec, within, window in questions:
+            paths_with_start = int(len(start_pos[start_spec]))
+            # No start anchor means no question was asked of these paths,
+            # which is data, not an error: the rate is undefined, not zero.
+            count = converted.get((start_spec, end_spec, window), 0)
+            rate = count / paths_with_start if paths_with_start else float("nan")
+            base_rate = base_rates[end_spec]
+            rows.append(
+                {
+                    "start_anchor": start_spec.pattern,
+                    "end_anchor": end_spec.pattern,
+                    "within": within,
+                    "paths_with_start": paths_with_start,
+                    "converted": count,
+                    "conversion_rate": rate,
+                    "base_rate": base_rate,
+                    "lift": rate / base_rate if base_rate else float("nan"),
+                }
+            )
+
+        result = pd.DataFrame(rows, columns=BATCH_COLUMNS)
         result["paths_with_start"] = result["paths_with_start"].astype("int64")
         result["converted"] = result["converted"].astype("int64")
         return result
@@ -172,22 +239,23 @@ class ConversionRate:
         )
         return len(match.paths()) / total_paths
 
-    def _converted(
-        self,
-        start_pos: pd.DataFrame,
-        floor: pd.DataFrame,
-        end_spec,
-        window: tuple[str, float] | None,
-        path_col: str,
-    ) -> int:
-        """Paths whose end anchor lands after the start one and inside `within`.
+    def _end_positions(
+        self, start_pos: pd.DataFrame, end_spec, path_col: str
+    ) -> pd.DataFrame:
+        """Where `end_spec` lands after the start anchor, per path.
+
+        Step space, strictly after: an end anchor at the same position as the
+        start one is the start one (`start_anchor == end_anchor` asks about a
+        *repeat*), and only steps put a `path_end` sentinel after the last real
+        event rather than on it.
 
         `not_before_part=0` puts the *whole* end pattern after the start anchor,
         not just the token it anchors on: "what happened after Y" is a question
         about what follows Y, so a `"cart->.*->purchase"` target whose cart
         precedes Y has not happened after Y.
         """
-        end_pos = anchors.resolve_positions(
+        floor = start_pos[[path_col, "step"]].rename(columns={"step": "bound_step"})
+        return anchors.resolve_positions(
             self.eventstream.df,
             self.eventstream.schema,
             end_spec,
@@ -196,48 +264,95 @@ class ConversionRate:
             not_before=floor,
             not_before_part=0,
         )
-        if end_pos.empty:
-            return 0
-        if window is None:
-            return int(len(end_pos))
 
-        schema = self.eventstream.schema
-        path_q = engine.quote_ident(path_col)
-        index_q = engine.quote_ident(schema.index)
-        subindex_q = engine.quote_ident(schema.subindex)
-        ts_q = engine.quote_ident(schema.timestamp_col)
+    def _converted(
+        self,
+        start_pos: dict,
+        end_pos: dict,
+        windows: set,
+        path_col: str,
+    ) -> dict:
+        """Conversions per `(start_spec, end_spec, window)`, in one query.
+
+        Without a window every end position counts. With one, every (start,
+        end) pair whose end lands inside the window measured from that start
+        counts. Every pair's positions go into the same two tables, keyed by
+        pair, and every window into a third, so thirty questions are one range
+        join over the step numbering rather than thirty.
+        """
+        pairs = [pair for pair, ends in end_pos.items() if not ends.empty]
+        converted = {
+            (start, end, window): int(len(end_pos[(start, end)]))
+            for start, end, window in windows
+            if window is None and (start, end) in pairs
+        }
+        windows = {question for question in windows if question[2] is not None}
+        if not pairs or not windows:
+            return converted
+        start_keys = {
+            spec: i for i, spec in enumerate(dict.fromkeys(s for s, _ in pairs))
+        }
+        pair_keys = {pair: i for i, pair in enumerate(pairs)}
 
-        unit, size = window
-        if unit == "steps":
-            condition = f"e.step <= s.step + {int(size)}"
-        else:
-            condition = f"e.ts <= s.ts + {dialect.interval_seconds(size)}"
+        def positions(frame: pd.DataFrame, **keys: int) -> pd.DataFrame:
+            out = frame[[path_col, "step", "bound"]].rename(columns={path_col: "p"})
+            return out.assign(**keys)
+
+        starts = pd.concat(
+            [positions(start_pos[spec], sk=k) for spec, k in start_keys.items()],
+            ignore_index=True,
+        )
+        ends = pd.concat(
+            [
+                positions(end_pos[pair], pk=k, sk=start_keys[pair[0]])
+                for pair, k in pair_keys.items()
+            ],
+            ignore_index=True,
+        )
+        asked = [
+            (start, end, window)
+            for start, end, window in windows
+            if (start, end) in pair_keys
+        ]
+        window_table = pd.DataFrame(
+            {
+                "pk": [pair_keys[(s, e)] for s, e, _ in asked],
+                "wk": range(len(asked)),
+                "unit": [window[0] for _, _, window in asked],
+                "size": [float(window[1]) for _, _, window in asked],
+            }
+        )
 
         # Steps come from the anchors themselves (a boundary sentinel has a step
         # but no row of its own); timestamps come from the row each anchor's
         # index points at, which for a virtual `path_end` is the path's last
         # real event — the only timestamp the end of a path can be said to have.
         query = f"""
-            WITH base AS (
-                SELECT {path_q} AS p, {index_q} AS idx, {ts_q} AS ts,
-                       row_number() OVER (
-                           PARTITION BY {path_q} ORDER BY {index_q}, {subindex_q}
-                       ) AS step
-                FROM df
-            ),
-            s AS (
-                SELECT a.{path_q} AS p, a.step AS step, b.ts AS ts
-                FROM starts a JOIN base b ON b.p = a.{path_q} AND b.idx = a.bound
+            WITH s AS (
+                SELECT a.sk, a.p, a.step, b.ts
+                FROM starts a JOIN steps b ON b.p = a.p AND b.idx = a.bound
             ),
             e AS (
-                SELECT x.{path_q} AS p, x.step AS step, b.ts AS ts
-                FROM ends x JOIN base b ON b.p = x.{path_q} AND b.idx = x.bound
+                SELECT x.pk, x.sk, x.p, x.step, b.ts
+                FROM ends x JOIN steps b ON b.p = x.p AND b.idx = x.bound
             )
-            SELECT COUNT(*) AS converted
-            FROM s JOIN e ON e.p = s.p
-            WHERE {condition}
+            SELECT w.wk, COUNT(*) AS converted
+            FROM windows w
+            JOIN e ON e.pk = w.pk
+            JOIN s ON s.sk = e.sk AND s.p = e.p
+            WHERE CASE w.unit
+                WHEN 'steps' THEN e.step <= s.step + w.size
+                ELSE {dialect.epoch("e.ts - s.ts")} <= w.size
+            END
+            GROUP BY w.wk
         """
+        steps = anchors._step_numbering(
+            self.eventstream.df, self.eventstream.schema, path_col
+        )
         result = engine.run(
-            query, df=self.eventstream.df, starts=start_pos, ends=end_pos
+            query, steps=steps, starts=starts, ends=ends, windows=window_table
         )
-        return int(result.iloc[0]["converted"])
+        counts = dict(zip(result["wk"], result["converted"]))
+        for k, question in enumerate(asked):
+            converted[question] = int(counts.get(k, 0))
+        return converted
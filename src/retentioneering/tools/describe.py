@@ -4,6 +4,12 @@ Describe - tool for computing basic descriptive statistics of an eventstream.
 Headless-only summary: dataset shape, schema, date range, event frequency,
 and per-path-column length/duration statistics. Meant as a quick sanity
 check, not an interactive drill-down (use `SegmentOverview` for that).
+
+Every statistic comes out of a single aggregation query, so the event log is
+handed to the engine once however many path and segment columns the schema
+has. With `approx=True` the distinct path count and the percentiles use
+DuckDB's sketches (`approx_count_distinct`, `approx_quantile`) instead of
+exact counting and sorting.
 """
 
 from dataclasses import dataclass
@@ -11,10 +17,18 @@ from typing import TYPE_CHECKING, Any, Dict, Tuple
 
 import pandas as pd
 
+from retentioneering import engine
+from retentioneering.engine import dialect
+
 if TYPE_CHECKING:
     from retentioneering.eventstream.eventstream import Eventstream
 
 
+def _percentile_label(p: float) -> str:
+    """Row label `DataFrame.describe` gives percentile `p` (0.25 -> "25%")"""
+    return f"{p * 100:g}%"
+
+
 @dataclass
 class Describe:
     """Computes basic descriptive statistics for an eventstream."""
@@ -25,14 +39,18 @@ class Describe:
         self,
         percentiles: Tuple[float, ...] = (0.25, 0.5, 0.75, 0.9, 0.99),
         top_events: int | None = 20,
+        approx: bool = False,
     ) -> Dict[str, Any]:
         """
         Compute basic descriptive statistics for the eventstream.
 
         Args:
-            percentiles: Percentiles (0-1) to report in `path_stats`.
+            percentiles: Percentiles (0-1) to report in `path_stats`, plus
+                the median.
             top_events: Number of most frequent events to include in `event_frequency`,
                 or `None` to include all events, unranked and unlimited.
+            approx: Estimate `shape.n_paths` and the `path_stats` percentiles
+                with sketches instead of computing them exactly.
 
         Returns:
             Dict with `schema`, `shape`, `date_range`, `event_frequency`,
@@ -41,11 +59,12 @@ class Describe:
             full unique event count) so truncation is visible on the
             DataFrame itself, not just derivable via `shape.n_unique_events`.
         """
-        es = self.eventstream
-        schema = es.schema
-        df = es.df
+        schema = self.eventstream.schema
+        # `DataFrame.describe` always reports the median, asked for or not
+        percentiles = tuple(sorted(set(percentiles) | {0.5}))
+        row = self._aggregate(percentiles, approx, with_paths=True)
 
-        event_counts = es.get_event_counts()
+        event_counts = dict(zip(row["events"], row["event_counts"]))
         total_events = int(sum(event_counts.values()))
         n_unique_events = len(event_counts)
         truncated = top_events is not None and n_unique_events > top_events
@@ -53,11 +72,10 @@ class Describe:
             pd.DataFrame(
                 {
                     "event": list(event_counts.keys()),
-                    "count": list(event_counts.values()),
+                    "count": [int(c) for c in event_counts.values()],
                 }
             )
             .assign(share=lambda d: d["count"] / total_events if total_events else 0.0)
-            .sort_values("count", ascending=False)
             .head(top_events)
             .reset_index(drop=True)
         )
@@ -67,18 +85,35 @@ class Describe:
         # One DataFrame per path_cols entry (rows: count/mean/std/min/.../max,
         # columns: length/duration) - always keyed by path_col name, even when
         # there is only one, so the shape doesn't change with schema config.
+        stat_rows = (
+            ["count", "mean", "std", "min"]
+            + [_percentile_label(p) for p in percentiles]
+            + ["max"]
+        )
         path_stats = {
-            path_col: es.get_metrics(
-                [{"metric": "length"}, {"metric": "duration"}], path_col=path_col
-            ).describe(percentiles=list(percentiles))
-            for path_col in schema.path_cols
+            path_col: pd.DataFrame(
+                {
+                    metric: [
+                        row[f"{metric}_{i}_{stat}"]
+                        for stat in ("count", "mean", "std", "min")
+                    ]
+                    + self._quantiles(row[f"{metric}_{i}_q"], len(percentiles))
+                    + [row[f"{metric}_{i}_max"]]
+                    for metric in ("length", "duration")
+                },
+                index=stat_rows,
+                dtype=float,
+            )
+            for i, path_col in enumerate(schema.path_cols)
         }
 
         segments = pd.DataFrame(
             [
                 {"segment_col": col, "value": str(value), "count": int(count)}
-                for col in schema.segment_cols
-                for value, count in df[col].value_counts().items()
+                for i, col in enumerate(schema.segment_cols)
+                for value, count in zip(
+                    row[f"segment_{i}_values"], row[f"segment_{i}_counts"]
+                )
             ],
             columns=["segment_col", "value", "count"],
         )
@@ -87,8 +122,8 @@ class Describe:
                 "count"
             ].transform("sum")
 
-        ts = df[schema.timestamp_col]
-
+        overview = self._overview(row)
+        overview["shape"]["n_unique_events"] = n_unique_events
         return {
             "schema": {
                 "event_col": schema.event_col,
@@ -97,17 +132,151 @@ class Describe:
                 "segment_cols": list(schema.segment_cols),
                 "timestamp_col": schema.timestamp_col,
             },
-            "shape": {
-                "n_events": len(df),
-                "n_paths": int(df[schema.path_col].nunique()),
-                "n_unique_events": len(event_counts),
-            },
-            "date_range": {
-                "min": ts.min(),
-                "max": ts.max(),
-                "span": ts.max() - ts.min(),
-            },
+            **overview,
             "event_frequency": event_frequency,
             "path_stats": path_stats,
             "segments": segments,
         }
+
+    def overview(self, approx: bool = False) -> Dict[str, Any]:
+        """
+        The cheap part of `fit`: shape, date range and event counts, without
+        the per-path statistics.
+
+        Args:
+            approx: Estimate `shape.n_paths` with a sketch instead of counting
+                distinct paths exactly.
+
+        Returns:
+            Dict with `shape` (n_events, n_paths, n_unique_events),
+            `date_range` (min, max, span) and `event_counts` (event -> count,
+            most frequent first) keys.
+        """
+        row = self._aggregate((), approx, with_paths=False)
+        overview = self._overview(row)
+        overview["event_counts"] = {
+            event: int(count)
+            for event, count in zip(row["events"], row["event_counts"])
+        }
+        overview["shape"]["n_unique_events"] = len(overview["event_counts"])
+        return overview
+
+    @staticmethod
+    def _quantiles(values, n: int) -> list:
+        """The quantile list of one metric; NULL (no paths at all) is NaN for
+        each percentile, as `DataFrame.describe` reports on no rows."""
+        if values is None or values is pd.NA:
+            return [float("nan")] * n
+        return list(values)
+
+    @staticmethod
+    def _overview(row: pd.Series) -> Dict[str, Any]:
+        # MIN/MAX over no rows are NULL
+        ts_min = pd.NaT if pd.isna(row["ts_min"]) else row["ts_min"]
+        ts_max = pd.NaT if pd.isna(row["ts_max"]) else row["ts_max"]
+        return {
+            "shape": {
+                "n_events": int(row["n_events"]),
+                "n_paths": int(row["n_paths"]),
+            },
+            "date_range": {"min": ts_min, "max": ts_max, "span": ts_max - ts_min},
+        }
+
+    def _aggregate(
+        self, percentiles: Tuple[float, ...], approx: bool, with_paths: bool
+    ) -> pd.Series:
+        """Runs the one query behind `fit`/`overview` and returns its single
+        row. Each statistic is a column; event and segment counts come back as
+        parallel value/count lists, most frequent first."""
+        es = self.eventstream
+        schema = es.schema
+        df = es.df
+
+        def value_sql(col: str) -> str:
+            # A categorical column reaches the engine as an ENUM, whose
+            # aggregated lists come back as codes rather than labels
+            col_q = engine.quote_ident(col)
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                return f"CAST({col_q} AS VARCHAR)"
+            return col_q
+
+        def counts_sql(col: str) -> str:
+            value = value_sql(col)
+            return f"""
+                SELECT
+                    COALESCE(list(value ORDER BY n DESC, value), []) AS values,
+                    COALESCE(list(n ORDER BY n DESC, value), []) AS counts
+                FROM (
+                    SELECT {value} AS value, COUNT(*) AS n
+                    FROM df
+                    WHERE {engine.quote_ident(col)} IS NOT NULL
+                    GROUP BY 1
+                )
+            """
+
+        path_q = engine.quote_ident(schema.path_col)
+        ts_q = engine.quote_ident(schema.timestamp_col)
+        n_paths = (
+            f"approx_count_distinct({path_q})"
+            if approx
+            else f"COUNT(DISTINCT {path_q})"
+        )
+        ctes: Dict[str, str] = {
+            "totals": f"""
+                SELECT
+                    COUNT(*) AS n_events,
+                    {n_paths} AS n_paths,
+                    MIN({ts_q}) AS ts_min,
+                    MAX({ts_q}) AS ts_max
+                FROM df
+            """,
+            "event_totals": counts_sql(schema.event_col),
+        }
+        selects = [
+            "totals.*",
+            "event_totals.values AS events",
+            "event_totals.counts AS event_counts",
+        ]
+
+        if with_paths:
+            quantile_fn = "approx_quantile" if approx else "quantile_cont"
+            quantiles = "[" + ", ".join(repr(float(p)) for p in percentiles) + "]"
+            duration = dialect.epoch(f"MAX({ts_q}) - MIN({ts_q})")
+            for i, path_col in enumerate(schema.path_cols):
+                stats = [
+                    f"COUNT(*) AS length_{i}_count",
+                    f"COUNT(*) AS duration_{i}_count",
+                ]
+                for metric in ("length", "duration"):
+                    stats += [
+                        f"AVG({metric}) AS {metric}_{i}_mean",
+                        f"STDDEV_SAMP({metric}) AS {metric}_{i}_std",
+                        f"MIN({metric}) AS {metric}_{i}_min",
+                        f"{quantile_fn}({metric}, {quantiles}) AS {metric}_{i}_q",
+                        f"MAX({metric}) AS {metric}_{i}_max",
+                    ]
+                ctes[f"paths_{i}"] = f"""
+                    SELECT {", ".join(stats)}
+                    FROM (
+                        SELECT
+                            CAST(COUNT(*) AS DOUBLE) AS length,
+                            CAST({duration} AS DOUBLE) AS duration
+                        FROM df
+                        GROUP BY {engine.quote_ident(path_col)}
+                    )
+                """
+                selects.append(f"paths_{i}.*")
+            for i, col in enumerate(schema.segment_cols):
+                ctes[f"segment_{i}"] = counts_sql(col)
+                selects += [
+                    f"segment_{i}.values AS segment_{i}_values",
+                    f"segment_{i}.counts AS segment_{i}_counts",
+                ]
+
+        # Every CTE is a single row, so joining them all is one row too
+        query = f"""
+        WITH {", ".join(f"{name} AS ({body})" for name, body in ctes.items())}
+        SELECT {", ".join(selects)}
+        FROM {", ".join(ctes)}
+        """
+        return engine.run(query, df=df).iloc[0]
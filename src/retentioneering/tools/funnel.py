@@ -58,6 +58,21 @@ class Funnel:
                 )
             return {"steps": combined}
 
+    @staticmethod
+    def scale_counts(result: dict, factor: float) -> dict:
+        """`fit`'s `result` with its path counts multiplied by `factor` (see
+        `tools.approx`); rates are left as they are."""
+        return {
+            **result,
+            "steps": [
+                {
+                    k: v * factor if k.endswith("unique_paths") else v
+                    for k, v in step.items()
+                }
+                for step in result["steps"]
+            ],
+        }
+
     def _fit_single(self, steps: list[str], path_col: str) -> dict:
         event_col = self.eventstream.schema.event_col
         index_col = self.eventstream.schema.index
@@ -5,8 +5,6 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from gensim.models import Word2Vec
-from sklearn.cluster import AgglomerativeClustering
 
 from retentioneering import engine
 from retentioneering.eventstream.event_type import EventTypes
@@ -223,6 +221,10 @@ class GraphLayout:
     def _embed_events(
         self, trajectories: list[list[str]], vector_size: int, seed: int
     ) -> tuple[np.ndarray, dict[int, str]]:
+        # gensim and sklearn are imported on first layout, not with the
+        # package: together they take longer to import than everything else
+        from gensim.models import Word2Vec
+
         model = Word2Vec(
             sentences=trajectories,
             vector_size=vector_size,
@@ -242,6 +244,8 @@ class GraphLayout:
     # ── clustering + nested-rectangles placement ───────────────────────────────
 
     def _cluster_events(self, embeddings: np.ndarray, n_clusters: int) -> np.ndarray:
+        from sklearn.cluster import AgglomerativeClustering
+
         n_clusters = min(n_clusters, len(embeddings))
         if n_clusters < 2:
             return np.zeros(len(embeddings), dtype=int)
@@ -259,6 +263,8 @@ class GraphLayout:
     ) -> dict[str, dict[str, float]]:
         """Recursive nested-rectangles placement: split the current box among
         agglomerative sub-clusters of the embedding subset, recurse."""
+        from sklearn.cluster import AgglomerativeClustering
+
         layout: dict[str, dict[str, float]] = {}
         rng = np.random.RandomState(random_state)
 
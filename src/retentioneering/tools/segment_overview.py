@@ -14,7 +14,6 @@ from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.stats import gaussian_kde, wasserstein_distance
 
 if TYPE_CHECKING:
     from retentioneering.eventstream.eventstream import Eventstream
@@ -52,43 +51,36 @@ AGG_FUNCTIONS = {
 }
 
 
-def _build_composite_path(
-    df: pd.DataFrame, path_col: str, segment_col: str
-) -> Tuple[np.ndarray, Dict[Any, Any]]:
+def _segment_key(path_col: str, segment_col: str) -> List[str]:
     """
-    Build an integer composite path id combining ``path_col`` and ``segment_col``,
-    so MetricBuilder can compute per-path metrics separately for each segment
-    value.
-
-    This uses `factorize` rather than the previous `astype(str) + sep +
-    astype(str)` string concatenation, which had two failure modes: numeric
-    segment levels came back stringified (e.g. `1.0` instead of `1`), and rows
-    with a missing (None/NaN) segment level — which `add_segment` can produce
-    via its `func`/`sql` modes — silently vanished, since concatenating a NaN
-    into a string produces NaN for the whole composite key. `path_col` is
-    already guaranteed non-null by Eventstream's own validation, and
-    `use_na_sentinel=False` gives every distinct segment level (including a
-    missing one) its own stable code, so the composite id is always defined.
-
-    Returns the composite id array and a mapping from composite id back to the
-    original segment level (None for a missing segment, the original level
-    otherwise).
+    The composite path key ``[path_col, segment_col]`` MetricBuilder groups by,
+    so per-path metrics are computed separately for each segment level a path
+    visits. Grouping by both columns directly - rather than materializing a
+    combined id column on a copy of the event log - keeps the frame untouched.
+    Missing (None/NaN) segment levels, which `add_segment` can produce via its
+    `func`/`sql` modes, form their own group, and numeric levels keep their
+    dtype, since the key's values come straight from the original columns.
     """
-    segment_codes, segment_uniques = pd.factorize(
-        df[segment_col], use_na_sentinel=False
+    if segment_col == path_col:
+        return [path_col]
+    return [path_col, segment_col]
+
+
+def _segment_metrics(
+    metric_builder: MetricBuilder,
+    metrics: List[Dict[str, Any]],
+    path_col: str,
+    segment_col: str,
+) -> pd.DataFrame:
+    """Per-(path, segment level) metrics, one row each, with the segment level
+    in `segment_col` (None/NaN for a missing level)"""
+    metrics_df = metric_builder.build_metrics(
+        config=metrics, path_col=_segment_key(path_col, segment_col)
     )
-    pairs = pd.array(list(zip(df[path_col], segment_codes)), dtype=object)
-    composite_ids, _ = pd.factorize(pairs)
-    segment_by_composite = dict(
-        zip(
-            composite_ids,
-            (
-                None if pd.isna(segment_uniques[code]) else segment_uniques[code]
-                for code in segment_codes
-            ),
-        )
-    )
-    return composite_ids, segment_by_composite
+    segment_levels = metrics_df.index.get_level_values(segment_col).astype(object)
+    metrics_df = metrics_df.reset_index(drop=True)
+    metrics_df[segment_col] = segment_levels
+    return metrics_df
 
 
 def _segment_mask(series: pd.Series, value: Any) -> pd.Series:
@@ -98,6 +90,100 @@ def _segment_mask(series: pd.Series, value: Any) -> pd.Series:
     return series == value
 
 
+def _complement_wasserstein(
+    values: np.ndarray, group_codes: np.ndarray, n_groups: int
+) -> np.ndarray:
+    """
+    Wasserstein-1 distance between each group's values and the values of every
+    other group, for all groups at once.
+
+    `scipy.stats.wasserstein_distance` sorts both samples on every call, so
+    asking it for each segment against its complement re-sorts the whole column
+    once per segment. Here the column is sorted once (`np.unique`), each group's
+    CDF over the shared sorted support is a `bincount` + `cumsum`, and the
+    complement's CDF falls out of the total CDF minus the group's. The result is
+    exact - the same integral of |F_group - F_complement| scipy computes - in
+    O(n log n + groups * (n + support)) rather than O(groups * n log n).
+
+    NaN values are ignored. A group with no values, or with no values outside
+    it, gets NaN.
+    """
+    values = np.asarray(values, dtype=float)
+    group_codes = np.asarray(group_codes)
+    distances = np.full(n_groups, np.nan)
+
+    valid = ~np.isnan(values)
+    values, group_codes = values[valid], group_codes[valid]
+    total = len(values)
+    if total == 0:
+        return distances
+
+    support, support_idx = np.unique(values, return_inverse=True)
+    deltas = np.diff(support)
+    total_cdf = np.cumsum(np.bincount(support_idx, minlength=len(support)))[:-1]
+
+    # Group rows together once so each group is a contiguous slice.
+    order = np.argsort(group_codes, kind="stable")
+    group_sizes = np.bincount(group_codes, minlength=n_groups)
+    bounds = np.concatenate([[0], np.cumsum(group_sizes)])
+    for group in range(n_groups):
+        size = group_sizes[group]
+        if size == 0 or size == total:
+            continue
+        rows = order[bounds[group] : bounds[group + 1]]
+        group_cdf = np.cumsum(np.bincount(support_idx[rows], minlength=len(support)))[
+            :-1
+        ]
+        complement_cdf = total_cdf - group_cdf
+        distances[group] = float(
+            np.sum(np.abs(group_cdf / size - complement_cdf / (total - size)) * deltas)
+        )
+    return distances
+
+
+def _binned_kde(data: np.ndarray, x_values: np.ndarray) -> np.ndarray | None:
+    """
+    Gaussian KDE of `data` evaluated on the evenly spaced grid `x_values`.
+
+    Equivalent to `scipy.stats.gaussian_kde(data)(x_values)` (same Scott's-rule
+    bandwidth) up to the binning error, but the data is first linearly binned
+    onto the grid and the kernel applied as one FFT convolution, so the cost is
+    O(n + grid log grid) instead of O(n * grid). Returns None when the bandwidth
+    is degenerate (all values equal), where scipy's KDE is undefined too.
+    """
+    n = len(data)
+    bandwidth = float(np.std(data, ddof=1)) * n ** (-1 / 5)
+    if not np.isfinite(bandwidth) or bandwidth <= 0:
+        return None
+
+    n_points = len(x_values)
+    step = (x_values[-1] - x_values[0]) / (n_points - 1)
+
+    # Linear binning: each value splits its unit weight between the two
+    # surrounding grid points in proportion to its distance from each.
+    position = (data - x_values[0]) / step
+    left = np.clip(np.floor(position).astype(np.int64), 0, n_points - 2)
+    right_share = position - left
+    weights = np.bincount(
+        left, weights=1 - right_share, minlength=n_points
+    ) + np.bincount(left + 1, weights=right_share, minlength=n_points)
+
+    # The kernel is negligible beyond 5 bandwidths; it never needs to reach
+    # further than the grid itself.
+    half_width = int(min(n_points - 1, np.ceil(5 * bandwidth / step)))
+    offsets = np.arange(-half_width, half_width + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (
+        bandwidth * np.sqrt(2 * np.pi) * n
+    )
+
+    fft_size = 1 << int(np.ceil(np.log2(n_points + 2 * half_width)))
+    density = np.fft.irfft(
+        np.fft.rfft(weights, fft_size) * np.fft.rfft(kernel, fft_size), fft_size
+    )[half_width : half_width + n_points]
+    # FFT round-off can leave tiny negative values far out in the tails.
+    return np.clip(density, 0, None)
+
+
 @dataclass
 class SegmentOverview:
     """Builds overview of metric distributions across segment levels"""
@@ -133,25 +219,11 @@ class SegmentOverview:
         """
         path_col = path_col or self.eventstream.schema.path_col
         event_col = self.eventstream.schema.event_col
-        df = self.eventstream.df.copy()
+        df = self.eventstream.df
 
         if segment_col not in df.columns:
             raise ValueError(f"Segment column '{segment_col}' not found in DataFrame")
 
-        # Create composite path ID: (path_id, segment_level)
-        composite_col = "__composite_path_id__"
-        composite_ids, segment_by_composite = _build_composite_path(
-            df, path_col, segment_col
-        )
-        df[composite_col] = composite_ids
-
-        # Create a temporary eventstream with composite path ID
-        from retentioneering.eventstream.eventstream import Eventstream
-
-        temp_schema = dict(self.eventstream._schema) if self.eventstream._schema else {}
-        temp_schema["path_cols"] = [composite_col]
-        temp_stream = Eventstream(df, temp_schema, preprocess=False)
-
         # Use MetricConfig to get enriched configs with column names. Pass the
         # available events so that has_event/event_count with omitted 'events'
         # (the "all events" wildcard) resolves to its real per-event column names
@@ -169,18 +241,10 @@ class SegmentOverview:
             for col in metric_config.get("cols", []):
                 column_to_agg[col] = agg
 
-        # Build metrics using MetricBuilder
-        if metrics:
-            metric_builder = MetricBuilder(temp_stream)
-            metrics_df = metric_builder.build_metrics(
-                config=metrics,
-                path_col=composite_col,
-            )
-            metrics_df[segment_col] = metrics_df.index.map(segment_by_composite)
-        else:
-            unique_composite_ids = df[composite_col].unique()
-            metrics_df = pd.DataFrame(index=unique_composite_ids)
-            metrics_df[segment_col] = metrics_df.index.map(segment_by_composite)
+        # Build metrics using MetricBuilder, one row per (path, segment level)
+        metrics_df = _segment_metrics(
+            MetricBuilder(self.eventstream), metrics, path_col, segment_col
+        )
 
         metric_columns = [col for col in metrics_df.columns if col != segment_col]
         total_paths = len(metrics_df)
@@ -218,24 +282,19 @@ class SegmentOverview:
                 agg_name = column_to_agg.get(col, "mean")
                 result_data[f"{col}_{agg_name}"] = aggregated[col]
 
-        # Compute complement_distance separately (needs full dataframe)
-        for col in complement_distance_cols:
-            complement_distance_values = {}
-            for segment_level in segment_sizes.index:
-                mask = _segment_mask(metrics_df[segment_col], segment_level)
-                segment_data = metrics_df.loc[mask, col].dropna()
-                complement_data = metrics_df.loc[~mask, col].dropna()
-
-                if len(segment_data) > 0 and len(complement_data) > 0:
-                    complement_distance_values[segment_level] = wasserstein_distance(
-                        segment_data.values, complement_data.values
-                    )
-                else:
-                    complement_distance_values[segment_level] = np.nan
-
-            result_data[f"{col}_complement_distance"] = pd.Series(
-                complement_distance_values
-            )
+        # Compute complement_distance separately (needs full dataframe). All
+        # segments of a column are handled in one pass over its sorted values.
+        if complement_distance_cols:
+            group_codes = grouped.ngroup().to_numpy()
+            for col in complement_distance_cols:
+                distances = _complement_wasserstein(
+                    metrics_df[col].to_numpy(dtype=float),
+                    group_codes,
+                    len(segment_sizes),
+                )
+                result_data[f"{col}_complement_distance"] = pd.Series(
+                    distances, index=segment_sizes.index
+                )
 
         # Create result DataFrame (metrics as rows, segments as columns)
         result_df = pd.DataFrame(result_data).T
@@ -261,6 +320,14 @@ class SegmentOverview:
 
         return result_df
 
+    @staticmethod
+    def scale_counts(result: pd.DataFrame, factor: float) -> pd.DataFrame:
+        """`fit`'s `result` with its `segment_size` row multiplied by
+        `factor` (see `tools.approx`); the metrics are per path already."""
+        scaled = result.copy()
+        scaled.loc["segment_size"] = result.loc["segment_size"].to_numpy() * factor
+        return scaled
+
     def get_metric_distribution(
         self,
         segment_col: str,
@@ -289,7 +356,7 @@ class SegmentOverview:
             For a single segment level (vs. its complement) and for a pair alike:
                 {"distribution_1": {...}, "distribution_2": {...}, "distance": float}
         """
-        df = self.eventstream.df.copy()
+        df = self.eventstream.df
 
         # Validate path_col
         path_col = path_col or self.eventstream.schema.path_col
@@ -350,29 +417,11 @@ class SegmentOverview:
                 )
 
         # Validate metric configuration using MetricBuilder
-        MetricBuilder(self.eventstream).validate_metric_config(metric)
+        metric_builder = MetricBuilder(self.eventstream)
+        metric_builder.validate_metric_config(metric)
 
-        # Create composite path ID: (path_id, segment_level)
-        composite_col = "__composite_path_id__"
-        composite_ids, segment_by_composite = _build_composite_path(
-            df, path_col, segment_col
-        )
-        df[composite_col] = composite_ids
-
-        # Create a temporary eventstream with composite path ID
-        from retentioneering.eventstream.eventstream import Eventstream
-
-        temp_schema = dict(self.eventstream._schema) if self.eventstream._schema else {}
-        temp_schema["path_cols"] = [composite_col]
-        temp_stream = Eventstream(df, temp_schema, preprocess=False)
-
-        # Build metric using MetricBuilder
-        metric_builder = MetricBuilder(temp_stream)
-        metrics_df = metric_builder.build_metrics(
-            config=[metric],
-            path_col=composite_col,
-        )
-        metrics_df[segment_col] = metrics_df.index.map(segment_by_composite)
+        # Build metric using MetricBuilder, one row per (path, segment level)
+        metrics_df = _segment_metrics(metric_builder, [metric], path_col, segment_col)
 
         # Get the metric column name - must be exactly one
         metric_cols = [col for col in metrics_df.columns if col != segment_col]
@@ -521,23 +570,20 @@ class SegmentOverview:
         if len(data) < 2:
             return None
 
-        try:
-            kde = gaussian_kde(data)
-            x_min, x_max = data.min(), data.max()
-
-            # Add some padding to the range
-            padding = (x_max - x_min) * 0.1
-            if padding == 0:
-                padding = 0.5  # Handle case where all values are the same
+        x_min, x_max = data.min(), data.max()
 
-            x_values = np.linspace(x_min - padding, x_max + padding, n_points)
-            y_values = kde(x_values)
+        # Add some padding to the range
+        padding = (x_max - x_min) * 0.1
+        if padding == 0:
+            padding = 0.5  # Handle case where all values are the same
 
-            return [x_values.tolist(), y_values.tolist()]
-        except Exception:
-            # KDE can fail for various reasons (e.g., singular covariance matrix)
+        x_values = np.linspace(x_min - padding, x_max + padding, n_points)
+        y_values = _binned_kde(data, x_values)
+        if y_values is None:
             return None
 
+        return [x_values.tolist(), y_values.tolist()]
+
     def _build_pair_distribution(
         self, data_1: np.ndarray, data_2: np.ndarray
     ) -> Dict[str, Any]:
@@ -636,7 +682,13 @@ class SegmentOverview:
 
         # Compute Wasserstein distance (on transformed data if log scale)
         if len(data_1_hist) > 0 and len(data_2_hist) > 0:
-            distance = float(wasserstein_distance(data_1_hist, data_2_hist))
+            distance = float(
+                _complement_wasserstein(
+                    np.concatenate([data_1_hist, data_2_hist]),
+                    np.repeat([0, 1], [len(data_1_hist), len(data_2_hist)]),
+                    2,
+                )[0]
+            )
         else:
             distance = float("nan")
 
@@ -191,12 +191,17 @@ class StepMatrix:
         match = anchors.resolve_anchors(
             stream.df, stream.schema, path_pattern, path_col=path_col
         )
-        matching_ids = match.paths().tolist()
+        matching_ids = match.paths()
 
-        if not matching_ids:
+        if matching_ids.empty:
             raise PatternNoMatchError(path_pattern)
 
-        return self.eventstream.filter_events(keep={path_col: matching_ids}), match
+        kept = self.eventstream._keep_paths(
+            matching_ids,
+            path_col,
+            self.eventstream._pattern_step(path_pattern, path_col),
+        )
+        return kept, match
 
     def _stepped(self, stream, path_col):
         """The stream's frame with a 1-based `step` per path."""
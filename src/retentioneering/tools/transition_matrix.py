@@ -1,3 +1,4 @@
+import weakref
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, get_args
 
@@ -6,6 +7,8 @@ import pandas as pd
 from retentioneering import engine
 from retentioneering.eventstream.event_type import EventTypes
 from retentioneering.exceptions import EmptyEventstreamError, InvalidParameterError
+from retentioneering.utils.sketch import DurationSketch, bucket_sql
+from retentioneering.utils.stream_cache import get_or_build, per_stream_cache
 from .types import T_Diff, T_TransitionMatrixValues
 
 if TYPE_CHECKING:
@@ -13,6 +16,11 @@ if TYPE_CHECKING:
 
 TRANSITION_MATRIX_VALUES_OPTIONS = get_args(T_TransitionMatrixValues)
 
+#: Quantile each time-valued weight reads off the transition time sketch
+TIME_QUANTILES = {"time_median": 0.5, "time_q95": 0.95}
+
+_time_sketches: "weakref.WeakKeyDictionary[Eventstream, dict]" = per_stream_cache()
+
 
 @dataclass
 class TransitionMatrix:
@@ -47,12 +55,10 @@ class TransitionMatrix:
                 values, diff, path_col=path_col
             )
         event_col = self.eventstream.schema.event_col
-        timestamp_col = self.eventstream.schema.timestamp_col
         index_col = self.eventstream.schema.index
         subindex_col = self.eventstream.schema.subindex
         path_col_q = engine.quote_ident(path_col)
         event_col_q = engine.quote_ident(event_col)
-        timestamp_col_q = engine.quote_ident(timestamp_col)
         index_col_q = engine.quote_ident(index_col)
         subindex_col_q = engine.quote_ident(subindex_col)
         # path_cols is validated (coarsest-first, strictly nested) at Eventstream
@@ -68,7 +74,9 @@ class TransitionMatrix:
             )
 
         if diff is None:
-            df = self.eventstream.add_start_end_events(path_col=path_col).df
+            # The time weights read a cached sketch and never need the frame
+            if values not in TIME_QUANTILES:
+                df = self.eventstream.add_start_end_events(path_col=path_col).df
             event_types = EventTypes()
             tm = pd.DataFrame()
 
@@ -134,36 +142,10 @@ class TransitionMatrix:
                     .astype(int)
                 )
 
-            elif values in ["time_median", "time_q95"]:
-                if values == "time_median":
-                    agg_func = "median(timedelta)"
-                else:
-                    agg_func = "quantile_cont(timedelta, 0.95)"
-
-                query = f"""
-                select {event_col_q}, next_{event_col}, {agg_func} as timedelta
-                from (
-                    select
-                        {event_col_q},
-                        lead({event_col_q}) over (
-                            partition by {path_col_q}
-                            order by {order_by}
-                        ) as next_{event_col},
-                        lead({timestamp_col_q}) over (
-                            partition by {path_col_q}
-                            order by {order_by}
-                        ) as next_{timestamp_col},
-                        date_diff('second', {timestamp_col_q}, next_{timestamp_col}) as timedelta
-                    from df
-                ) where next_{event_col} is not null
-                group by {event_col_q}, next_{event_col}
-                """
-                timedeltas = engine.run(query, df=df)
-                timedeltas = timedeltas.set_index([event_col, f"next_{event_col}"])[
-                    "timedelta"
-                ]
-                timedeltas = pd.to_timedelta(timedeltas, unit="s")
-                tm = timedeltas.unstack()
+            elif values in TIME_QUANTILES:
+                timedeltas = self.time_sketch(path_col).quantile(TIME_QUANTILES[values])
+                timedeltas.index.names = [event_col, f"next_{event_col}"]
+                tm = pd.to_timedelta(timedeltas, unit="s").unstack()
 
             else:
                 raise InvalidParameterError(
@@ -194,3 +176,47 @@ class TransitionMatrix:
             tm1 = tm1.reindex(index=index, columns=columns, fill_value=fill_value)
             tm2 = tm2.reindex(index=index, columns=columns, fill_value=fill_value)
             return tm1 - tm2, tm1, tm2
+
+    def time_sketch(self, path_col: str | None = None) -> DurationSketch:
+        """
+        Seconds between consecutive events, sketched per transition.
+
+        The `time_median` / `time_q95` weights are quantiles of this
+        :class:`~retentioneering.utils.sketch.DurationSketch`, keyed by
+        ``("source", "target")``. It is computed once per eventstream and
+        `path_col`, so switching between the two weights costs nothing, and
+        sketches of separately processed parts of a dataset — shards, or
+        yesterday's data and today's — combine with `merge` into the
+        sketch of the whole.
+        """
+        path_col = path_col or self.eventstream.schema.path_col
+        return get_or_build(
+            _time_sketches,
+            self.eventstream,
+            path_col,
+            lambda: self._build_time_sketch(path_col),
+        )
+
+    def _build_time_sketch(self, path_col: str) -> DurationSketch:
+        schema = self.eventstream.schema
+        event_col_q = engine.quote_ident(schema.event_col)
+        timestamp_col_q = engine.quote_ident(schema.timestamp_col)
+        path_col_q = engine.quote_ident(path_col)
+        order_by = (
+            f"{engine.quote_ident(schema.index)}, {engine.quote_ident(schema.subindex)}"
+        )
+        df = self.eventstream.add_start_end_events(path_col=path_col).df
+        query = f"""
+        select source, target, {bucket_sql("timedelta")} as value, count(*) as count
+        from (
+            select
+                {event_col_q} as source,
+                lead({event_col_q}) over w as target,
+                date_diff('second', {timestamp_col_q}, lead({timestamp_col_q}) over w)
+                    as timedelta
+            from df
+            window w as (partition by {path_col_q} order by {order_by})
+        ) where target is not null
+        group by all
+        """
+        return DurationSketch(("source", "target"), engine.run(query, df=df))
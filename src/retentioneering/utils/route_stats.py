@@ -4,8 +4,18 @@ Not a public tool: the graph is the only caller (via
 ``widgets/transition_graph.py``'s ``route_stats`` compute tool), so this
 stays a plain internal helper rather than an ``Eventstream``-exposed
 ``tools/`` class.
+
+Hovering a route asks for its statistics again on every mouse move, so the
+answers for short routes are precomputed: the first request on a stream
+builds a :class:`RouteIndex` of every contiguous run of up to
+``ROUTE_INDEX_MAX_N`` events, and later requests are dictionary lookups.
+That first request is slower than a single scan would be (about five times
+on the bundled ecom dataset), which the next few hovers pay back. Longer
+routes are rare enough to keep scanning the stream.
 """
 
+import weakref
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from retentioneering import engine
@@ -14,6 +24,7 @@ from retentioneering.exceptions import (
     EmptyEventstreamError,
     InvalidParameterError,
 )
+from retentioneering.utils.stream_cache import get_or_build, per_stream_cache
 
 if TYPE_CHECKING:
     from retentioneering.eventstream.eventstream import Eventstream
@@ -24,17 +35,142 @@ def _sql_str(value: str) -> str:
     return "'" + str(value).replace("'", "''") + "'"
 
 
+def _seconds(value) -> float:
+    """A duration quantile as a float; NaN where the engine returned NULL."""
+    return float("nan") if value is None else float(value)
+
+
+#: Longest route, in events, answered from the index; longer ones scan
+ROUTE_INDEX_MAX_N = 4
+
+_indexes: "weakref.WeakKeyDictionary[Eventstream, dict]" = per_stream_cache()
+
+
+@dataclass(frozen=True)
+class RouteIndex:
+    """Statistics of every contiguous run of 2..`max_n` events in a stream.
+
+    `grams` maps a run's events, as a tuple, to its ``(occurrences,
+    unique_paths, time_median, time_q95)``. Its two-event entries are the
+    transition counts the Markov probability of any route is a product of,
+    so even a route too long for the index takes its ``proba`` from here.
+    """
+
+    n_paths: int
+    max_n: int
+    grams: dict[tuple[str, ...], tuple[int, int, float, float]]
+    out_totals: dict[str, int]
+
+    def lookup(self, nodes: list[str]) -> tuple[int, int, float, float] | None:
+        """`grams`' entry for a route; zeros for one that never occurs, None
+        for one longer than the index."""
+        if len(nodes) > self.max_n:
+            return None
+        return self.grams.get(tuple(nodes), (0, 0, float("nan"), float("nan")))
+
+    def proba(self, nodes: list[str]) -> float:
+        """Product of ``P(next | source)`` over the route's consecutive pairs."""
+        proba = 1.0
+        for pair in zip(nodes, nodes[1:]):
+            total = self.out_totals.get(pair[0], 0)
+            count = self.grams[pair][0] if pair in self.grams else 0
+            proba *= count / total if total else 0.0
+        return proba
+
+
+def route_index(
+    eventstream: "Eventstream",
+    path_col: str | None = None,
+    max_n: int = ROUTE_INDEX_MAX_N,
+) -> RouteIndex:
+    """The :class:`RouteIndex` of `eventstream`, built on first use.
+
+    Kept for as long as the eventstream lives — its frame never changes
+    (ADR-0003), so neither do its routes. One query over the
+    boundary-enriched stream builds every run length at once; while it runs,
+    other eventstreams' requests are not held up.
+    """
+    path_col = path_col or eventstream.schema.path_col
+    return get_or_build(
+        _indexes,
+        eventstream,
+        (path_col, max_n),
+        lambda: _build_index(eventstream, path_col, max_n),
+    )
+
+
+def _build_index(eventstream: "Eventstream", path_col: str, max_n: int) -> RouteIndex:
+    schema = eventstream.schema
+    event_q = engine.quote_ident(schema.event_col)
+    ts_q = engine.quote_ident(schema.timestamp_col)
+    path_q = engine.quote_ident(path_col)
+    index_q = engine.quote_ident(schema.index)
+    subindex_q = engine.quote_ident(schema.subindex)
+    df = eventstream.add_start_end_events(path_col=path_col).df
+
+    leads = "".join(
+        f", lead({event_q}, {i}) over w as e{i}, lead({ts_q}, {i}) over w as t{i}"
+        for i in range(1, max_n)
+    )
+    # One aggregate per run length over the same lead columns; shorter runs
+    # pad the missing events with NULL so they stack into one frame.
+    grams = "\n    union all\n    ".join(
+        f"""select {n} as n, {", ".join(f"e{i}" for i in range(n))}
+        {"".join(f", null as e{i}" for i in range(n, max_n))},
+        count(*) as occurrences,
+        count(distinct {path_q}) as unique_paths,
+        median({dialect.epoch(f"t{n - 1} - t0")}) as time_median,
+        quantile_cont({dialect.epoch(f"t{n - 1} - t0")}, 0.95) as time_q95
+    from seq where e{n - 1} is not null
+    group by {", ".join(f"e{i}" for i in range(n))}"""
+        for n in range(2, max_n + 1)
+    )
+    query = f"""
+    with seq as materialized (
+        select {path_q}, {event_q} as e0, {ts_q} as t0{leads}
+        from df
+        window w as (
+            partition by {path_q} order by {index_q}, {subindex_q}
+        )
+    )
+    {grams}
+    """
+    result = engine.run(query, df=df)
+    grams: dict[tuple[str, ...], tuple[int, int, float, float]] = {}
+    out_totals: dict[str, int] = {}
+    for row in result.itertuples(index=False):
+        key = tuple(str(e) for e in row[1 : row.n + 1])
+        grams[key] = (
+            int(row.occurrences),
+            int(row.unique_paths),
+            _seconds(row.time_median),
+            _seconds(row.time_q95),
+        )
+        if row.n == 2:
+            out_totals[key[0]] = out_totals.get(key[0], 0) + int(row.occurrences)
+    return RouteIndex(
+        n_paths=int(df[path_col].nunique()),
+        max_n=max_n,
+        grams=grams,
+        out_totals=out_totals,
+    )
+
+
 def route_stats(
-    eventstream: "Eventstream", nodes: list[str], path_col: str | None = None
+    eventstream: "Eventstream",
+    nodes: list[str],
+    path_col: str | None = None,
+    max_n: int = ROUTE_INDEX_MAX_N,
 ) -> dict:
     """Statistics of a route — a strict contiguous sequence of transitions
     A→B→…→N — over the eventstream's paths.
 
-    One SQL pass: a chain of ``lead()`` columns finds every occurrence of
-    the route (overlapping occurrences count, consistent with transition
-    counts), which yields the occurrence count, the number of distinct
-    paths containing the route, and per-occurrence durations for the time
-    quantiles.
+    Every occurrence of the route counts (overlapping occurrences too,
+    consistent with transition counts), which yields the occurrence count,
+    the number of distinct paths containing the route, and per-occurrence
+    durations for the time quantiles. Routes of up to `max_n` events are
+    read from the stream's :class:`RouteIndex`; longer ones are found with
+    one pass of ``lead()`` columns over the stream.
 
     Parameters
     ----------
@@ -43,6 +179,8 @@ def route_stats(
         and contiguous — no gaps, no stutter collapsing.
     path_col:
         Path ID column override; defaults to `schema.path_col`.
+    max_n:
+        Longest route, in events, the index covers.
 
     Returns
     -------
@@ -65,9 +203,36 @@ def route_stats(
         raise InvalidParameterError(
             "nodes", nodes, ["a route of two or more event names"]
         )
+    if isinstance(max_n, bool) or not isinstance(max_n, int) or max_n < 2:
+        raise InvalidParameterError("max_n", max_n, ["an integer of 2 or more"])
     if eventstream.is_empty():
         raise EmptyEventstreamError("Cannot compute path stats for empty eventstream")
 
+    index = route_index(eventstream, path_col, max_n)
+    found = index.lookup(nodes)
+    if found is None:
+        found = _scan_route(eventstream, nodes, path_col)
+    occurrences, unique_paths, time_median, time_q95 = found
+
+    n_paths = index.n_paths
+    return {
+        "n_paths": n_paths,
+        "unique_paths": unique_paths,
+        "unique_paths_share": unique_paths / n_paths if n_paths else 0.0,
+        "occurrences": occurrences,
+        "avg_per_path": occurrences / n_paths if n_paths else 0.0,
+        "time_median": time_median
+        if occurrences and time_median == time_median
+        else None,
+        "time_q95": time_q95 if occurrences and time_q95 == time_q95 else None,
+        "proba": index.proba(nodes),
+    }
+
+
+def _scan_route(
+    eventstream: "Eventstream", nodes: list[str], path_col: str
+) -> tuple[int, int, float, float]:
+    """:meth:`RouteIndex.lookup` for a route longer than the index."""
     schema = eventstream.schema
     event_q = engine.quote_ident(schema.event_col)
     ts_q = engine.quote_ident(schema.timestamp_col)
@@ -109,7 +274,6 @@ def route_stats(
         where {conditions}
     )
     select
-        (select count(distinct {path_q}) from df) as n_paths,
         count(*) as occurrences,
         count(distinct {path_q}) as unique_paths,
         median(duration) as time_median,
@@ -117,49 +281,9 @@ def route_stats(
     from hits
     """
     row = engine.run(query, df=df).iloc[0]
-
-    # Markov product of the route's edge probabilities:
-    # prod over consecutive pairs of count(a→b) / count(a→*).
-    sources = sorted({nodes[i] for i in range(len(nodes) - 1)})
-    source_list = ", ".join(_sql_str(s) for s in sources)
-    trans_query = f"""
-    with seq as (
-        select
-            {event_q} as src,
-            lead({event_q}) over (
-                partition by {path_q} order by {index_q}, {subindex_q}
-            ) as dst
-        from df
+    return (
+        int(row["occurrences"]),
+        int(row["unique_paths"]),
+        _seconds(row["time_median"]),
+        _seconds(row["time_q95"]),
     )
-    select src, dst, count(*) as cnt
-    from seq
-    where src in ({source_list}) and dst is not null
-    group by src, dst
-    """
-    trans = engine.run(trans_query, df=df)
-    pair_counts = {(r.src, r.dst): int(r.cnt) for r in trans.itertuples(index=False)}
-    out_totals: dict[str, int] = {}
-    for (src, _), cnt in pair_counts.items():
-        out_totals[src] = out_totals.get(src, 0) + cnt
-    proba = 1.0
-    for a, b in zip(nodes, nodes[1:]):
-        total = out_totals.get(a, 0)
-        proba *= pair_counts.get((a, b), 0) / total if total else 0.0
-
-    n_paths = int(row["n_paths"])
-    occurrences = int(row["occurrences"])
-    unique_paths = int(row["unique_paths"])
-    return {
-        "n_paths": n_paths,
-        "unique_paths": unique_paths,
-        "unique_paths_share": unique_paths / n_paths if n_paths else 0.0,
-        "occurrences": occurrences,
-        "avg_per_path": occurrences / n_paths if n_paths else 0.0,
-        "time_median": float(row["time_median"])
-        if occurrences and row["time_median"] == row["time_median"]
-        else None,
-        "time_q95": float(row["time_q95"])
-        if occurrences and row["time_q95"] == row["time_q95"]
-        else None,
-        "proba": proba,
-    }
@@ -0,0 +1,88 @@
+"""
+Deterministic path sampling by hash.
+
+A path is in the `frac` sample when a seeded 64-bit hash of its id falls in
+the lowest `frac` of the hash range. Unlike a reservoir sample this is a
+plain per-row filter: it runs on every thread, can be pushed down into a
+Parquet or DuckDB scan, and keeps a path in or out of the sample no matter
+which other paths are in the data — sampling a stream, then the same stream
+with a day of events appended, picks the same old paths. Samples nest: every
+path in the 1% sample is also in the 5% one with the same seed.
+
+A sample of `n` paths is the `n` lowest hashes: still a plain filter, below
+the n-th lowest hash, so it keeps the same properties except that paths added
+to the data can push old ones out of it.
+
+`groups` splits a sample into near-equal random parts by the same hash, which
+is what `tools.approx` reads its error bars off.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from retentioneering import engine
+from retentioneering.engine import dialect
+
+__all__ = [
+    "HASH_RANGE",
+    "hash_sample",
+    "path_hash_sql",
+    "sample_n_predicate",
+    "sample_predicate",
+]
+
+#: hash() is an unsigned 64-bit integer
+HASH_RANGE = 2**64
+
+
+def path_hash_sql(df: pd.DataFrame, path_col: str, seed: int) -> str:
+    """The seeded hash of `df`'s `path_col`, as SQL."""
+    expr = engine.quote_ident(path_col)
+    # A categorical reaches DuckDB as an ENUM, which hashes by its code — and
+    # codes shift as categories are added. Its values hash the same always.
+    if isinstance(df[path_col].dtype, pd.CategoricalDtype):
+        expr = f"CAST({expr} AS VARCHAR)"
+    return dialect.seeded_hash(expr, seed)
+
+
+def sample_predicate(hash_sql: str, frac: float) -> str:
+    """SQL condition keeping the paths of the `frac` sample."""
+    if frac >= 1:
+        return "TRUE"
+    return f"{hash_sql} < {int(frac * HASH_RANGE)}"
+
+
+def sample_n_predicate(hash_sql: str, n: int, source: str = "df") -> str:
+    """SQL condition keeping the `n` paths of `source` with the lowest
+    hashes (all of them when there are fewer)."""
+    return f"""{hash_sql} <= (
+        SELECT max(h) FROM (
+            SELECT DISTINCT {hash_sql} AS h FROM {source} ORDER BY h LIMIT {int(n)}
+        )
+    )"""
+
+
+def hash_sample(
+    df: pd.DataFrame,
+    path_col: str,
+    frac: float | None = None,
+    seed: int = 0,
+    groups: int | None = None,
+    n: int | None = None,
+) -> pd.DataFrame:
+    """
+    The rows of `df` whose path is in the `frac` — or `n`-path — sample for
+    `seed`, in their original order. Pass one of `frac` and `n`.
+
+    With `groups`, adds a ``__group`` column numbering each sampled path's
+    group, 0 to ``groups - 1``.
+    """
+    hash_sql = path_hash_sql(df, path_col, seed)
+    group = f", {hash_sql} % {int(groups)} AS __group" if groups else ""
+    where = (
+        sample_n_predicate(hash_sql, n)
+        if n is not None
+        else sample_predicate(hash_sql, frac)
+    )
+    return engine.run(f"SELECT *{group} FROM df WHERE {where}", df=df)
@@ -0,0 +1,78 @@
+"""
+Caches of values derived from an eventstream, keyed by the eventstream.
+
+An eventstream's frame doesn't change after construction (ADR-0003), so a
+tool can keep what it derives from one — a time sketch, a route index, a
+path sample — for as long as the eventstream lives, in a
+``WeakKeyDictionary`` keyed by it. The one exception, Cluster Analysis
+saving its clusters into the stream it was opened on, swaps the frame in
+place through `Eventstream._replace_data`, which must then drop every such
+entry: caches created with `per_stream_cache` are the ones it knows about.
+
+`get_or_build` fills an entry on first use without holding a lock shared by
+every stream while it builds: a slow build for one stream doesn't hold up
+lookups and builds for the others.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Callable, Hashable, TypeVar
+
+__all__ = ["forget", "get_or_build", "per_stream_cache"]
+
+T = TypeVar("T")
+
+_caches: list[weakref.WeakKeyDictionary] = []
+
+
+def per_stream_cache() -> weakref.WeakKeyDictionary:
+    """A new cache keyed by eventstream, cleared by `forget`."""
+    cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    _caches.append(cache)
+    return cache
+
+
+def forget(eventstream: Any) -> None:
+    """Drop `eventstream`'s entries from every per-stream cache."""
+    for cache in _caches:
+        cache.pop(eventstream, None)
+
+
+# One lock per (cache, stream, key) being built, so that only callers after
+# the same entry wait on each other
+_guards: weakref.WeakKeyDictionary = per_stream_cache()
+_guards_lock = threading.Lock()
+
+
+def get_or_build(
+    cache: weakref.WeakKeyDictionary,
+    eventstream: Any,
+    key: Hashable,
+    build: Callable[[], T],
+) -> T:
+    """`cache[eventstream][key]`, calling `build()` to fill it on first use.
+
+    The shared lock is only held for the dictionary lookups. The first caller
+    for an entry builds it under that entry's own lock: later callers for the
+    same entry wait for its result, everyone else goes ahead. A build that
+    `forget` overtook, because the stream's frame was replaced while it ran,
+    is returned to its caller but not cached.
+    """
+    with _guards_lock:
+        built = cache.get(eventstream, {})
+        if key in built:
+            return built[key]
+        guards = _guards.setdefault(eventstream, {})
+        guard = guards.setdefault((id(cache), key), threading.Lock())
+    with guard:
+        with _guards_lock:
+            built = cache.get(eventstream, {})
+            if key in built:
+                return built[key]
+        value = build()
+        with _guards_lock:
+            if _guards.get(eventstream, {}).get((id(cache), key)) is guard:
+                cache.setdefault(eventstream, {})[key] = value
+        return value
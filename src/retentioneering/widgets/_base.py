@@ -30,12 +30,27 @@ Factors out what's genuinely identical across ``transition_graph``,
   ``route_stats`` tool has no ``Eventstream`` counterpart — it's a
   widget-only helper (the route badge's data) backed directly by
   ``utils/route_stats.py``, not exposed as public API.
+- ``result_version``/``result_patch`` — versioned ``result`` delivery.
+  ``_set_result`` sends a recomputed result as a patch against the previous
+  one (``widgets/_delta.py``) when that is much smaller than the result
+  itself; the JS host applies it (``js/widget/src/delta.ts``) and falls back
+  to the base ``result`` tool if it missed a version.
+- ``result_approx`` — approximate mode. A widget built with ``sample=``
+  publishes an estimate from that fraction of paths first
+  (``tools/approx.py``), then the exact result from a background thread;
+  ``result_approx`` is the fraction while the estimate is showing, 0 after.
+  An estimated result carries each cell's 95% confidence interval next to
+  it: ``values_low``/``values_high`` beside a matrix's ``values``, and
+  ``steps_low``/``steps_high`` beside a funnel's ``steps``, of the same
+  shape (None where a cell has no interval).
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
 import pathlib
+import threading
 import uuid
 from typing import Any, Callable
 
@@ -43,6 +58,7 @@ import anywidget
 import traitlets
 
 from retentioneering.exceptions import WidgetExportError
+from retentioneering.widgets import _delta, _payload
 from retentioneering.widgets._esm import _get_esm
 from retentioneering.widgets._html_export import render_static_display, write_html
 from retentioneering.widgets._state_file import StateFileMixin
@@ -89,6 +105,16 @@ class RetentioneeringWidget(StateFileMixin, anywidget.AnyWidget):
     def _default_widget_id(self) -> str:
         return uuid.uuid4().hex
 
+    # ── versioned result delivery ───────────────────────────────────────────
+    #: Bumped on every ``_set_result``; ``result_patch`` (JSON, possibly
+    #: packed) is ``{"base", "version", "ops"}`` when that version was sent
+    #: as a patch, or "" when ``result`` itself was sent.
+    result_version = traitlets.Int(0).tag(sync=True)
+    result_patch = traitlets.Unicode("").tag(sync=True)
+    #: Fraction of paths the current ``result`` was estimated from, or 0 when
+    #: it is exact (see ``_set_result_progressively``).
+    result_approx = traitlets.Float(0.0).tag(sync=True)
+
     # ── generic compute protocol ────────────────────────────────────────────
     compute_request = traitlets.Unicode("").tag(sync=True)
     compute_response = traitlets.Unicode("").tag(sync=True)
@@ -106,8 +132,98 @@ class RetentioneeringWidget(StateFileMixin, anywidget.AnyWidget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # The last result passed to _set_result, the base of the next patch
+        self._result_obj: Any = None
+        # Approximate mode: the sample fraction a subclass was built with, and
+        # the recompute a background refinement must still belong to
+        self._sample: float | None = None
+        self._result_generation = 0
+        self._result_lock = threading.Lock()
+        self._refinement: threading.Thread | None = None
         self.observe(self._on_compute_request, names=["compute_request"])
 
+    def _set_result(self, result: Any) -> None:
+        """Publish *result* as the subclass's ``result`` trait.
+
+        Python always holds the full value. The browser is sent either that
+        or, when the previous result is known and the patch from it is under
+        half the size, only the patch: ``result`` is then updated without
+        being synced, and ``result_patch``/``result_version`` go out in the
+        same message.
+        """
+        text = _payload.dumps(result)
+        previous, self._result_obj = self._result_obj, result
+        version = self.result_version + 1
+        patch = ""
+        if previous is not None:
+            ops = _delta.diff(previous, result)
+            patch = _payload.dumps(
+                {"base": version - 1, "version": version, "ops": ops}
+            )
+            if len(patch) * 2 > len(text):
+                patch = ""
+        lock = self._unsynced("result", text) if patch else contextlib.nullcontext()
+        with self.hold_sync(), lock:
+            self.result = text
+            self.result_patch = patch
+            self.result_version = version
+
+    def _set_result_progressively(self, compute: Callable[[Any], Any]) -> None:
+        """Publish ``compute(None)``, the exact result — or, for a widget
+        built with ``sample=``, ``compute(sample)`` right away and the exact
+        result when a background thread has it.
+
+        A recompute started in the meantime supersedes the refinement, whose
+        result is then dropped rather than shown over newer parameters. If
+        the exact computation fails, the estimate stays up with the error.
+        """
+        with self._result_lock:
+            self._result_generation += 1
+            generation = self._result_generation
+        sample = self._sample
+        result = compute(sample)
+        with self._result_lock, self.hold_sync():
+            self._set_result(result)
+            self.result_approx = sample or 0.0
+        if sample:
+            self._refinement = threading.Thread(
+                target=self._refine,
+                args=(compute, generation),
+                name=f"{type(self).__name__}-refine",
+                daemon=True,
+            )
+            self._refinement.start()
+
+    def _refine(self, compute: Callable[[Any], Any], generation: int) -> None:
+        try:
+            result, error = compute(None), ""
+        except Exception as exc:
+            result, error = None, str(exc)
+        with self._result_lock, self.hold_sync():
+            if generation != self._result_generation:
+                return
+            if error:
+                self.error = error
+            else:
+                self._set_result(result)
+                self.result_approx = 0.0
+
+    @contextlib.contextmanager
+    def _unsynced(self, name: str, value: Any):
+        """Don't send trait *name* to the browser when it is set to *value*
+        inside the block.
+
+        Uses ipywidgets' property lock — the mechanism that keeps a change
+        made by the front end from being echoed back to it — extended rather
+        than replaced, so a lock already held for such a change survives.
+        """
+        saved = self._property_lock
+        self._property_lock = {**saved, name: value}
+        try:
+            yield
+        finally:
+            self._property_lock = saved
+
     def _raise_if_error(self) -> None:
         """Guard for ``export_html``: refuse to export a stale/failed result.
 
@@ -267,5 +383,13 @@ class RetentioneeringWidget(StateFileMixin, anywidget.AnyWidget):
         """
         handler = self.compute_tools.get(tool)
         if handler is None:
+            if tool == "result":
+                return self._tool_result(params)
             raise ValueError(f"Unknown tool: {tool!r}")
         return handler(self, params)
+
+    def _tool_result(self, params: dict) -> dict:
+        """The current ``result`` and its version — what a host that missed
+        a ``result_patch`` resynchronizes from. Shared by every widget, so
+        it lives here rather than in each ``compute_tools`` table."""
+        return {"version": self.result_version, "result": self.result}
@@ -0,0 +1,147 @@
+"""Incremental patches between two versions of a widget `result`.
+
+Re-sending the whole result whenever a parameter changes puts the full
+matrix on the kernel-to-browser channel even when most of it is unchanged:
+switching the transition graph's edge weight keeps its events and the raw
+transition `counts`, and only the `values` move. `diff` describes the new
+result as a list of operations on the old one, each addressing a value by
+its `path` of dict keys / list indices from the root:
+
+- `{"op": "set", "path": p, "value": v}` — replace (or add) the value at *p*;
+  an empty path replaces the whole result.
+- `{"op": "del", "path": p}` — remove a dict key.
+- `{"op": "reindex", "path": p, "index": [...]}` — rebuild the square
+  matrix at *p* for a new event list: position *i* of the new rows and
+  columns is old position `index[i]`, or a new node (all None) for -1.
+  Emitted when a dict's `events` changed and its `values` matrix is indexed
+  by them, so added and removed nodes don't resend the cells they kept.
+- `{"op": "cells", "path": p, "rows": [...], "cols": [...], "values": [...]}`
+  — overwrite individual cells of the matrix at *p*.
+
+`apply` replays the operations; the viewer does the same in
+`js/widget/src/delta.ts`.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+#: A matrix with more than this share of its cells changed is resent whole
+_MAX_CHANGED_SHARE = 0.3
+
+
+def diff(old: Any, new: Any) -> list[dict]:
+    """Operations turning *old* into *new* (`apply(old, diff(old, new)) == new`)."""
+    ops: list[dict] = []
+    _diff(old, new, [], ops)
+    return ops
+
+
+def apply(obj: Any, ops: list[dict]) -> Any:
+    """Replay *ops* on *obj*, in place where possible; returns the result."""
+    for op in ops:
+        path = op["path"]
+        if not path:
+            obj = op["value"]
+            continue
+        parent = obj
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+        kind = op["op"]
+        if kind == "set":
+            parent[key] = op["value"]
+        elif kind == "del":
+            del parent[key]
+        elif kind == "reindex":
+            parent[key] = _reindex(parent[key], op["index"])
+        elif kind == "cells":
+            matrix = parent[key]
+            for r, c, v in zip(op["rows"], op["cols"], op["values"]):
+                matrix[r][c] = v
+        else:
+            raise ValueError(f"Unknown patch operation: {kind!r}")
+    return obj
+
+
+def _diff(old: Any, new: Any, path: list, ops: list[dict]) -> None:
+    if type(old) is type(new) and old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        keys = list(new)
+        if _is_labelled_matrix(old) and _is_labelled_matrix(new):
+            _diff_labelled_matrix(old, new, path, ops)
+            keys = [k for k in keys if k not in ("events", "values")]
+        for key in old:
+            if key not in new:
+                ops.append({"op": "del", "path": path + [key]})
+        for key in keys:
+            if key in old:
+                _diff(old[key], new[key], path + [key], ops)
+            else:
+                ops.append({"op": "set", "path": path + [key], "value": new[key]})
+        return
+    if not _diff_cells(old, new, path, ops):
+        ops.append({"op": "set", "path": path, "value": new})
+
+
+def _is_labelled_matrix(obj: dict) -> bool:
+    events, values = obj.get("events"), obj.get("values")
+    return (
+        isinstance(events, list)
+        and isinstance(values, list)
+        and len(values) == len(events)
+        and all(isinstance(row, list) and len(row) == len(events) for row in values)
+    )
+
+
+def _diff_labelled_matrix(old: dict, new: dict, path: list, ops: list[dict]) -> None:
+    values = old["values"]
+    if old["events"] != new["events"]:
+        position = {event: i for i, event in enumerate(old["events"])}
+        index = [position.get(event, -1) for event in new["events"]]
+        ops.append({"op": "set", "path": path + ["events"], "value": new["events"]})
+        if not all(i == -1 for i in index):
+            ops.append({"op": "reindex", "path": path + ["values"], "index": index})
+        values = _reindex(values, index)
+    _diff(values, new["values"], path + ["values"], ops)
+
+
+def _reindex(matrix: list, index: list) -> list:
+    return [
+        [None if r == -1 or c == -1 else matrix[r][c] for c in index] for r in index
+    ]
+
+
+def _diff_cells(old: Any, new: Any, path: list, ops: list[dict]) -> bool:
+    """Append a `cells` op if *old* and *new* are numeric matrices of one shape
+    differing in few enough cells; False when they aren't."""
+    if not (isinstance(old, list) and isinstance(new, list)) or not new:
+        return False
+    if not all(isinstance(row, list) for row in old + new):
+        return False
+    try:
+        # None becomes NaN; ragged or non-numeric rows raise
+        a = np.array(old, dtype=float)
+        b = np.array(new, dtype=float)
+    except (TypeError, ValueError):
+        return False
+    if a.ndim != 2 or a.shape != b.shape:
+        return False
+    changed = ~((a == b) | (np.isnan(a) & np.isnan(b)))
+    rows, cols = np.nonzero(changed)
+    if len(rows) > _MAX_CHANGED_SHARE * a.size:
+        return False
+    if len(rows):
+        ops.append(
+            {
+                "op": "cells",
+                "path": path,
+                "rows": rows.tolist(),
+                "cols": cols.tolist(),
+                "values": [new[r][c] for r, c in zip(rows.tolist(), cols.tolist())],
+            }
+        )
+    return True
@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import pathlib
 import re
+import shutil
 import html as _html_mod
+from typing import TextIO
 
 _BUNDLE_PATH = pathlib.Path(__file__).parent.parent / "static" / "widget-static.js"
 _CSS_PATH = pathlib.Path(__file__).parent.parent / "static" / "widget.css"
@@ -29,6 +31,21 @@ def _json_for_script(obj: object) -> str:
     return json.dumps(obj, ensure_ascii=False).replace("</", "<\\/")
 
 
+#: ``{{NAME}}`` slots in the HTML templates
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _write_widgets_json(out: TextIO, widgets: list[dict]) -> None:
+    """Write ``_json_for_script(widgets)`` to ``out`` one tab at a time, so
+    only a single tab's payload is ever held as a string."""
+    out.write("[")
+    for i, widget in enumerate(widgets):
+        if i:
+            out.write(", ")
+        out.write(_json_for_script(widget))
+    out.write("]")
+
+
 # ── Public API ─────────────────────────────────────────────────────────────────
 
 
@@ -70,8 +87,6 @@ def write_report_html(
             f"Static bundle not found at {_BUNDLE_PATH}. "
             "Run `npm run build` in js/widget/ to generate it."
         )
-    bundle_js = _BUNDLE_PATH.read_text(encoding="utf-8")
-    widget_css = _CSS_PATH.read_text(encoding="utf-8")
     # Build enriched map: label → {tab_id, widget_type, segment_col}
     # segment_col is used by render_analysis to format segment_overview links
     label_map = {
@@ -82,18 +97,28 @@ def write_report_html(
         }
         for i, w in enumerate(widgets)
     }
-    widgets_json = _json_for_script(widgets)
     analysis_html = render_analysis(analysis, label_map=label_map) if analysis else ""
     if data_sources_html:
         analysis_html = data_sources_html + "\n" + analysis_html
-    html = (
-        _HTML_TEMPLATE_REPORT.replace("{{TITLE}}", _html_mod.escape(title))
-        .replace("{{WIDGETS_JSON}}", widgets_json)
-        .replace("{{BUNDLE_JS}}", bundle_js)
-        .replace("{{WIDGET_CSS}}", widget_css)
-        .replace("{{ANALYSIS_HTML}}", analysis_html)
-    )
-    pathlib.Path(path).write_text(html, encoding="utf-8")
+    values = {"TITLE": _html_mod.escape(title), "ANALYSIS_HTML": analysis_html}
+    files = {"BUNDLE_JS": _BUNDLE_PATH, "WIDGET_CSS": _CSS_PATH}
+
+    # Streamed piece by piece: a report with many large tabs is never built
+    # as one string, and the bundle is copied over rather than read whole
+    with open(path, "w", encoding="utf-8") as out:
+        pos = 0
+        for m in _PLACEHOLDER.finditer(_HTML_TEMPLATE_REPORT):
+            out.write(_HTML_TEMPLATE_REPORT[pos : m.start()])
+            name = m.group(1)
+            if name == "WIDGETS_JSON":
+                _write_widgets_json(out, widgets)
+            elif name in files:
+                with open(files[name], encoding="utf-8") as src:
+                    shutil.copyfileobj(src, out)
+            else:
+                out.write(values[name])
+            pos = m.end()
+        out.write(_HTML_TEMPLATE_REPORT[pos:])
 
 
 def render_analysis(text: str, label_map: dict | None = None) -> str:
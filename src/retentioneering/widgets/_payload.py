@@ -0,0 +1,162 @@
+"""Compact encoding for large widget `result` payloads.
+
+A step matrix or diff transition graph over a thousand-plus events is a
+handful of dense float matrices, and as JSON lists of lists it reaches tens
+of megabytes - sent over the comm channel, stored in the notebook with the
+widget state, and embedded again in every HTML export. When its columnar
+form (below) is past `PACK_THRESHOLD` characters, `dumps` sends instead:
+
+    {"$packed": 1, "gzip": "<base64 of the gzipped JSON below>"}
+
+where the inner JSON is the payload with its bulky parts made columnar:
+
+- a rectangular list of numeric rows (None allowed) becomes
+  `{"$typed": "f8" | "i4", "shape": [rows, cols], "data": "<base64>"}`,
+  little-endian, None stored as NaN (JSON never holds NaN, so this is
+  lossless); a long flat numeric list is the same with a 1-d shape;
+- a long list of strings with repeats becomes
+  `{"$dict": [unique values], "codes": <typed i4 array>}`.
+
+The viewer (`js/widget/src/payload.ts`) unpacks it the first time a widget
+reads the key, back to the exact object `json.loads` of the plain form
+would give. Small payloads stay plain JSON, so existing readers of `result`
+are unaffected by anything but a large widget; `loads` reads both forms.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import itertools
+import json
+import math
+from typing import Any
+
+import numpy as np
+
+#: Columnar-JSON size (characters) above which `dumps` packs a payload
+PACK_THRESHOLD = 256 * 1024
+
+#: Flat lists shorter than this stay as they are; not worth a typed array
+_MIN_COLUMN = 64
+
+_I4 = np.iinfo(np.int32)
+_INT_TYPES = {int, np.int32, np.int64}
+
+
+def dumps(obj: Any, threshold: int = PACK_THRESHOLD) -> str:
+    """`json.dumps(obj)`, or the packed form when the columnar JSON is longer
+    than *threshold* characters."""
+    # Measured on the columnar form: far cheaper to serialize than the plain
+    # one when it matters, i.e. when the payload is mostly matrices
+    inner = json.dumps(pack(obj), separators=(",", ":"))
+    if len(inner) <= threshold:
+        return json.dumps(obj)
+    blob = base64.b64encode(
+        gzip.compress(inner.encode("utf-8"), compresslevel=6, mtime=0)
+    )
+    return json.dumps({"$packed": 1, "gzip": blob.decode("ascii")})
+
+
+def loads(text: str) -> Any:
+    """Inverse of `dumps`: parses the plain and the packed form alike."""
+    return unpack_envelope(json.loads(text))
+
+
+def unpack_envelope(obj: Any) -> Any:
+    """The payload behind a parsed `{"$packed": ...}` envelope; anything
+    else is returned as is."""
+    if not (isinstance(obj, dict) and "$packed" in obj):
+        return obj
+    inner = gzip.decompress(base64.b64decode(obj["gzip"]))
+    return unpack(json.loads(inner))
+
+
+def pack(obj: Any) -> Any:
+    """Replace numeric matrices/columns and repetitive string lists in *obj*
+    with their columnar encodings, recursively."""
+    if isinstance(obj, dict):
+        return {k: pack(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        encoded = _encode_list(obj)
+        if encoded is not None:
+            return encoded
+        return [pack(v) for v in obj]
+    return obj
+
+
+def unpack(obj: Any) -> Any:
+    """Inverse of `pack`."""
+    if isinstance(obj, dict):
+        if "$typed" in obj:
+            return _decode_typed(obj)
+        if "$dict" in obj:
+            values = obj["$dict"]
+            return [values[i] for i in _decode_typed(obj["codes"])]
+        return {k: unpack(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [unpack(v) for v in obj]
+    return obj
+
+
+def _encode_list(values: list) -> dict | None:
+    if not values:
+        return None
+    is_matrix = all(isinstance(row, list) for row in values)
+    if not is_matrix and len(values) < _MIN_COLUMN:
+        return None
+    if not is_matrix and all(isinstance(v, str) for v in values):
+        uniques = list(dict.fromkeys(values))
+        if len(uniques) * 2 > len(values):
+            return None
+        index = {v: i for i, v in enumerate(uniques)}
+        codes = np.fromiter((index[v] for v in values), dtype="<i4", count=len(values))
+        return {"$dict": uniques, "codes": _typed(codes, [len(values)])}
+
+    cells = itertools.chain.from_iterable(values) if is_matrix else values
+    types = set(map(type, cells))
+    if not types or not all(_is_number_type(t) for t in types):
+        return None
+    try:
+        # None becomes NaN; ragged rows raise
+        arr = np.array(values, dtype="<f8" if types - _INT_TYPES else np.int64)
+    except ValueError:
+        return None
+    if arr.ndim != (2 if is_matrix else 1) or arr.size == 0:
+        return None
+    if arr.dtype.kind == "i" and _I4.min <= arr.min() and arr.max() <= _I4.max:
+        arr = arr.astype("<i4")
+    else:
+        arr = arr.astype("<f8")
+        if np.isinf(arr).any():
+            return None
+    return _typed(arr, list(arr.shape))
+
+
+def _is_number_type(t: type) -> bool:
+    if t is type(None):
+        return True
+    return issubclass(t, (int, float, np.integer, np.floating)) and not issubclass(
+        t, (bool, np.bool_)
+    )
+
+
+def _typed(arr: np.ndarray, shape: list) -> dict:
+    return {
+        "$typed": "i4" if arr.dtype.kind == "i" else "f8",
+        "shape": shape,
+        "data": base64.b64encode(arr.tobytes()).decode("ascii"),
+    }
+
+
+def _decode_typed(spec: dict) -> list:
+    arr = np.frombuffer(base64.b64decode(spec["data"]), dtype="<" + spec["$typed"])
+    if spec["$typed"] == "i4":
+        items = arr.tolist()
+    else:
+        items = [None if math.isnan(v) else v for v in arr.tolist()]
+    shape = spec["shape"]
+    if len(shape) == 1:
+        return items
+    rows, cols = shape
+    return [items[r * cols : (r + 1) * cols] for r in range(rows)]
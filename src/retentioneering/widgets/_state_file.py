@@ -9,13 +9,114 @@ state (and the overridden values are saved back on the initial snapshot).
 
 The file stores raw traitlet values under a ``state`` key, plus the
 ``widget_type`` so a file can't silently be reused across widget kinds.
+
+Saves are debounced: a change marks its key dirty and a background thread
+writes once the changes pause for ``SAVE_DELAY`` seconds (at most every
+``MAX_SAVE_DELAY`` during a continuous drag), so a burst of node-position or
+slider updates costs one write. Each write re-encodes only the keys changed
+since the last one, as compact JSON, and replaces the file atomically.
+Pending saves are flushed before a widget loads the same file and at exit;
+a flush also waits for the saves the background thread is writing right
+then, so the file it leaves behind is the latest state.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import pathlib
+import threading
+import time
+import warnings
+from typing import Callable
+
+#: Seconds without a change before pending state is written
+SAVE_DELAY = 0.25
+
+#: Longest a change waits to be written while changes keep coming
+MAX_SAVE_DELAY = 2.0
+
+
+class _StateWriter:
+    """The background thread writing debounced saves, shared by every widget."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        # widget -> (monotonic time of its first unsaved change, of its last)
+        self._pending: dict = {}
+        # widget -> number of its saves taken off `_pending` but not written yet
+        self._writing: dict = {}
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, widget: "StateFileMixin") -> None:
+        now = time.monotonic()
+        with self._cond:
+            first, _ = self._pending.get(widget, (now, now))
+            self._pending[widget] = (first, now)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="retentioneering-state-file", daemon=True
+                )
+                self._thread.start()
+            # `flush` waits on the same condition, so wake every waiter
+            self._cond.notify_all()
+
+    def flush(self, which: Callable[["StateFileMixin"], bool] = lambda _: True):
+        """Write the pending saves of the widgets *which* selects, now, and
+        wait for those the background thread is already writing."""
+        with self._cond:
+            due = self._take(w for w in self._pending if which(w))
+        for widget in due:
+            self._write(widget)
+        with self._cond:
+            while any(which(w) for w in self._writing):
+                self._cond.wait()
+
+    def _take(self, widgets) -> list:
+        """Move *widgets* from pending to being written. Holds `_cond`."""
+        due = list(widgets)
+        for widget in due:
+            del self._pending[widget]
+            self._writing[widget] = self._writing.get(widget, 0) + 1
+        return due
+
+    def _write(self, widget: "StateFileMixin") -> None:
+        try:
+            widget._write_state()
+        except Exception as exc:
+            warnings.warn(
+                f"Could not save widget state to {widget._state_file}: {exc}",
+                stacklevel=1,
+            )
+        finally:
+            with self._cond:
+                self._writing[widget] -= 1
+                if not self._writing[widget]:
+                    del self._writing[widget]
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                deadlines = {
+                    w: min(last + SAVE_DELAY, first + MAX_SAVE_DELAY)
+                    for w, (first, last) in self._pending.items()
+                }
+                due = self._take(
+                    w for w, deadline in deadlines.items() if deadline <= now
+                )
+                if not due:
+                    timeout = min(deadlines.values(), default=now + 60) - now
+                    self._cond.wait(timeout)
+                    continue
+            for widget in due:
+                self._write(widget)
+
+
+_writer = _StateWriter()
+atexit.register(_writer.flush)
 
 
 class StateFileMixin:
@@ -36,7 +137,16 @@ class StateFileMixin:
     def _load_state_file(self, state_file) -> None:
         self._state_file = pathlib.Path(state_file).expanduser() if state_file else None
         self._saved_state: dict = {}
-        if self._state_file is None or not self._state_file.exists():
+        self._state_lock = threading.Lock()
+        # Encoded value of every persisted key, and the keys changed since
+        self._state_json: dict[str, str] = {}
+        self._state_dirty: set[str] = set(self._persist_names)
+        self._state_written = ""
+        if self._state_file is None:
+            return
+        # Another widget on the same file may have a save pending
+        _writer.flush(lambda w: _same_file(w._state_file, self._state_file))
+        if not self._state_file.exists():
             return
         try:
             payload = json.loads(self._state_file.read_text())
@@ -62,15 +172,43 @@ class StateFileMixin:
         if self._state_file is None:
             return
         self.observe(self._save_state, names=list(self._persist_names))
-        self._save_state()
-
-    def _save_state(self, _change=None) -> None:
-        payload = {
-            "widget_type": self.widget_type,
-            "state": {name: getattr(self, name) for name in self._persist_names},
-        }
-        self._state_file.parent.mkdir(parents=True, exist_ok=True)
-        # Write-then-rename so a crash mid-write can't corrupt the state file.
-        tmp = self._state_file.with_suffix(self._state_file.suffix + ".tmp")
-        tmp.write_text(json.dumps(payload, indent=2))
-        os.replace(tmp, self._state_file)
+        # The initial snapshot is written right away, creating the file
+        self._write_state()
+
+    def _save_state(self, change) -> None:
+        with self._state_lock:
+            self._state_dirty.add(change["name"])
+        _writer.schedule(self)
+
+    def _flush_state(self) -> None:
+        """Write this widget's pending state change now."""
+        _writer.flush(lambda w: w is self)
+        self._write_state()
+
+    def _write_state(self) -> None:
+        # Held across the write so concurrent flushes land in order
+        with self._state_lock:
+            for name in self._state_dirty:
+                self._state_json[name] = json.dumps(
+                    getattr(self, name), separators=(",", ":")
+                )
+            self._state_dirty.clear()
+            state = ",".join(
+                f"{json.dumps(name)}:{self._state_json[name]}"
+                for name in self._persist_names
+            )
+            text = (
+                f'{{"widget_type":{json.dumps(self.widget_type)},"state":{{{state}}}}}'
+            )
+            if text == self._state_written:
+                return
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a crash mid-write can't corrupt the state file.
+            tmp = self._state_file.with_suffix(self._state_file.suffix + ".tmp")
+            tmp.write_text(text)
+            os.replace(tmp, self._state_file)
+            self._state_written = text
+
+
+def _same_file(a: pathlib.Path | None, b: pathlib.Path) -> bool:
+    return a is not None and os.path.abspath(a) == os.path.abspath(b)
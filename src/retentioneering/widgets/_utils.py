@@ -31,6 +31,35 @@ def step_matrix_blocks(raw, diff, path_pattern):
     return (combined,), (group1,), (group2,)
 
 
+def bound_values(df) -> list:
+    """`df`'s cells as nested lists for a ``values_low``/``values_high`` key
+    (see ``RetentioneeringWidget._set_result_progressively``); NaN, a cell
+    without an interval, becomes None since JSON has no NaN."""
+    import numpy as np
+
+    values = df.to_numpy(dtype=float, na_value=np.nan)
+    cells = values.astype(object)
+    cells[np.isnan(values)] = None
+    return cells.tolist()
+
+
+def attach_step_matrix_bounds(matrices, estimate, diff, path_pattern) -> None:
+    """Add ``values_low``/``values_high`` to the step matrices rendered from
+    `estimate.value` — and to their ``group1``/``group2`` in diff mode — from
+    the `Approximation`'s bounds, which have the value's shape."""
+    for key, bound in (("values_low", estimate.low), ("values_high", estimate.high)):
+        blocks = step_matrix_blocks(bound, diff, path_pattern)
+        if diff is None:
+            for m, sm in zip(matrices, blocks):
+                m[key] = bound_values(sm)
+            continue
+        diff_sms, sms1, sms2 = blocks
+        for m, sm, sm1, sm2 in zip(matrices, diff_sms, sms1, sms2):
+            m[key] = bound_values(sm)
+            m["group1"][key] = bound_values(sm1)
+            m["group2"][key] = bound_values(sm2)
+
+
 def pattern_edges(path_pattern, anchor=None) -> tuple[bool, bool]:
     """Whether the rendered strip reaches each of the path's own boundaries.
 
@@ -311,7 +311,7 @@ class ClusterAnalysisWidget(RetentioneeringWidget):
         try:
             features = json.loads(self.features) if self.features else []
             if not features:
-                self.result = "{}"
+                self._set_result({})
                 self._cluster_labels = None
                 return
             metrics = json.loads(self.overview_metrics) if self.overview_metrics else []
@@ -350,14 +350,14 @@ class ClusterAnalysisWidget(RetentioneeringWidget):
                     path_col=self.path_col or None,
                 )
 
-            self.result = json.dumps(computed["result"])
+            self._set_result(computed["result"])
             self.chosen_params = json.dumps(computed["best_params"])
             self._cluster_labels = computed["cluster_labels"]
         except RetentioneeringError:
             raise
         except Exception as exc:
             self.error = str(exc)
-            self.result = "{}"
+            self._set_result({})
             self.chosen_params = "{}"
             self._cluster_labels = None
         finally:
@@ -518,12 +518,7 @@ class ClusterAnalysisWidget(RetentioneeringWidget):
             )
 
         es = self._eventstream
-        es._df = new_df
-        es._schema = asdict(new_schema)
-        # `schema`/`fingerprint` are cached_property - drop the stale cached values
-        # so the next access recomputes them from the new _df/_schema.
-        es.__dict__.pop("schema", None)
-        es.__dict__.pop("fingerprint", None)
+        es._replace_data(new_df, asdict(new_schema))
 
         # Refresh this widget's own catalogs so its sidebar reflects the new column.
         self.segment_cols = json.dumps(es.schema.segment_cols)
@@ -38,11 +38,13 @@ class FunnelWidget(RetentioneeringWidget):
         path_col=_UNSET,
         height=_UNSET,
         sidebar_open=_UNSET,
+        sample=None,
         state_file=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._eventstream = eventstream
+        self._sample = sample
         self._initialized = False
         self._load_state_file(state_file)
 
@@ -122,21 +124,29 @@ class FunnelWidget(RetentioneeringWidget):
             steps = json.loads(self.steps) if self.steps else []
             diff = _parse_diff(self.diff)
             pid = self.path_col or None
-            self.result = json.dumps(
-                self._compute_raw(steps=steps, diff=diff, path_col=pid)
+            self._set_result_progressively(
+                lambda sample: self._compute_raw(
+                    steps=steps, diff=diff, path_col=pid, sample=sample
+                )
             )
         except RetentioneeringError:
             raise
         except Exception as exc:
             self.error = str(exc)
-            self.result = "{}"
+            self._set_result({})
         finally:
             self.is_loading = False
 
-    def _compute_raw(self, steps, diff=None, path_col=None) -> dict:
+    def _compute_raw(self, steps, diff=None, path_col=None, sample=None) -> dict:
         result = self._eventstream.funnel_data(
-            steps=steps, diff=diff, path_col=path_col
+            steps=steps, diff=diff, path_col=path_col, sample=sample
         )
+        if sample:
+            result = {
+                **result.value,
+                "steps_low": result.low["steps"],
+                "steps_high": result.high["steps"],
+            }
         if diff:
             if len(diff) == 3:
                 result["group1_label"] = str(diff[1])
@@ -6,6 +6,10 @@ from retentioneering.exceptions import RetentioneeringError
 from retentioneering.widgets._base import _UNSET, RetentioneeringWidget
 from retentioneering.widgets._utils import distribution_levels as _distribution_levels
 
+# How many distribution results to keep per widget. Toggling back and forth
+# between a handful of segment levels/metrics is the common interaction.
+_DIST_CACHE_SIZE = 32
+
 
 class SegmentOverviewWidget(RetentioneeringWidget):
     widget_type = traitlets.Unicode("segment_overview").tag(sync=True)
@@ -44,11 +48,16 @@ class SegmentOverviewWidget(RetentioneeringWidget):
         path_col=_UNSET,
         height=_UNSET,
         sidebar_open=_UNSET,
+        sample=None,
         state_file=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._eventstream = eventstream
+        self._sample = sample
+        # The eventstream is immutable, so a distribution request always yields
+        # the same histogram/KDE payload - keyed by the request itself.
+        self._dist_cache: dict[str, str] = {}
         self._initialized = False
         self.widget_id = ""
         self.widget_type = "segment_overview"
@@ -151,31 +160,42 @@ class SegmentOverviewWidget(RetentioneeringWidget):
         self.error = ""
         try:
             metrics = json.loads(self.metrics) if self.metrics else []
-            self.result = json.dumps(
-                self._compute_raw(
-                    segment_col=self.segment_col,
+            segment_col, path_col = self.segment_col, self.path_col or None
+            self._set_result_progressively(
+                lambda sample: self._compute_raw(
+                    segment_col=segment_col,
                     metrics=metrics,
-                    path_col=self.path_col or None,
+                    path_col=path_col,
+                    sample=sample,
                 )
             )
         except RetentioneeringError:
             raise
         except Exception as exc:
             self.error = str(exc)
-            self.result = "{}"
+            self._set_result({})
         finally:
             self.is_loading = False
 
-    def _compute_raw(self, segment_col, metrics, path_col=None) -> dict:
+    def _compute_raw(self, segment_col, metrics, path_col=None, sample=None) -> dict:
         df = self._eventstream.segment_overview_data(
             segment_col=segment_col,
             metrics=metrics,
             path_col=path_col,
+            sample=sample,
         )
+        bounds = {}
+        if sample:
+            bounds = {
+                "values_low": _rows(df.low),
+                "values_high": _rows(df.high),
+            }
+            df = df.value
         return {
             "metrics": df.index.tolist(),
             "segments": df.columns.tolist(),
-            "values": [[_safe(v) for v in df.loc[m].tolist()] for m in df.index],
+            "values": _rows(df),
+            **bounds,
         }
 
     # ── HTML export (export_html/render_static: see RetentioneeringWidget) ────
@@ -200,6 +220,11 @@ class SegmentOverviewWidget(RetentioneeringWidget):
         }
 
     def _compute_distribution(self, req: dict):
+        key = json.dumps(req, sort_keys=True, default=str)
+        cached = self._dist_cache.get(key)
+        if cached is not None:
+            self.dist_result = cached
+            return
         self.is_loading = True
         try:
             result = self._eventstream.get_metric_distribution(
@@ -212,12 +237,19 @@ class SegmentOverviewWidget(RetentioneeringWidget):
                 result,
                 default=lambda x: None if (isinstance(x, float) and x != x) else x,
             )
+            if len(self._dist_cache) >= _DIST_CACHE_SIZE:
+                self._dist_cache.pop(next(iter(self._dist_cache)))
+            self._dist_cache[key] = self.dist_result
         except Exception as exc:
             self.dist_result = json.dumps({"error": str(exc)})
         finally:
             self.is_loading = False
 
 
+def _rows(df) -> list:
+    return [[_safe(v) for v in df.loc[m].tolist()] for m in df.index]
+
+
 def _safe(v):
     import math
 
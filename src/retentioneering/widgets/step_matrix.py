@@ -5,6 +5,9 @@ import traitlets
 from retentioneering.exceptions import RetentioneeringError
 from retentioneering.widgets._base import _UNSET, RetentioneeringWidget
 from retentioneering.widgets._utils import max_steps_for_window as _max_steps_for_window
+from retentioneering.widgets._utils import (
+    attach_step_matrix_bounds as _attach_step_matrix_bounds,
+)
 from retentioneering.widgets._utils import parse_diff as _parse_diff
 from retentioneering.widgets._utils import pattern_edges as _pattern_edges
 from retentioneering.widgets._utils import step_matrix_blocks as _step_matrix_blocks
@@ -72,11 +75,13 @@ class StepMatrixWidget(RetentioneeringWidget):
         step_window=_UNSET,
         height=_UNSET,
         sidebar_open=_UNSET,
+        sample=None,
         state_file=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._eventstream = eventstream
+        self._sample = sample
         self._initialized = False
         self.widget_type = "step_matrix"
         self._load_state_file(state_file)
@@ -199,24 +204,32 @@ class StepMatrixWidget(RetentioneeringWidget):
         self.is_loading = True
         self.error = ""
         try:
-            result = self._compute_raw(
+            params = dict(
                 max_steps=self.max_steps,
                 path_col=self.path_col or None,
                 diff=_parse_diff(self.diff),
                 path_pattern=self.path_pattern or None,
                 anchor=self._anchor_spec(),
             )
-            self.result = json.dumps(result)
+            self._set_result_progressively(
+                lambda sample: self._compute_raw(**params, sample=sample)
+            )
         except RetentioneeringError:
             raise
         except Exception as exc:
             self.error = str(exc)
-            self.result = "{}"
+            self._set_result({})
         finally:
             self.is_loading = False
 
     def _compute_raw(
-        self, max_steps, path_col=None, diff=None, path_pattern=None, anchor=None
+        self,
+        max_steps,
+        path_col=None,
+        diff=None,
+        path_pattern=None,
+        anchor=None,
+        sample=None,
     ) -> dict:
         raw = self._eventstream.step_sankey_data(
             max_steps=max_steps,
@@ -224,7 +237,11 @@ class StepMatrixWidget(RetentioneeringWidget):
             path_col=path_col,
             path_pattern=path_pattern,
             anchor=anchor,
+            sample=sample,
         )
+        estimate = None
+        if sample:
+            estimate, raw = raw, raw.value
         raw = _step_matrix_blocks(raw, diff, path_pattern or anchor)
         if diff is not None:
             diff_sms, sms1, sms2 = raw
@@ -239,6 +256,8 @@ class StepMatrixWidget(RetentioneeringWidget):
             for m in matrices:
                 m["group1"] = None
                 m["group2"] = None
+        if estimate is not None:
+            _attach_step_matrix_bounds(matrices, estimate, diff, path_pattern or anchor)
 
         try:
             from retentioneering import engine
@@ -108,12 +108,15 @@ class TransitionGraphWidget(RetentioneeringWidget):
         sidebar_open=_UNSET,
         views=_UNSET,
         view=_UNSET,
+        sample=None,
         state_file=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self._eventstream = eventstream
+        self._sample = sample
         self._initialized = False
+        self._group_counts_key = None
         self._load_state_file(state_file)
 
         try:
@@ -268,55 +271,81 @@ class TransitionGraphWidget(RetentioneeringWidget):
         self.error = ""
         try:
             diff_list = _parse_diff(self.diff)
-            result = self._compute_tm_raw(
-                edge_weight=self.edge_weight,
-                path_col=self.path_col or None,
-                diff=diff_list,
+            edge_weight, path_col = self.edge_weight, self.path_col or None
+            self._set_result_progressively(
+                lambda sample: self._compute_tm_raw(
+                    edge_weight=edge_weight,
+                    path_col=path_col,
+                    diff=diff_list,
+                    sample=sample,
+                )
             )
-            self.result = json.dumps(result)
 
-            if diff_list:
-                try:
-                    s1, s2 = self._eventstream._split_two(
-                        diff_list, path_col=self.path_col or None
-                    )
-                    c1 = s1.get_event_counts()
-                    c2 = s2.get_event_counts()
-                    pid = self.path_col or s1.schema.path_cols[0]
-                    for counts, s in ((c1, s1), (c2, s2)):
-                        n = int(s.df[pid].nunique())
-                        counts.setdefault("path_start", n)
-                        counts.setdefault("path_end", n)
-                    self.event_counts_g1 = json.dumps(c1)
-                    self.event_counts_g2 = json.dumps(c2)
-                except Exception:
-                    self.event_counts_g1 = "{}"
-                    self.event_counts_g2 = "{}"
-            else:
-                self.event_counts_g1 = "{}"
-                self.event_counts_g2 = "{}"
+            # The groups' event counts depend on the split, not the edge
+            # weight: switching weights keeps the ones already sent
+            group_key = (self.diff, self.path_col)
+            if group_key != self._group_counts_key:
+                self.event_counts_g1, self.event_counts_g2 = self._group_counts(
+                    diff_list
+                )
+                self._group_counts_key = group_key
         except RetentioneeringError:
             raise
         except Exception as exc:
             self.error = str(exc)
-            self.result = "{}"
+            self._set_result({})
         finally:
             self.is_loading = False
 
-    def _compute_tm_raw(self, edge_weight: str, path_col=None, diff=None) -> dict:
+    def _group_counts(self, diff_list) -> tuple:
+        """JSON event counts of the two diff groups, or "{}"s outside diff
+        mode or when the split fails."""
+        if not diff_list:
+            return "{}", "{}"
+        try:
+            s1, s2 = self._eventstream._split_two(
+                diff_list, path_col=self.path_col or None
+            )
+            c1 = s1.get_event_counts()
+            c2 = s2.get_event_counts()
+            pid = self.path_col or s1.schema.path_cols[0]
+            for counts, s in ((c1, s1), (c2, s2)):
+                n = int(s.df[pid].nunique())
+                counts.setdefault("path_start", n)
+                counts.setdefault("path_end", n)
+            return json.dumps(c1), json.dumps(c2)
+        except Exception:
+            return "{}", "{}"
+
+    def _compute_tm_raw(
+        self, edge_weight: str, path_col=None, diff=None, sample=None
+    ) -> dict:
         tm = self._eventstream.transition_graph_data(
             edge_weight=edge_weight,
             path_col=path_col,
             diff=diff,
+            sample=sample,
         )
+        estimate = None
+        if sample:
+            estimate, tm = tm, tm.value
         if diff is not None:
             tm, tm1, tm2 = tm
-            return {
+            result = {
                 "events": tm.index.tolist(),
                 "values": _df_to_list(tm),
                 "group1": {"events": tm1.index.tolist(), "values": _df_to_list(tm1)},
                 "group2": {"events": tm2.index.tolist(), "values": _df_to_list(tm2)},
             }
+            if estimate is not None:
+                for key, bound in (
+                    ("values_low", estimate.low),
+                    ("values_high", estimate.high),
+                ):
+                    result[key] = _df_to_list(bound[0])
+                    result["group1"][key] = _df_to_list(bound[1])
+                    result["group2"][key] = _df_to_list(bound[2])
+            return result
         # Raw transition counts ride along as a sparse mapping so the client
         # can derive exact incoming/outgoing shares (proba_in / proba_out for
         # the ego view) regardless of the displayed edge weight — including
@@ -325,19 +354,25 @@ class TransitionGraphWidget(RetentioneeringWidget):
             tm
             if edge_weight == "count"
             else self._eventstream.transition_graph_data(
-                edge_weight="count", path_col=path_col, diff=None
+                edge_weight="count", path_col=path_col, diff=None, sample=sample
             )
         )
+        if sample and edge_weight != "count":
+            cnt = cnt.value
         counts: dict = {}
         for src, row in cnt.iterrows():
             nonzero = {dst: int(v) for dst, v in row.items() if v}
             if nonzero:
                 counts[src] = nonzero
-        return {
+        result = {
             "events": tm.index.tolist(),
             "values": _df_to_list(tm),
             "counts": counts,
         }
+        if estimate is not None:
+            result["values_low"] = _df_to_list(estimate.low)
+            result["values_high"] = _df_to_list(estimate.high)
+        return result
 
     def semantic_layout_positions(self) -> dict:
         """Best-effort semantic layout positions for static consumers (HTML
@@ -402,6 +437,28 @@ class TransitionGraphWidget(RetentioneeringWidget):
 
 
 def _df_to_list(df) -> list:
+    import numpy as np
+    import pandas as pd
+
+    # Column at a time: a 1000-event matrix is a million cells, too many to
+    # visit one by one. Columns numpy can't make floats of take the slow path.
+    try:
+        columns = [
+            col.dt.total_seconds().to_numpy(dtype=float, na_value=np.nan)
+            if pd.api.types.is_timedelta64_dtype(col.dtype)
+            else col.to_numpy(dtype=float, na_value=np.nan)
+            for _, col in df.items()
+        ]
+    except (TypeError, ValueError):
+        return _df_to_list_by_cell(df)
+    if not columns:
+        return [[] for _ in range(len(df))]
+    values = np.column_stack(columns).astype(object)
+    values[pd.isna(values)] = None
+    return values.tolist()
+
+
+def _df_to_list_by_cell(df) -> list:
     import pandas as pd
 
     rows = []
@@ -0,0 +1,44 @@
+"""Every asv benchmark still runs, on a tiny log (benchmarks/)."""
+
+import importlib
+import pkgutil
+
+import pytest
+
+import benchmarks
+from benchmarks import common
+
+ROWS = 2_000
+
+
+def _benchmarks():
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for cls in vars(module).values():
+            if isinstance(cls, type) and cls.__module__ == module.__name__:
+                for name in sorted(vars(cls)):
+                    if name.startswith("time_"):
+                        yield pytest.param(cls, name, id=f"{info.name}.{name}")
+
+
+@pytest.mark.parametrize("cls, name", list(_benchmarks()))
+def test_benchmark_runs(cls, name, monkeypatch, tmp_path):
+    monkeypatch.setattr(common, "DATA_DIR", tmp_path)
+    bench = cls()
+    bench.setup(ROWS)
+    getattr(bench, name)(ROWS)
+
+
+def test_event_log_is_deterministic_and_exact():
+    df = common.event_log(ROWS, seed=1)
+    assert len(df) == ROWS
+    assert df.equals(common.event_log(ROWS, seed=1))
+    # Sessions nest in users and stay in time order
+    assert (df.groupby("session_id")["user_id"].nunique() == 1).all()
+    assert df.groupby("session_id")["timestamp"].is_monotonic_increasing.all()
+
+
+def test_every_benchmark_has_a_peakmem_twin():
+    for param in _benchmarks():
+        cls, name = param.values
+        assert hasattr(cls, "peakmem_" + name.removeprefix("time_"))
@@ -569,3 +569,143 @@ class TestAddClusters:
                 "cluster"
             ].unique()
             assert len(session_clusters) == 1
+
+
+def get_two_group_df(n_per_group: int = 30) -> pd.DataFrame:
+    """Two well separated groups of paths: short ones without a purchase and
+    long ones with one, so any sane clustering splits them the same way."""
+    rows = []
+    start = pd.Timestamp("2020-01-01 00:00:00")
+    for i in range(n_per_group):
+        uid = f"short_{i:02d}"
+        rows.append([uid, "login", start])
+        rows.append([uid, "view", start + pd.Timedelta(seconds=10)])
+    for i in range(n_per_group):
+        uid = f"long_{i:02d}"
+        rows.append([uid, "login", start])
+        for step in range(1, 8):
+            rows.append([uid, "view", start + pd.Timedelta(minutes=step)])
+        rows.append([uid, "purchase", start + pd.Timedelta(minutes=9)])
+    return pd.DataFrame(rows, columns=["user_id", "event", "timestamp"])
+
+
+class TestAddClustersBatchSize:
+    FEATURES = [
+        {"metric": "length"},
+        {"metric": "has_event", "metric_args": {"event": "purchase"}},
+    ]
+
+    @staticmethod
+    def _path_labels(stream, name: str) -> pd.Series:
+        """One label per path, checking that it covers every row of the path."""
+        grouped = stream.df.groupby("user_id", observed=True)[name]
+        assert (grouped.nunique() == 1).all()
+        return grouped.first().astype(str)
+
+    def test_kmeans_batches_separate_the_groups(self) -> None:
+        stream = Eventstream(get_two_group_df())
+        result = stream.add_clusters(
+            name="cluster",
+            features=self.FEATURES,
+            method_args={"n_clusters": 2},
+            batch_size=7,
+        )
+
+        labels = self._path_labels(result, "cluster")
+        short = labels[labels.index.str.startswith("short")]
+        long = labels[labels.index.str.startswith("long")]
+        assert short.nunique() == 1 and long.nunique() == 1
+        assert short.iloc[0] != long.iloc[0]
+        assert set(labels) <= {"cluster_0", "cluster_1"}
+
+    def test_batch_size_larger_than_stream_is_one_batch(self) -> None:
+        stream = Eventstream(get_two_group_df())
+        result = stream.add_clusters(
+            name="cluster",
+            features=self.FEATURES,
+            method_args={"n_clusters": 2},
+            batch_size=10_000,
+        )
+        assert result.df["cluster"].notna().all()
+        assert result.df["cluster"].nunique() == 2
+
+    def test_hdbscan_labels_every_path_from_a_sample(self) -> None:
+        stream = Eventstream(get_two_group_df())
+        result = stream.add_clusters(
+            name="cluster",
+            features=self.FEATURES,
+            method="hdbscan",
+            method_args={"min_cluster_size": 5},
+            batch_size=20,
+        )
+
+        labels = self._path_labels(result, "cluster")
+        assert len(labels) == 60
+        assert labels.notna().all()
+        # Paths outside the 20-path sample still get a label, and the two
+        # groups never share one.
+        short = set(labels[labels.index.str.startswith("short")])
+        long = set(labels[labels.index.str.startswith("long")])
+        assert not (short & long) - {"noise"}
+
+    def test_batches_with_nmf_and_std_scaler(self) -> None:
+        stream = Eventstream(get_two_group_df())
+        result = stream.add_clusters(
+            name="cluster",
+            features=self.FEATURES,
+            method_args={"n_clusters": 2},
+            scaler="minmax",
+            nmf_components=2,
+            batch_size=16,
+        )
+        assert result.df["cluster"].notna().all()
+
+        result = stream.add_clusters(
+            name="cluster",
+            features=self.FEATURES,
+            method_args={"n_clusters": 2},
+            scaler="std",
+            batch_size=16,
+        )
+        assert result.df["cluster"].notna().all()
+
+    def test_batch_size_is_recorded_in_the_recipe(self) -> None:
+        stream = Eventstream(get_two_group_df())
+        result = stream.add_clusters(
+            name="cluster",
+            features=self.FEATURES,
+            method_args={"n_clusters": 2},
+            batch_size=16,
+        )
+        assert result.recipe()[-1]["batch_size"] == 16
+
+    @pytest.mark.parametrize("batch_size", [0, -5, 2.5, True])
+    def test_invalid_batch_size_raises(self, batch_size) -> None:
+        stream = Eventstream(get_df())
+        with pytest.raises(PreprocessingConfigError, match="batch_size"):
+            stream.add_clusters(
+                name="cluster",
+                features=self.FEATURES,
+                method_args={"n_clusters": 2},
+                batch_size=batch_size,
+            )
+
+    def test_batch_size_below_n_clusters_raises(self) -> None:
+        stream = Eventstream(get_two_group_df())
+        with pytest.raises(PreprocessingConfigError, match="n_clusters"):
+            stream.add_clusters(
+                name="cluster",
+                features=self.FEATURES,
+                method_args={"n_clusters": 4},
+                batch_size=2,
+            )
+
+    def test_batch_size_equal_to_n_clusters_is_allowed(self) -> None:
+        stream = Eventstream(get_two_group_df())
+        result = stream.add_clusters(
+            name="cluster",
+            features=self.FEATURES,
+            method_args={"n_clusters": 4},
+            batch_size=4,
+        )
+        assert result.df["cluster"].notna().all()
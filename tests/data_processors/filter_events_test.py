@@ -290,3 +290,37 @@ class TestFilterEvents:
         expected = Eventstream(expected_df)
 
         assert res.equals(expected)
+
+
+class TestKeepPaths:
+    """The internal semi-join path filter behind filter_paths, path_pattern and
+    id-list diffs must return exactly what `filter_events(keep=...)` does."""
+
+    def test__matches_filter_events_keep(self) -> None:
+        stream = Eventstream(get_df(), {"segment_cols": ["country"]})
+
+        res = stream._keep_paths(["user_3", "user_1"], "user_id", {})
+        expected = stream.filter_events(keep={"user_id": ["user_3", "user_1"]})
+
+        pd.testing.assert_frame_equal(res.df, expected.df)
+        assert res.get_segment_levels() == expected.get_segment_levels()
+
+    def test__numeric_path_ids_and_duplicates(self) -> None:
+        df = get_df()
+        df["user_id"] = df["user_id"].str.removeprefix("user_").astype(int)
+        stream = Eventstream(df, {"custom_cols": ["country"]})
+
+        res = stream._keep_paths(pd.Index([2, 3, 3]), "user_id", {})
+
+        assert sorted(res.df["user_id"].unique().tolist()) == [2, 3]
+        assert len(res.df) == 3
+
+    def test__pattern_lineage_replays_without_the_ids(self) -> None:
+        df = get_df()
+        stream = Eventstream(df, {"custom_cols": ["country"]})
+
+        res = stream._restrict_to_pattern("A", "user_id", stacklevel=2)
+
+        assert sorted(res.df["user_id"].unique()) == ["user_1", "user_2"]
+        assert "user_1" not in str(res.recipe())
+        assert Eventstream.from_recipe(df, res.recipe()).fingerprint == res.fingerprint
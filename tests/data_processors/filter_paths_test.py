@@ -603,6 +603,24 @@ class TestFilterPathsAST:
         expected = stream.filter_events(keep={"user_id": ["user_1"]})
         assert res.equals(expected)
 
+    def test__time_between_from_path_start(self) -> None:
+        """path_start is the path's first timestamp, though the condition is
+        evaluated without adding the synthetic rows; paths missing the end
+        event compare as NULL and are dropped."""
+        stream = build_stream()
+        condition = {
+            "op": "<=",
+            "metric": "time_between",
+            "metric_args": {"start_event": "path_start", "end_event": "logout"},
+            "value": 1200,
+        }
+
+        res = stream.filter_paths(condition=condition)
+
+        expected = stream.filter_events(keep={"user_id": ["user_1"]})
+        assert res.equals(expected)
+        assert res.recipe() == [{"type": "filter_paths", "condition": condition}]
+
     def test__in_segment_none_segment_level_raises(self) -> None:
         """in_segment with segment_level=None cannot be used in condition"""
         stream = build_stream()
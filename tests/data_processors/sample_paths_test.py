@@ -93,3 +93,52 @@ class TestSamplePaths:
     def test__frac_out_of_range_raises(self) -> None:
         with pytest.raises(PreprocessingConfigError):
             _make_stream().sample_paths(frac=1.5)
+
+
+class TestSamplePathsHash:
+    def _stream(self, n_paths: int) -> Eventstream:
+        df = pd.DataFrame(
+            {
+                "user_id": [f"user_{i}" for i in range(n_paths)],
+                "event": "A",
+                "timestamp": "2020-01-01 00:00:00",
+            }
+        )
+        return Eventstream(df)
+
+    def test__frac_keeps_about_that_share_of_paths(self) -> None:
+        res = self._stream(2000).sample_paths(frac=0.1, method="hash")
+        assert 120 < len(_sampled_users(res)) < 280
+
+    def test__same_paths_as_the_data_grows(self) -> None:
+        small = self._stream(1000).sample_paths(frac=0.2, method="hash")
+        grown = self._stream(2000).sample_paths(frac=0.2, method="hash")
+        assert set(_sampled_users(small)) <= set(_sampled_users(grown))
+
+    def test__seed_changes_the_sample(self) -> None:
+        stream = self._stream(500)
+        res1 = stream.sample_paths(frac=0.2, method="hash", random_state=1)
+        res2 = stream.sample_paths(frac=0.2, method="hash", random_state=1)
+        res3 = stream.sample_paths(frac=0.2, method="hash", random_state=2)
+        assert _sampled_users(res1) == _sampled_users(res2)
+        assert _sampled_users(res1) != _sampled_users(res3)
+
+    def test__n_keeps_exactly_n_whole_paths(self) -> None:
+        res = _make_stream().sample_paths(n=2, method="hash")
+        users = _sampled_users(res)
+        assert len(users) == 2
+
+        original = get_df()
+        sampled = res.df.astype({"user_id": str, "event": str})
+        for user in users:
+            expected_events = original[original["user_id"] == user]["event"].tolist()
+            actual_events = sampled[sampled["user_id"] == user]["event"].tolist()
+            assert actual_events == expected_events
+
+    def test__n_too_large_returns_all_paths(self) -> None:
+        res = _make_stream().sample_paths(n=10, method="hash")
+        assert _sampled_users(res) == ["user_1", "user_2", "user_3", "user_4"]
+
+    def test__unknown_method_raises(self) -> None:
+        with pytest.raises(PreprocessingConfigError):
+            _make_stream().sample_paths(frac=0.5, method="bernoulli")
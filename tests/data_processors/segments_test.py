@@ -256,6 +256,34 @@ class TestFilterEvents:
         seg_by_path = res.df.groupby("user_id", observed=True)["seg"].first()
         assert seg_by_path["P1"] == "shipping"
 
+    def test__add_segment_funnel_events_matches_in_order_scan(self) -> None:
+        # Repeated funnel events and interleavings: each path's level is what
+        # walking its events in order and advancing on the next expected
+        # step gives, on shuffled input rows.
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        n = 600
+        df = pd.DataFrame(
+            {
+                "user_id": rng.integers(0, 40, n).astype(str),
+                "event": rng.choice(["A", "B", "C", "D"], n),
+                "timestamp": pd.Timestamp("2024-01-01")
+                + pd.to_timedelta(rng.permutation(n), unit="s"),
+            }
+        )
+        funnel = ["A", "B", "A", "C"]
+        stream = Eventstream(df, {"path_cols": ["user_id"]})
+        res = stream.add_segment(name="seg", funnel_events=funnel)
+
+        for user, path in res.df.groupby("user_id", observed=True):
+            depth = 0
+            for event in path["event"]:
+                if depth < len(funnel) and event == funnel[depth]:
+                    depth += 1
+            expected = funnel[depth - 1] if depth else "out_of_funnel"
+            assert set(path["seg"]) == {expected}, user
+
     def test__add_segment_funnel_events_rejects_undeclared_path_col(self) -> None:
         df = pd.DataFrame(
             [
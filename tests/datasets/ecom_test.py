@@ -1,7 +1,10 @@
 import pandas as pd
+import pytest
 
-from retentioneering.datasets.ecom import load_ecom
+from retentioneering.datasets import ecom
+from retentioneering.datasets.ecom import generate_ecom, iter_ecom, load_ecom
 from retentioneering.eventstream.eventstream import Eventstream
+from retentioneering.exceptions import InvalidParameterError
 
 
 class TestLoadEcom:
@@ -30,3 +33,74 @@ class TestLoadEcom:
         stream = load_ecom()
 
         assert len(stream.df) == len(df)
+
+
+class TestGenerateEcom:
+    @pytest.fixture(autouse=True)
+    def _small_blocks(self, monkeypatch) -> None:
+        # Several blocks per call without simulating thousands of users
+        monkeypatch.setattr(ecom, "_BLOCK_USERS", 64)
+
+    def test__output_does_not_depend_on_chunk_size(self) -> None:
+        full = generate_ecom(200, seed=7, as_dataframe=True)
+
+        for chunk_size in (1, 50, 64, 150, 10_000):
+            chunks = list(iter_ecom(200, seed=7, chunk_size=chunk_size))
+            assert pd.concat(chunks, ignore_index=True).equals(full)
+
+    def test__chunks_hold_whole_users(self) -> None:
+        chunks = list(iter_ecom(200, seed=7, chunk_size=50))
+
+        assert [chunk["user_id"].nunique() for chunk in chunks] == [50] * 4
+
+    def test__seed_changes_the_output(self) -> None:
+        a = generate_ecom(100, seed=1, as_dataframe=True)
+        b = generate_ecom(100, seed=2, as_dataframe=True)
+
+        assert not a.equals(b)
+
+    def test__default_returns_configured_eventstream(self) -> None:
+        stream = generate_ecom(100)
+
+        assert isinstance(stream, Eventstream)
+        assert stream.schema.segment_cols == load_ecom().schema.segment_cols
+        assert stream.df["user_id"].nunique() == 100
+
+    def test__columns_match_the_bundled_dataset(self) -> None:
+        df = generate_ecom(100, as_dataframe=True)
+
+        assert list(df.columns) == list(load_ecom(as_dataframe=True).columns)
+        assert set(df["event"]) <= set(ecom._EVENTS)
+
+    def test__sessions_nest_in_users_and_are_time_ordered(self) -> None:
+        df = generate_ecom(300, as_dataframe=True)
+
+        assert (df.groupby("session_id")["user_id"].nunique() == 1).all()
+        assert df.groupby("session_id")["timestamp"].is_monotonic_increasing.all()
+        assert df.groupby("user_id")["session_id"].nunique().between(3, 9).all()
+
+    def test__stories_stay_in_their_periods(self) -> None:
+        df = generate_ecom(2000, as_dataframe=True)
+        day = (df["timestamp"] - pd.Timestamp("2024-01-01")).dt.days
+
+        bug = df["event"] == "checkout_bug"
+        assert bug.any()
+        assert day[bug].between(*ecom._BUG_DAYS).all()
+        assert (df.loc[bug, "platform"] == "mobile").all()
+        payment_error = df["event"] == "payment_error"
+        assert payment_error.any()
+        assert day[payment_error].between(*ecom._PAY_DAYS).all()
+
+    def test__path_streams_chunks_to_parquet(self, tmp_path) -> None:
+        path = generate_ecom(200, seed=3, chunk_size=64, path=tmp_path / "ecom.parquet")
+
+        assert path == tmp_path / "ecom.parquet"
+        written = pd.read_parquet(path)
+        expected = generate_ecom(200, seed=3, as_dataframe=True)
+        assert written.astype(str).equals(expected.astype(str))
+
+    @pytest.mark.parametrize("param", ["n_users", "chunk_size"])
+    @pytest.mark.parametrize("value", [0, -5, 2.5, True])
+    def test__rejects_non_positive_integer_sizes(self, param, value) -> None:
+        with pytest.raises(InvalidParameterError):
+            generate_ecom(**{"n_users": 10, param: value})
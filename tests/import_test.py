@@ -0,0 +1,54 @@
+"""`import retentioneering` stays cheap: heavy optional stacks load on use."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = (
+    "sklearn",
+    "scipy",
+    "gensim",
+    "mcp",
+    "retentioneering.mcp",
+    "retentioneering.widgets",
+    "retentioneering.data_processors",
+    "retentioneering.tools.cluster_analysis",
+    "retentioneering.tools.graph_layout",
+)
+
+
+def _import_in_subprocess(statement: str) -> dict:
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        "print(json.dumps({'modules': sorted(sys.modules)}))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+    loaded = set(_import_in_subprocess("import retentioneering")["modules"])
+    assert sorted(loaded.intersection(HEAVY_MODULES)) == []
+
+
+@pytest.mark.parametrize(
+    "statement, module",
+    [
+        ("import retentioneering; retentioneering.mcp.serve", "mcp"),
+        (
+            "from retentioneering.tools import ClusterAnalysis",
+            "retentioneering.tools.cluster_analysis",
+        ),
+        (
+            "import retentioneering; retentioneering.datasets",
+            "retentioneering.datasets",
+        ),
+    ],
+)
+def test_lazy_names_still_resolve(statement, module):
+    assert module in _import_in_subprocess(statement)["modules"]
@@ -51,6 +51,16 @@ class TestDescribe:
 
         assert result["event_descriptions"] == {"purchase": "Completed purchase"}
 
+    def test__approx_keeps_the_same_keys(self) -> None:
+        session = get_session()
+
+        exact = tools.describe(session, {})
+        approx = tools.describe(session, {}, approx=True)
+
+        assert approx.keys() == exact.keys()
+        assert approx["n_events_total"] == exact["n_events_total"]
+        assert approx["events"] == exact["events"]
+
 
 class TestUpdateAndResetBaseStream:
     def test__update_base_stream_filters_events(self) -> None:
@@ -94,6 +104,68 @@ class TestUpdateAndResetBaseStream:
         assert session.base_preprocessors == []
 
 
+class TestDerivedStreamCache:
+    DROP_NOISE = [{"type": "filter_events", "drop": {"event": ["noise"]}}]
+
+    def test__same_preprocessors_reuse_derived_stream(self) -> None:
+        session = get_session()
+
+        first = session.derived(self.DROP_NOISE)
+        # Key order in the step dicts doesn't matter
+        second = session.derived(
+            [{"drop": {"event": ["noise"]}, "type": "filter_events"}]
+        )
+
+        assert second is first
+        info = session.cache_info()
+        assert (info["hits"], info["misses"], info["entries"]) == (1, 1, 1)
+        assert info["bytes"] > 0
+
+    def test__empty_preprocessors_return_active_stream(self) -> None:
+        session = get_session()
+
+        assert session.derived([]) is session.active_stream
+        assert session.cache_info()["misses"] == 0
+
+    def test__budget_evicts_least_recently_used(self) -> None:
+        session = get_session()
+        keep_view = [{"type": "filter_events", "keep": {"event": ["view"]}}]
+        session.cache_bytes = (
+            session.derived(self.DROP_NOISE)
+            .df.memory_usage(index=True, deep=True)
+            .sum()
+        )
+
+        session.derived(keep_view)
+
+        assert session.cache_info()["entries"] == 1
+        session.derived(keep_view)
+        assert session.cache_info()["hits"] == 1
+
+    def test__update_base_stream_derives_from_new_stream(self) -> None:
+        session = get_session()
+        session.derived(self.DROP_NOISE)
+        tools.update_base_stream(
+            session, [{"type": "filter_events", "keep": {"event": ["view", "noise"]}}]
+        )
+
+        derived = session.derived(self.DROP_NOISE)
+
+        assert set(derived.df["event"].astype(str)) == {"view"}
+        assert session.cache_info()["hits"] == 0
+
+    def test__describe_reports_cache_counts(self) -> None:
+        session = get_session()
+        for _ in range(2):
+            tools.get_conversion_rate(
+                session, "view", "purchase", local_preprocessors=self.DROP_NOISE
+            )
+
+        cache = tools.describe(session, {})["derived_cache"]
+
+        assert (cache["hits"], cache["misses"]) == (1, 1)
+
+
 class TestLoadDataAndDataAgnosticMode:
     def test__tools_error_before_any_data_is_loaded(self) -> None:
         session = ReportSession(None, None)
@@ -140,6 +212,109 @@ class TestLoadDataAndDataAgnosticMode:
         # Failed load must not have touched the previous stream/tabs.
         assert session.pending_tabs
 
+    def test__load_data_reads_only_schema_columns(self, tmp_path) -> None:
+        session = ReportSession(None, None)
+        csv_path = tmp_path / "events.csv"
+        get_stream().df.assign(payload="x" * 100).to_csv(csv_path, index=False)
+
+        result = tools.load_data(session, str(csv_path))
+
+        assert "payload" not in session.active_stream.df.columns
+        assert "payload" not in result["load"]["columns"]
+        assert result["load"]["bytes_read"] == csv_path.stat().st_size
+        assert result["load"]["load_seconds"] >= 0
+
+    def test__load_data_max_paths_and_sample_keep_whole_paths(self, tmp_path) -> None:
+        session = ReportSession(None, None)
+        csv_path = tmp_path / "events.csv"
+        base = get_stream().df
+        pd.concat(
+            base.assign(user_id=base["user_id"] + f"_{i}") for i in range(50)
+        ).to_csv(csv_path, index=False)
+
+        capped = tools.load_data(session, str(csv_path), max_paths=10)
+        sampled = tools.load_data(session, str(csv_path), sample=0.5)
+
+        assert capped["n_paths"] == 10
+        assert capped["n_events_total"] == 30  # every kept path is whole
+        assert 0 < sampled["n_paths"] < 100
+        assert sampled["n_events_total"] == 3 * sampled["n_paths"]
+
+    def test__load_data_max_paths_is_deterministic(self, tmp_path) -> None:
+        csv_path = tmp_path / "events.csv"
+        base = get_stream().df
+        pd.concat(
+            base.assign(user_id=base["user_id"] + f"_{i}") for i in range(50)
+        ).to_csv(csv_path, index=False)
+
+        loaded = []
+        for _ in range(2):
+            session = ReportSession(None, None)
+            tools.load_data(session, str(csv_path), max_paths=10)
+            loaded.append(set(session.active_stream.df["user_id"]))
+
+        assert loaded[0] == loaded[1]
+
+    def test__load_data_sample_is_the_shared_hash_sample(self, tmp_path) -> None:
+        from retentioneering.utils.sampling import hash_sample
+
+        session = ReportSession(None, None)
+        csv_path = tmp_path / "events.csv"
+        base = get_stream().df
+        df = pd.concat(
+            base.assign(user_id=base["user_id"] + f"_{i}") for i in range(50)
+        )
+        df.to_csv(csv_path, index=False)
+
+        tools.load_data(session, str(csv_path), sample=0.3)
+
+        expected = set(hash_sample(df, "user_id", 0.3)["user_id"])
+        assert set(session.active_stream.df["user_id"]) == expected
+
+    def test__load_data_reads_ids_past_the_sniffed_rows(self, tmp_path) -> None:
+        # DuckDB sniffs types from the first rows: these ids look numeric there
+        session = ReportSession(None, None)
+        csv_path = tmp_path / "events.csv"
+        n = 50_000
+        pd.DataFrame(
+            {
+                "user_id": [str(i) for i in range(n)] + ["user_x"],
+                "event": ["view"] * (n + 1),
+                "timestamp": "2020-01-01 00:00:00",
+            }
+        ).to_csv(csv_path, index=False)
+
+        result = tools.load_data(session, str(csv_path))
+
+        assert result["n_paths"] == n + 1
+        assert "user_x" in set(session.active_stream.df["user_id"])
+
+    def test__load_data_keeps_numeric_ids_numeric(self, tmp_path) -> None:
+        session = ReportSession(None, None)
+        csv_path = tmp_path / "events.csv"
+        df = get_stream().df
+        df.assign(user_id=df["user_id"].factorize()[0] + 100).to_csv(
+            csv_path, index=False
+        )
+
+        tools.load_data(session, str(csv_path))
+
+        user_id = session.active_stream.df["user_id"]
+        assert user_id.dtype == pd.read_csv(csv_path)["user_id"].dtype == "int64"
+        assert set(user_id) == set(pd.read_csv(csv_path)["user_id"])
+
+    def test__load_data_error_on_missing_schema_column(self, tmp_path) -> None:
+        session = ReportSession(None, None)
+        csv_path = tmp_path / "events.csv"
+        get_stream().df.to_csv(csv_path, index=False)
+
+        result = tools.load_data(
+            session, str(csv_path), schema={"segment_cols": ["platform"]}
+        )
+
+        assert "platform" in result["error"]
+        assert session.active_stream is None
+
     def test__load_data_error_on_bad_path(self) -> None:
         session = ReportSession(None, None)
 
@@ -323,3 +498,42 @@ class TestAddWidgetsAndExportReport:
         assert len(result["tabs"]) == 1
         assert result["tabs"][0]["label"] == "Overall Flow"
         assert session.pending_tabs == []
+
+    def test__export_report_refresh_recomputes_tabs_on_the_active_stream(
+        self, monkeypatch
+    ) -> None:
+        session = get_session()
+        seen = []
+
+        def build(src, params):
+            seen.append(params["n"])
+            return {
+                "widget_type": "step_matrix",
+                "events": sorted(src.df["event"].astype(str).unique()),
+            }
+
+        monkeypatch.setitem(tools._TAB_BUILDERS, "step_matrix", build)
+        for n in range(3):
+            session.add_tab(f"Tab {n}", {"widget_type": "step_matrix"}, [], {"n": n})
+        session.add_tab("Static", {"widget_type": "step_matrix"}, [])
+        tools.update_base_stream(
+            session, [{"type": "filter_events", "drop": {"event": ["noise"]}}]
+        )
+
+        result = tools.export_report(session, title="Report", refresh=True)
+
+        assert sorted(seen) == [0, 1, 2]
+        assert [r["status"] for r in result["refreshed"]] == ["refreshed"] * 3 + [
+            "skipped"
+        ]
+        assert result["tabs"][0]["data"]["events"] == ["purchase", "view"]
+        assert "events" not in result["tabs"][3]["data"]
+
+    def test__refresh_tabs_keeps_data_of_a_failing_tab(self) -> None:
+        session = get_session()
+        session.add_tab("Broken", {"widget_type": "step_matrix", "v": 1}, [], {})
+
+        result = session.refresh_tabs(lambda src, widget_type, params: {"error": "x"})
+
+        assert result == [{"label": "Broken", "status": "error", "error": "x"}]
+        assert session.pending_tabs[0]["data"] == {"widget_type": "step_matrix", "v": 1}
@@ -0,0 +1,173 @@
+"""Tests for `ToolPool`, the worker pool MCP tool calls run on, and for the
+progress checkpoints it forwards."""
+
+import asyncio
+import threading
+
+import pandas as pd
+import pytest
+
+from retentioneering._progress import checkpoint, reporting
+from retentioneering.eventstream.eventstream import Eventstream
+from retentioneering.exceptions import OperationCancelledError
+from retentioneering.mcp._worker_pool import ToolPool
+from retentioneering.mcp.server import _build_server
+
+
+def get_stream() -> Eventstream:
+    df = pd.DataFrame(
+        [
+            ["user_1", "view", "2020-01-01 00:00:00"],
+            ["user_1", "purchase", "2020-01-02 00:00:00"],
+            ["user_2", "view", "2020-01-01 00:00:00"],
+        ],
+        columns=["user_id", "event", "timestamp"],
+    )
+    return Eventstream(df)
+
+
+class TestCheckpoint:
+    def test__noop_outside_reporting(self) -> None:
+        checkpoint("anything")
+
+    def test__forwards_numbered_messages(self) -> None:
+        seen = []
+        with reporting(lambda n, message: seen.append((n, message))):
+            checkpoint("a")
+            checkpoint("b")
+
+        assert seen == [(1, "a"), (2, "b")]
+
+    def test__raises_once_cancelled(self) -> None:
+        with reporting() as cancelled:
+            checkpoint("before")
+            cancelled.set()
+            with pytest.raises(OperationCancelledError):
+                checkpoint("after")
+
+    def test__preprocessor_steps_are_checkpoints(self) -> None:
+        seen = []
+        with reporting(lambda n, message: seen.append(message)):
+            Eventstream.from_recipe(
+                get_stream().df,
+                [
+                    {"type": "filter_events", "keep": {"event": ["view"]}},
+                    {"type": "add_start_end_events"},
+                ],
+            )
+
+        assert seen == ["step 1/2: filter_events", "step 2/2: add_start_end_events"]
+
+
+class TestToolPool:
+    def test__readers_run_concurrently(self) -> None:
+        pool = ToolPool(max_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        async def main():
+            return await asyncio.gather(
+                pool.run(barrier.wait, "a"), pool.run(barrier.wait, "b")
+            )
+
+        # Both calls must be inside `barrier.wait` at once to get through it
+        assert sorted(asyncio.run(main())) == [0, 1]
+
+    def test__exclusive_call_runs_alone(self) -> None:
+        pool = ToolPool(max_workers=3)
+        running = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def work(name):
+            def call():
+                with lock:
+                    running.append(name)
+                    if len(running) > 1 and "writer" in running:
+                        overlaps.append(list(running))
+                threading.Event().wait(0.05)
+                with lock:
+                    running.remove(name)
+
+            return call
+
+        async def main():
+            await asyncio.gather(
+                pool.run(work("reader_1"), "r1"),
+                pool.run(work("writer"), "w", exclusive=True),
+                pool.run(work("reader_2"), "r2"),
+            )
+
+        asyncio.run(main())
+        assert overlaps == []
+
+    def test__timeout_cancels_at_next_checkpoint(self) -> None:
+        pool = ToolPool(max_workers=1, timeout=0.05)
+        stopped = threading.Event()
+
+        def slow():
+            try:
+                for _ in range(200):
+                    threading.Event().wait(0.01)
+                    checkpoint("tick")
+            except OperationCancelledError:
+                stopped.set()
+                raise
+
+        async def main():
+            await pool.run(slow, "slow")
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(main())
+        assert stopped.wait(5)
+
+    def test__progress_reaches_the_loop(self) -> None:
+        pool = ToolPool()
+        seen = []
+
+        async def on_progress(n, message):
+            seen.append((n, message))
+
+        def work():
+            checkpoint("halfway")
+            return "done"
+
+        async def main():
+            result = await pool.run(work, "work", on_progress=on_progress)
+            await asyncio.sleep(0.05)  # let the forwarded notifications land
+            return result
+
+        assert asyncio.run(main()) == "done"
+        assert seen == [(1, "work"), (2, "halfway")]
+
+
+class TestServerTools:
+    def test__tools_keep_their_parameters(self) -> None:
+        server = _build_server(get_stream(), {})
+
+        tools = {t.name: t for t in asyncio.run(server.list_tools())}
+
+        assert set(tools["describe"].inputSchema["properties"]) == {"approx"}
+        assert "ctx" not in tools["add_step_matrix"].inputSchema["properties"]
+
+    def test__call_runs_and_returns_json(self) -> None:
+        server = _build_server(get_stream(), {})
+
+        _, structured = asyncio.run(
+            server.call_tool(
+                "update_base_stream",
+                {
+                    "preprocessors": [
+                        {"type": "filter_events", "keep": {"event": ["view"]}}
+                    ]
+                },
+            )
+        )
+
+        assert '"n_events_total": 2' in structured["result"]
+
+    def test__timeout_becomes_an_error_result(self) -> None:
+        server = _build_server(get_stream(), {}, tool_timeout=0)
+
+        _, structured = asyncio.run(server.call_tool("describe", {}))
+
+        assert "was cancelled" in structured["result"]
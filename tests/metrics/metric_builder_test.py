@@ -1055,3 +1055,235 @@ class TestMetricArgsEventCol:
                     }
                 ]
             )
+
+
+class TestIterMetrics:
+    def test__chunks_concatenate_to_build_metrics(self) -> None:
+        """Chunked output is the one-shot table split by rows: same paths,
+        same columns, same values, wildcards and pattern metrics included."""
+        from retentioneering.metrics.metric_builder import MetricBuilder
+
+        stream = build_segmented_stream()
+        config = [
+            {"metric": "length"},
+            {"metric": "event_count_bulk"},
+            {"metric": "in_segment_bulk"},
+            {
+                "metric": "matches_pattern",
+                "metric_args": {"pattern": "promo_view->purchase"},
+            },
+        ]
+        builder = MetricBuilder(stream)
+        expected = builder.build_metrics(config)
+        chunks = list(builder.iter_metrics(config, chunk_size=2))
+
+        assert len(chunks) == -(-len(expected) // 2)
+        assert all(len(chunk) <= 2 for chunk in chunks)
+        for chunk in chunks:
+            assert chunk.columns.tolist() == expected.columns.tolist()
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks).sort_index(), expected.sort_index(), check_dtype=False
+        )
+
+    def test__wildcard_resolves_against_the_whole_stream(self) -> None:
+        """A chunk holding none of an event still gets that event's column."""
+        from retentioneering.metrics.metric_builder import MetricBuilder
+
+        stream = build_stream()
+        chunks = list(
+            MetricBuilder(stream).iter_metrics(
+                [{"metric": "event_count_bulk"}], chunk_size=1
+            )
+        )
+        user_1 = next(c for c in chunks if "user_1" in c.index)
+        assert user_1.loc["user_1", "event_count_bulk_cancellation"] == 0
+
+    def test__paths_restricts_the_rows_read(self) -> None:
+        from retentioneering.metrics.metric_builder import MetricBuilder
+
+        stream = build_stream()
+        (chunk,) = MetricBuilder(stream).iter_metrics(
+            [{"metric": "length"}], paths=["user_2", "user_3"]
+        )
+        assert sorted(chunk.index) == ["user_2", "user_3"]
+        assert chunk.loc["user_2", "length"] == 3
+
+    def test__invalid_config_raises_before_any_chunk(self) -> None:
+        from retentioneering.metrics.metric_builder import MetricBuilder
+
+        chunks = MetricBuilder(build_stream()).iter_metrics(
+            [{"metric": "has_event", "metric_args": {"event": "purchse"}}]
+        )
+        with pytest.raises(InvalidMetricConfigError, match="purchse"):
+            next(chunks)
+
+
+class TestCompositePathKey:
+    CONFIG = [
+        {"metric": "length"},
+        {"metric": "duration"},
+        {"metric": "event_count_bulk"},
+        {
+            "metric": "time_between",
+            "metric_args": {"start_event": "path_start", "end_event": "purchase"},
+        },
+        {
+            "metric": "matches_pattern",
+            "metric_args": {"pattern": "promo_view->purchase"},
+        },
+    ]
+
+    def test__matches_one_path_per_key_combination(self) -> None:
+        """A (path, segment) key measures each path separately within each
+        segment level - the same numbers as a single column holding the pair."""
+        from retentioneering.metrics.metric_builder import MetricBuilder
+
+        stream = build_segmented_stream()
+        result = MetricBuilder(stream).build_metrics(
+            self.CONFIG, path_col=["user_id", "segment"]
+        )
+
+        df = stream.df.copy()
+        df["pair"] = df["user_id"].astype(str) + "|" + df["segment"].astype(str)
+        schema = {"event_col": "event", "path_cols": ["pair"]}
+        expected = MetricBuilder(
+            Eventstream(df, schema, preprocess=False)
+        ).build_metrics(self.CONFIG, path_col="pair")
+        expected.index = pd.MultiIndex.from_tuples(
+            [tuple(p.split("|")) for p in expected.index],
+            names=["user_id", "segment"],
+        )
+
+        assert result.index.names == ["user_id", "segment"]
+        assert sorted(result.index) == [
+            ("user_1", "s1"),
+            ("user_2", "s1"),
+            ("user_2", "s2"),
+            ("user_3", "s2"),
+        ]
+        plain_index = pd.MultiIndex.from_tuples(
+            [(p, str(s)) for p, s in result.index], names=["user_id", "segment"]
+        )
+        pd.testing.assert_frame_equal(
+            result.set_axis(plain_index).sort_index(),
+            expected.sort_index(),
+            check_dtype=False,
+            check_index_type=False,
+        )
+        # user_2 matches as a whole, but neither of its segment halves does
+        matched = result["matches_pattern_promo_view->purchase"]
+        assert matched[("user_1", "s1")]
+        assert not matched[("user_2", "s1")] and not matched[("user_2", "s2")]
+
+    def test__missing_key_value_is_its_own_path(self) -> None:
+        from retentioneering.metrics.metric_builder import MetricBuilder
+
+        df = pd.DataFrame(
+            [
+                ["user_1", "promo_view", "s1", "2020-01-01 00:00:00"],
+                ["user_1", "purchase", None, "2020-01-01 00:01:00"],
+                ["user_1", "logout", None, "2020-01-01 00:02:00"],
+            ],
+            columns=["user_id", "event", "segment", "timestamp"],
+        )
+        stream = Eventstream(df, {"event_col": "event", "segment_cols": ["segment"]})
+
+        result = MetricBuilder(stream).build_metrics(
+            [{"metric": "length"}], path_col=["user_id", "segment"]
+        )
+
+        lengths = dict(
+            zip(
+                result.index.get_level_values("segment").astype(object),
+                result["length"],
+            )
+        )
+        assert lengths["s1"] == 1
+        assert [v for k, v in lengths.items() if pd.isna(k)] == [2]
+
+
+class TestMetricsSql:
+    """`metrics_sql` is `build_metrics` evaluated inside the engine: the same
+    table, column for column."""
+
+    CONFIG = [
+        {"metric": "length"},
+        {"metric": "duration"},
+        {"metric": "first_event_time"},
+        {"metric": "active_days", "metric_args": {"active_events": ["purchase"]}},
+        {"metric": "event_count_bulk"},
+        {"metric": "has_event", "metric_args": {"event": "purchase"}},
+        {
+            "metric": "has_all_events",
+            "metric_args": {"events": ["promo_view", "purchase"]},
+        },
+        {
+            "metric": "has_any_event",
+            "metric_args": {"events": ["purchase", "promo_view"]},
+        },
+        {
+            "metric": "time_between",
+            "metric_args": {"start_event": "path_start", "end_event": "purchase"},
+        },
+        {
+            "metric": "time_between",
+            "metric_args": {"start_event": "promo_view", "end_event": "path_end"},
+        },
+        {
+            "metric": "matches_pattern",
+            "metric_args": {"pattern": "promo_view->purchase"},
+        },
+        {"metric": "in_segment_bulk"},
+        {
+            "metric": "in_segment",
+            "metric_args": {
+                "segment_name": "segment",
+                "segment_level": "s1",
+                "mode": "event_share",
+                "threshold": 0.5,
+            },
+        },
+        {
+            "metric": "in_segment",
+            "metric_args": {
+                "segment_name": "channel",
+                "segment_level": "mobile",
+                "mode": "all",
+            },
+        },
+    ]
+
+    def _both(self, stream, path_col):
+        from retentioneering import engine
+        from retentioneering.metrics.metric_builder import MetricBuilder
+
+        builder = MetricBuilder(stream)
+        expected = builder.build_metrics(self.CONFIG, path_col)
+        query, tables = builder.metrics_sql(self.CONFIG, path_col)
+        result = engine.run(query, df=stream.df, **tables).set_index(path_col)
+        return result, expected
+
+    def test__same_table_as_build_metrics(self) -> None:
+        result, expected = self._both(build_segmented_stream(), "user_id")
+
+        assert list(result.columns) == list(expected.columns)
+        result = result.reindex(expected.index)
+        for col in expected.columns:
+            assert result[col].astype(float).tolist() == pytest.approx(
+                expected[col].astype(float).tolist(), nan_ok=True
+            ), col
+
+    def test__composite_key(self) -> None:
+        result, expected = self._both(build_segmented_stream(), ["user_id", "segment"])
+
+        result.index = pd.MultiIndex.from_tuples(
+            [(u, str(s)) for u, s in result.index], names=expected.index.names
+        )
+        expected.index = pd.MultiIndex.from_tuples(
+            [(u, str(s)) for u, s in expected.index], names=expected.index.names
+        )
+        result = result.reindex(expected.index)
+        for col in expected.columns:
+            assert result[col].astype(float).tolist() == pytest.approx(
+                expected[col].astype(float).tolist(), nan_ok=True
+            ), col
@@ -901,3 +901,49 @@ class TestOccurrenceAll:
     def test__unknown_offset_side_is_rejected(self):
         with pytest.raises(InvalidParameterError):
             anchors.parse_spec({"pattern": "A", "offset_side": "middle"})
+
+
+class TestStepNumberingCache:
+    """Offsets read a per-frame step numbering that is built once and reused."""
+
+    @staticmethod
+    def _stream(paths):
+        return TestResolveAnchorsSmallFixtures._stream(paths)
+
+    def test__repeat_offsets_on_one_frame_number_the_steps_once(self, monkeypatch):
+        stream = self._stream({"u1": ["A", "B", "C", "D"], "u2": ["B", "A", "C"]})
+        calls = []
+        run = anchors.engine.run
+
+        def counting_run(query, **tables):
+            calls.append(sorted(tables))
+            return run(query, **tables)
+
+        monkeypatch.setattr(anchors.engine, "run", counting_run)
+        spec = anchors.parse_spec({"pattern": "A", "offset": 1})
+
+        first = anchors.resolve_positions(stream.df, stream.schema, spec)
+        second = anchors.resolve_positions(stream.df, stream.schema, spec)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert sorted(first["step"].tolist()) == [2, 3]
+        # Numbering once; then one anchor and one offset query per call
+        assert calls.count(["df"]) == 3
+        assert calls.count(["anchor", "steps"]) == 2
+
+    def test__numbering_is_dropped_with_its_frame(self):
+        stream = self._stream({"u1": ["A", "B", "C"]})
+        df = stream.df.copy()
+        anchors._step_numbering(df, stream.schema, "user_id")
+        assert any(ref() is df for ref, _ in anchors._numberings.values())
+
+        del df
+        assert all(ref() is not None for ref, _ in anchors._numberings.values())
+
+    def test__frames_get_their_own_numbering(self):
+        a = self._stream({"u1": ["A", "B", "C"]})
+        b = self._stream({"u1": ["X", "A", "B", "C"]})
+        spec = anchors.parse_spec({"pattern": "A", "offset": 2})
+
+        assert anchors.resolve_positions(a.df, a.schema, spec)["step"].tolist() == [3]
+        assert anchors.resolve_positions(b.df, b.schema, spec)["step"].tolist() == [4]
@@ -231,6 +231,60 @@ def test_from_csv(tmp_path):
     assert len(es.df) == 2
 
 
+# ── cached stream stats ──────────────────────────────────────────────────────
+
+
+def test_stream_stats_match_a_direct_scan(simple_df):
+    df = simple_df.assign(segment=["a", "a", "a", None, None])
+    es = Eventstream(df, {"segment_cols": ["segment"]}).add_start_end_events()
+
+    assert es.get_event_counts() == {
+        str(k): int(v) for k, v in es.df["event"].value_counts().items()
+    }
+    assert es.get_event_counts()["path_start"] == 2
+    assert es._stats.n_rows == 5
+    assert es._stats.n_paths == 2
+    assert es.get_segment_levels() == {"segment": ["a", "<MISSING>"]}
+    assert repr(es).endswith("· 5 rows")
+
+
+def test_stream_stats_are_computed_once(simple_df, monkeypatch):
+    from retentioneering import engine
+
+    es = Eventstream(simple_df)
+    calls = []
+    real_run = engine.run
+    monkeypatch.setattr(
+        engine, "run", lambda *a, **kw: calls.append(a) or real_run(*a, **kw)
+    )
+
+    repr(es)
+    es.is_empty()
+    es.get_event_counts()
+    es.get_segment_levels()
+
+    assert len(calls) == 1
+
+
+def test_stream_stats_accessors_return_fresh_containers(simple_df):
+    es = Eventstream(simple_df)
+    es.get_event_counts()["home"] = 0
+
+    assert es.get_event_counts()["home"] == 2
+
+
+def test_is_empty_when_only_synthetic_rows_remain(simple_df):
+    es = Eventstream(simple_df).add_start_end_events()
+    only_boundaries = Eventstream(
+        es.df[es.df["event"].isin(["path_start", "path_end"])],
+        {},
+        preprocess=False,
+    )
+
+    assert only_boundaries.is_empty()
+    assert not only_boundaries.is_empty(exclude_start_end=False)
+
+
 # ── lineage / recipe / repr ──────────────────────────────────────────────────
 
 
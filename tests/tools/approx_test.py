@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from retentioneering.eventstream.eventstream import Eventstream
+from retentioneering.exceptions import InvalidParameterError
+from retentioneering.tools.approx import Approximation, approximate
+from retentioneering.utils.sampling import hash_sample
+
+
+def _stream(n_paths: int = 4000, seed: int = 0) -> Eventstream:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n_paths):
+        events = ["A"] + list(rng.choice(["B", "C", "D"], size=rng.integers(1, 5)))
+        for j, event in enumerate(events):
+            rows.append(
+                [f"user_{i}", event, pd.Timestamp("2020-01-01") + pd.Timedelta(j, "m")]
+            )
+    df = pd.DataFrame(rows, columns=["user_id", "event", "timestamp"])
+    df["platform"] = np.where(df["user_id"].str[-1].isin(list("01234")), "web", "app")
+    return Eventstream(df, {"event_col": "event", "segment_cols": ["platform"]})
+
+
+class TestHashSample:
+    def test_sample_is_stable_as_paths_are_added(self):
+        df = pd.DataFrame({"user_id": [f"u{i}" for i in range(2000)]})
+        small = set(hash_sample(df, "user_id", 0.1)["user_id"])
+        grown = pd.concat([df, pd.DataFrame({"user_id": ["new1", "new2"] * 50})])
+        assert small <= set(hash_sample(grown, "user_id", 0.1)["user_id"])
+        assert 100 < len(small) < 300
+
+    def test_samples_nest(self):
+        df = pd.DataFrame({"user_id": range(2000)})
+        small = set(hash_sample(df, "user_id", 0.05)["user_id"])
+        assert small <= set(hash_sample(df, "user_id", 0.2)["user_id"])
+
+    def test_groups_partition_the_sample(self):
+        df = pd.DataFrame({"user_id": range(2000)})
+        sample = hash_sample(df, "user_id", 0.5, groups=10)
+        assert set(sample["__group"]) == set(range(10))
+        assert (sample.groupby("user_id")["__group"].nunique() == 1).all()
+
+
+class TestApproximate:
+    def test_funnel_counts_are_scaled_and_covered(self):
+        stream = _stream()
+        exact = stream.funnel_data(["A", "B", "C"])
+        est = stream.funnel_data(["A", "B", "C"], sample=0.25)
+        assert isinstance(est, Approximation)
+        assert est.frac == 0.25
+        for step, e, lo, hi in zip(
+            exact["steps"], est.value["steps"], est.low["steps"], est.high["steps"]
+        ):
+            assert e["step"] == lo["step"] == hi["step"] == step["step"]
+            assert lo["unique_paths"] < e["unique_paths"] < hi["unique_paths"]
+            assert e["unique_paths"] == pytest.approx(step["unique_paths"], rel=0.15)
+            rate = e["conversion_rate"]
+            assert lo["conversion_rate"] <= rate <= hi["conversion_rate"]
+
+    def test_parts_missing_a_step_event_add_no_estimate(self):
+        stream = _stream()
+        df = stream.df.copy()
+        # Some 10 sampled paths reach E: not every one of the ten parts has one
+        rare = df["user_id"].isin([f"user_{i}" for i in range(30)]) & (
+            df["event"] == "A"
+        )
+        df["event"] = df["event"].astype(str).where(~rare, "E")
+        stream = Eventstream(df, {"event_col": "event", "segment_cols": ["platform"]})
+
+        est = stream.funnel_data(["B", "E"], sample=1 / 3)
+
+        assert est.value["steps"][0]["step"] == "B"
+        assert (
+            est.low["steps"][0]["unique_paths"] < est.value["steps"][0]["unique_paths"]
+        )
+
+    def test_same_estimate_on_every_call(self):
+        stream = _stream()
+        first = stream.transition_graph_data(edge_weight="count", sample=0.2)
+        second = stream.transition_graph_data(edge_weight="count", sample=0.2)
+        pd.testing.assert_frame_equal(first.value, second.value)
+        pd.testing.assert_frame_equal(first.low, second.low)
+
+    @pytest.mark.parametrize("edge_weight", ["proba_out", "share_of_total"])
+    def test_shares_are_not_scaled(self, edge_weight):
+        stream = _stream()
+        exact = stream.transition_graph_data(edge_weight=edge_weight)
+        est = stream.transition_graph_data(edge_weight=edge_weight, sample=0.3)
+        value = est.value.reindex_like(exact).fillna(0).to_numpy()
+        np.testing.assert_allclose(value, exact.to_numpy(), atol=0.05)
+        assert est.value.to_numpy().max() <= 1
+        assert (est.low.to_numpy() <= est.value.to_numpy() + 1e-12).all()
+        assert (est.high.to_numpy() >= est.value.to_numpy() - 1e-12).all()
+        assert (est.low.to_numpy() >= 0).all()
+        assert np.nanmax(est.high.to_numpy()) < 1.5
+
+    def test_segment_overview_scales_only_the_segment_size(self):
+        stream = _stream()
+        exact = stream.segment_overview_data("platform", metrics=[])
+        est = stream.segment_overview_data("platform", metrics=[], sample=0.3)
+        assert list(est.value.columns) == list(exact.columns)
+        assert est.value.loc["segment_size"].sum() == pytest.approx(
+            exact.loc["segment_size"].sum(), rel=0.15
+        )
+
+    def test_full_fraction_is_exact(self):
+        stream = _stream(200)
+        est = approximate(stream, lambda s: s.funnel_data(["A", "B"]), 1)
+        assert est.value == stream.funnel_data(["A", "B"])
+        assert est.low == est.high == est.value
+        assert est.paths == 200
+
+    @pytest.mark.parametrize("frac", [0, 1.5, -0.1, True, "0.1"])
+    def test_rejects_bad_fraction(self, frac):
+        with pytest.raises(InvalidParameterError):
+            _stream(50).funnel_data(["A"], sample=frac)
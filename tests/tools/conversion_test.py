@@ -309,6 +309,92 @@ class TestConversionRateFanOut:
             pd.testing.assert_frame_equal(rows, single)
 
 
+class TestConversionRateBatch:
+    QUESTIONS = [
+        {"start_anchor": "add_to_cart", "end_anchor": "purchase"},
+        {"start_anchor": "add_to_cart", "end_anchor": "purchase", "within": 5},
+        {"start_anchor": "add_to_cart", "end_anchor": "purchase", "within": "30m"},
+        {"start_anchor": "catalog", "end_anchor": ["cart", "path_end"], "within": 3},
+    ]
+
+    def test_each_question_matches_its_single_call(self) -> None:
+        stream = load_ecom()
+        batch = stream.get_conversion_rates(self.QUESTIONS, path_col="session_id")
+
+        expected = pd.concat(
+            [
+                stream.get_conversion_rate(**question, path_col="session_id")
+                for question in self.QUESTIONS
+            ],
+            ignore_index=True,
+        )
+        pd.testing.assert_frame_equal(batch.drop(columns="within"), expected)
+        assert list(batch["within"]) == [None, 5, "30m", 3, 3]
+
+    def test_shared_anchors_are_resolved_once(self, monkeypatch) -> None:
+        from retentioneering.paths import anchors
+
+        calls = []
+        resolve = anchors.resolve_positions
+
+        def counting_resolve(df, schema, spec, **kwargs):
+            calls.append((spec.pattern, kwargs["offset_side"]))
+            return resolve(df, schema, spec, **kwargs)
+
+        monkeypatch.setattr(anchors, "resolve_positions", counting_resolve)
+        load_ecom().get_conversion_rates(self.QUESTIONS)
+
+        assert sorted(calls) == [
+            ("add_to_cart", "start"),
+            ("cart", "end"),
+            ("catalog", "start"),
+            ("path_end", "end"),
+            ("purchase", "end"),
+        ]
+
+    def test_every_start_occurrence_counts_as_in_a_single_call(self) -> None:
+        # From the first A, B is 3 events away; from the second, 1.
+        stream = _stream(
+            [
+                ["user_1", "A", "2020-01-01 00:00:00"],
+                ["user_1", "X", "2020-01-01 00:01:00"],
+                ["user_1", "A", "2020-01-01 00:02:00"],
+                ["user_1", "B", "2020-01-01 00:03:00"],
+                ["user_2", "A", "2020-01-01 00:00:00"],
+                ["user_2", "A", "2020-01-01 00:01:00"],
+            ]
+        )
+        every = {"pattern": "A", "occurrence": "all"}
+        questions = [
+            {"start_anchor": "A", "end_anchor": "B", "within": 1},
+            {"start_anchor": every, "end_anchor": "B", "within": 1},
+            {"start_anchor": every, "end_anchor": "B", "within": 3},
+        ]
+        result = stream.get_conversion_rates(questions)
+
+        assert list(result["paths_with_start"]) == [2, 4, 4]
+        assert list(result["converted"]) == [0, 1, 2]
+        expected = pd.concat(
+            [stream.get_conversion_rate(**question) for question in questions],
+            ignore_index=True,
+        )
+        pd.testing.assert_frame_equal(result.drop(columns="within"), expected)
+
+    @pytest.mark.parametrize(
+        "questions",
+        [
+            [],
+            "add_to_cart",
+            [{"start_anchor": "add_to_cart"}],
+            [{"start_anchor": "A", "end_anchor": "A", "window": 5}],
+        ],
+    )
+    def test_invalid_questions(self, questions) -> None:
+        stream = _stream([["user_1", "A", "2020-01-01 00:00:00"]])
+        with pytest.raises(InvalidParameterError):
+            stream.get_conversion_rates(questions)
+
+
 class TestConversionRateEdgeCases:
     def test_start_that_never_happens_is_data_not_an_error(self) -> None:
         stream = _stream(
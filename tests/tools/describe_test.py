@@ -129,3 +129,84 @@ class TestDescribe:
     def test_custom_percentiles(self) -> None:
         result = self._stream().describe(percentiles=(0.1, 0.5))
         assert {"10%", "50%"} <= set(result["path_stats"]["user_id"].index)
+
+    def test_custom_percentiles_keep_the_median(self) -> None:
+        stream = self._stream()
+        result = stream.describe(percentiles=(0.9,))
+        expected = stream.get_metrics(
+            [{"metric": "length"}, {"metric": "duration"}]
+        ).describe(percentiles=[0.9])
+
+        assert list(result["path_stats"]["user_id"].index) == list(expected.index)
+        assert "50%" in expected.index
+
+    def test_path_stats_match_dataframe_describe(self) -> None:
+        stream = self._stream()
+        result = stream.describe(percentiles=(0.9, 0.1, 0.5))
+        expected = stream.get_metrics(
+            [{"metric": "length"}, {"metric": "duration"}]
+        ).describe(percentiles=[0.1, 0.5, 0.9])
+
+        pd.testing.assert_frame_equal(
+            result["path_stats"]["user_id"], expected, check_dtype=False
+        )
+
+    def test_approx_keeps_the_result_layout(self) -> None:
+        stream = self._stream()
+        exact = stream.describe()
+        approx = stream.describe(approx=True)
+
+        assert approx.keys() == exact.keys()
+        assert approx["shape"]["n_events"] == exact["shape"]["n_events"]
+        assert approx["shape"]["n_unique_events"] == 3
+        assert approx["shape"]["n_paths"] > 0
+        stats = approx["path_stats"]["user_id"]
+        assert list(stats.index) == list(exact["path_stats"]["user_id"].index)
+        # Counts, means and extremes are exact even in approx mode
+        for row in ("count", "mean", "min", "max"):
+            assert (
+                stats.loc[row, "length"]
+                == exact["path_stats"]["user_id"].loc[row, "length"]
+            )
+        pd.testing.assert_frame_equal(approx["segments"], exact["segments"])
+
+    def test_categorical_columns_report_labels(self) -> None:
+        df = self._stream().df
+        stream = Eventstream(
+            df.assign(segment=df["segment"].astype("category")),
+            {"event_col": "event", "segment_cols": ["segment"]},
+        )
+        result = stream.describe()
+
+        assert set(result["event_frequency"]["event"]) == {"A", "B", "C"}
+        assert set(result["segments"]["value"]) == {"segment_1", "segment_2"}
+
+    def test_overview_is_the_cheap_subset(self) -> None:
+        from retentioneering.tools.describe import Describe
+
+        overview = Describe(self._stream()).overview()
+
+        assert overview["shape"] == {
+            "n_events": 8,
+            "n_paths": 4,
+            "n_unique_events": 3,
+        }
+        assert overview["event_counts"] == {"A": 4, "B": 3, "C": 1}
+        assert str(overview["date_range"]["min"])[:10] == "2020-01-01"
+
+    def test_empty_eventstream(self) -> None:
+        df = pd.DataFrame(
+            {
+                "user_id": pd.Series([], dtype=object),
+                "event": pd.Series([], dtype=object),
+                "timestamp": pd.Series([], dtype="datetime64[ns]"),
+            }
+        )
+        result = Eventstream(df, {"event_col": "event"}).describe()
+
+        assert result["shape"] == {"n_events": 0, "n_paths": 0, "n_unique_events": 0}
+        assert result["date_range"]["span"] is pd.NaT
+        stats = result["path_stats"]["user_id"]
+        assert stats.loc["count"].tolist() == [0.0, 0.0]
+        assert stats.drop(index="count").isna().all().all()
+        assert result["event_frequency"].empty
@@ -8,8 +8,12 @@ from retentioneering.exceptions import (
     InvalidParameterError,
     SegmentLevelNotFoundError,
 )
-from retentioneering.tools.segment_overview import SegmentOverview
-from scipy.stats import wasserstein_distance
+from retentioneering.tools.segment_overview import (
+    SegmentOverview,
+    _binned_kde,
+    _complement_wasserstein,
+)
+from scipy.stats import gaussian_kde, wasserstein_distance
 
 
 class TestSegmentOverview:
@@ -1743,3 +1747,74 @@ class TestLogScaleSharedZeroOffset:
         )
         # Sanity: under the old code distribution_1's mean was inflated by
         # (log10(50) - log10(0.005)) / len(data_1) = 4 / 7 ~= 0.57.
+
+
+class TestBinnedKde:
+    """_binned_kde must track scipy's gaussian_kde on the same grid."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            np.random.default_rng(0).normal(10.0, 2.0, 5000),
+            np.random.default_rng(1).exponential(3.0, 2000),
+            np.concatenate(
+                [
+                    np.random.default_rng(2).normal(0.0, 1.0, 500),
+                    np.random.default_rng(3).normal(8.0, 0.5, 500),
+                ]
+            ),
+        ],
+    )
+    def test_matches_gaussian_kde(self, data: np.ndarray) -> None:
+        x_values = np.linspace(data.min() - 1, data.max() + 1, 1000)
+        expected = gaussian_kde(data)(x_values)
+
+        actual = _binned_kde(data, x_values)
+
+        assert actual is not None
+        assert np.max(np.abs(actual - expected)) < 0.01 * expected.max()
+
+    def test_constant_data_has_no_kde(self) -> None:
+        assert _binned_kde(np.array([2.0, 2.0, 2.0]), np.linspace(1, 3, 100)) is None
+
+    def test_build_kde_keeps_grid_and_nonnegative_density(self) -> None:
+        overview = TestLogScaleSharedZeroOffset._make_overview()
+        data = np.random.default_rng(4).lognormal(0.0, 1.0, 3000)
+
+        x_values, y_values = overview._build_kde(data)
+
+        assert len(x_values) == len(y_values) == 1000
+        assert x_values[0] < data.min() and x_values[-1] > data.max()
+        assert min(y_values) >= 0
+        # Integrates to ~1 over the padded range
+        x, y = np.asarray(x_values), np.asarray(y_values)
+        area = float(np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2))
+        assert area == pytest.approx(1.0, abs=0.01)
+
+
+class TestComplementWasserstein:
+    """_complement_wasserstein must equal scipy's per-segment computation."""
+
+    def test_matches_scipy_per_group(self) -> None:
+        rng = np.random.default_rng(0)
+        values = np.round(rng.gamma(2.0, 2.0, 3000), 1)
+        values[rng.random(3000) < 0.05] = np.nan
+        codes = rng.integers(0, 5, 3000)
+
+        distances = _complement_wasserstein(values, codes, 5)
+
+        for group in range(5):
+            in_group = (codes == group) & ~np.isnan(values)
+            out_group = (codes != group) & ~np.isnan(values)
+            assert distances[group] == pytest.approx(
+                wasserstein_distance(values[in_group], values[out_group])
+            )
+
+    def test_group_without_values_or_complement_is_nan(self) -> None:
+        values = np.array([1.0, 2.0, np.nan])
+        codes = np.array([0, 0, 1])
+
+        distances = _complement_wasserstein(values, codes, 3)
+
+        # group 0 holds every non-NaN value; group 1 only NaN; group 2 is empty
+        assert np.isnan(distances).all()
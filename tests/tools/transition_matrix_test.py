@@ -1,5 +1,6 @@
 import warnings
 
+import numpy as np
 import pandas as pd
 import pytest
 from retentioneering.eventstream.eventstream import Eventstream
@@ -529,6 +530,108 @@ class TestTransitionMatrix:
         pd.testing.assert_frame_equal(res, expected)
 
 
+class TestTransitionTimeSketch:
+    @staticmethod
+    def _stream(seed=0, n_users=200):
+        rng = np.random.default_rng(seed)
+        rows = []
+        for user in range(n_users):
+            ts = pd.Timestamp("2024-01-01") + pd.Timedelta(
+                seconds=int(rng.integers(1e6))
+            )
+            for _ in range(int(rng.integers(2, 8))):
+                rows.append([f"u{seed}_{user}", rng.choice(["A", "B", "C"]), ts])
+                ts += pd.Timedelta(seconds=float(rng.lognormal(6, 2)))
+        return Eventstream(
+            pd.DataFrame(rows, columns=["user_id", "event", "timestamp"])
+        )
+
+    @pytest.mark.parametrize("values, q", [("time_median", 0.5), ("time_q95", 0.95)])
+    def test__within_the_error_bound_of_the_exact_quantile(self, values, q):
+        from retentioneering import engine
+        from retentioneering.utils.sketch import ALPHA
+
+        stream = self._stream()
+        res = stream.transition_graph_data(edge_weight=values)
+
+        df = stream.add_start_end_events().df
+        exact = engine.run(
+            f"""
+            select event, next_event, quantile_cont(d, {q}) as q from (
+                select event,
+                       lead(event) over w as next_event,
+                       date_diff('second', timestamp, lead(timestamp) over w) as d
+                from df window w as (partition by user_id order by index, subindex)
+            ) where next_event is not null group by all
+            """,
+            df=df,
+        )
+        for row in exact.itertuples(index=False):
+            got = res.loc[row.event, row.next_event].total_seconds()
+            assert got == pytest.approx(row.q, rel=ALPHA)
+
+    def test__switching_time_weights_reuses_the_sketch(self, monkeypatch):
+        from retentioneering import engine
+
+        stream = self._stream()
+        stream.transition_graph_data(edge_weight="time_median")
+
+        calls = []
+        run = engine.run
+
+        def counting_run(sql, **tables):
+            calls.append(sql)
+            return run(sql, **tables)
+
+        monkeypatch.setattr(engine, "run", counting_run)
+        stream.transition_graph_data(edge_weight="time_q95")
+        stream.transition_graph_data(edge_weight="time_median")
+        assert calls == []
+
+    def test__sketches_of_separate_runs_merge(self):
+        from retentioneering.tools.transition_matrix import TransitionMatrix
+
+        first, second = self._stream(seed=1), self._stream(seed=2)
+        both = Eventstream(pd.concat([first.to_dataframe(), second.to_dataframe()]))
+
+        merged = (
+            TransitionMatrix(first)
+            .time_sketch()
+            .merge(TransitionMatrix(second).time_sketch())
+        )
+        whole = TransitionMatrix(both).time_sketch()
+        for q in (0.5, 0.95):
+            pd.testing.assert_series_equal(
+                merged.quantile(q).sort_index(), whole.quantile(q).sort_index()
+            )
+
+    def test__a_slow_sketch_holds_up_only_its_own_stream(self, monkeypatch):
+        import threading
+
+        from retentioneering.tools.transition_matrix import TransitionMatrix
+
+        slow, other = self._stream(seed=1), self._stream(seed=2)
+        started, release = threading.Event(), threading.Event()
+        build = TransitionMatrix._build_time_sketch
+
+        def blocking_build(tm, path_col):
+            if tm.eventstream is slow:
+                started.set()
+                release.wait(10)
+            return build(tm, path_col)
+
+        monkeypatch.setattr(TransitionMatrix, "_build_time_sketch", blocking_build)
+        waiting = threading.Thread(target=TransitionMatrix(slow).time_sketch)
+        waiting.start()
+        try:
+            assert started.wait(10)
+            other.transition_graph_data(edge_weight="time_median")
+            assert waiting.is_alive()
+        finally:
+            release.set()
+            waiting.join(10)
+
+
 class TestTransitionGraphPathPattern:
     """path_pattern selects which paths are drawn. Unlike Step Matrix's
     parameter of the same name it does not centre or cut anything — a graph has
@@ -1,7 +1,12 @@
-"""Tests for the PostHog tracking opt-out."""
+"""Tests for the PostHog tracking opt-out and delivery."""
 
+import inspect
 import json
+import queue
+import subprocess
 import sys
+import threading
+from collections import Counter
 from functools import cached_property
 from unittest.mock import MagicMock
 
@@ -50,6 +55,7 @@ def test_track_respects_no_track(monkeypatch):
 
     _tracking.track("some_event", {"key": "value"})
 
+    _tracking.flush()
     fake_ph.capture.assert_not_called()
 
 
@@ -63,6 +69,7 @@ def test_track_respects_no_track_in_config_file(monkeypatch, tmp_path):
 
     _tracking.track("some_event", {"key": "value"})
 
+    _tracking.flush()
     fake_ph.capture.assert_not_called()
 
 
@@ -185,6 +192,7 @@ def test_track_tags_events_with_default_caller_type(monkeypatch, tmp_path):
 
     _tracking.track("some_event")
 
+    _tracking.flush()
     assert fake_ph.capture.call_args.kwargs["properties"]["caller_type"] == "user"
 
 
@@ -198,6 +206,7 @@ def test_caller_context_tags_events_and_restores_on_exit(monkeypatch, tmp_path):
         _tracking.track("inside")
     _tracking.track("outside")
 
+    _tracking.flush()
     inside_props = fake_ph.capture.call_args_list[0].kwargs["properties"]
     outside_props = fake_ph.capture.call_args_list[1].kwargs["properties"]
     assert inside_props["caller_type"] == "platform"
@@ -217,6 +226,7 @@ def test_caller_context_restores_on_exception(monkeypatch, tmp_path):
         pass
 
     _tracking.track("after")
+    _tracking.flush()
     assert fake_ph.capture.call_args.kwargs["properties"]["caller_type"] == "user"
 
 
@@ -260,6 +270,7 @@ def test_tracked_reports_success_status_and_arg_split(monkeypatch, tmp_path):
 
     assert Dummy().method(keep="x") == "ok"
 
+    _tracking.flush()
     _, kwargs = fake_ph.capture.call_args
     props = kwargs["properties"]
     assert props["status"] == "success"
@@ -287,6 +298,7 @@ def test_tracked_reports_error_status_and_reraises(monkeypatch, tmp_path):
 
     assert raised
 
+    _tracking.flush()
     _, kwargs = fake_ph.capture.call_args
     props = kwargs["properties"]
     assert props["status"] == "error"
@@ -314,6 +326,7 @@ def test_tracked_error_uses_error_code_for_retentioneering_errors(
     except EmptyEventstreamError:
         pass
 
+    _tracking.flush()
     _, kwargs = fake_ph.capture.call_args
     assert kwargs["properties"]["error_type"] == "EMPTY_EVENTSTREAM"
 
@@ -333,9 +346,145 @@ def test_tracked_error_respects_no_track(monkeypatch):
     except RuntimeError:
         pass
 
+    _tracking.flush()
     fake_ph.capture.assert_not_called()
 
 
+# ── delivery: queue, sampling, lazy client ──────────────────────────────────────
+
+
+def test_track_hands_events_over_off_the_calling_thread(monkeypatch, tmp_path):
+    fake_ph = MagicMock()
+    monkeypatch.setattr(_tracking, "_ph", fake_ph)
+    monkeypatch.delenv("RETENTIONEERING_NO_TRACK", raising=False)
+    monkeypatch.setattr(_tracking, "_CONFIG", tmp_path / "config.json")
+    delivered = threading.Event()
+    fake_ph.capture.side_effect = lambda **kwargs: delivered.set()
+
+    _tracking.track("background_event")
+
+    assert delivered.wait(5)
+    assert _tracking._thread is not None and _tracking._thread.is_alive()
+
+
+def test_track_samples_frequent_events(monkeypatch, tmp_path):
+    fake_ph = MagicMock()
+    monkeypatch.setattr(_tracking, "_ph", fake_ph)
+    monkeypatch.delenv("RETENTIONEERING_NO_TRACK", raising=False)
+    monkeypatch.setattr(_tracking, "_CONFIG", tmp_path / "config.json")
+    monkeypatch.setattr(_tracking, "_event_counts", Counter())
+    monkeypatch.setattr(_tracking, "_SAMPLE_AFTER", 5)
+    monkeypatch.setattr(_tracking, "_SAMPLE_EVERY", 10)
+
+    for _ in range(30):
+        _tracking.track("loop_event", {"status": "success"})
+    _tracking.track("loop_event", {"status": "error"})
+    _tracking.flush()
+
+    props = [c.kwargs["properties"] for c in fake_ph.capture.call_args_list]
+    # 5 in full, then the 10th, 20th and 30th occurrences; errors always
+    assert len(props) == 9
+    assert [p.get("sample_rate") for p in props[5:8]] == [0.1] * 3
+    assert props[-1]["status"] == "error" and "sample_rate" not in props[-1]
+
+
+def test_track_drops_events_when_queue_is_full(monkeypatch):
+    monkeypatch.setattr(_tracking, "_ph", MagicMock())
+    monkeypatch.delenv("RETENTIONEERING_NO_TRACK", raising=False)
+    monkeypatch.setattr(_tracking, "_queue", queue.Queue(1))
+    monkeypatch.setattr(_tracking, "_dropped", 0)
+    monkeypatch.setattr(_tracking, "_event_counts", Counter())
+    # Nothing drains the queue while the delivery lock is held
+    with _tracking._deliver_lock:
+        _tracking.track("first")
+        _tracking.track("second")  # must not block or raise
+
+    assert _tracking._dropped == 1
+
+
+def test_events_queued_at_exit_reach_the_client_before_it_shuts_down(tmp_path):
+    # A stand-in client with an exit hook of its own, like PostHog's
+    (tmp_path / "posthog.py").write_text(
+        "import atexit\n"
+        "class Posthog:\n"
+        "    def __init__(self, **kwargs):\n"
+        "        self.closed = False\n"
+        "        atexit.register(self.close)\n"
+        "    def close(self):\n"
+        "        self.closed = True\n"
+        "    def capture(self, distinct_id, event, properties):\n"
+        "        print(event, 'closed' if self.closed else 'open', flush=True)\n"
+        "    def flush(self, timeout_seconds=None):\n"
+        "        pass\n"
+    )
+    code = (
+        "import atexit\n"
+        "hooks = []\n"
+        "register, unregister = atexit.register, atexit.unregister\n"
+        "atexit.register = lambda f: (hooks.append(f), register(f))[1]\n"
+        "atexit.unregister = lambda f: (hooks.remove(f), unregister(f))[1]\n"
+        "from retentioneering import _tracking\n"
+        "_tracking.track('first')\n"
+        "_tracking.flush()\n"
+        "ours = [f for f in hooks if f.__module__ in ('posthog', _tracking.__name__)]\n"
+        "print(*[f.__qualname__ for f in ours], flush=True)\n"
+        "_tracking._queue.put(('late', 'user', None))\n"
+    )
+    env = {
+        "PATH": "",
+        "HOME": str(tmp_path),
+        "PYTHONPATH": f"{tmp_path}:{':'.join(sys.path)}",
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+    # One hook of ours, registered after the client's so that it runs first
+    assert out.stdout.splitlines()[:3] == [
+        "first open",
+        "Posthog.close _flush_at_exit",
+        "late open",
+    ]
+
+
+def test_import_does_not_build_the_client():
+    code = (
+        "import sys; from retentioneering import _tracking; "
+        "print(_tracking._ph is _tracking._NOT_BUILT, 'posthog' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert out.stdout.split() == ["True", "False"]
+
+
+def test_arg_splitter_matches_split_args():
+    def f(self, a, b=1, *, c=None, d="x"):
+        pass
+
+    def g(a, /, b=2, *args, e=None, **kwargs):
+        pass
+
+    calls = [
+        (f, ("self", 0), {}),
+        (f, ("self", 0, 2), {"d": "y"}),
+        (f, ("self",), {"a": 0, "b": 1, "c": [1]}),
+        (f, ("self",), {}),  # missing a required argument
+        (f, ("self", 0), {"a": 1}),  # a passed twice
+        (g, (0, 3, 4), {"e": 1, "z": 2}),
+    ]
+    for func, args, kwargs in calls:
+        sig = inspect.signature(func)
+        assert _tracking._ArgSplitter(sig)(args, kwargs) == _tracking._split_args(
+            sig, args, kwargs
+        )
+
+
 # ── coverage: every public Eventstream method is tracked or explicitly excused ──
 
 # Read-only accessors/inspectors — not "actions" in the dp_/widget_/headless_ sense,
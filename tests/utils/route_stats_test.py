@@ -3,7 +3,7 @@ import pytest
 
 from retentioneering.eventstream.eventstream import Eventstream
 from retentioneering.exceptions import InvalidParameterError
-from retentioneering.utils.route_stats import route_stats
+from retentioneering.utils.route_stats import route_index, route_stats
 
 
 def _stream() -> Eventstream:
@@ -94,3 +94,80 @@ class TestRouteStats:
         stats = route_stats(Eventstream(df), ["it's a trap", "B"])
 
         assert stats["unique_paths"] == 1
+
+
+class TestRouteIndex:
+    ROUTES = [
+        ["A", "B"],
+        ["B", "B"],
+        ["A", "B", "C"],
+        ["A", "B", "B", "C"],
+        ["path_start", "A", "C", "path_end"],
+        ["C", "A"],
+    ]
+
+    @pytest.mark.parametrize("route", ROUTES)
+    def test__index_matches_the_scan(self, route):
+        stream = _stream()
+        # max_n=2 leaves every route of three or more events to the scan
+        assert route_stats(stream, route) == route_stats(stream, route, max_n=2)
+
+    def test__built_once_per_stream(self, monkeypatch):
+        from retentioneering import engine
+
+        stream = _stream()
+        route_stats(stream, ["A", "B"])
+
+        calls = []
+        run = engine.run
+
+        def counting_run(sql, **tables):
+            calls.append(sql)
+            return run(sql, **tables)
+
+        monkeypatch.setattr(engine, "run", counting_run)
+        for route in self.ROUTES:
+            route_stats(stream, route)
+        assert calls == []
+
+    def test__a_slow_build_holds_up_only_its_own_stream(self, monkeypatch):
+        import threading
+
+        from retentioneering.utils import route_stats as module
+
+        slow, other = _stream(), _stream()
+        started, release = threading.Event(), threading.Event()
+        build = module._build_index
+
+        def blocking_build(eventstream, path_col, max_n):
+            if eventstream is slow:
+                started.set()
+                release.wait(10)
+            return build(eventstream, path_col, max_n)
+
+        monkeypatch.setattr(module, "_build_index", blocking_build)
+        waiting = threading.Thread(target=route_index, args=(slow,))
+        waiting.start()
+        try:
+            assert started.wait(10)
+            assert route_index(other).lookup(["A", "B"])[0] == 2
+            assert waiting.is_alive()
+        finally:
+            release.set()
+            waiting.join(10)
+        assert route_index(slow).lookup(["A", "B"])[0] == 2
+
+    def test__longer_routes_scan(self):
+        stream = _stream()
+        index = route_index(stream, max_n=3)
+
+        assert index.lookup(["A", "B", "C"]) is not None
+        assert index.lookup(["A", "B", "B", "C"]) is None
+        stats = route_stats(stream, ["A", "B", "B", "C"], max_n=3)
+        assert stats["occurrences"] == 1
+        assert stats["time_median"] == pytest.approx(180.0)
+
+    @pytest.mark.parametrize("max_n", [1, 0, True, "4"])
+    def test__invalid_max_n(self, max_n):
+        with pytest.raises(InvalidParameterError):
+            route_stats(_stream(), ["A", "B"], max_n=max_n)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from retentioneering import engine
+from retentioneering.utils.sketch import ALPHA, DurationSketch, bucket_sql
+
+
+def _sketch(values, keys=None) -> DurationSketch:
+    df = pd.DataFrame({"k": keys if keys is not None else "x", "d": values})
+    bins = engine.run(
+        f"select k, {bucket_sql('d')} as value, count(*) as count from df group by all",
+        df=df,
+    )
+    return DurationSketch(("k",), bins)
+
+
+def _exact(values, q) -> float:
+    df = pd.DataFrame({"d": values})
+    return float(
+        engine.run(f"select quantile_cont(d, {q}) as q from df", df=df)["q"][0]
+    )
+
+
+class TestDurationSketch:
+    @pytest.mark.parametrize("q", [0.0, 0.25, 0.5, 0.95, 1.0])
+    def test__exact_below_the_threshold(self, q):
+        values = np.random.default_rng(0).integers(0, 1000, 501).astype(float)
+        assert _sketch(values).quantile(q)["x"] == _exact(values, q)
+
+    @pytest.mark.parametrize("q", [0.05, 0.5, 0.95])
+    def test__relative_error_above_the_threshold(self, q):
+        values = np.random.default_rng(1).lognormal(9, 2, 20_000)
+        estimate = _sketch(values).quantile(q)["x"]
+        assert estimate == pytest.approx(_exact(values, q), rel=ALPHA)
+
+    def test__negative_durations_mirror_the_grid(self):
+        values = np.array([-5000.0, -30.0, 20.0, 7000.0])
+        estimate = _sketch(values).quantile(0.0)["x"]
+        assert estimate == pytest.approx(-5000.0, rel=ALPHA)
+
+    def test__keys_are_independent(self):
+        sketch = _sketch([1.0, 2.0, 3.0, 100.0, 200.0], keys=list("aaabb"))
+        assert sketch.quantile(0.5).to_dict() == {"a": 2.0, "b": 150.0}
+        assert sketch.count().to_dict() == {"a": 3, "b": 2}
+
+    def test__merged_shards_equal_the_whole(self):
+        rng = np.random.default_rng(2)
+        values = rng.lognormal(6, 2, 3000)
+        keys = rng.choice(list("abc"), 3000)
+        whole = _sketch(values, keys)
+        merged = _sketch(values[:1000], keys[:1000]).merge(
+            _sketch(values[1000:2500], keys[1000:2500]),
+            _sketch(values[2500:], keys[2500:]),
+        )
+        for q in (0.5, 0.95):
+            pd.testing.assert_series_equal(merged.quantile(q), whole.quantile(q))
+
+    def test__merge_rejects_a_different_grid(self):
+        sketch = _sketch([1.0])
+        with pytest.raises(ValueError):
+            sketch.merge(DurationSketch(("k",), sketch.bins, alpha=0.05))
@@ -103,6 +103,42 @@ class TestClusterAnalysisWidgetSave:
         # The widget's own catalogs must be refreshed too.
         assert "cluster" in json.loads(widget.segment_cols)
 
+    def test__save_drops_caches_derived_from_the_old_frame(self) -> None:
+        from retentioneering.tools import approx, transition_matrix
+        from retentioneering.utils import route_stats
+
+        df = pd.DataFrame(
+            [
+                [f"user_{i}", event, f"2020-01-01 00:0{j}:00"]
+                for i in range(100)
+                for j, event in enumerate(["login"] + ["view"] * (i % 4))
+            ],
+            columns=["user_id", "event", "timestamp"],
+        )
+        stream = Eventstream(df)
+        stream.transition_graph_data(edge_weight="time_median")
+        stream.funnel_data(["login", "view"], sample=0.5)
+        route_stats.route_index(stream, stream.schema.path_col)
+        caches = (
+            transition_matrix._time_sketches,
+            approx._samples,
+            route_stats._indexes,
+        )
+        assert all(stream in cache for cache in caches)
+
+        widget = ClusterAnalysisWidget(
+            stream, features=[{"metric": "length"}], method_args={"n_clusters": 2}
+        )
+        widget.save_segment_name = "cluster"
+        widget.save_trigger = "1"
+
+        assert json.loads(widget.save_result)["ok"] is True
+        assert not any(stream in cache for cache in caches)
+        # A new estimate samples the new frame, clusters included
+        stream.funnel_data(["login"], sample=0.5)
+        sample, _, _ = approx._samples[stream][(stream.schema.path_col, 0.5)]
+        assert "cluster" in sample.df.columns
+
     def test__save_without_rename(self) -> None:
         stream = _make_stream()
         widget = ClusterAnalysisWidget(
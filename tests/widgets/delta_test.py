@@ -0,0 +1,124 @@
+"""Versioned `result` delivery: patches (widgets._delta) and the widget side."""
+
+import json
+
+import pandas as pd
+
+from retentioneering.eventstream.eventstream import Eventstream
+from retentioneering.widgets import _delta, _payload
+
+
+def _copy(obj):
+    return json.loads(json.dumps(obj))
+
+
+def _graph(events, value=0.5) -> dict:
+    return {
+        "events": events,
+        "values": [[value] * len(events) for _ in events],
+        "counts": {e: {events[0]: 1} for e in events},
+    }
+
+
+def _roundtrip(old, new) -> list:
+    ops = _delta.diff(old, new)
+    assert _delta.apply(_copy(old), ops) == new
+    return ops
+
+
+def test_identical_results_give_no_ops():
+    assert _roundtrip(_graph(["a", "b"]), _graph(["a", "b"])) == []
+
+
+def test_changed_cells_are_sent_alone():
+    old = _graph(list("abcdefgh"))
+    new = _copy(old)
+    new["values"][2][5] = None
+    new["values"][7][0] = 0.25
+    ops = _roundtrip(old, new)
+    assert ops == [
+        {
+            "op": "cells",
+            "path": ["values"],
+            "rows": [2, 7],
+            "cols": [5, 0],
+            "values": [None, 0.25],
+        }
+    ]
+
+
+def test_mostly_changed_matrix_is_replaced():
+    ops = _roundtrip(_graph(list("abcd")), _graph(list("abcd"), value=0.1))
+    assert [op["op"] for op in ops] == ["set"]
+
+
+def test_added_and_removed_nodes_keep_the_remaining_cells():
+    old = _graph(list("abcd"))
+    old["values"][1][3] = 0.9
+    new = _copy(old)
+    new["events"] = ["b", "d", "e"]
+    new["values"] = [[0.5, 0.9, None], [0.5, 0.5, None], [None, None, None]]
+    new["counts"] = {"b": {"a": 1}}
+    ops = _roundtrip(old, new)
+    reindex = next(op for op in ops if op["op"] == "reindex")
+    assert reindex["index"] == [1, 3, -1]
+    assert not any(op["op"] == "set" and op["path"] == ["values"] for op in ops)
+
+
+def test_keys_are_added_and_removed():
+    _roundtrip({"a": 1, "b": [1, 2]}, {"b": [1, 2, 3], "c": "x"})
+    _roundtrip({}, _graph(["a"]))
+    _roundtrip(_graph(["a"]), {})
+
+
+def _stream() -> Eventstream:
+    df = pd.DataFrame(
+        {
+            "user_id": [1, 1, 1, 2, 2, 2, 2, 3, 3],
+            "event": ["A", "B", "C", "A", "B", "B", "C", "A", "C"],
+            "timestamp": pd.date_range("2024-01-01", periods=9, freq="1min"),
+        }
+    )
+    return Eventstream(df)
+
+
+class TestSetResult:
+    def test_first_result_is_sent_whole(self):
+        widget = _stream().transition_graph()
+        assert widget.result_version == 1
+        assert widget.result_patch == ""
+
+    def test_recompute_sends_a_patch_that_rebuilds_the_result(self):
+        widget = _stream().transition_graph(edge_weight="count")
+        before = json.loads(widget.result)
+        result = _copy(before)
+        result["counts"]["A"]["B"] = 5
+        widget._set_result(result)
+
+        assert widget.result_version == 2
+        patch = _payload.loads(widget.result_patch)
+        assert (patch["base"], patch["version"]) == (1, 2)
+        assert _delta.apply(before, patch["ops"]) == json.loads(widget.result)
+
+    def test_large_patch_falls_back_to_the_whole_result(self):
+        widget = _stream().transition_graph()
+        widget._set_result({"other": list(range(100))})
+        assert widget.result_patch == ""
+        assert json.loads(widget.result) == {"other": list(range(100))}
+
+    def test_result_tool_returns_the_current_version(self):
+        widget = _stream().transition_graph()
+        widget.edge_weight = "count"
+        reply = widget.dispatch_compute("result", {})
+        assert reply == {"version": 2, "result": widget.result}
+
+    def test_edge_weight_switch_keeps_group_event_counts(self, monkeypatch):
+        stream = _stream().add_segment(
+            "platform", func=lambda df: df["user_id"] % 2 == 0
+        )
+        widget = stream.transition_graph(diff=["platform", "True", "False"])
+        counts_g1 = widget.event_counts_g1
+        assert counts_g1 != "{}"
+        monkeypatch.setattr(type(widget), "_group_counts", lambda *_: ("{}", "{}"))
+        widget.edge_weight = "count"
+        assert widget.event_counts_g1 == counts_g1
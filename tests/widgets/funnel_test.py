@@ -1,4 +1,4 @@
-"""Tests for FunnelWidget's diff-mode group labels."""
+"""Tests for FunnelWidget's diff-mode group labels and approximate mode."""
 
 import json
 
@@ -57,3 +57,47 @@ class TestFunnelWidgetDiff:
         assert result["group2_label"] == "Group 2"
         assert result["group1_total"] == 2
         assert result["group2_total"] == 2
+
+
+def _make_large_stream(n_paths: int = 400) -> Eventstream:
+    rows = []
+    for i in range(n_paths):
+        rows.append([f"user_{i}", "step1", "2020-01-01 00:00:00"])
+        if i % 2:
+            rows.append([f"user_{i}", "step2", "2020-01-01 00:01:00"])
+    return Eventstream(pd.DataFrame(rows, columns=["user_id", "event", "timestamp"]))
+
+
+class TestFunnelWidgetApprox:
+    def test__estimate_is_replaced_by_the_exact_result(self) -> None:
+        stream = _make_large_stream()
+        widget = FunnelWidget(stream, steps=["step1", "step2"], sample=0.25)
+        widget._refinement.join(timeout=30)
+
+        assert widget.error == ""
+        assert widget.result_approx == 0.0
+        result = json.loads(widget.result)
+        assert result["steps"][0]["unique_paths"] == 400
+        assert result["steps"][1]["unique_paths"] == 200
+
+    def test__stale_refinement_is_dropped(self) -> None:
+        stream = _make_large_stream()
+        widget = FunnelWidget(stream, steps=["step1", "step2"], sample=0.25)
+        first = widget._refinement
+        widget.steps = json.dumps(["step1"])
+        first.join(timeout=30)
+        widget._refinement.join(timeout=30)
+
+        result = json.loads(widget.result)
+        assert [s["step"] for s in result["steps"]] == ["step1"]
+
+    def test__estimate_carries_per_step_bounds(self) -> None:
+        widget = FunnelWidget(_make_large_stream(), steps=["step1", "step2"])
+        result = widget._compute_raw(steps=["step1", "step2"], sample=0.25)
+
+        assert len(result["steps_low"]) == len(result["steps_high"]) == 2
+        for step, low, high in zip(
+            result["steps"], result["steps_low"], result["steps_high"]
+        ):
+            assert low["unique_paths"] <= step["unique_paths"] <= high["unique_paths"]
+        json.dumps(result, allow_nan=False)
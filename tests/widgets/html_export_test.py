@@ -98,3 +98,18 @@ def test_bare_html_escapes_script_breakout_and_title(tmp_path):
 
     payload = _extract_json(html, "__HS_DATA__")
     assert json.loads(payload) == data
+
+
+def test_report_html_streams_every_tab_and_the_bundle(tmp_path):
+    widgets = [
+        {"label": f"Tab {i}", "data": {"widget_type": "step_matrix", "i": i}}
+        for i in range(3)
+    ]
+    out = tmp_path / "report.html"
+
+    _html_export.write_report_html(str(out), "Report", widgets, analysis="text")
+    html = out.read_text(encoding="utf-8")
+
+    assert json.loads(_extract_json(html, "__HS_WIDGETS__")) == widgets
+    assert "<script>/* stub bundle */</script>" in html
+    assert "{{" not in html
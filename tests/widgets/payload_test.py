@@ -0,0 +1,75 @@
+"""Tests for the packed encoding of large widget payloads (widgets._payload)."""
+
+import json
+
+import numpy as np
+
+from retentioneering.widgets import _payload
+
+
+def _matrix_payload(n: int) -> dict:
+    rng = np.random.default_rng(0)
+    values = rng.random((n, n)).tolist()
+    values[0][1] = None
+    return {
+        "events": [f"event_{i}" for i in range(n)],
+        "values": values,
+        "counts": rng.integers(0, 1000, (n, n)).tolist(),
+        "labels": ["a", "b", "a", "b"] * 32,
+        "edge_weight": "proba_out",
+    }
+
+
+def test_small_payload_stays_plain_json():
+    obj = {"events": ["a", "b"], "values": [[0.5, None], [1.0, 0.0]]}
+    assert _payload.dumps(obj) == json.dumps(obj)
+
+
+def test_large_payload_is_packed_and_roundtrips():
+    obj = _matrix_payload(300)
+    text = _payload.dumps(obj)
+    assert json.loads(text).keys() == {"$packed", "gzip"}
+    assert len(text) < len(json.dumps(obj))
+    assert _payload.loads(text) == obj
+
+
+def test_threshold_controls_packing():
+    obj = _matrix_payload(20)
+    assert "$packed" in json.loads(_payload.dumps(obj, threshold=0))
+    assert "$packed" not in json.loads(_payload.dumps(obj, threshold=10**9))
+
+
+def test_loads_reads_plain_json():
+    assert _payload.loads('{"values": [1, 2]}') == {"values": [1, 2]}
+
+
+def test_unpack_envelope_passes_other_objects_through():
+    obj = {"values": [[1.0]]}
+    assert _payload.unpack_envelope(obj) is obj
+
+
+def test_pack_encodes_numeric_matrices_and_repeated_strings():
+    packed = _payload.pack(_matrix_payload(64))
+    assert packed["values"]["$typed"] == "f8"
+    assert packed["values"]["shape"] == [64, 64]
+    assert packed["counts"]["$typed"] == "i4"
+    assert packed["labels"]["$dict"] == ["a", "b"]
+    # All distinct: nothing to gain from a dictionary
+    assert packed["events"] == [f"event_{i}" for i in range(64)]
+
+
+def test_pack_leaves_lists_it_cannot_type_as_is():
+    ragged = [[1.0, 2.0], [3.0]]
+    bools = [[True, False]] * 70
+    mixed = [[1.0, "x"]] * 70
+    huge = [[2**40, 1]] * 70
+    for obj in (ragged, bools, mixed):
+        assert _payload.pack(obj) == obj
+    # Out of int32 range: stored as f8, still exact
+    assert _payload.pack(huge)["$typed"] == "f8"
+    assert _payload.unpack(_payload.pack(huge)) == huge
+
+
+def test_roundtrip_keeps_ints_floats_and_none():
+    obj = {"flat": [None, 1, 2.5] * 30, "ints": list(range(100))}
+    assert _payload.loads(_payload.dumps(obj, threshold=0)) == obj
@@ -1,11 +1,14 @@
 """Tests for the widgets' ``state_file`` persistence protocol."""
 
 import json
+import os
+import time
 
 import pandas as pd
 import pytest
 
 from retentioneering.eventstream.eventstream import Eventstream
+from retentioneering.widgets import _state_file
 from retentioneering.widgets.funnel import FunnelWidget
 from retentioneering.widgets.step_matrix import StepMatrixWidget
 from retentioneering.widgets.transition_graph import TransitionGraphWidget
@@ -49,6 +52,7 @@ class TestStateFileAutosave:
 
         widget.max_steps = 4
         widget.sidebar_open = False
+        widget._flush_state()
 
         state = json.loads(path.read_text())["state"]
         assert state["max_steps"] == 4
@@ -60,10 +64,89 @@ class TestStateFileAutosave:
 
         positions = json.dumps({"A": {"x": 1, "y": 2}})
         widget.node_positions = positions
+        widget._flush_state()
 
         state = json.loads(path.read_text())["state"]
         assert state["node_positions"] == positions
 
+    def test__changes_are_saved_in_the_background(self, tmp_path) -> None:
+        path = tmp_path / "matrix.json"
+        widget = StepMatrixWidget(_make_stream(), state_file=str(path))
+
+        widget.max_steps = 4
+        deadline = time.monotonic() + 5
+        while json.loads(path.read_text())["state"]["max_steps"] != 4:
+            assert time.monotonic() < deadline, "state was never saved"
+            time.sleep(0.05)
+
+    def test__a_burst_of_changes_is_written_once(self, tmp_path, monkeypatch) -> None:
+        path = tmp_path / "graph.json"
+        widget = TransitionGraphWidget(_make_stream(), state_file=str(path))
+        writes = []
+        real_replace = os.replace
+        monkeypatch.setattr(
+            _state_file.os,
+            "replace",
+            lambda src, dst: (writes.append(dst), real_replace(src, dst)),
+        )
+
+        for x in range(50):
+            widget.node_positions = json.dumps({"A": {"x": x, "y": 0}})
+        widget._flush_state()
+
+        assert len(writes) == 1
+        text = path.read_text()
+        assert "\n" not in text  # compact
+        assert text.startswith('{"widget_type":"transition_graph","state":{')
+        assert json.loads(json.loads(text)["state"]["node_positions"]) == {
+            "A": {"x": 49, "y": 0}
+        }
+
+    def test__loading_waits_for_a_save_being_written(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        import threading
+
+        path = tmp_path / "matrix.json"
+        widget = StepMatrixWidget(_make_stream(), state_file=str(path))
+        started, release = threading.Event(), threading.Event()
+        real_replace = os.replace
+
+        def slow_replace(src, dst):
+            if threading.current_thread().name == "retentioneering-state-file":
+                started.set()
+                release.wait(10)
+            real_replace(src, dst)
+
+        monkeypatch.setattr(_state_file.os, "replace", slow_replace)
+        widget.max_steps = 4
+        assert started.wait(10)
+
+        loaded = []
+        loader = threading.Thread(
+            target=lambda: loaded.append(
+                StepMatrixWidget(_make_stream(), state_file=str(path))
+            )
+        )
+        loader.start()
+        loader.join(0.5)
+        assert loader.is_alive()  # the write in flight holds the load back
+        release.set()
+        loader.join(10)
+        assert loaded[0].max_steps == 4
+
+    def test__a_failed_flush_warns(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(_state_file, "SAVE_DELAY", 60)
+        monkeypatch.setattr(_state_file, "MAX_SAVE_DELAY", 60)
+        widget = StepMatrixWidget(_make_stream(), state_file=str(tmp_path / "s.json"))
+        # A regular file where the state file's directory should be
+        (tmp_path / "blocked").write_text("")
+        widget._state_file = tmp_path / "blocked" / "s.json"
+
+        widget.max_steps = 4
+        with pytest.warns(UserWarning, match="Could not save widget state"):
+            _state_file._writer.flush()
+
 
 class TestStateFileRestore:
     def test__state_is_restored_from_file(self, tmp_path) -> None:
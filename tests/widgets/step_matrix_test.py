@@ -1,4 +1,5 @@
-"""Tests for StepMatrixWidget's diff-mode per-group event counts."""
+"""Tests for StepMatrixWidget's diff-mode per-group event counts and
+approximate-mode bounds."""
 
 import json
 
@@ -194,3 +195,25 @@ class TestStepMatrixWidgetAnchor:
 
         assert widget.error == ""
         assert json.loads(widget.result)["matrices"]
+
+
+class TestStepMatrixWidgetApprox:
+    def test__estimate_carries_bounds_in_diff_mode(self) -> None:
+        rows = []
+        for i in range(400):
+            seg = "seg_1" if i % 2 else "seg_2"
+            rows.append([f"user_{i}", "A", "2020-01-01 00:00:00", seg])
+            rows.append([f"user_{i}", "BC"[i % 3 % 2], "2020-01-01 00:01:00", seg])
+        df = pd.DataFrame(rows, columns=["user_id", "event", "timestamp", "my_segment"])
+        stream = Eventstream(df, {"segment_cols": ["my_segment"]})
+        widget = StepMatrixWidget(stream)
+
+        result = widget._compute_raw(
+            max_steps=3, diff=["my_segment", "seg_1", "seg_2"], sample=0.5
+        )
+
+        for m in result["matrices"]:
+            for matrix in (m, m["group1"], m["group2"]):
+                assert len(matrix["values_low"]) == len(matrix["values"])
+                assert len(matrix["values_high"]) == len(matrix["values"])
+        json.dumps(result, allow_nan=False)
@@ -45,3 +45,35 @@ class TestTransitionCountsPayload:
         widget = stream.transition_graph(diff=["platform", "True", "False"])
 
         assert "counts" not in json.loads(widget.result)
+
+
+class TestApproxBoundsPayload:
+    def _large_stream(self) -> Eventstream:
+        n = 400
+        df = pd.DataFrame(
+            {
+                "user_id": [i for i in range(n) for _ in range(3)],
+                "event": [e for i in range(n) for e in ("A", "BC"[i % 3 % 2], "C")],
+                "timestamp": pd.date_range("2024-01-01", periods=3 * n, freq="1min"),
+            }
+        )
+        return Eventstream(df)
+
+    def test__bounds_have_the_values_shape(self):
+        widget = self._large_stream().transition_graph(edge_weight="count")
+        result = widget._compute_tm_raw("count", sample=0.25)
+
+        assert "values_low" in result and "values_high" in result
+        assert len(result["values_low"]) == len(result["values"])
+        for row, low, high in zip(
+            result["values"], result["values_low"], result["values_high"]
+        ):
+            assert len(low) == len(high) == len(row)
+            for v, lo, hi in zip(row, low, high):
+                if lo is not None:
+                    assert lo <= v <= hi
+        json.dumps(result, allow_nan=False)
+
+    def test__exact_result_has_no_bounds(self):
+        widget = self._large_stream().transition_graph(edge_weight="count")
+        assert "values_low" not in json.loads(widget.result)